@@ -1,70 +1,103 @@
-from .affinda import AffindaApi
-from .ai21labs import Ai21labsApi
-from .alephalpha import AlephAlphaApi
-from .amazon import AmazonApi
-from .anthropic import AnthropicApi
-from .api4ai import Api4aiApi
-from .assembly import AssemblyApi
-from .astria import AstriaApi
-from .base64 import Base64Api
-from .clarifai import ClarifaiApi
-from .cohere import CohereApi
-from .connexun import ConnexunApi
-from .corticalio import CorticalioApi
-from .dataleon import DataleonApi
-from .deepai import DeepAIApi
-from .deepgram import DeepgramApi
-from .deepl import DeeplApi
-from .elevenlabs import ElevenlabsApi
-from .emvista import EmvistaApi
-from .extracta import ExtractaApi
-from .facepp import FaceppApi
-from .faker import FakerApi
-from .gladia import GladiaApi
-from .google import GoogleApi
-from .hireability import HireabilityApi
-from .huggingface import HuggingfaceApi
-from .ibm import IbmApi
-from .klippa import KlippaApi
-from .lettria import LettriaApi
-from .lovoai import LovoaiApi
-from .meaningcloud import MeaningcloudApi
-from .meta import MetaApi
-from .microsoft import MicrosoftApi
-from .mindee import MindeeApi
-from .mistral import MistralApi
-from .modernmt import ModernmtApi
-from .neuralspace import NeuralSpaceApi
-from .nlpcloud import NlpCloudApi
-from .nyckel import NyckelApi
-from .oneai import OneaiApi
-from .openai import OpenaiApi
-from .originalityai import OriginalityaiApi
-from .perplexityai import PerplexityApi
-from .phedone import PhedoneApi
-from .photoroom import PhotoroomApi
-from .picpurify import PicpurifyApi
-from .privateai import PrivateaiApi
-from .prowritingaid import ProWritingAidApi
-from .readyredact import ReadyRedactApi
-from .replicate import ReplicateApi
-from .revai import RevAIApi
-from .rossum import RossumApi
-from .sapling import SaplingApi
-from .senseloaf import SenseloafApi
-from .sentisight import SentiSightApi
-from .skybiometry import SkybiometryApi
-from .smartclick import SmartClickApi
-from .speechmatics import SpeechmaticsApi
-from .stabilityai import StabilityAIApi
-from .symbl import SymblApi
-from .tabscanner import TabscannerApi
-from .tenstorrent import TenstorrentApi
-from .vernai import VernaiApi
-from .veryfi import VeryfiApi
-from .voci import VociApi
-from .voxist import VoxistApi
-from .winstonai import WinstonaiApi
-from .writesonic import WritesonicApi
+"""
+Providers packages.
 
-# THIS NEEDS TO BE DONE AUTOMATICALLY
+Providers are imported lazily: each provider package (and its dependencies, eg: boto3,
+google-cloud-*, openai...) is only imported when its class is first accessed,
+eg: `edenai_apis.apis.AmazonApi` or `load_class("amazon")`.
+
+To add a new provider, register its package name and its class name in `PROVIDERS`.
+"""
+from importlib import import_module
+from typing import Dict, List
+
+# provider_name (package name) -> provider class name
+PROVIDERS: Dict[str, str] = {
+    "affinda": "AffindaApi",
+    "ai21labs": "Ai21labsApi",
+    "alephalpha": "AlephAlphaApi",
+    "amazon": "AmazonApi",
+    "anthropic": "AnthropicApi",
+    "api4ai": "Api4aiApi",
+    "assembly": "AssemblyApi",
+    "astria": "AstriaApi",
+    "base64": "Base64Api",
+    "clarifai": "ClarifaiApi",
+    "cohere": "CohereApi",
+    "connexun": "ConnexunApi",
+    "corticalio": "CorticalioApi",
+    "dataleon": "DataleonApi",
+    "deepai": "DeepAIApi",
+    "deepgram": "DeepgramApi",
+    "deepl": "DeeplApi",
+    "elevenlabs": "ElevenlabsApi",
+    "emvista": "EmvistaApi",
+    "extracta": "ExtractaApi",
+    "facepp": "FaceppApi",
+    "faker": "FakerApi",
+    "gladia": "GladiaApi",
+    "google": "GoogleApi",
+    "hireability": "HireabilityApi",
+    "huggingface": "HuggingfaceApi",
+    "ibm": "IbmApi",
+    "klippa": "KlippaApi",
+    "lettria": "LettriaApi",
+    "lovoai": "LovoaiApi",
+    "meaningcloud": "MeaningcloudApi",
+    "meta": "MetaApi",
+    "microsoft": "MicrosoftApi",
+    "mindee": "MindeeApi",
+    "mistral": "MistralApi",
+    "modernmt": "ModernmtApi",
+    "neuralspace": "NeuralSpaceApi",
+    "nlpcloud": "NlpCloudApi",
+    "nyckel": "NyckelApi",
+    "oneai": "OneaiApi",
+    "openai": "OpenaiApi",
+    "originalityai": "OriginalityaiApi",
+    "perplexityai": "PerplexityApi",
+    "phedone": "PhedoneApi",
+    "photoroom": "PhotoroomApi",
+    "picpurify": "PicpurifyApi",
+    "privateai": "PrivateaiApi",
+    "prowritingaid": "ProWritingAidApi",
+    "readyredact": "ReadyRedactApi",
+    "replicate": "ReplicateApi",
+    "revai": "RevAIApi",
+    "rossum": "RossumApi",
+    "sapling": "SaplingApi",
+    "senseloaf": "SenseloafApi",
+    "sentisight": "SentiSightApi",
+    "skybiometry": "SkybiometryApi",
+    "smartclick": "SmartClickApi",
+    "speechmatics": "SpeechmaticsApi",
+    "stabilityai": "StabilityAIApi",
+    "symbl": "SymblApi",
+    "tabscanner": "TabscannerApi",
+    "tenstorrent": "TenstorrentApi",
+    "vernai": "VernaiApi",
+    "veryfi": "VeryfiApi",
+    "voci": "VociApi",
+    "voxist": "VoxistApi",
+    "winstonai": "WinstonaiApi",
+    "writesonic": "WritesonicApi",
+}
+
+_PROVIDERS_BY_CLASS_NAME: Dict[str, str] = {
+    class_name: provider_name for provider_name, class_name in PROVIDERS.items()
+}
+
+__all__ = list(PROVIDERS.values())
+
+
+def __getattr__(name: str):
+    provider_name = _PROVIDERS_BY_CLASS_NAME.get(name)
+    if provider_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    provider_class = getattr(import_module(f".{provider_name}", __name__), name)
+    # cache the class so next accesses don't go through __getattr__
+    globals()[name] = provider_class
+    return provider_class
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -19,6 +19,8 @@ from .standardization import IdentityStandardizer, InvoiceStandardizer, ReceiptS
 
 class AffindaApi(ProviderInterface, OcrInterface):
     provider_name = "affinda"
+    # calls update the client workspace and last response on the instance
+    poolable = False
 
     def __init__(self, api_keys: Dict = {}):
         super().__init__()
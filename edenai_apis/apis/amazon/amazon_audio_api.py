@@ -2,7 +2,6 @@ import json
 import urllib
 import uuid
 import base64
-import requests
 from io import BufferedReader, BytesIO
 from botocore.exceptions import BotoCoreError, ClientError
 from pathlib import Path
@@ -22,9 +21,11 @@ from edenai_apis.features.audio.speech_to_text_async.speech_to_text_async_datacl
 from edenai_apis.features.audio.text_to_speech.text_to_speech_dataclass import (
     TextToSpeechDataClass,
 )
+from edenai_apis.utils.audio import TTS_CHUNK_SIZE, upload_text_to_speech_audio
 from edenai_apis.utils.exception import (
     ProviderException,
 )
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.ssml import is_ssml
 from edenai_apis.utils.types import (
     AsyncBaseResponseType,
@@ -34,8 +35,6 @@ from edenai_apis.utils.types import (
     ResponseType,
 )
 from edenai_apis.utils.upload_s3 import (
-    upload_file_bytes_to_s3,
-    USER_PROCESS,
     get_s3_file_url,
     URL_LONG_PERIOD,
     get_cloud_front_file_url,
@@ -87,15 +86,12 @@ class AmazonAudioApi(AudioInterface):
             self.clients["texttospeech"].synthesize_speech, **params
         )
 
-        audio_content = BytesIO(response["AudioStream"].read())
-
-        # convert 'StreamBody' to b64
-        audio_file = base64.b64encode(audio_content.read()).decode("utf-8")
+        # stream the 'StreamBody' to s3 and convert it to b64
+        audio_file, resource_url = upload_text_to_speech_audio(
+            response["AudioStream"].iter_chunks(TTS_CHUNK_SIZE), f".{ext}"
+        )
         voice_type = 1
 
-        audio_content.seek(0)
-        resource_url = upload_file_bytes_to_s3(audio_content, f".{ext}", USER_PROCESS)
-
         standardized_response = TextToSpeechDataClass(
             audio=audio_file, voice_type=voice_type, audio_resource_url=resource_url
         )
@@ -426,7 +422,7 @@ class AmazonAudioApi(AudioInterface):
                 output_uri.split("/")[-1], URL_LONG_PERIOD
             )
             synthesis_task["OutputUri"] = file_url
-            response_file = requests.get(file_url)
+            response_file = http_client.get(file_url)
             print(response_file.content)
             audio_content = BytesIO(response_file.content)
             audio = base64.b64encode(audio_content.read()).decode("utf-8")
@@ -40,6 +40,7 @@ from edenai_apis.utils.exception import (
     AsyncJobExceptionReason,
     ProviderException,
 )
+from edenai_apis.utils.job_completion import JOB_NOTIFICATIONS
 from edenai_apis.utils.types import (
     AsyncBaseResponseType,
     AsyncLaunchJobResponseType,
@@ -52,6 +53,7 @@ from .helpers import (
     amazon_ocr_async_formatter,
     amazon_ocr_tables_parser,
     amazon_custom_document_parsing_formatter,
+    amazon_job_pages,
     amazon_invoice_parser_formatter,
     amazon_receipt_parser_formatter,
     amazon_financial_parser_formatter,
@@ -60,6 +62,21 @@ from .helpers import (
 
 
 class AmazonOcrApi(OcrInterface):
+    def _notification_channel(self) -> dict:
+        """`NotificationChannel` argument of the textract jobs, only given when job
+        notifications are received (see utils.job_completion)"""
+        if not JOB_NOTIFICATIONS or not (
+            self.api_settings.get("topic") and self.api_settings.get("role")
+        ):
+            return {}
+        # textract publishes the completion of the jobs on this topic
+        return {
+            "NotificationChannel": {
+                "SNSTopicArn": self.api_settings["topic"],
+                "RoleArn": self.api_settings["role"],
+            }
+        }
+
     def ocr__ocr(
         self,
         file: str,
@@ -250,27 +267,13 @@ class AmazonOcrApi(OcrInterface):
             )
             raise ProviderException(error)
 
-        pagination_token = response.get("NextToken")
-        pages = [response]
-        if not pagination_token:
-            return AsyncResponseType[OcrTablesAsyncDataClass](
-                original_response=pages,
-                standardized_response=amazon_ocr_tables_parser(pages),
-                provider_job_id=job_id,
-            )
-
-        finished = False
-        while not finished:
-            response = self.clients["textract"].get_document_analysis(
-                JobId=job_id,
-                NextToken=pagination_token,
+        pages = list(
+            amazon_job_pages(
+                self.clients["textract"].get_document_analysis,
+                job_id,
+                first_page=response,
             )
-            pages.append(response)
-            if "NextToken" in response:
-                pagination_token = response["NextToken"]
-            else:
-                finished = True
-
+        )
         return AsyncResponseType[OcrTablesAsyncDataClass](
             original_response=pages,
             standardized_response=amazon_ocr_tables_parser(pages),
@@ -297,6 +300,7 @@ class AmazonOcrApi(OcrInterface):
             },
             "FeatureTypes": ["QUERIES"],
             "QueriesConfig": {"Queries": formatted_queries},
+            **self._notification_channel(),
         }
         response = handle_amazon_call(
             self.clients["textract"].start_document_analysis, **payload
@@ -332,27 +336,13 @@ class AmazonOcrApi(OcrInterface):
             )
             raise ProviderException(error)
 
-        pagination_token = response.get("NextToken")
-        pages = [response]
-        if not pagination_token:
-            return AsyncResponseType[CustomDocumentParsingAsyncDataClass](
-                original_response=pages,
-                standardized_response=amazon_custom_document_parsing_formatter(pages),
-                provider_job_id=provider_job_id,
-            )
-
-        finished = False
-        while not finished:
-            response = self.clients["textract"].get_document_analysis(
-                JobId=provider_job_id,
-                NextToken=pagination_token,
+        pages = list(
+            amazon_job_pages(
+                self.clients["textract"].get_document_analysis,
+                provider_job_id,
+                first_page=response,
             )
-            pages.append(response)
-            if "NextToken" in response:
-                pagination_token = response["NextToken"]
-            else:
-                finished = True
-
+        )
         return AsyncResponseType[CustomDocumentParsingAsyncDataClass](
             original_response=pages,
             standardized_response=amazon_custom_document_parsing_formatter(pages),
@@ -373,7 +363,8 @@ class AmazonOcrApi(OcrInterface):
         payload = {
             "DocumentLocation": {
                 "S3Object": {"Bucket": self.api_settings["bucket"], "Name": file},
-            }
+            },
+            **self._notification_channel(),
         }
         launch_job_response = handle_amazon_call(
             self.clients["textract"].start_expense_analysis, **payload
@@ -395,6 +386,7 @@ class AmazonOcrApi(OcrInterface):
             status="SUCCEEDED",
             func=self.clients["textract"].get_expense_analysis,
             provider_handel_call=handle_amazon_call,
+            job_key=("amazon", job_id),
             **waiting_args,
         )  # waiting exponentially using fibonacci
 
@@ -438,7 +430,8 @@ class AmazonOcrApi(OcrInterface):
         payload = {
             "DocumentLocation": {
                 "S3Object": {"Bucket": self.api_settings["bucket"], "Name": file}
-            }
+            },
+            **self._notification_channel(),
         }
         launch_job_response = handle_amazon_call(
             self.clients["textract"].start_expense_analysis, **payload
@@ -460,6 +453,7 @@ class AmazonOcrApi(OcrInterface):
             status="SUCCEEDED",
             func=self.clients["textract"].get_expense_analysis,
             provider_handel_call=handle_amazon_call,
+            job_key=("amazon", job_id),
             **waiting_args,
         )
 
@@ -502,7 +496,8 @@ class AmazonOcrApi(OcrInterface):
         payload = {
             "DocumentLocation": {
                 "S3Object": {"Bucket": self.api_settings["bucket"], "Name": file}
-            }
+            },
+            **self._notification_channel(),
         }
         launch_job_response = handle_amazon_call(
             self.clients["textract"].start_document_text_detection, **payload
@@ -525,34 +520,20 @@ class AmazonOcrApi(OcrInterface):
             raise ProviderException(error)
 
         if response["JobStatus"] == "SUCCEEDED":
-            pagination_token = response.get("NextToken")
-            responses = [response]
-
-            while pagination_token:
-                payload = {
-                    "JobId": provider_job_id,
-                    "NextToken": pagination_token,
-                }
-                response = handle_amazon_call(
-                    self.clients["textract"].get_document_text_detection, **payload
+            responses = list(
+                amazon_job_pages(
+                    self.clients["textract"].get_document_text_detection,
+                    provider_job_id,
+                    first_page=response,
                 )
-
-                if response["JobStatus"] == "FAILED":
-                    error: str = response.get(
-                        "StatusMessage", "Amazon returned a job status: FAILED"
-                    )
-                    raise ProviderException(error)
-
-                responses.append(response)
-                pagination_token = response.get("NextToken")
-
+            )
             return AsyncResponseType(
                 original_response=responses,
                 standardized_response=amazon_ocr_async_formatter(responses),
                 provider_job_id=provider_job_id,
             )
 
-        return AsyncPendingResponseType(provider_job_id=response["JobStatus"])
+        return AsyncPendingResponseType(provider_job_id=provider_job_id)
 
     def ocr__data_extraction(
         self, file: str, file_url: str = ""
@@ -572,6 +553,7 @@ class AmazonOcrApi(OcrInterface):
                     }
                 },
                 "FeatureTypes": ["FORMS"],
+                **self._notification_channel(),
             }
             launch_job_response = handle_amazon_call(
                 self.clients["textract"].start_document_analysis, **payload
@@ -584,6 +566,7 @@ class AmazonOcrApi(OcrInterface):
                 func=self.clients["textract"].get_document_analysis,
                 provider_handel_call=handle_amazon_call,
                 status_positif=False,
+                job_key=("amazon", launch_job_response["JobId"]),
                 **waiting_args,
             )
 
@@ -632,7 +615,8 @@ class AmazonOcrApi(OcrInterface):
         payload = {
             "DocumentLocation": {
                 "S3Object": {"Bucket": self.api_settings["bucket"], "Name": file},
-            }
+            },
+            **self._notification_channel(),
         }
         launch_job_response = handle_amazon_call(
             self.clients["textract"].start_expense_analysis, **payload
@@ -654,6 +638,7 @@ class AmazonOcrApi(OcrInterface):
             status="SUCCEEDED",
             func=self.clients["textract"].get_expense_analysis,
             provider_handel_call=handle_amazon_call,
+            job_key=("amazon", job_id),
             **waiting_args,
         )  # waiting exponentially using fibonacci
 
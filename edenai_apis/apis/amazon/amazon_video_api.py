@@ -1,3 +1,5 @@
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
 from edenai_apis.features.video.explicit_content_detection_async.explicit_content_detection_async_dataclass import (
     ExplicitContentDetectionAsyncDataClass,
 )
@@ -23,7 +25,9 @@ from edenai_apis.utils.types import (
     AsyncPendingResponseType,
     AsyncResponseType,
 )
+from edenai_apis.utils.pagination import iter_items
 from .helpers import (
+    amazon_job_pages,
     amazon_launch_video_job,
     handle_amazon_call,
     amazon_video_person_tracking_parser,
@@ -33,14 +37,35 @@ from .helpers import (
     amazon_video_explicit_parser
 )
 
+# client method and page parser of the result of each video job
+VIDEO_JOB_RESULTS = {
+    "label_detection": ("get_label_detection", amazon_video_labels_parser),
+    "text_detection": ("get_text_detection", amazon_video_text_parser),
+    "face_detection": ("get_face_detection", amazon_video_face_parser),
+    "person_tracking": ("get_person_tracking", amazon_video_person_tracking_parser),
+    "explicit_content_detection": (
+        "get_content_moderation",
+        amazon_video_explicit_parser,
+    ),
+}
+
 
 class AmazonVideoApi(VideoInterface):
+    def _launch_video_job(self, file: str, feature: str) -> str:
+        return amazon_launch_video_job(
+            file,
+            feature,
+            api_settings=self.api_settings,
+            video_client=self.clients["video"],
+            s3_client=self.storage_clients["video"].meta.client,
+        )
+
     # Launch job label detection
     def video__label_detection_async__launch_job(
         self, file: str, file_url: str = ""
     ) -> AsyncLaunchJobResponseType:
         return AsyncLaunchJobResponseType(
-            provider_job_id=amazon_launch_video_job(file, "LABEL")
+            provider_job_id=self._launch_video_job(file, "LABEL")
         )
 
     # Launch job text detection
@@ -48,7 +73,7 @@ class AmazonVideoApi(VideoInterface):
         self, file: str, file_url: str = ""
     ) -> AsyncLaunchJobResponseType:
         return AsyncLaunchJobResponseType(
-            provider_job_id=amazon_launch_video_job(file, "TEXT")
+            provider_job_id=self._launch_video_job(file, "TEXT")
         )
 
     # Launch job face detection
@@ -56,7 +81,7 @@ class AmazonVideoApi(VideoInterface):
         self, file: str, file_url: str = ""
     ) -> AsyncLaunchJobResponseType:
         return AsyncLaunchJobResponseType(
-            provider_job_id=amazon_launch_video_job(file, "FACE")
+            provider_job_id=self._launch_video_job(file, "FACE")
         )
 
     # Launch job person tracking
@@ -64,7 +89,7 @@ class AmazonVideoApi(VideoInterface):
         self, file: str, file_url: str = ""
     ) -> AsyncLaunchJobResponseType:
         return AsyncLaunchJobResponseType(
-            provider_job_id=amazon_launch_video_job(file, "PERSON")
+            provider_job_id=self._launch_video_job(file, "PERSON")
         )
 
     # Launch job explicit content detection
@@ -72,235 +97,110 @@ class AmazonVideoApi(VideoInterface):
         self, file: str, file_url: str = ""
     ) -> AsyncLaunchJobResponseType:
         return AsyncLaunchJobResponseType(
-            provider_job_id=amazon_launch_video_job(file, "EXPLICIT")
+            provider_job_id=self._launch_video_job(file, "EXPLICIT")
         )
 
-    # Get job result for label detection
-    def video__label_detection_async__get_job_result(
-        self, provider_job_id: str
-    ) -> AsyncBaseResponseType[LabelDetectionAsyncDataClass]:
-        payload = {"JobId": provider_job_id}
+    def iter_video_job_items(
+        self, subfeature: str, provider_job_id: str, first_page: Optional[dict] = None
+    ) -> Iterator[Any]:
+        """Yield the standardized items (labels, texts, faces...) of a finished video
+        job page by page, without keeping the pages in memory.
+
+        Args:
+            subfeature (str): video subfeature, eg: `label_detection`
+            provider_job_id (str): Amazon job id
+            first_page (dict): first page of the result, if it was already fetched
+        """
+        method_name, parser = VIDEO_JOB_RESULTS[subfeature.replace("_async", "")]
+        pages = amazon_job_pages(
+            getattr(self.clients["video"], method_name), provider_job_id, first_page
+        )
+        return iter_items(pages, parser)
+
+    def _video_job_result(
+        self,
+        subfeature: str,
+        provider_job_id: str,
+        build_response: Callable[[List[Any]], Any],
+    ) -> AsyncBaseResponseType:
+        method_name, parser = VIDEO_JOB_RESULTS[subfeature]
         response = handle_amazon_call(
-            self.clients["video"].get_label_detection, **payload
-            )
+            getattr(self.clients["video"], method_name), JobId=provider_job_id
+        )
         if response["JobStatus"] == "FAILED":
             error: str = response.get(
                 "StatusMessage", "Amazon returned a job status: FAILED"
             )
             raise ProviderException(error)
 
-        if response["JobStatus"] == "SUCCEEDED":
-            pagination_token = response.get("NextToken")
-            responses = [response]
-            while pagination_token:
-                payload = {
-                    "JobId": provider_job_id,
-                    "NextToken": pagination_token,
-                }
-                response = handle_amazon_call(
-                    self.clients["video"].get_label_detection, **payload
-                )
-
-                if response["JobStatus"] == "FAILED":
-                    error: str = response.get(
-                        "StatusMessage", "Amazon returned a job status: FAILED"
-                    )
-                    raise ProviderException(error)
+        if response["JobStatus"] != "SUCCEEDED":
+            return AsyncPendingResponseType(provider_job_id=provider_job_id)
+
+        responses: List[Dict] = []
+        items: List[Any] = []
+        # the next page is fetched while the current one is parsed
+        for page in amazon_job_pages(
+            getattr(self.clients["video"], method_name),
+            provider_job_id,
+            first_page=response,
+        ):
+            responses.append(page)
+            items.extend(parser(page))
+
+        return AsyncResponseType(
+            original_response=responses,
+            standardized_response=build_response(items),
+            provider_job_id=provider_job_id,
+        )
 
-                responses.append(response)
-                pagination_token = response.get("NextToken")
-                
-            labels = []
-            for response in responses:
-                labels.extend(amazon_video_labels_parser(response))
-                
-            return AsyncResponseType(
-                original_response=responses,
-                standardized_response=LabelDetectionAsyncDataClass(labels=labels),
-                provider_job_id=provider_job_id,
-            )
-        return AsyncPendingResponseType(provider_job_id=response["JobStatus"])
+    # Get job result for label detection
+    def video__label_detection_async__get_job_result(
+        self, provider_job_id: str
+    ) -> AsyncBaseResponseType[LabelDetectionAsyncDataClass]:
+        return self._video_job_result(
+            "label_detection",
+            provider_job_id,
+            lambda labels: LabelDetectionAsyncDataClass(labels=labels),
+        )
 
     # Get job result for text detection
     def video__text_detection_async__get_job_result(
         self, provider_job_id: str
-    ) -> TextDetectionAsyncDataClass:
-        payload = {"JobId": provider_job_id}
-        response = handle_amazon_call(
-            self.clients["video"].get_text_detection, **payload
-            )
-        if response["JobStatus"] == "FAILED":
-            error: str = response.get(
-                "StatusMessage", "Amazon returned a job status: FAILED"
-            )
-            raise ProviderException(error)
-
-        if response["JobStatus"] == "SUCCEEDED":
-            pagination_token = response.get("NextToken")
-            responses = [response]
-            while pagination_token:
-                payload = {
-                    "JobId": provider_job_id,
-                    "NextToken": pagination_token,
-                }
-                response = handle_amazon_call(
-                    self.clients["video"].get_text_detection, **payload
-                )
-
-                if response["JobStatus"] == "FAILED":
-                    error: str = response.get(
-                        "StatusMessage", "Amazon returned a job status: FAILED"
-                    )
-                    raise ProviderException(error)
-
-                responses.append(response)
-                pagination_token = response.get("NextToken")
-                
-            texts = []
-            for response in responses:
-                texts.extend(amazon_video_text_parser(response))
-                
-            return AsyncResponseType(
-                original_response=responses,
-                standardized_response=TextDetectionAsyncDataClass(texts=texts),
-                provider_job_id=provider_job_id,
-            )
-        return AsyncPendingResponseType(provider_job_id=response["JobStatus"])
+    ) -> AsyncBaseResponseType[TextDetectionAsyncDataClass]:
+        return self._video_job_result(
+            "text_detection",
+            provider_job_id,
+            lambda texts: TextDetectionAsyncDataClass(texts=texts),
+        )
 
     # Get job result for face detection
     def video__face_detection_async__get_job_result(
         self, provider_job_id: str
-    ) -> FaceDetectionAsyncDataClass:
-        payload = {"JobId": provider_job_id}
-        response = handle_amazon_call(
-            self.clients["video"].get_face_detection, **payload
-            )
-        if response["JobStatus"] == "FAILED":
-            error: str = response.get(
-                "StatusMessage", "Amazon returned a job status: FAILED"
-            )
-            raise ProviderException(error)
-
-        if response["JobStatus"] == "SUCCEEDED":
-            pagination_token = response.get("NextToken")
-            responses = [response]
-            while pagination_token:
-                payload = {
-                    "JobId": provider_job_id,
-                    "NextToken": pagination_token,
-                }
-                response = handle_amazon_call(
-                    self.clients["video"].get_face_detection, **payload
-                )
-
-                if response["JobStatus"] == "FAILED":
-                    error: str = response.get(
-                        "StatusMessage", "Amazon returned a job status: FAILED"
-                    )
-                    raise ProviderException(error)
-
-                responses.append(response)
-                pagination_token = response.get("NextToken")
-                
-            faces = []
-            for response in responses:
-                faces.extend(amazon_video_face_parser(response))
-                
-            return AsyncResponseType(
-                original_response=responses,
-                standardized_response=FaceDetectionAsyncDataClass(faces=faces),
-                provider_job_id=provider_job_id,
-            )
-        return AsyncPendingResponseType(provider_job_id=response["JobStatus"])
+    ) -> AsyncBaseResponseType[FaceDetectionAsyncDataClass]:
+        return self._video_job_result(
+            "face_detection",
+            provider_job_id,
+            lambda faces: FaceDetectionAsyncDataClass(faces=faces),
+        )
 
     # Get job result for person tracking
     def video__person_tracking_async__get_job_result(
         self, provider_job_id: str
-    ) -> PersonTrackingAsyncDataClass:
-        payload = {"JobId": provider_job_id}
-        response = handle_amazon_call(
-            self.clients["video"].get_person_tracking, **payload
-            )
-        if response["JobStatus"] == "FAILED":
-            error: str = response.get(
-                "StatusMessage", "Amazon returned a job status: FAILED"
-            )
-            raise ProviderException(error)
-
-        if response["JobStatus"] == "SUCCEEDED":
-            pagination_token = response.get("NextToken")
-            responses = [response]
-            while pagination_token:
-                payload = {
-                    "JobId": provider_job_id,
-                    "NextToken": pagination_token,
-                }
-                response = handle_amazon_call(
-                    self.clients["video"].get_person_tracking, **payload
-                )
-
-                if response["JobStatus"] == "FAILED":
-                    error: str = response.get(
-                        "StatusMessage", "Amazon returned a job status: FAILED"
-                    )
-                    raise ProviderException(error)
-
-                responses.append(response)
-                pagination_token = response.get("NextToken")
-                
-            persons = []
-            for response in responses:
-                persons.extend(amazon_video_person_tracking_parser(response))
-                
-            return AsyncResponseType(
-                original_response=responses,
-                standardized_response=PersonTrackingAsyncDataClass(persons=persons),
-                provider_job_id=provider_job_id,
-            )
-        return AsyncPendingResponseType(provider_job_id=response["JobStatus"])
+    ) -> AsyncBaseResponseType[PersonTrackingAsyncDataClass]:
+        return self._video_job_result(
+            "person_tracking",
+            provider_job_id,
+            lambda persons: PersonTrackingAsyncDataClass(persons=persons),
+        )
 
     # Get job result for explicit content detection
     def video__explicit_content_detection_async__get_job_result(
         self, provider_job_id: str
-    ) -> ExplicitContentDetectionAsyncDataClass:
-        payload = {"JobId": provider_job_id}
-        response = handle_amazon_call(
-            self.clients["video"].get_content_moderation, **payload
-            )
-        if response["JobStatus"] == "FAILED":
-            error: str = response.get(
-                "StatusMessage", "Amazon returned a job status: FAILED"
-            )
-            raise ProviderException(error)
-
-        if response["JobStatus"] == "SUCCEEDED":
-            pagination_token = response.get("NextToken")
-            responses = [response]
-            while pagination_token:
-                payload = {
-                    "JobId": provider_job_id,
-                    "NextToken": pagination_token,
-                }
-                response = handle_amazon_call(
-                    self.clients["video"].get_content_moderation, **payload
-                )
-
-                if response["JobStatus"] == "FAILED":
-                    error: str = response.get(
-                        "StatusMessage", "Amazon returned a job status: FAILED"
-                    )
-                    raise ProviderException(error)
-
-                responses.append(response)
-                pagination_token = response.get("NextToken")
-                
-            moderated_content = []
-            for response in responses:
-                moderated_content.extend(amazon_video_explicit_parser(response))
-                
-            return AsyncResponseType(
-                original_response=responses,
-                standardized_response=ExplicitContentDetectionAsyncDataClass(moderation=moderated_content),
-                provider_job_id=provider_job_id,
-            )
-        return AsyncPendingResponseType(provider_job_id=response["JobStatus"])
+    ) -> AsyncBaseResponseType[ExplicitContentDetectionAsyncDataClass]:
+        return self._video_job_result(
+            "explicit_content_detection",
+            provider_job_id,
+            lambda moderation: ExplicitContentDetectionAsyncDataClass(
+                moderation=moderation
+            ),
+        )
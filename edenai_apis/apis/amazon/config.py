@@ -3,6 +3,16 @@ from typing import Dict
 import boto3
 
 
+def client(api_settings: Dict, service: str, region_key: str = "region_name"):
+    """Build the boto3 client of one service only"""
+    return boto3.client(
+        service,
+        region_name=api_settings[region_key],
+        aws_access_key_id=api_settings["aws_access_key_id"],
+        aws_secret_access_key=api_settings["aws_secret_access_key"],
+    )
+
+
 def clients(api_settings: Dict) -> Dict:
     return {
         "speech": boto3.client(
@@ -1,9 +1,12 @@
+import os
+import threading
 import urllib
+from collections import OrderedDict
 from pathlib import Path
 from time import time
-from typing import Callable, Dict, List, Optional, Tuple, TypeVar, Sequence
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar, Sequence
 
-import requests
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError, ParamValidationError
 from trp import Document
 
@@ -99,11 +102,19 @@ from edenai_apis.utils.exception import (
     AsyncJobExceptionReason,
     ProviderException,
 )
+from edenai_apis.utils.http import http_client
+from edenai_apis.utils.pagination import iter_pages
+from edenai_apis.utils.provider_pool import api_keys_fingerprint
 from edenai_apis.utils.ssml import convert_audio_attr_in_prosody_tag
 from edenai_apis.utils.types import (
     ResponseType,
 )
-from .config import clients, storage_clients
+from edenai_apis.utils.upload_staging import (
+    S3StagingBackend,
+    file_sha256,
+    get_upload_staging,
+)
+from .config import client, storage_clients
 
 
 def check_webhook_result(job_id: str, api_settings: dict) -> Dict:
@@ -121,7 +132,7 @@ def check_webhook_result(job_id: str, api_settings: dict) -> Dict:
         f"https://webhook.site/token/{webhook_token}/requests"
         + f"?sorting=newest&query={urllib.parse.quote_plus('content:'+str(job_id))}"
     )
-    webhook_response = requests.get(url=webhook_get_url, headers={"Api-Key": api_key})
+    webhook_response = http_client.get(url=webhook_get_url, headers={"Api-Key": api_key})
     response_status = webhook_response.status_code
     try:
         return webhook_response.json().get("data"), response_status
@@ -188,72 +199,130 @@ T = TypeVar("T")
 
 
 # Video analysis async
-def _upload_video_file_to_amazon_server(file: str, file_name: str, api_settings: Dict):
-    """
-    :param video:       String that contains the video file path
-    :return:            String that contains the filename on the server
+AMAZON_VIDEO_CHUNK_SIZE = int(os.environ.get("AMAZON_VIDEO_CHUNK_SIZE", 8 * 1024 * 1024))
+AMAZON_VIDEO_UPLOAD_CONCURRENCY = int(
+    os.environ.get("AMAZON_VIDEO_UPLOAD_CONCURRENCY", 8)
+)
+AMAZON_VIDEO_DEDUP = os.environ.get("AMAZON_VIDEO_DEDUP", "false").lower() == "true"
+
+# Rekognition method starting each video job
+VIDEO_JOB_STARTERS = {
+    "LABEL": "start_label_detection",
+    "TEXT": "start_text_detection",
+    "FACE": "start_face_detection",
+    "PERSON": "start_person_tracking",
+    "EXPLICIT": "start_content_moderation",
+}
+
+
+def _upload_video_file_to_amazon_server(
+    file: str,
+    api_settings: Dict,
+    s3_client=None,
+    dedup: Optional[bool] = None,
+    chunk_size: int = AMAZON_VIDEO_CHUNK_SIZE,
+) -> str:
+    """Upload a video in the video bucket, with a concurrent multipart upload for
+    videos bigger than `chunk_size`.
+
+    Videos are staged by content hash (see utils.upload_staging), so the same video
+    is uploaded once for all the video features. With `dedup` (`AMAZON_VIDEO_DEDUP`
+    by default), a video already in the bucket is not uploaded again, even by
+    another process.
+
+    Returns:
+        str: name of the object in the bucket
     """
-    # Store file in an Amazon server
+    dedup = AMAZON_VIDEO_DEDUP if dedup is None else dedup
+    backend = S3StagingBackend(
+        bucket=api_settings["bucket_video"],
+        s3_client=s3_client or storage_clients(api_settings)["video"].meta.client,
+        presign=False,
+        skip_existing=dedup,
+        transfer_config=TransferConfig(
+            multipart_threshold=chunk_size,
+            multipart_chunksize=chunk_size,
+            max_concurrency=AMAZON_VIDEO_UPLOAD_CONCURRENCY,
+        ),
+    )
     file_extension = file.split(".")[-1]
-    filename = str(int(time())) + file_name.stem + "_video_." + file_extension
-    storage_clients(api_settings)["video"].meta.client.upload_file(
-        file, api_settings["bucket_video"], filename
+    staging = get_upload_staging()
+    if staging is not None:
+        return staging.stage(file, f"video.{file_extension}", backend)
+    if dedup:
+        return backend.upload(file, f"{file_sha256(file)}_video.{file_extension}")
+    return backend.upload(
+        file, str(int(time())) + Path(file).stem + "_video_." + file_extension
     )
 
-    return filename
 
+VIDEO_CLIENTS_CACHE_SIZE = 8
+_video_clients_cache: "OrderedDict[str, Tuple[Any, Any]]" = OrderedDict()
+_video_clients_lock = threading.Lock()
 
-def amazon_launch_video_job(file: str, feature: str):
-    api_settings = load_provider(ProviderDataEnum.KEY, "amazon")
-    # Upload video to amazon server
-    filename = _upload_video_file_to_amazon_server(file, Path(file), api_settings)
 
-    # Get response
-    role = api_settings["role"]
-    topic = api_settings["topic_video"]
-    bucket = api_settings["bucket_video"]
+def _video_clients(api_settings: Dict) -> Tuple[Any, Any]:
+    """Return the rekognition and s3 clients of the video region, built once per
+    settings and keyed on their fingerprint so the raw keys are never stored"""
+    key = api_keys_fingerprint(api_settings)
+    with _video_clients_lock:
+        clients = _video_clients_cache.get(key)
+        if clients is not None:
+            _video_clients_cache.move_to_end(key)
+            return clients
 
-    features = {
-        "LABEL": clients(api_settings)["video"].start_label_detection(
-            Video={"S3Object": {"Bucket": bucket, "Name": filename}},
-            NotificationChannel={
-                "RoleArn": role,
-                "SNSTopicArn": topic,
-            },
-        ),
-        "TEXT": clients(api_settings)["video"].start_text_detection(
-            Video={"S3Object": {"Bucket": bucket, "Name": filename}},
-            NotificationChannel={
-                "RoleArn": role,
-                "SNSTopicArn": topic,
-            },
-        ),
-        "FACE": clients(api_settings)["video"].start_face_detection(
-            Video={"S3Object": {"Bucket": bucket, "Name": filename}},
-            NotificationChannel={
-                "RoleArn": role,
-                "SNSTopicArn": topic,
-            },
-        ),
-        "PERSON": clients(api_settings)["video"].start_person_tracking(
-            Video={"S3Object": {"Bucket": bucket, "Name": filename}},
-            NotificationChannel={
-                "RoleArn": role,
-                "SNSTopicArn": topic,
-            },
-        ),
-        "EXPLICIT": clients(api_settings)["video"].start_content_moderation(
-            Video={"S3Object": {"Bucket": bucket, "Name": filename}},
-            NotificationChannel={
-                "RoleArn": role,
-                "SNSTopicArn": topic,
-            },
-        ),
-    }
-    response = features.get(feature)
-    # return job id
-    job_id = response["JobId"]
-    return job_id
+    # build the clients outside the lock, boto3 client creation is slow
+    clients = (
+        client(api_settings, "rekognition", "video-region"),
+        client(api_settings, "s3", "video-region"),
+    )
+    with _video_clients_lock:
+        _video_clients_cache[key] = clients
+        while len(_video_clients_cache) > VIDEO_CLIENTS_CACHE_SIZE:
+            _video_clients_cache.popitem(last=False)
+    return clients
+
+
+def amazon_launch_video_job(
+    file: str,
+    feature: str,
+    api_settings: Optional[Dict] = None,
+    video_client=None,
+    s3_client=None,
+    dedup: Optional[bool] = None,
+) -> str:
+    """Upload a video and start the Rekognition job of the given feature
+
+    Args:
+        file (str): video path
+        feature (str): one of `VIDEO_JOB_STARTERS` (LABEL, TEXT, FACE...)
+        api_settings (dict): amazon settings, default to the edenai ones
+        video_client: rekognition client, built once per settings if not given
+        s3_client: s3 client of the video bucket, same
+        dedup (bool): reuse the video already uploaded for another feature
+
+    Returns:
+        str: the job id
+    """
+    api_settings = api_settings or load_provider(ProviderDataEnum.KEY, "amazon")
+    if video_client is None or s3_client is None:
+        cached_video_client, cached_s3_client = _video_clients(api_settings)
+        video_client = video_client or cached_video_client
+        s3_client = s3_client or cached_s3_client
+
+    start_job = getattr(video_client, VIDEO_JOB_STARTERS[feature])
+    filename = _upload_video_file_to_amazon_server(
+        file, api_settings, s3_client=s3_client, dedup=dedup
+    )
+    response = handle_amazon_call(
+        start_job,
+        Video={"S3Object": {"Bucket": api_settings["bucket_video"], "Name": filename}},
+        NotificationChannel={
+            "RoleArn": api_settings["role"],
+            "SNSTopicArn": api_settings["topic_video"],
+        },
+    )
+    return response["JobId"]
 
 
 def amazon_video_original_response(
@@ -271,6 +340,35 @@ def amazon_video_original_response(
     return response
 
 
+def amazon_job_pages(
+    function_to_call: Callable, job_id: str, first_page: Optional[dict] = None, **params
+) -> Iterator[dict]:
+    """Yield the pages of the result of a Textract/Rekognition job, the next page
+    is requested while the current one is processed (see utils.pagination).
+
+    Args:
+        function_to_call (Callable): client method getting the job result
+        job_id (str): Amazon job id
+        first_page (dict): first page, if it was already fetched to check the job status
+        **params: other parameters of `function_to_call` (eg: SortBy)
+
+    Raise ProviderException if a page has the FAILED job status.
+    """
+
+    def fetch_page(token: Optional[str]) -> dict:
+        payload = {"JobId": job_id, **params}
+        if token:
+            payload["NextToken"] = token
+        response = handle_amazon_call(function_to_call, **payload)
+        if response.get("JobStatus") == "FAILED":
+            raise ProviderException(
+                response.get("StatusMessage", "Amazon returned a job status: FAILED")
+            )
+        return response
+
+    return iter_pages(fetch_page, first_page)
+
+
 def amazon_custom_document_parsing_formatter(
     pages: List[dict],
 ) -> ResponseType[CustomDocumentParsingAsyncDataClass]:
@@ -3,6 +3,8 @@ from edenai_apis.features import ProviderInterface, TextInterface
 from edenai_apis.features.text import GenerationDataClass
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
+from edenai_apis.utils.llm_cache import cached_llm_response
+from edenai_apis.utils.llm_engine import llm_request
 from edenai_apis.utils.types import ResponseType
 from edenai_apis.apis.amazon.helpers import handle_amazon_call
 import boto3
@@ -16,6 +18,7 @@ class AnthropicApi(
     provider_name = "anthropic"
     
     def __init__(self, api_keys: Dict = {}) -> None:
+        self.api_keys = api_keys
         self.api_settings = load_provider(
             ProviderDataEnum.KEY, self.provider_name, api_keys=api_keys
         )
@@ -26,6 +29,8 @@ class AnthropicApi(
             aws_secret_access_key=self.api_settings["aws_secret_access_key"],
         )
 
+    @cached_llm_response
+    @llm_request
     def text__generation(
         self, 
         text: str,
@@ -3,7 +3,6 @@ from io import BytesIO
 from json import JSONDecodeError
 from typing import Dict, Sequence, Optional, Any
 
-import requests
 
 from edenai_apis.features import ProviderInterface, ImageInterface, OcrInterface
 from edenai_apis.features.image.anonymization.anonymization_dataclass import (
@@ -49,6 +48,7 @@ from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
 from edenai_apis.utils.conversion import standardized_confidence_score
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import ResponseType
 from edenai_apis.utils.upload_s3 import upload_file_bytes_to_s3, USER_PROCESS
 from .helpers import get_errors_from_response
@@ -97,7 +97,7 @@ class Api4aiApi(
         """
         file_ = open(file, "rb")
         files = {"image": file_}
-        response = requests.post(self.urls["object_detection"], files=files)
+        response = http_client.post(self.urls["object_detection"], files=files)
         original_response = response.json()
 
         file_.close()
@@ -140,7 +140,7 @@ class Api4aiApi(
             "image": file_,
         }
         # Get response
-        response = requests.post(self.urls["face_detection"], files=payload)
+        response = http_client.post(self.urls["face_detection"], files=payload)
         original_response = response.json()
         file_.close()
 
@@ -202,7 +202,7 @@ class Api4aiApi(
     ) -> ResponseType[AnonymizationDataClass]:
         file_ = open(file, "rb")
         files = {"image": file_}
-        response = requests.post(self.urls["anonymization"], files=files)
+        response = http_client.post(self.urls["anonymization"], files=files)
 
         original_response = response.json()
 
@@ -251,7 +251,7 @@ class Api4aiApi(
             "image": file_,
         }
         # Get response
-        response = requests.post(self.urls["logo_detection"], files=payload)
+        response = http_client.post(self.urls["logo_detection"], files=payload)
         if response.status_code >= 400:
             error_message = ""
             try:
@@ -307,7 +307,7 @@ class Api4aiApi(
             "image": file_,
         }
         # Get response
-        response = requests.post(self.urls["nsfw"], files=payload)
+        response = http_client.post(self.urls["nsfw"], files=payload)
         try:
             original_response = response.json()
         except JSONDecodeError as exp:
@@ -364,7 +364,7 @@ class Api4aiApi(
         file_url: str = "",
     ) -> ResponseType[OcrDataClass]:
         file_ = open(file, "rb")
-        response = requests.post(self.urls["ocr"], files={"image": file_})
+        response = http_client.post(self.urls["ocr"], files={"image": file_})
         file_.close()
 
         error = get_errors_from_response(response)
@@ -411,7 +411,7 @@ class Api4aiApi(
 
         url: str = self.urls["bg_removal"] + f"&mode={api4ai_params.mode}"
         with open(file, "rb") as f:
-            response = requests.post(url, files={"image": f.read()})
+            response = http_client.post(url, files={"image": f.read()})
 
             error = get_errors_from_response(response)
             if error is not None:
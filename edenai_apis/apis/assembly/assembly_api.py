@@ -2,7 +2,6 @@ from pathlib import Path
 from time import time
 from typing import Dict, List, Optional
 
-import requests
 
 from edenai_apis.features import ProviderInterface, AudioInterface
 from edenai_apis.features.audio import (
@@ -17,6 +16,7 @@ from edenai_apis.utils.exception import (
     AsyncJobExceptionReason,
     ProviderException,
 )
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import (
     AsyncBaseResponseType,
     AsyncLaunchJobResponseType,
@@ -84,7 +84,7 @@ class AssemblyApi(ProviderInterface, AudioInterface):
         while not launch_transcription:
             trials -= 1
             # launch transcription
-            response = requests.post(self.url_transcription, json=data, headers=header)
+            response = http_client.post(self.url_transcription, json=data, headers=header)
             if response.status_code != 200:
                 error = response.json().get("error")
                 if "not available in this language" in error:
@@ -105,7 +105,7 @@ class AssemblyApi(ProviderInterface, AudioInterface):
     ) -> AsyncBaseResponseType[SpeechToTextAsyncDataClass]:
         headers = {"authorization": self.api_key}
 
-        response = requests.get(
+        response = http_client.get(
             url=f"{self.url_transcription}/{provider_job_id}", headers=headers
         )
 
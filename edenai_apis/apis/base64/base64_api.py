@@ -47,6 +47,7 @@ from edenai_apis.loaders.loaders import load_provider
 from edenai_apis.utils.bounding_box import BoundingBox
 from apis.amazon.helpers import check_webhook_result
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import (
     AsyncBaseResponseType,
     AsyncLaunchJobResponseType,
@@ -113,7 +114,7 @@ class Base64Api(ProviderInterface, OcrInterface):
 
         headers = {"Content-type": "application/json", "Authorization": self.api_key}
 
-        response = requests.post(url=self.url, headers=headers, json=data)
+        response = http_client.post(url=self.url, headers=headers, json=data)
 
         if response.status_code != 200:
             raise ProviderException(response.text, code=response.status_code)
@@ -189,7 +190,7 @@ class Base64Api(ProviderInterface, OcrInterface):
 
         headers = {"Content-Type": "application/json", "Authorization": self.api_key}
 
-        response = requests.post(url=self.url, headers=headers, data=payload)
+        response = http_client.post(url=self.url, headers=headers, data=payload)
 
         file_.close()
 
@@ -354,7 +355,7 @@ class Base64Api(ProviderInterface, OcrInterface):
                 }
             )
 
-        response = requests.request("POST", url, headers=headers, data=payload)
+        response = http_client.request("POST", url, headers=headers, data=payload)
         original_response = self._get_response(response)
 
         faces = []
@@ -392,7 +393,7 @@ class Base64Api(ProviderInterface, OcrInterface):
                 "Authorization": self.api_key,
             }
 
-            response = requests.post(url=self.url, headers=headers, data=payload)
+            response = http_client.post(url=self.url, headers=headers, data=payload)
 
         original_response = self._get_response(response)
 
@@ -438,7 +439,7 @@ class Base64Api(ProviderInterface, OcrInterface):
                 "Authorization": self.api_key,
             }
 
-            response = requests.post(url=self.url, headers=headers, data=payload)
+            response = http_client.post(url=self.url, headers=headers, data=payload)
             original_response = self._get_response(response)
 
             items: Sequence[ItemBankCheckParsingDataClass] = []
@@ -509,13 +510,13 @@ class Base64Api(ProviderInterface, OcrInterface):
 
         headers = {"Content-Type": "application/json", "Authorization": self.api_key}
 
-        response = requests.post(url=self.url, headers=headers, data=payload)
+        response = http_client.post(url=self.url, headers=headers, data=payload)
 
         original_response = self._get_response(response)
 
         job_id = "document_anonymization_base64" + str(uuid.uuid4())
         data_job_id[job_id] = original_response
-        requests.post(
+        http_client.post(
             url=f"https://webhook.site/{self.webhook_token}",
             data=json.dumps(data_job_id),
             headers={"content-type": "application/json"},
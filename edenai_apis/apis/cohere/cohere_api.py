@@ -14,7 +14,7 @@ from edenai_apis.features.text.custom_named_entity_recognition import (
 )
 from edenai_apis.features.text.embeddings import EmbeddingsDataClass, EmbeddingDataClass
 from edenai_apis.features.text.generation import GenerationDataClass
-from edenai_apis.features.text.search import SearchDataClass, InfosSearchDataClass
+from edenai_apis.features.text.search import SearchDataClass
 from edenai_apis.features.text.spell_check.spell_check_dataclass import (
     SpellCheckDataClass,
     SpellCheckItem,
@@ -24,8 +24,14 @@ from edenai_apis.features.text.summarize import SummarizeDataClass
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
 from edenai_apis.utils.conversion import construct_word_list
+from edenai_apis.utils.embeddings import batched_embeddings
+from edenai_apis.utils.embeddings_cache import cached_embeddings
 from edenai_apis.utils.exception import ProviderException
-from edenai_apis.utils.metrics import METRICS
+from edenai_apis.utils.http import http_client
+from edenai_apis.utils.llm_cache import cached_llm_response
+from edenai_apis.utils.llm_engine import llm_request
+from edenai_apis.utils.metrics import rank_documents
+from edenai_apis.utils.streaming import iter_ndjson
 from edenai_apis.utils.types import ResponseType
 
 from edenai_apis.features.text import ChatDataClass, ChatMessageDataClass
@@ -36,6 +42,7 @@ class CohereApi(ProviderInterface, TextInterface):
     provider_name = "cohere"
 
     def __init__(self, api_keys: Dict = {}):
+        self.api_keys = api_keys
         self.api_settings = load_provider(
             ProviderDataEnum.KEY, self.provider_name, api_keys=api_keys
         )
@@ -102,18 +109,16 @@ List of corrected words:
 
     @staticmethod
     def __text_to_json(
-        lst_data: List[str],
+        response: requests.Response,
     ) -> Generator[ChatStreamResponse, None, None]:
-        lst_json = []
-        for token in lst_data:
-            if token != "":
-                lst_json.append(json.loads(token))
-        for elt in lst_json:
+        for elt in iter_ndjson(response):
             if elt["event_type"] == "text-generation":
                 yield ChatStreamResponse(
                     text=elt["text"], blocked=False, provider="cohere"
                 )
 
+    @cached_llm_response
+    @llm_request
     def text__generation(
         self,
         text: str,
@@ -135,7 +140,7 @@ List of corrected words:
         if max_tokens != 0:
             payload["max_tokens"] = max_tokens
 
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = http_client.post(url, json=payload, headers=self.headers)
         if response.status_code >= 500:
             raise ProviderException("Internal Server Error")
 
@@ -162,6 +167,7 @@ List of corrected words:
             standardized_response=standardized_response,
         )
 
+    @llm_request
     def text__custom_classification(
         self, texts: List[str], labels: List[str], examples: List[List[str]]
     ) -> ResponseType[CustomClassificationDataClass]:
@@ -175,7 +181,7 @@ List of corrected words:
             "examples": example_dict,
         }
 
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = http_client.post(url, json=payload, headers=self.headers)
         original_response = response.json()
 
         # Handle provider errors
@@ -202,6 +208,8 @@ List of corrected words:
             ),
         )
 
+    @cached_llm_response(deterministic=True)
+    @llm_request
     def text__summarize(
         self, text: str, output_sentences: int, language: str, model: str
     ) -> ResponseType[SummarizeDataClass]:
@@ -220,7 +228,7 @@ List of corrected words:
             "text": text,
         }
 
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = http_client.post(url, json=payload, headers=self.headers)
         original_response = response.json()
 
         if "message" in original_response:
@@ -243,6 +251,8 @@ List of corrected words:
             standardized_response=standardized_response,
         )
 
+    @cached_llm_response(deterministic=True)
+    @llm_request
     def text__custom_named_entity_recognition(
         self, text: str, entities: List[str], examples: Optional[List[Dict]] = None
     ) -> ResponseType[CustomNamedEntityRecognitionDataClass]:
@@ -290,7 +300,7 @@ For Example:
             "message": prompt,
             "temperature": 0,
         }
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = http_client.post(url, json=payload, headers=self.headers)
         if response.status_code != 200:
             raise ProviderException(response.text, response.status_code)
 
@@ -315,6 +325,8 @@ For Example:
             standardized_response=standardized_response,
         )
 
+    @cached_llm_response(deterministic=True)
+    @llm_request
     def text__spell_check(
         self, text: str, language: str
     ) -> ResponseType[SpellCheckDataClass]:
@@ -328,7 +340,7 @@ For Example:
             "truncate": "END",
         }
 
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = http_client.post(url, json=payload, headers=self.headers)
         original_response = response.json()
 
         if "message" in original_response:
@@ -368,13 +380,15 @@ For Example:
             standardized_response=SpellCheckDataClass(text=text, items=items),
         )
 
+    @cached_embeddings
+    @batched_embeddings
     def text__embeddings(
         self, texts: List[str], model: str
     ) -> ResponseType[EmbeddingsDataClass]:
         url = f"{self.base_url}embed"
         model = model.split("__")[1]
         payload = {"texts": texts, "model": model}
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = http_client.post(url, json=payload, headers=self.headers)
         original_response = response.json()
         if "message" in original_response:
             raise ProviderException(
@@ -402,41 +416,29 @@ For Example:
             "cosine", "hamming", "manhattan", "euclidean"
         ] = "cosine",
         model: Optional[str] = None,
+        top_k: Optional[int] = None,
     ) -> ResponseType[SearchDataClass]:
         if model is None:
             model = "768__embed-multilingual-v2.0"
-        # Import the function
-        function_score = METRICS[similarity_metric]
-
         # Embed the texts & query
-        texts_embed_response = self.text__embeddings(
-            texts=texts, model=model
-        ).original_response
-        query_embed_response = self.text__embeddings(
-            texts=[query], model=model
-        ).original_response
-
-        # Extracts embeddings from texts & query
-        texts_embed = list(texts_embed_response["embeddings"])
-        query_embed = query_embed_response["embeddings"][0]
-
-        items = []
-        # Calculate score for each text index
-        for index, text in enumerate(texts_embed):
-            score = function_score(query_embed, text)
-            items.append(
-                InfosSearchDataClass(
-                    object="search_result", document=index, score=score
-                )
-            )
-
-        # Sort items by score in descending order
-        sorted_items = sorted(items, key=lambda x: x.score, reverse=True)
+        texts_embed = self.text__embeddings(texts=texts, model=model)
+        query_embed = self.text__embeddings(texts=[query], model=model)
+        texts_embed_response = texts_embed.original_response
+        query_embed_response = query_embed.original_response
+
+        # Extracts embeddings from texts & query (embeddings may come from the cache)
+        texts_embed = [item.embedding for item in texts_embed.standardized_response.items]
+        query_embed = query_embed.standardized_response.items[0].embedding
+
+        # Score all texts at once and keep the best ones, sorted by score
+        sorted_items = rank_documents(
+            query_embed, texts_embed, similarity_metric, top_k=top_k
+        )
 
         # Calculate total tokens
         usage = {
-            "total_tokens": texts_embed_response["meta"]["billed_units"]["input_tokens"]
-            + query_embed_response["meta"]["billed_units"]["input_tokens"]
+            "total_tokens": texts_embed_response["usage"]["total_tokens"]
+            + query_embed_response["usage"]["total_tokens"]
         }
         # Build the original response
         original_response = {
@@ -450,6 +452,8 @@ For Example:
         )
         return result
 
+    @cached_llm_response
+    @llm_request
     def text__chat(
         self,
         text: str,
@@ -482,7 +486,9 @@ For Example:
             "stream": stream,
         }
 
-        response = requests.post(url, headers=self.headers, json=payload)
+        response = http_client.post(
+            url, headers=self.headers, json=payload, stream=stream
+        )
 
         if response.status_code != 200:
             raise ProviderException(response.text, response.status_code)
@@ -511,11 +517,9 @@ For Example:
                     standardized_response=standardized_response,
                 )
             else:
-                data = response.text
-                lst_data = data.split("\n")
                 return ResponseType[StreamChat](
                     original_response=None,
                     standardized_response=StreamChat(
-                        stream=self.__text_to_json(lst_data)
+                        stream=self.__text_to_json(response)
                     ),
                 )
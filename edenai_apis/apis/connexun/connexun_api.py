@@ -1,7 +1,6 @@
 import json
 from typing import Dict
 
-import requests
 
 from edenai_apis.features import ProviderInterface, TextInterface
 from edenai_apis.features.text import (
@@ -11,6 +10,7 @@ from edenai_apis.features.text import (
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import ResponseType
 
 
@@ -35,7 +35,7 @@ class ConnexunApi(ProviderInterface, TextInterface):
         }
         url = f"{self.base_url}text-analysis/sentiment"
 
-        response = requests.post(url, headers=headers, json=files)
+        response = http_client.post(url, headers=headers, json=files)
         original_response = response.json()
 
         if isinstance(original_response, dict) and original_response.get("message"):
@@ -76,7 +76,7 @@ class ConnexunApi(ProviderInterface, TextInterface):
         url = f"{self.base_url}text-analysis/summarize"
 
         # Send request to API
-        response = requests.post(url, headers=headers, json=files)
+        response = http_client.post(url, headers=headers, json=files)
         status_code = response.status_code
         try:
             original_response = response.json()
@@ -3,7 +3,6 @@ from pathlib import Path
 from time import time
 from typing import Dict
 
-import requests
 from apis.amazon.helpers import check_webhook_result
 
 from edenai_apis.features import ProviderInterface, AudioInterface
@@ -15,6 +14,7 @@ from edenai_apis.features.audio import (
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import (
     AsyncBaseResponseType,
     AsyncLaunchJobResponseType,
@@ -90,7 +90,7 @@ class DeepgramApi(ProviderInterface, AudioInterface):
             if isinstance(value, bool):
                 data_config[key] = str(value).lower()
 
-        response = requests.post(self.url, headers=headers, json=data, params=data_config)
+        response = http_client.post(self.url, headers=headers, json=data, params=data_config)
         result = response.json()
         if response.status_code != 200:
             raise ProviderException(
@@ -6,7 +6,6 @@ from io import BytesIO
 from time import sleep
 from typing import Dict
 
-import requests
 
 from edenai_apis.features.provider.provider_interface import ProviderInterface
 from edenai_apis.features.translation.automatic_translation import (
@@ -19,6 +18,7 @@ from edenai_apis.features.translation.translation_interface import TranslationIn
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import ResponseType
 from edenai_apis.utils.upload_s3 import upload_file_bytes_to_s3, USER_PROCESS
 
@@ -47,7 +47,7 @@ class DeeplApi(ProviderInterface, TranslationInterface):
             "target_lang": target_language,
         }
 
-        response = requests.request("POST", url, headers=self.header, data=data)
+        response = http_client.request("POST", url, headers=self.header, data=data)
         original_response = response.json()
 
         if response.status_code >= 500:
@@ -89,7 +89,7 @@ class DeeplApi(ProviderInterface, TranslationInterface):
         data = {"target_lang": target_language, "source_lang": source_language}
 
         try:
-            response = requests.post(
+            response = http_client.post(
                 f"{self.url}document", headers=self.header, data=data, files=files
             )
         except:
@@ -117,18 +117,18 @@ class DeeplApi(ProviderInterface, TranslationInterface):
 
         doc_key = {"document_key": document_key}
 
-        response = requests.post(
+        response = http_client.post(
             f"{self.url}document/{document_id}", headers=self.header, data=doc_key
         ).json()
         while response["status"] != "done":
-            response = requests.post(
+            response = http_client.post(
                 f"{self.url}document/{document_id}", headers=self.header, data=doc_key
             ).json()
             if response["status"] == "error":
                 raise ProviderException(response["error_message"])
             sleep(0.5)
 
-        response = requests.post(
+        response = http_client.post(
             f"{self.url}document/{document_id}/result",
             headers=self.header,
             data=doc_key,
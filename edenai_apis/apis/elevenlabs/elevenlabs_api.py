@@ -1,17 +1,15 @@
-import base64
-from io import BytesIO
 from typing import Dict
 
-import requests
 
 from edenai_apis.features import AudioInterface
 from edenai_apis.features.audio.text_to_speech.text_to_speech_dataclass import TextToSpeechDataClass
 from edenai_apis.features.provider.provider_interface import ProviderInterface
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
+from edenai_apis.utils.audio import TTS_CHUNK_SIZE, upload_text_to_speech_audio
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import ResponseType
-from edenai_apis.utils.upload_s3 import USER_PROCESS, upload_file_bytes_to_s3
 from .config import voice_ids
 
 
@@ -67,7 +65,7 @@ class ElevenlabsApi(ProviderInterface, AudioInterface):
                 "similarity_boost": 0.5
             }
         }
-        response = requests.post(url, json=data, headers=self.headers)
+        response = http_client.post(url, json=data, headers=self.headers, stream=True)
         
         if response.status_code != 200:
             raise ProviderException(
@@ -75,11 +73,10 @@ class ElevenlabsApi(ProviderInterface, AudioInterface):
                 code = response.status_code
                 )
         
-        audio_content = BytesIO(response.content)
-        audio = base64.b64encode(audio_content.read()).decode("utf-8")
-
-        audio_content.seek(0)
-        resource_url = upload_file_bytes_to_s3(audio_content, ".wav", USER_PROCESS)
+        # stream the audio to s3 instead of loading it in memory
+        audio, resource_url = upload_text_to_speech_audio(
+            response.iter_content(TTS_CHUNK_SIZE), ".wav"
+        )
 
         return ResponseType[TextToSpeechDataClass](
             original_response=audio,
@@ -1,6 +1,5 @@
 from typing import Dict, Sequence
 
-import requests
 
 from edenai_apis.features import TextInterface
 from edenai_apis.features.provider.provider_interface import ProviderInterface
@@ -23,6 +22,7 @@ from edenai_apis.features.text.sentiment_analysis.sentiment_analysis_dataclass i
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
 from edenai_apis.utils.exception import ProviderException, LanguageException
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import ResponseType
 from .emvista_tags import tags
 
@@ -54,7 +54,7 @@ class EmvistaApi(ProviderInterface, TextInterface):
         url = f"{self.base_url}summarizer"
 
         # Send request to API
-        response = requests.post(url, headers=headers, json=files)
+        response = http_client.post(url, headers=headers, json=files)
         original_response = response.json()
 
         status_code = response.status_code
@@ -98,7 +98,7 @@ class EmvistaApi(ProviderInterface, TextInterface):
         url = f"{self.base_url}parser"
 
         # Send request to API
-        response = requests.post(url, headers=headers, json=files)
+        response = http_client.post(url, headers=headers, json=files)
 
         if response.status_code == 201:
             raise ProviderException("Input text is too long", code=response.status_code)
@@ -149,7 +149,7 @@ class EmvistaApi(ProviderInterface, TextInterface):
         url = f"{self.base_url}anonymizer"
 
         # Send request to API
-        response = requests.post(url, headers=headers, json=files)
+        response = http_client.post(url, headers=headers, json=files)
         original_response = response.json()
 
         status_code = response.status_code
@@ -221,7 +221,7 @@ class EmvistaApi(ProviderInterface, TextInterface):
         url = f"{self.base_url}opinions"
 
         # Send request to API
-        response = requests.post(url, headers=headers, json=files)
+        response = http_client.post(url, headers=headers, json=files)
 
         if response.status_code == 201:
             raise ProviderException("Input text is too long", code=response.status_code)
@@ -276,7 +276,7 @@ class EmvistaApi(ProviderInterface, TextInterface):
         url = f"{self.base_url}keywords"
 
         # Send request to API
-        response = requests.post(url, headers=headers, json=files)
+        response = http_client.post(url, headers=headers, json=files)
         original_response = response.json()
 
         status_code = response.status_code
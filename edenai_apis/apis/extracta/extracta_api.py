@@ -6,7 +6,6 @@ from edenai_apis.loaders.loaders import load_provider
 
 import mimetypes
 import base64
-import requests
 
 import json
 from typing import List, Dict, Union
@@ -23,6 +22,7 @@ from edenai_apis.utils.exception import (
     ProviderException,
 )
 
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import (
     AsyncBaseResponseType,
     AsyncLaunchJobResponseType,
@@ -108,7 +108,7 @@ class ExtractaApi(
         }
 
         # call api
-        response = requests.post(
+        response = http_client.post(
             url=self.url + self.uploadFileRoute, headers=headers, data=payload
         )
 
@@ -146,7 +146,7 @@ class ExtractaApi(
         }
 
         # call api
-        response = requests.post(
+        response = http_client.post(
             url=self.url + self.getResultRoute, headers=headers, data=payload
         )
 
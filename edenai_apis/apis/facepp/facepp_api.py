@@ -1,6 +1,5 @@
 from typing import List, Optional
 
-import requests
 
 from edenai_apis.features import ImageInterface, ProviderInterface
 from edenai_apis.features.image.face_compare.face_compare_dataclass import (
@@ -33,6 +32,7 @@ from edenai_apis.features.image.face_recognition.recognize.face_recognition_reco
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import ResponseType
 
 
@@ -47,12 +47,12 @@ class FaceppApi(ProviderInterface, ImageInterface):
 
     def _get_face_tokens(self, file: str, file_url: Optional[str] = None) -> List[str]:
         if file_url:
-            response = requests.post(
+            response = http_client.post(
                 f"{self.base_url}/detect",
                 data={**self.api_settings, "image_url": file_url},
             )
         else:
-            response = requests.post(
+            response = http_client.post(
                 f"{self.base_url}/detect",
                 data=self.api_settings,
                 files={"image_file": open(file, "rb")},
@@ -67,7 +67,7 @@ class FaceppApi(ProviderInterface, ImageInterface):
         self, collection_id: str
     ) -> FaceRecognitionCreateCollectionDataClass:
         payload = {**self.api_settings, "outer_id": collection_id}
-        response = requests.post(f"{self.base_url}/faceset/create", data=payload)
+        response = http_client.post(f"{self.base_url}/faceset/create", data=payload)
         if not response.ok:
             raise ProviderException(response.text, code = response.status_code)
 
@@ -78,7 +78,7 @@ class FaceppApi(ProviderInterface, ImageInterface):
     def image__face_recognition__list_collections(
         self,
     ) -> ResponseType[FaceRecognitionListCollectionsDataClass]:
-        response = requests.post(
+        response = http_client.post(
             f"{self.base_url}/faceset/getfacesets", data=self.api_settings
         )
         if not response.ok:
@@ -98,7 +98,7 @@ class FaceppApi(ProviderInterface, ImageInterface):
     ) -> ResponseType[FaceRecognitionDeleteCollectionDataClass]:
         payload = {**self.api_settings, "outer_id": collection_id, "check_empty": 0}
 
-        response = requests.post(f"{self.base_url}/faceset/delete", data=payload)
+        response = http_client.post(f"{self.base_url}/faceset/delete", data=payload)
         if not response.ok:
             raise ProviderException(response.text, code = response.status_code)
 
@@ -126,7 +126,7 @@ class FaceppApi(ProviderInterface, ImageInterface):
             "face_tokens": ",".join(faces_tokens),
         }
 
-        response = requests.post(f"{self.base_url}/faceset/addface", data=payload)
+        response = http_client.post(f"{self.base_url}/faceset/addface", data=payload)
         if not response.ok:
             raise ProviderException(response.text, code = response.status_code)
 
@@ -143,7 +143,7 @@ class FaceppApi(ProviderInterface, ImageInterface):
     ) -> ResponseType[FaceRecognitionListFacesDataClass]:
         payload = {**self.api_settings, "outer_id": collection_id}
 
-        response = requests.post(f"{self.base_url}/faceset/getdetail", data=payload)
+        response = http_client.post(f"{self.base_url}/faceset/getdetail", data=payload)
         if not response.ok:
             raise ProviderException(response.text, code = response.status_code)
 
@@ -165,7 +165,7 @@ class FaceppApi(ProviderInterface, ImageInterface):
             "face_tokens": face_id,
         }
 
-        response = requests.post(f"{self.base_url}/faceset/removeface", data=payload)
+        response = http_client.post(f"{self.base_url}/faceset/removeface", data=payload)
         if not response.ok:
             raise ProviderException(response.text, code = response.status_code)
 
@@ -184,11 +184,11 @@ class FaceppApi(ProviderInterface, ImageInterface):
             "outer_id": collection_id,
         }
         if file_url:
-            response = requests.post(
+            response = http_client.post(
                 f"{self.base_url}/search", data={"image_url": file_url, **payload}
             )
         else:
-            response = requests.post(
+            response = http_client.post(
                 f"{self.base_url}/search",
                 data=payload,
                 files={"image_file": open(file, "rb")},
@@ -220,9 +220,9 @@ class FaceppApi(ProviderInterface, ImageInterface):
                 "image_url1": file1_url,
                 "image_url2": file2_url,
             }
-            response = requests.post(url, data=payload)
+            response = http_client.post(url, data=payload)
         else:
-            response = requests.post(
+            response = http_client.post(
                 url=url,
                 data=self.api_settings,
                 files={
@@ -3,7 +3,6 @@ from pathlib import Path
 from time import time
 from typing import Dict
 
-import requests
 
 from edenai_apis.features import ProviderInterface, AudioInterface
 from edenai_apis.features.audio import SpeechDiarizationEntry, SpeechDiarization
@@ -13,6 +12,7 @@ from edenai_apis.features.audio.speech_to_text_async.speech_to_text_async_datacl
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http import async_http_client, http_client
 from edenai_apis.utils.types import (
     AsyncBaseResponseType,
     AsyncLaunchJobResponseType,
@@ -64,7 +64,7 @@ class GladiaApi(ProviderInterface, AudioInterface):
         if language:
             data.update({"detect_language": False, "language": language})
         data.update(provider_params)
-        response = requests.post(self.url, headers=headers, json=data)
+        response = http_client.post(self.url, headers=headers, json=data)
         if response.status_code != 201:
             raise ProviderException(message=response.text, code=response.status_code)
         try:
@@ -81,7 +81,23 @@ class GladiaApi(ProviderInterface, AudioInterface):
         if not provider_job_id:
             raise ProviderException("Job id None or empty!")
         headers = {"x-gladia-key": self.api_key, "accept": "application/json"}
-        response = requests.get(self.url + provider_job_id, headers=headers)
+        response = http_client.get(self.url + provider_job_id, headers=headers)
+        return self.__get_job_result(provider_job_id, response)
+
+    async def _async_audio__speech_to_text_async__get_job_result(
+        self, provider_job_id: str
+    ) -> AsyncBaseResponseType[SpeechToTextAsyncDataClass]:
+        if not provider_job_id:
+            raise ProviderException("Job id None or empty!")
+        headers = {"x-gladia-key": self.api_key, "accept": "application/json"}
+        response = await async_http_client.get(
+            self.url + provider_job_id, headers=headers
+        )
+        return self.__get_job_result(provider_job_id, response)
+
+    def __get_job_result(
+        self, provider_job_id: str, response
+    ) -> AsyncBaseResponseType[SpeechToTextAsyncDataClass]:
         print(response.text)
         if response.status_code != 200:
             raise ProviderException(message=response.text, code=response.status_code)
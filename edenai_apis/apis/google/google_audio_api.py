@@ -1,5 +1,3 @@
-import base64
-from io import BytesIO
 from pathlib import Path
 from time import time
 from typing import List, Optional
@@ -22,6 +20,7 @@ from edenai_apis.features.audio.speech_to_text_async.speech_to_text_async_datacl
 from edenai_apis.features.audio.text_to_speech.text_to_speech_dataclass import (
     TextToSpeechDataClass,
 )
+from edenai_apis.utils.audio import upload_text_to_speech_audio
 from edenai_apis.utils.exception import LanguageException, ProviderException
 from edenai_apis.utils.ssml import is_ssml
 from edenai_apis.utils.types import (
@@ -31,7 +30,7 @@ from edenai_apis.utils.types import (
     AsyncResponseType,
     ResponseType,
 )
-from edenai_apis.utils.upload_s3 import USER_PROCESS, upload_file_bytes_to_s3
+from edenai_apis.utils.upload_staging import GCSStagingBackend, stage_file
 
 
 class GoogleAudioApi(AudioInterface):
@@ -85,12 +84,9 @@ class GoogleAudioApi(AudioInterface):
         }
         response = handle_google_call(client.synthesize_speech, **payload)
 
-        audio_content = BytesIO(response.audio_content)
-
-        audio = base64.b64encode(audio_content.read()).decode("utf-8")
-
-        audio_content.seek(0)
-        resource_url = upload_file_bytes_to_s3(audio_content, f".{ext}", USER_PROCESS)
+        audio, resource_url = upload_text_to_speech_audio(
+            [response.audio_content], f".{ext}"
+        )
 
         standardized_response = TextToSpeechDataClass(
             audio=audio, voice_type=voice_type, audio_resource_url=resource_url
@@ -118,15 +114,20 @@ class GoogleAudioApi(AudioInterface):
         if not language:
             raise LanguageException("Language not provided")
 
-        audio_name = str(int(time())) + Path(file).stem + "." + export_format
-        # Upload file to google cloud
+        # Upload file to google cloud, once for the same content
         storage_client: storage.Client = self.clients["storage"]
         bucket_name = "audios-speech2text"
-        bucket = storage_client.get_bucket(bucket_name)
-        blob = bucket.blob(audio_name)
-        blob.upload_from_filename(file)
-
-        gcs_uri = f"gs://{bucket_name}/{audio_name}"
+        gcs_uri = stage_file(
+            file,
+            Path(file).stem + "." + export_format,
+            GCSStagingBackend(storage_client, bucket_name),
+        )
+        if gcs_uri is None:
+            audio_name = str(int(time())) + Path(file).stem + "." + export_format
+            bucket = storage_client.get_bucket(bucket_name)
+            blob = bucket.blob(audio_name)
+            blob.upload_from_filename(file)
+            gcs_uri = f"gs://{bucket_name}/{audio_name}"
         # Launch file transcription
         client = SpeechClient()
 
@@ -3,7 +3,6 @@ import json
 from typing import Sequence, Optional, BinaryIO, Dict
 
 import numpy as np
-import requests
 from PIL import Image as Img, UnidentifiedImageError
 from google.cloud import vision
 from google.cloud.vision_v1.types.image_annotator import AnnotateImageResponse
@@ -54,6 +53,7 @@ from edenai_apis.features.image.object_detection.object_detection_dataclass impo
 )
 from edenai_apis.features.image.question_answer import QuestionAnswerDataClass
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import ResponseType
 
 
@@ -407,7 +407,7 @@ class GoogleImageApi(ImageInterface):
             },
         }
 
-        response = requests.post(url, json=payload, headers=headers)
+        response = http_client.post(url, json=payload, headers=headers)
 
         try:
             original_response = response.json()
@@ -467,7 +467,7 @@ class GoogleImageApi(ImageInterface):
             },
         }
 
-        response = requests.post(url, json=payload, headers=header)
+        response = http_client.post(url, json=payload, headers=header)
 
         try:
             original_response = response.json()
@@ -39,7 +39,7 @@ from edenai_apis.features.text.named_entity_recognition.named_entity_recognition
     InfosNamedEntityRecognitionDataClass,
     NamedEntityRecognitionDataClass,
 )
-from edenai_apis.features.text.search import InfosSearchDataClass, SearchDataClass
+from edenai_apis.features.text.search import SearchDataClass
 from edenai_apis.features.text.sentiment_analysis.sentiment_analysis_dataclass import (
     SegmentSentimentAnalysisDataClass,
     SentimentAnalysisDataClass,
@@ -54,8 +54,12 @@ from edenai_apis.features.text.topic_extraction.topic_extraction_dataclass impor
     TopicExtractionDataClass,
 )
 from edenai_apis.utils.conversion import standardized_confidence_score
+from edenai_apis.utils.embeddings import batched_embeddings
+from edenai_apis.utils.embeddings_cache import cached_embeddings
 from edenai_apis.utils.exception import ProviderException
-from edenai_apis.utils.metrics import METRICS
+from edenai_apis.utils.http import http_client
+from edenai_apis.utils.metrics import rank_documents
+from edenai_apis.utils.streaming import iter_json_array
 from edenai_apis.utils.types import ResponseType
 
 
@@ -269,7 +273,7 @@ class GoogleTextApi(TextInterface):
             },
         }
 
-        response = requests.post(url=url, headers=headers, json=payload)
+        response = http_client.post(url=url, headers=headers, json=payload)
 
         try:
             original_response = response.json()[0]
@@ -322,7 +326,7 @@ class GoogleTextApi(TextInterface):
                     "maxOutputTokens": max_tokens,
                 },
             }
-            response = requests.post(url=url, headers=headers, json=payload)
+            response = http_client.post(url=url, headers=headers, json=payload)
             original_response = response.json()
             if "error" in original_response:
                 raise ProviderException(
@@ -422,48 +426,28 @@ class GoogleTextApi(TextInterface):
         Yields:
             Generator: generator of messages
         """
-        bytes_data = b""
         yield ChatStreamResponse(
             text="",
             blocked=False,
             provider="google",
         )
-        for raw in response.iter_lines():
-            if raw.decode() == ",":
-                try:
-                    res = json.loads(bytes_data.decode())
-                    yield ChatStreamResponse(
-                        text=res["outputs"][0]["structVal"]["candidates"]["listVal"][0][
-                            "structVal"
-                        ]["content"]["stringVal"][0],
-                        blocked=res["outputs"][0]["structVal"]["safetyAttributes"][
-                            "listVal"
-                        ][0]["structVal"]["blocked"]["boolVal"][0],
-                        provider="google",
-                    )
-                except:
-                    return
-                bytes_data = b""
-                continue
-            if raw.decode() == "[{":
-                bytes_data += b"{"
-            else:
-                bytes_data += raw
-        if bytes_data:
-            try:
-                res = json.loads(bytes_data.decode()[: len(bytes_data.decode()) - 1])
+        predictions = iter_json_array(response)
+        try:
+            for res in predictions:
+                output = res["outputs"][0]["structVal"]
                 yield ChatStreamResponse(
-                    text=res["outputs"][0]["structVal"]["candidates"]["listVal"][0][
-                        "structVal"
-                    ]["content"]["stringVal"][0],
-                    blocked=res["outputs"][0]["structVal"]["safetyAttributes"][
-                        "listVal"
-                    ][0]["structVal"]["blocked"]["boolVal"][0],
+                    text=output["candidates"]["listVal"][0]["structVal"]["content"][
+                        "stringVal"
+                    ][0],
+                    blocked=output["safetyAttributes"]["listVal"][0]["structVal"][
+                        "blocked"
+                    ]["boolVal"][0],
                     provider="google",
                 )
-            except:
-                return
-        response.close()
+        except (ProviderException, LookupError, TypeError):
+            return
+        finally:
+            predictions.close()
 
     def text__chat(
         self,
@@ -494,7 +478,7 @@ class GoogleTextApi(TextInterface):
                 max_tokens,
                 context,
             )
-            response = requests.post(
+            response = http_client.post(
                 url=f"{url}:predict", headers=headers, json=payload
             )
             original_response = response.json()
@@ -530,12 +514,14 @@ class GoogleTextApi(TextInterface):
                 context,
             )
 
-            response = requests.post(
+            response = http_client.post(
                 url=f"{url}:serverStreamingPredict",
                 headers=headers,
                 json=payload,
                 stream=True,
             )
+            if response.status_code != 200:
+                raise ProviderException(response.text, code=response.status_code)
 
             response = self.__text_chat_stream_generator(response)
 
@@ -544,6 +530,8 @@ class GoogleTextApi(TextInterface):
                 standardized_response=StreamChat(stream=response),
             )
 
+    @cached_embeddings
+    @batched_embeddings
     def text__embeddings(
         self, texts: List[str], model: str
     ) -> ResponseType[EmbeddingsDataClass]:
@@ -560,7 +548,7 @@ class GoogleTextApi(TextInterface):
         for text in texts:
             instances.append({"content": text})
         payload = {"instances": instances}
-        response = requests.post(url=url, headers=headers, json=payload)
+        response = http_client.post(url=url, headers=headers, json=payload)
         original_response = response.json()
         if "error" in original_response:
             raise ProviderException(
@@ -600,7 +588,7 @@ class GoogleTextApi(TextInterface):
             ],
             "parameters": {"temperature": temperature, "maxOutputTokens": max_tokens},
         }
-        response = requests.post(url=url, headers=headers, json=payload)
+        response = http_client.post(url=url, headers=headers, json=payload)
         original_response = response.json()
         print("THe original response is\n\n", original_response)
         if "error" in original_response:
@@ -724,6 +712,7 @@ class GoogleTextApi(TextInterface):
             "cosine", "hamming", "manhattan", "euclidean"
         ] = "cosine",
         model: str = None,
+        top_k: Optional[int] = None,
     ) -> ResponseType[SearchDataClass]:
         if len(texts) > 5:
             raise ProviderException(
@@ -731,35 +720,20 @@ class GoogleTextApi(TextInterface):
             )
         if model is None:
             model = "768__textembedding-gecko"
-        # Import the function
-        function_score = METRICS[similarity_metric]
-
         # Embed the texts & query
-        texts_embed_response = GoogleTextApi.text__embeddings(
-            self, texts=texts, model=model
-        ).original_response
-        query_embed_response = GoogleTextApi.text__embeddings(
-            self, texts=[query], model=model
-        ).original_response
-
-        # Extracts embeddings from texts & query
-        texts_embed = [
-            item["embeddings"]["values"] for item in texts_embed_response["predictions"]
-        ]
-        query_embed = query_embed_response["predictions"][0]["embeddings"]["values"]
-
-        items = []
-        # Calculate score for each text index
-        for index, text in enumerate(texts_embed):
-            score = function_score(query_embed, text)
-            items.append(
-                InfosSearchDataClass(
-                    object="search_result", document=index, score=score
-                )
-            )
-
-        # Sort items by score in descending order
-        sorted_items = sorted(items, key=lambda x: x.score, reverse=True)
+        texts_embed = GoogleTextApi.text__embeddings(self, texts=texts, model=model)
+        query_embed = GoogleTextApi.text__embeddings(self, texts=[query], model=model)
+        texts_embed_response = texts_embed.original_response
+        query_embed_response = query_embed.original_response
+
+        # Extracts embeddings from texts & query (embeddings may come from the cache)
+        texts_embed = [item.embedding for item in texts_embed.standardized_response.items]
+        query_embed = query_embed.standardized_response.items[0].embedding
+
+        # Score all texts at once and keep the best ones, sorted by score
+        sorted_items = rank_documents(
+            query_embed, texts_embed, similarity_metric, top_k=top_k
+        )
 
         # Build the original response
         original_response = {
@@ -64,6 +64,7 @@ from edenai_apis.utils.types import (
     AsyncPendingResponseType,
     AsyncResponseType,
 )
+from edenai_apis.utils.upload_staging import GCSStagingBackend, stage_file
 
 
 class GoogleVideoApi(VideoInterface):
@@ -76,14 +77,21 @@ class GoogleVideoApi(VideoInterface):
         storage_client = self.clients["storage"]
         bucket_name = "audios-speech2text"
         file_extension = file.split(".")[-1]
-        file_name = str(int(time())) + Path(file).stem + "_video_." + file_extension
 
-        # Upload video to GCS
-        bucket = storage_client.get_bucket(bucket_name)
-        blob = bucket.blob(file_name)
-
-        blob.upload_from_filename(file)
-        gcs_uri = f"gs://{bucket_name}/{file_name}"
+        # Upload video to GCS, once for the same content
+        gcs_uri = stage_file(
+            file,
+            "video." + file_extension,
+            GCSStagingBackend(storage_client, bucket_name),
+        )
+        if gcs_uri is None:
+            file_name = (
+                str(int(time())) + Path(file).stem + "_video_." + file_extension
+            )
+            bucket = storage_client.get_bucket(bucket_name)
+            blob = bucket.blob(file_name)
+            blob.upload_from_filename(file)
+            gcs_uri = f"gs://{bucket_name}/{file_name}"
 
         # Configure the request for each feature
         features = {
@@ -1,7 +1,6 @@
 from asyncio import sleep
 from typing import Dict, List, Optional
 
-import requests
 
 from edenai_apis.features import ProviderInterface, TextInterface, TranslationInterface
 from edenai_apis.features.text import SummarizeDataClass, QuestionAnswerDataClass
@@ -10,6 +9,7 @@ from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
 from edenai_apis.utils.conversion import concatenate_params_in_url
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import ResponseType
 
 
@@ -28,7 +28,7 @@ class HuggingfaceApi(ProviderInterface, TextInterface, TranslationInterface):
         }
 
     def _post(self, url: str, inputs: dict):
-        res = requests.post(url, headers=self.headers, json={"inputs": inputs})
+        res = http_client.post(url, headers=self.headers, json={"inputs": inputs})
         if res.status_code >= 500:
             raise ProviderException(
                 message="Internal Server Error", code=res.status_code
@@ -1,5 +1,3 @@
-import base64
-from io import BytesIO
 from typing import List, Optional
 
 from edenai_apis.apis.ibm.ibm_helpers import (
@@ -14,6 +12,7 @@ from edenai_apis.features.audio import (
     TextToSpeechDataClass,
 )
 from edenai_apis.features.audio.audio_interface import AudioInterface
+from edenai_apis.utils.audio import upload_text_to_speech_audio
 from edenai_apis.utils.exception import (
     ProviderException,
 )
@@ -24,7 +23,6 @@ from edenai_apis.utils.types import (
     AsyncResponseType,
     ResponseType,
 )
-from edenai_apis.utils.upload_s3 import USER_PROCESS, upload_file_bytes_to_s3
 
 
 class IbmAudioApi(AudioInterface):
@@ -57,13 +55,9 @@ class IbmAudioApi(AudioInterface):
         request = handle_ibm_call(self.clients["texttospeech"].synthesize, **params)
         response = handle_ibm_call(request.get_result)
 
-        audio_content = BytesIO(response.content)
-        audio = base64.b64encode(audio_content.read()).decode("utf-8")
+        audio, resource_url = upload_text_to_speech_audio([response.content], f".{ext}")
         voice_type = 1
 
-        audio_content.seek(0)
-        resource_url = upload_file_bytes_to_s3(audio_content, f".{ext}", USER_PROCESS)
-
         standardized_response = TextToSpeechDataClass(
             audio=audio, voice_type=voice_type, audio_resource_url=resource_url
         )
@@ -1,7 +1,6 @@
 import json
 from typing import Dict, Sequence
 
-import requests
 
 from edenai_apis.features import ProviderInterface, TextInterface
 from edenai_apis.features.text import (
@@ -18,6 +17,7 @@ from edenai_apis.features.text.sentiment_analysis.sentiment_analysis_dataclass i
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import ResponseType
 from .lettria_tags import tags
 
@@ -38,7 +38,7 @@ class LettriaApi(ProviderInterface, TextInterface):
     def text__named_entity_recognition(
         self, language: str, text: str
     ) -> ResponseType[NamedEntityRecognitionDataClass]:
-        original_response = requests.post(
+        original_response = http_client.post(
             url=self.url, headers=self.headers, json={"text": text}
         )
         try:
@@ -77,7 +77,7 @@ class LettriaApi(ProviderInterface, TextInterface):
         self, language: str, text: str
     ) -> ResponseType[SentimentAnalysisDataClass]:
         try:
-            original_response = requests.post(
+            original_response = http_client.post(
                 url=self.url, headers=self.headers, json={"text": text}
             ).json()
         except json.JSONDecodeError:
@@ -116,7 +116,7 @@ class LettriaApi(ProviderInterface, TextInterface):
         self, language: str, text: str
     ) -> ResponseType[SyntaxAnalysisDataClass]:
         try:
-            original_response = requests.post(
+            original_response = http_client.post(
                 url=self.url, headers=self.headers, json={"text": text}
             ).json()
         except:
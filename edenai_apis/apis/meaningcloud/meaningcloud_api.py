@@ -1,11 +1,11 @@
 from typing import Dict
 
-import requests
 
 from edenai_apis.features import ProviderInterface, TextInterface
 from edenai_apis.features.text import SummarizeDataClass
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import ResponseType
 
 
@@ -27,7 +27,7 @@ class MeaningcloudApi(ProviderInterface, TextInterface):
             "txt": text,
             "sentences": output_sentences,
         }
-        response = requests.post(self.url, data=data)
+        response = http_client.post(self.url, data=data)
 
         original_response = response.json()
 
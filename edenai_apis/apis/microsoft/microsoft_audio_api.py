@@ -1,11 +1,8 @@
-import base64
 import json
-from io import BytesIO
 from pathlib import Path
 from typing import List, Optional
 
 import azure.cognitiveservices.speech as speechsdk
-import requests
 
 from edenai_apis.apis.microsoft.microsoft_helpers import (
     generate_right_ssml_text,
@@ -18,6 +15,7 @@ from edenai_apis.features.audio import (
     TextToSpeechDataClass,
 )
 from edenai_apis.features.audio.audio_interface import AudioInterface
+from edenai_apis.utils.audio import upload_text_to_speech_audio
 from edenai_apis.utils.conversion import convert_pt_date_from_string
 from edenai_apis.utils.exception import (
     AsyncJobException,
@@ -25,6 +23,7 @@ from edenai_apis.utils.exception import (
     LanguageException,
     ProviderException,
 )
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.ssml import is_ssml
 from edenai_apis.utils.types import (
     AsyncBaseResponseType,
@@ -33,11 +32,7 @@ from edenai_apis.utils.types import (
     AsyncResponseType,
     ResponseType,
 )
-from edenai_apis.utils.upload_s3 import (
-    USER_PROCESS,
-    upload_file_bytes_to_s3,
-    upload_file_to_s3,
-)
+from edenai_apis.utils.upload_s3 import upload_file_to_s3
 
 
 class MicrosoftAudioApi(AudioInterface):
@@ -83,13 +78,9 @@ class MicrosoftAudioApi(AudioInterface):
             cancellation_details = response.cancellation_details
             raise ProviderException(str(cancellation_details.error_details))
 
-        audio_content = BytesIO(response.audio_data)
-        audio = base64.b64encode(audio_content.read()).decode("utf-8")
+        audio, resource_url = upload_text_to_speech_audio([response.audio_data], f".{ext}")
         voice_type = 1
 
-        audio_content.seek(0)
-        resource_url = upload_file_bytes_to_s3(audio_content, f".{ext}", USER_PROCESS)
-
         standardized_response = TextToSpeechDataClass(
             audio=audio, voice_type=voice_type, audio_resource_url=resource_url
         )
@@ -144,7 +135,7 @@ class MicrosoftAudioApi(AudioInterface):
         #     config["properties"]["profanityFilterMode"] = "Removed"
 
         config.update(provider_params)
-        response = requests.post(
+        response = http_client.post(
             url=self.url["speech"], headers=headers, data=json.dumps(config)
         )
         if response.status_code == 201:
@@ -158,7 +149,7 @@ class MicrosoftAudioApi(AudioInterface):
         self, provider_job_id: str
     ) -> AsyncBaseResponseType[SpeechToTextAsyncDataClass]:
         headers = self.headers["speech"]
-        response = requests.get(
+        response = http_client.get(
             url=f'{self.url["speech"]}/{provider_job_id}/files', headers=headers
         )
         original_response = None
@@ -174,7 +165,7 @@ class MicrosoftAudioApi(AudioInterface):
                 diarization_entries = []
                 speakers = set()
                 for file_url in files_urls:
-                    response = requests.get(file_url, headers=headers)
+                    response = http_client.get(file_url, headers=headers)
                     original_response = response.json()
                     if response.status_code != 200:
                         error = original_response.get("message")
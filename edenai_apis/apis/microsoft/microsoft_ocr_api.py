@@ -1,7 +1,6 @@
 from collections import defaultdict
 from typing import Sequence
 
-import requests
 from PIL import Image as Img
 from azure.ai.formrecognizer import DocumentAnalysisClient
 from azure.core.credentials import AzureKeyCredential
@@ -50,6 +49,7 @@ from edenai_apis.utils.exception import (
     AsyncJobExceptionReason,
     ProviderException,
 )
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import (
     AsyncBaseResponseType,
     AsyncLaunchJobResponseType,
@@ -71,7 +71,7 @@ class MicrosoftOcrApi(OcrInterface):
 
         url = f"{self.api_settings['vision']['url']}/ocr?detectOrientation=true"
 
-        request = requests.post(
+        request = http_client.post(
             url=add_query_param_in_url(url, {"language": language}),
             headers=self.headers["vision"],
             data=file_content,
@@ -370,7 +370,7 @@ class MicrosoftOcrApi(OcrInterface):
         )
         url = add_query_param_in_url(url, {"locale": language})
 
-        response = requests.post(
+        response = http_client.post(
             url,
             headers={
                 "Content-Type": "application/octet-stream",
@@ -404,7 +404,7 @@ class MicrosoftOcrApi(OcrInterface):
             + f"formrecognizer/documentModels/prebuilt-layout/"
             f"analyzeResults/{job_id}?api-version=2022-08-31"
         )
-        response = requests.get(url, headers=headers)
+        response = http_client.get(url, headers=headers)
 
         if response.status_code >= 400:
             error = response.json()["error"]["message"]
@@ -440,7 +440,7 @@ class MicrosoftOcrApi(OcrInterface):
             f"{get_microsoft_urls()['form_recognizer']}formrecognizer/documentModels/"
             f"prebuilt-layout:analyze?api-version=2023-07-31"
         )
-        response = requests.post(
+        response = http_client.post(
             url,
             headers={
                 "Content-Type": "application/octet-stream",
@@ -471,7 +471,7 @@ class MicrosoftOcrApi(OcrInterface):
             + f"formrecognizer/documentModels/prebuilt-layout/"
             f"analyzeResults/{provider_job_id}?api-version=2023-07-31"
         )
-        response = requests.get(url, headers=headers)
+        response = http_client.get(url, headers=headers)
 
         if response.status_code >= 400:
             error = response.json()["error"]["message"]
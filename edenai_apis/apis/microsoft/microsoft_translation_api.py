@@ -1,6 +1,5 @@
 from typing import Sequence
 
-import requests
 
 from edenai_apis.features.translation import (
     AutomaticTranslationDataClass,
@@ -10,6 +9,7 @@ from edenai_apis.features.translation import (
 from edenai_apis.features.translation.translation_interface import TranslationInterface
 from edenai_apis.utils.conversion import add_query_param_in_url
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.languages import get_language_name_from_code
 from edenai_apis.utils.types import ResponseType
 
@@ -18,7 +18,7 @@ class MicrosoftTranslationApi(TranslationInterface):
     def translation__language_detection(
         self, text
     ) -> ResponseType[LanguageDetectionDataClass]:
-        response = requests.post(
+        response = http_client.post(
             url=f"{self.url['text']}",
             headers=self.headers["text"],
             json={
@@ -73,7 +73,7 @@ class MicrosoftTranslationApi(TranslationInterface):
             }
         ]
         # Getting response of API
-        response = requests.post(url, headers=self.headers["translator"], json=body)
+        response = http_client.post(url, headers=self.headers["translator"], json=body)
         data = response.json()
 
         if response.status_code >= 400:
@@ -2,7 +2,6 @@ from collections import defaultdict
 from io import BufferedReader
 from typing import Dict, Optional, Sequence, TypeVar
 
-import requests
 
 from edenai_apis.apis.mindee.mindee_ocr_normalizer import mindee_financial_parser
 from edenai_apis.features import ProviderInterface, OcrInterface
@@ -47,6 +46,7 @@ from edenai_apis.utils.conversion import (
     convert_string_to_number,
 )
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import ResponseType
 
 ParamsApi = TypeVar("ParamsApi")
@@ -96,7 +96,7 @@ class MindeeApi(ProviderInterface, OcrInterface):
     ) -> ResponseType[ReceiptParserDataClass]:
         file_ = open(file, "rb")
         args = self._get_api_attributes(file_, language)
-        response = requests.post(
+        response = http_client.post(
             self.url_receipt,
             headers=args["headers"],
             files=args["files"],
@@ -196,7 +196,7 @@ class MindeeApi(ProviderInterface, OcrInterface):
         file_ = open(file, "rb")
         files = {"document": file_}
         params = {"locale": {"language": language}}
-        response = requests.post(self.url, headers=headers, files=files, params=params)
+        response = http_client.post(self.url, headers=headers, files=files, params=params)
         original_response = response.json()
 
         file_.close()
@@ -354,7 +354,7 @@ class MindeeApi(ProviderInterface, OcrInterface):
         file_ = open(file, "rb")
         args = self._get_api_attributes(file_)
 
-        response = requests.post(
+        response = http_client.post(
             url=self.url_identity, files=args["files"], headers=args["headers"]
         )
 
@@ -461,7 +461,7 @@ class MindeeApi(ProviderInterface, OcrInterface):
         files = {"document": file_}
 
         try:
-            response = requests.post(self.url_bank_check, headers=headers, files=files)
+            response = http_client.post(self.url_bank_check, headers=headers, files=files)
         except:
             raise ProviderException(
                 "Something went wrong when calling this feautre!!", code=500
@@ -532,7 +532,7 @@ class MindeeApi(ProviderInterface, OcrInterface):
         file_ = open(file, "rb")
         files = {"document": file_}
         params = {"locale": {"language": language}}
-        response = requests.post(
+        response = http_client.post(
             self.url_financial, headers=headers, files=files, params=params
         )
         original_response = response.json()
@@ -1,6 +1,5 @@
 from typing import Dict, List, Optional, Union, Generator
 import requests
-import json
 
 from edenai_apis.features import ProviderInterface, TextInterface
 from edenai_apis.features.text import ChatDataClass, ChatMessageDataClass
@@ -11,7 +10,13 @@ from edenai_apis.features.text.generation.generation_dataclass import (
 )
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
+from edenai_apis.utils.embeddings import batched_embeddings
+from edenai_apis.utils.embeddings_cache import cached_embeddings
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http import async_http_client, http_client
+from edenai_apis.utils.llm_cache import cached_llm_response
+from edenai_apis.utils.llm_engine import llm_request
+from edenai_apis.utils.streaming import iter_sse_json
 from edenai_apis.utils.types import ResponseType
 
 
@@ -19,6 +24,7 @@ class MistralApi(ProviderInterface, TextInterface):
     provider_name = "mistral"
 
     def __init__(self, api_keys: Dict = {}) -> None:
+        self.api_keys = api_keys
         self.api_settings = load_provider(
             ProviderDataEnum.KEY, self.provider_name, api_keys=api_keys
         )
@@ -35,21 +41,40 @@ class MistralApi(ProviderInterface, TextInterface):
         Yields:
             Generator: generator of messages
         """
-        for res in response.iter_lines():
-            chunk = res.decode().split("data: ")
-            if len(chunk) > 1:
-                if chunk[1] != "[DONE]":
-                    data = json.loads(chunk[1])
-                    yield ChatStreamResponse(
-                        text=data["choices"][0]["delta"]["content"],
-                        blocked=not data["choices"][0].get("finish_reason")
-                        in (None, "stop"),
-                        provider=self.provider_name,
-                    )
+        for data in iter_sse_json(response):
+            yield ChatStreamResponse(
+                text=data["choices"][0]["delta"]["content"],
+                blocked=not data["choices"][0].get("finish_reason") in (None, "stop"),
+                provider=self.provider_name,
+            )
 
+    @cached_llm_response
+    @llm_request
     def text__generation(
         self, text: str, temperature: float, max_tokens: int, model: str
     ) -> ResponseType[GenerationDataClass]:
+        response = http_client.post(
+            self.url + "v1/chat/completions",
+            json=self.__generation_payload(text, temperature, max_tokens, model),
+            headers=self.headers,
+        )
+        return self.__generation_response(response)
+
+    @cached_llm_response
+    @llm_request
+    async def _async_text__generation(
+        self, text: str, temperature: float, max_tokens: int, model: str
+    ) -> ResponseType[GenerationDataClass]:
+        response = await async_http_client.post(
+            self.url + "v1/chat/completions",
+            json=self.__generation_payload(text, temperature, max_tokens, model),
+            headers=self.headers,
+        )
+        return self.__generation_response(response)
+
+    def __generation_payload(
+        self, text: str, temperature: float, max_tokens: int, model: str
+    ) -> Dict:
         messages = [
             {
                 "role": "system",
@@ -64,9 +89,9 @@ class MistralApi(ProviderInterface, TextInterface):
             "temperature": temperature,
             "max_tokens": max_tokens,
         }
-        response = requests.post(
-            self.url + "v1/chat/completions", json=payload, headers=self.headers
-        )
+        return payload
+
+    def __generation_response(self, response) -> ResponseType[GenerationDataClass]:
         try:
             original_response = response.json()
             if "message" in original_response or response.status_code >= 400:
@@ -87,6 +112,8 @@ class MistralApi(ProviderInterface, TextInterface):
             standardized_response=GenerationDataClass(generated_text=generated_text),
         )
 
+    @cached_llm_response
+    @llm_request
     def text__chat(
         self,
         text: str,
@@ -116,7 +143,7 @@ class MistralApi(ProviderInterface, TextInterface):
             "max_tokens": max_tokens,
         }
         if not stream:
-            response = requests.post(
+            response = http_client.post(
                 self.url + "v1/chat/completions", json=payload, headers=self.headers
             )
             try:
@@ -151,24 +178,28 @@ class MistralApi(ProviderInterface, TextInterface):
             )
         else:
             payload["stream"] = True
-            response = requests.post(
+            response = http_client.post(
                 self.url + "v1/chat/completions",
                 json=payload,
                 headers=self.headers,
                 stream=True,
             )
+            if response.status_code >= 400:
+                raise ProviderException(response.text, code=response.status_code)
             response = self.__get_stream_response(response)
             return ResponseType[StreamChat](
                 original_response=None,
                 standardized_response=StreamChat(stream=response),
             )
 
+    @cached_embeddings
+    @batched_embeddings
     def text__embeddings(
         self, texts: List[str], model: str
     ) -> ResponseType[EmbeddingsDataClass]:
         model = model.split("__")[1]
         payload = {"model": model, "input": texts}
-        response = requests.post(
+        response = http_client.post(
             url=self.url + "v1/embeddings", json=payload, headers=self.headers
         )
         try:
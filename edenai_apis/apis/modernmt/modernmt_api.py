@@ -1,6 +1,5 @@
 from typing import Dict, Sequence
 
-import requests
 
 from edenai_apis.features import ProviderInterface, TranslationInterface
 from edenai_apis.features.translation import (
@@ -11,6 +10,7 @@ from edenai_apis.features.translation import (
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.languages import get_language_name_from_code
 from edenai_apis.utils.types import ResponseType
 
@@ -28,7 +28,7 @@ class ModernmtApi(ProviderInterface, TranslationInterface):
     def translation__language_detection(
         self, text
     ) -> ResponseType[LanguageDetectionDataClass]:
-        response = requests.get(
+        response = http_client.get(
             url=f"{self.url}/detect", headers=self.header, data={"q": text}
         )
 
@@ -64,7 +64,7 @@ class ModernmtApi(ProviderInterface, TranslationInterface):
         }
 
         # Api output
-        output = requests.get(self.url, headers=self.header, data=data)
+        output = http_client.get(self.url, headers=self.header, data=data)
         response = output.json()
 
         # Handle error
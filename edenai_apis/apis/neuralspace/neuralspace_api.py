@@ -1,6 +1,5 @@
 from typing import Dict, List, Optional, Sequence
 
-import requests
 
 from edenai_apis.features import ProviderInterface, TextInterface, TranslationInterface
 from edenai_apis.features.audio.speech_to_text_async import (
@@ -23,6 +22,7 @@ from edenai_apis.utils.exception import (
     AsyncJobExceptionReason,
     ProviderException,
 )
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.languages import get_language_name_from_code
 from edenai_apis.utils.types import (
     AsyncBaseResponseType,
@@ -56,7 +56,7 @@ class NeuralSpaceApi(ProviderInterface, TextInterface, TranslationInterface):
 
         files = {"text": text, "language": language}
 
-        response = requests.request("POST", url, json=files, headers=self.header)
+        response = http_client.request("POST", url, json=files, headers=self.header)
         if response.status_code != 200:
             if not response.json().get("success"):
                 raise ProviderException(
@@ -101,7 +101,7 @@ class NeuralSpaceApi(ProviderInterface, TextInterface, TranslationInterface):
             "targetLanguage": target_language,
         }
 
-        response = requests.request("POST", url, json=files, headers=self.header)
+        response = http_client.request("POST", url, json=files, headers=self.header)
         original_resoonse = response.json()
 
         data = original_resoonse["data"]
@@ -123,7 +123,7 @@ class NeuralSpaceApi(ProviderInterface, TextInterface, TranslationInterface):
         url = f"{self.url}language-detection/v1/detect"
         files = {"text": text}
 
-        response = requests.request("POST", url, json=files, headers=self.header)
+        response = http_client.request("POST", url, json=files, headers=self.header)
 
         original_response = response.json()
         if response.status_code != 200:
@@ -171,7 +171,7 @@ class NeuralSpaceApi(ProviderInterface, TextInterface, TranslationInterface):
         file_ = open(file, "rb")
         files = {"files": file_}
 
-        response = requests.post(url=url_file_upload, headers=headers, files=files)
+        response = http_client.post(url=url_file_upload, headers=headers, files=files)
 
         file_.close()
         if response.status_code != 200:
@@ -195,7 +195,7 @@ class NeuralSpaceApi(ProviderInterface, TextInterface, TranslationInterface):
             )
         payload.update(provider_params)
 
-        response = requests.post(url=url_file_transcribe, headers=headers, data=payload)
+        response = http_client.post(url=url_file_transcribe, headers=headers, data=payload)
         original_response = response.json()
         if response.status_code != 201:
             raise ProviderException(
@@ -212,7 +212,7 @@ class NeuralSpaceApi(ProviderInterface, TextInterface, TranslationInterface):
         url_transcribe = f"{self.url}transcription/v1/single/transcription?transcribeId={provider_job_id}"
         headers = {"Authorization": f"{self.api_key}"}
 
-        response = requests.get(url=url_transcribe, headers=headers)
+        response = http_client.get(url=url_transcribe, headers=headers)
 
         status_code = response.status_code
         if status_code != 200:
@@ -1,6 +1,5 @@
 from typing import Dict, Sequence, Optional, List
 
-import requests
 
 from edenai_apis.apis.nlpcloud.utils import Iso_to_code
 from edenai_apis.features import ProviderInterface, TextInterface
@@ -25,6 +24,7 @@ from edenai_apis.features.text.spell_check import (
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import ResponseType
 
 
@@ -59,7 +59,7 @@ class NlpCloudApi(ProviderInterface, TextInterface):
         else:
             url = f"{self.url['basic']}gpu/{Iso_to_code.get(language)}/finetuned-llama-2-70b/gs-correction"
 
-        response = requests.post(
+        response = http_client.post(
             url=url,
             json={"text": text},
             headers=self.headers,
@@ -94,7 +94,7 @@ class NlpCloudApi(ProviderInterface, TextInterface):
                 self.url["basic"]
                 + f"gpu/{Iso_to_code.get(language)}/finetuned-llama-2-70b/kw-kp-extraction"
             )
-        response = requests.post(
+        response = http_client.post(
             url=url,
             json={"text": text},
             headers=self.headers,
@@ -115,7 +115,7 @@ class NlpCloudApi(ProviderInterface, TextInterface):
     def text__sentiment_analysis(
         self, language: str, text: str
     ) -> ResponseType[SentimentAnalysisDataClass]:
-        response = requests.post(
+        response = http_client.post(
             url=self.url["sentiment_analysis"],
             json={"text": text},
             headers=self.headers,
@@ -139,7 +139,7 @@ class NlpCloudApi(ProviderInterface, TextInterface):
     def text__code_generation(
         self, instruction: str, temperature: float, max_tokens: int, prompt: str = ""
     ) -> ResponseType[CodeGenerationDataClass]:
-        response = requests.post(
+        response = http_client.post(
             url=self.url["code_generation"],
             json={"instruction": instruction},
             headers=self.headers,
@@ -162,7 +162,7 @@ class NlpCloudApi(ProviderInterface, TextInterface):
         if language == "en" or language == "zh":
             url_model = "web"
         url = self.url["basic"] + f"{language}_core_{url_model}_lg/entities"
-        response = requests.post(
+        response = http_client.post(
             url=url,
             json={"text": text},
             headers=self.headers,
@@ -185,7 +185,7 @@ class NlpCloudApi(ProviderInterface, TextInterface):
     def text__emotion_detection(
         self, text: str
     ) -> ResponseType[EmotionDetectionDataClass]:
-        response = requests.post(
+        response = http_client.post(
             url=self.url["emotion_detection"],
             json={"text": text},
             headers=self.headers,
@@ -215,7 +215,7 @@ class NlpCloudApi(ProviderInterface, TextInterface):
     ) -> ResponseType[SummarizeDataClass]:
         # Check none model
         url = self.url["basic"] + "gpu/" + model + "/summarization"
-        response = requests.post(
+        response = http_client.post(
             url=url,
             json={"text": text},
             headers=self.headers,
@@ -44,6 +44,7 @@ from edenai_apis.features.image.search.upload_image.search_upload_image_dataclas
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import (
     ResponseType,
     AsyncLaunchJobResponseType,
@@ -64,6 +65,8 @@ def strip_nyckel_prefix(prefixed_id: str) -> str:
 
 class NyckelApi(ProviderInterface, ImageInterface):
     provider_name: str = "nyckel"
+    # calls update the session auth header on the instance
+    poolable = False
     DEFAULT_SIMILAR_IMAGE_COUNT = 10
 
     def __init__(self, api_keys: Dict = {}) -> None:
@@ -89,7 +92,7 @@ class NyckelApi(ProviderInterface, ImageInterface):
             "grant_type": "client_credentials",
         }
 
-        response = requests.post(url, data=data)
+        response = http_client.post(url, data=data)
         if not response.status_code == 200:
             self._raise_provider_exception(url, data, response)
 
@@ -155,7 +158,7 @@ class NyckelApi(ProviderInterface, ImageInterface):
 
         # The response 'data' key points to a url where we can fetch the image.
         try:
-            fetch_image_response = requests.get(response.json()[0]["data"])
+            fetch_image_response = http_client.get(response.json()[0]["data"])
             fetch_image_response.raise_for_status()
         except IndexError:
             raise ProviderException(f"Image '{image_name}' not found.")
@@ -496,7 +499,7 @@ class NyckelApi(ProviderInterface, ImageInterface):
         job_id = str(uuid.uuid4())
         data_job_id = {job_id: response.json()}
         try:
-            requests.post(
+            http_client.post(
                 url=f"https://webhook.site/{self.webhook_token}",
                 data=json.dumps(data_job_id),
                 headers={"content-type": "application/json"},
@@ -1,7 +1,8 @@
 import urllib
 from typing import Dict
 
-import requests
+from edenai_apis.utils.http import http_client
+
 
 
 def check_webhook_result(job_id: str, webhook_settings: dict) -> Dict:
@@ -20,7 +21,7 @@ def check_webhook_result(job_id: str, webhook_settings: dict) -> Dict:
         f"https://webhook.site/token/{webhook_token}/requests"
         + f"?sorting=newest&query={urllib.parse.quote_plus('content:'+str(job_id))}"
     )
-    webhook_response = requests.get(url=webhook_get_url, headers={"Api-Key": api_key})
+    webhook_response = http_client.get(url=webhook_get_url, headers={"Api-Key": api_key})
     response_status = webhook_response.status_code
     try:
         return webhook_response.json().get("data"), response_status
@@ -22,6 +22,7 @@ class OpenaiApi(
     provider_name = "openai"
 
     def __init__(self, api_keys: Dict = {}):
+        self.api_keys = api_keys
         self.api_settings = load_provider(
             ProviderDataEnum.KEY, self.provider_name, api_keys=api_keys
         )
@@ -1,11 +1,8 @@
-import base64
-from io import BytesIO
-
-import requests
 import uuid
 from typing import Optional, List, Literal
 from edenai_apis.apis.amazon.helpers import check_webhook_result
 from edenai_apis.features.audio import TextToSpeechDataClass
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import (
     AsyncBaseResponseType,
     AsyncLaunchJobResponseType,
@@ -17,12 +14,13 @@ from edenai_apis.features.audio.speech_to_text_async.speech_to_text_async_datacl
     SpeechToTextAsyncDataClass,
 )
 from edenai_apis.features import AudioInterface
+from edenai_apis.utils.audio import TTS_CHUNK_SIZE, upload_text_to_speech_audio
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.job_completion import get_job_store, record_job_result
 import json
 import urllib
 
 from .helpers import convert_tts_audio_rate, get_openapi_response
-from edenai_apis.utils.upload_s3 import upload_file_bytes_to_s3, USER_PROCESS
 
 
 class OpenaiAudioApi(AudioInterface):
@@ -47,13 +45,16 @@ class OpenaiAudioApi(AudioInterface):
         file_ = open(file, "rb")
         files = {"file": file_}
         payload = {"model": "whisper-1", "language": language, **provider_params}
-        response = requests.post(url, data=payload, files=files, headers=headers)
+        response = http_client.post(url, data=payload, files=files, headers=headers)
         if response.status_code != 200:
             raise ProviderException(response.text, response.status_code)
 
         job_id = str(uuid.uuid4())
         data_job_id[job_id] = response.json()
-        webhook_send = requests.post(
+        # the result is already known, keep it in the job-state store for this
+        # process, and on webhook.site for the others
+        record_job_result("openai", job_id, data_job_id[job_id])
+        webhook_send = http_client.post(
             url=f"https://webhook.site/{self.webhook_token}",
             data=json.dumps(data_job_id),
             headers={"content-type": "application/json"},
@@ -66,6 +67,12 @@ class OpenaiAudioApi(AudioInterface):
         if not provider_job_id:
             raise ProviderException("Job id None or empty!")
 
+        job_state = get_job_store().get("openai", provider_job_id)
+        if job_state is not None and job_state.payload is not None:
+            return self._speech_to_text_async_response(
+                provider_job_id, job_state.payload
+            )
+
         # Get results from webhooks :
         # List all webhook results
         # Getting results from webhook.site
@@ -104,6 +111,12 @@ class OpenaiAudioApi(AudioInterface):
                 provider_job_id=provider_job_id
             )
 
+        return self._speech_to_text_async_response(provider_job_id, original_response)
+
+    @staticmethod
+    def _speech_to_text_async_response(
+        provider_job_id: str, original_response: dict
+    ) -> AsyncResponseType[SpeechToTextAsyncDataClass]:
         diarization = SpeechDiarization(total_speakers=0, entries=[])
         standardized_response = SpeechToTextAsyncDataClass(
             text=original_response.get("text"), diarization=diarization
@@ -136,13 +149,14 @@ class OpenaiAudioApi(AudioInterface):
             "speed": speed,
             "response_format": audio_format
         }
-        response = requests.post(url, json=payload, headers=self.headers)
-        original_response = response.content
-        audio_content = BytesIO(response.content)
-        audio = base64.b64encode(audio_content.read()).decode("utf-8")
+        response = http_client.post(
+            url, json=payload, headers=self.headers, stream=True
+        )
+        # stream the audio to s3 instead of loading it in memory
+        audio, resource_url = upload_text_to_speech_audio(
+            response.iter_content(TTS_CHUNK_SIZE), f".{audio_format}"
+        )
         voice_type = 1
-        audio_content.seek(0)
-        resource_url = upload_file_bytes_to_s3(audio_content, f".{audio_format}", USER_PROCESS)
         standardized_response = TextToSpeechDataClass(
             audio=audio,
             voice_type=voice_type,
@@ -4,7 +4,6 @@ from json import JSONDecodeError
 from typing import Sequence, Literal, Optional
 
 import openai
-import requests
 
 from edenai_apis.features import ImageInterface
 from edenai_apis.features.image.generation import (
@@ -15,6 +14,7 @@ from edenai_apis.features.image.variation import (
     VariationDataClass,
     VariationImageDataClass,
 )
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import ResponseType
 from edenai_apis.utils.upload_s3 import USER_PROCESS, upload_file_bytes_to_s3
 from .helpers import (
@@ -40,7 +40,7 @@ class OpenaiImageApi(ImageInterface):
             "size": resolution,
             "response_format": "b64_json",
         }
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = http_client.post(url, json=payload, headers=self.headers)
         original_response = get_openapi_response(response)
 
         generations: Sequence[GeneratedImageDataClass] = []
@@ -98,7 +98,7 @@ class OpenaiImageApi(ImageInterface):
                 "temperature": temperature,
             }
 
-            response = requests.post(url, json=payload, headers=self.headers)
+            response = http_client.post(url, json=payload, headers=self.headers)
 
             if response.status_code >= 500:
                 raise ProviderException(
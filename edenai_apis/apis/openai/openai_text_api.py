@@ -3,7 +3,6 @@ from typing import Dict, List, Literal, Optional, Sequence, Union
 
 import numpy as np
 import openai
-import requests
 from pydantic_core._pydantic_core import ValidationError
 
 from edenai_apis.features import TextInterface
@@ -41,7 +40,7 @@ from edenai_apis.features.text.prompt_optimization import (
     PromptOptimizationDataClass,
 )
 from edenai_apis.features.text.question_answer import QuestionAnswerDataClass
-from edenai_apis.features.text.search import InfosSearchDataClass, SearchDataClass
+from edenai_apis.features.text.search import SearchDataClass
 from edenai_apis.features.text.sentiment_analysis import SentimentAnalysisDataClass
 from edenai_apis.features.text.spell_check.spell_check_dataclass import (
     SpellCheckDataClass,
@@ -59,8 +58,13 @@ from edenai_apis.utils.conversion import (
     find_all_occurrence,
     standardized_confidence_score,
 )
+from edenai_apis.utils.embeddings import batched_embeddings
+from edenai_apis.utils.embeddings_cache import cached_embeddings
 from edenai_apis.utils.exception import ProviderException
-from edenai_apis.utils.metrics import METRICS
+from edenai_apis.utils.http import async_http_client, http_client
+from edenai_apis.utils.llm_cache import cached_llm_response
+from edenai_apis.utils.llm_engine import llm_request
+from edenai_apis.utils.metrics import rank_documents
 from edenai_apis.utils.types import ResponseType
 from .helpers import (
     construct_anonymization_context,
@@ -79,6 +83,7 @@ from .helpers import (
 
 
 class OpenaiTextApi(TextInterface):
+    @llm_request
     def text__summarize(
         self, text: str, output_sentences: int, language: str, model: str
     ) -> ResponseType[SummarizeDataClass]:
@@ -99,7 +104,7 @@ class OpenaiTextApi(TextInterface):
             "messages": messages,
         }
 
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = http_client.post(url, json=payload, headers=self.headers)
         original_response = get_openapi_response(response)
 
         standardized_response = SummarizeDataClass(
@@ -112,15 +117,31 @@ class OpenaiTextApi(TextInterface):
         )
         return result
 
+    @cached_llm_response(deterministic=True)
     def text__moderation(
         self, text: str, language: str
     ) -> ResponseType[ModerationDataClass]:
         try:
-            response = requests.post(
+            response = http_client.post(
                 f"{self.url}/moderations", headers=self.headers, json={"input": text}
             )
         except Exception as exc:
             raise ProviderException(str(exc), code=500)
+        return self.__moderation_response(response)
+
+    @cached_llm_response(deterministic=True)
+    async def _async_text__moderation(
+        self, text: str, language: str
+    ) -> ResponseType[ModerationDataClass]:
+        try:
+            response = await async_http_client.post(
+                f"{self.url}/moderations", headers=self.headers, json={"input": text}
+            )
+        except Exception as exc:
+            raise ProviderException(str(exc), code=500)
+        return self.__moderation_response(response)
+
+    def __moderation_response(self, response) -> ResponseType[ModerationDataClass]:
         original_response = get_openapi_response(response)
 
         classification: Sequence[TextModerationItem] = []
@@ -159,41 +180,29 @@ class OpenaiTextApi(TextInterface):
             "cosine", "hamming", "manhattan", "euclidean"
         ] = "cosine",
         model: str = None,
+        top_k: Optional[int] = None,
     ) -> ResponseType[SearchDataClass]:
         if model is None:
             model = "1536__text-embedding-ada-002"
 
-        # Import the function
-        function_score = METRICS[similarity_metric]
-
         # Embed the texts & query
-        texts_embed_response = OpenaiTextApi.text__embeddings(
-            self, texts=texts, model=model
-        ).original_response
-        query_embed_response = OpenaiTextApi.text__embeddings(
-            self, texts=[query], model=model
-        ).original_response
+        texts_embed = OpenaiTextApi.text__embeddings(self, texts=texts, model=model)
+        query_embed = OpenaiTextApi.text__embeddings(self, texts=[query], model=model)
+        texts_embed_response = texts_embed.original_response
+        query_embed_response = query_embed.original_response
 
         # Extract Tokens consumed
-        texts_usage = texts_embed_response.get("usage").get("total_tokens")
-        query_usage = query_embed_response.get("usage").get("total_tokens")
-
-        # Extracts embeddings from texts & query
-        texts_embed = [item["embedding"] for item in texts_embed_response.get("data")]
-        query_embed = query_embed_response["data"][0]["embedding"]
+        texts_usage = texts_embed_response.get("usage", {}).get("total_tokens", 0)
+        query_usage = query_embed_response.get("usage", {}).get("total_tokens", 0)
 
-        items = []
-        # Calculate score for each text index
-        for index, text in enumerate(texts_embed):
-            score = function_score(query_embed, text)
-            items.append(
-                InfosSearchDataClass(
-                    object="search_result", document=index, score=score
-                )
-            )
+        # Extracts embeddings from texts & query (embeddings may come from the cache)
+        texts_embed = [item.embedding for item in texts_embed.standardized_response.items]
+        query_embed = query_embed.standardized_response.items[0].embedding
 
-        # Sort items by score in descending order
-        sorted_items = sorted(items, key=lambda x: x.score, reverse=True)
+        # Score all texts at once and keep the best ones, sorted by score
+        sorted_items = rank_documents(
+            query_embed, texts_embed, similarity_metric, top_k=top_k
+        )
 
         # Build the original response
         original_response = {
@@ -208,6 +217,8 @@ class OpenaiTextApi(TextInterface):
         )
         return result
 
+    @cached_llm_response
+    @llm_request
     def text__question_answer(
         self,
         texts: List[str],
@@ -243,7 +254,7 @@ class OpenaiTextApi(TextInterface):
             "frequency_penalty": 0,
             "presence_penalty": 0,
         }
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = http_client.post(url, json=payload, headers=self.headers)
         original_response = get_openapi_response(response)
 
         answer = original_response["choices"][0]["text"].split("\n")
@@ -256,6 +267,7 @@ class OpenaiTextApi(TextInterface):
         )
         return result
 
+    @llm_request
     def text__anonymization(
         self, text: str, language: str
     ) -> ResponseType[AnonymizationDataClass]:
@@ -277,7 +289,7 @@ class OpenaiTextApi(TextInterface):
             "messages": messages,
         }
         url = f"{self.url}/chat/completions"
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = http_client.post(url, json=payload, headers=self.headers)
         original_response = get_openapi_response(response)
         pii_data = original_response["choices"][0]["message"]["content"]
         try:
@@ -323,6 +335,7 @@ class OpenaiTextApi(TextInterface):
             standardized_response=standardized_response,
         )
 
+    @llm_request
     def text__keyword_extraction(
         self, language: str, text: str
     ) -> ResponseType[KeywordExtractionDataClass]:
@@ -373,6 +386,7 @@ class OpenaiTextApi(TextInterface):
             standardized_response=standardized_response,
         )
 
+    @llm_request
     def text__sentiment_analysis(
         self, language: str, text: str
     ) -> ResponseType[SentimentAnalysisDataClass]:
@@ -394,7 +408,7 @@ class OpenaiTextApi(TextInterface):
             "model": "gpt-3.5-turbo-1106",
             "messages": messages,
         }
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = http_client.post(url, json=payload, headers=self.headers)
         original_response = get_openapi_response(response)
         sentiments_content = original_response["choices"][0]["message"]["content"]
         try:
@@ -412,6 +426,7 @@ class OpenaiTextApi(TextInterface):
             original_response=original_response, standardized_response=standarize
         )
 
+    @llm_request
     def text__topic_extraction(
         self, language: str, text: str
     ) -> ResponseType[TopicExtractionDataClass]:
@@ -433,7 +448,7 @@ class OpenaiTextApi(TextInterface):
             "model": "gpt-3.5-turbo-1106",
             "messages": messages,
         }
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = http_client.post(url, json=payload, headers=self.headers)
         original_response = get_openapi_response(response)
         topics_data = original_response["choices"][0]["message"]["content"]
         try:
@@ -451,6 +466,8 @@ class OpenaiTextApi(TextInterface):
             standardized_response=standarized_response,
         )
 
+    @cached_llm_response
+    @llm_request
     def text__code_generation(
         self, instruction: str, temperature: float, max_tokens: int, prompt: str = ""
     ) -> ResponseType[CodeGenerationDataClass]:
@@ -474,7 +491,7 @@ class OpenaiTextApi(TextInterface):
             "max_tokens": max_tokens,
         }
 
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = http_client.post(url, json=payload, headers=self.headers)
         original_response = get_openapi_response(response)
 
         standardized_response = CodeGenerationDataClass(
@@ -485,6 +502,8 @@ class OpenaiTextApi(TextInterface):
             standardized_response=standardized_response,
         )
 
+    @cached_llm_response
+    @llm_request
     def text__generation(
         self,
         text: str,
@@ -492,8 +511,32 @@ class OpenaiTextApi(TextInterface):
         max_tokens: int,
         model: str,
     ) -> ResponseType[GenerationDataClass]:
-        url = f"{self.url}/completions"
+        response = http_client.post(
+            f"{self.url}/completions",
+            json=self.__generation_payload(text, temperature, max_tokens, model),
+            headers=self.headers,
+        )
+        return self.__generation_response(response)
+
+    @cached_llm_response
+    @llm_request
+    async def _async_text__generation(
+        self,
+        text: str,
+        temperature: float,
+        max_tokens: int,
+        model: str,
+    ) -> ResponseType[GenerationDataClass]:
+        response = await async_http_client.post(
+            f"{self.url}/completions",
+            json=self.__generation_payload(text, temperature, max_tokens, model),
+            headers=self.headers,
+        )
+        return self.__generation_response(response)
 
+    def __generation_payload(
+        self, text: str, temperature: float, max_tokens: int, model: str
+    ) -> Dict:
         payload = {
             "prompt": text,
             "model": model,
@@ -501,8 +544,9 @@ class OpenaiTextApi(TextInterface):
         }
         if max_tokens != 0:
             payload["max_tokens"] = max_tokens
+        return payload
 
-        response = requests.post(url, json=payload, headers=self.headers)
+    def __generation_response(self, response) -> ResponseType[GenerationDataClass]:
         original_response = get_openapi_response(response)
 
         standardized_response = GenerationDataClass(
@@ -513,6 +557,8 @@ class OpenaiTextApi(TextInterface):
             standardized_response=standardized_response,
         )
 
+    @cached_llm_response(deterministic=True)
+    @llm_request
     def text__custom_named_entity_recognition(
         self, text: str, entities: List[str], examples: Optional[List[Dict]] = None
     ) -> ResponseType[CustomNamedEntityRecognitionDataClass]:
@@ -555,6 +601,7 @@ class OpenaiTextApi(TextInterface):
             standardized_response=standardized_response,
         )
 
+    @llm_request
     def text__custom_classification(
         self, texts: List[str], labels: List[str], examples: List[List[str]]
     ) -> ResponseType[CustomClassificationDataClass]:
@@ -576,7 +623,7 @@ class OpenaiTextApi(TextInterface):
             "model": "gpt-3.5-turbo-1106",
             "messages": messages,
         }
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = http_client.post(url, json=payload, headers=self.headers)
         original_response = get_openapi_response(response)
 
         # Getting labels
@@ -601,6 +648,8 @@ class OpenaiTextApi(TextInterface):
             ),
         )
 
+    @cached_llm_response(deterministic=True)
+    @llm_request
     def text__spell_check(
         self, text: str, language: str
     ) -> ResponseType[SpellCheckDataClass]:
@@ -620,7 +669,7 @@ class OpenaiTextApi(TextInterface):
             "temperature": 0.0,
             "response_format": {"type": "json_object"},
         }
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = http_client.post(url, json=payload, headers=self.headers)
         original_response = get_openapi_response(response)
 
         try:
@@ -653,6 +702,7 @@ class OpenaiTextApi(TextInterface):
             standardized_response=SpellCheckDataClass(text=text, items=items),
         )
 
+    @llm_request
     def text__named_entity_recognition(
         self, language: str, text: str
     ) -> ResponseType[NamedEntityRecognitionDataClass]:
@@ -678,7 +728,7 @@ class OpenaiTextApi(TextInterface):
             "model": "gpt-3.5-turbo-1106",
             "messages": messages,
         }
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = http_client.post(url, json=payload, headers=self.headers)
         original_response = get_openapi_response(response)
         entities_data = original_response["choices"][0]["message"]["content"]
         try:
@@ -695,6 +745,8 @@ class OpenaiTextApi(TextInterface):
             ),
         )
 
+    @cached_embeddings
+    @batched_embeddings
     def text__embeddings(
         self, texts: List[str], model: str
     ) -> ResponseType[EmbeddingsDataClass]:
@@ -707,7 +759,7 @@ class OpenaiTextApi(TextInterface):
             "model": model[1],
         }
 
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = http_client.post(url, json=payload, headers=self.headers)
         original_response = get_openapi_response(response)
 
         items: Sequence[EmbeddingsDataClass] = []
@@ -723,6 +775,8 @@ class OpenaiTextApi(TextInterface):
             standardized_response=standardized_response,
         )
 
+    @cached_llm_response
+    @llm_request
     def text__chat(
         self,
         text: str,
@@ -789,6 +843,7 @@ class OpenaiTextApi(TextInterface):
                 original_response=None, standardized_response=StreamChat(stream=stream)
             )
 
+    @llm_request
     def text__prompt_optimization(
         self, text: str, target_provider: Literal["openai", "google", "cohere"]
     ) -> ResponseType[PromptOptimizationDataClass]:
@@ -809,10 +864,10 @@ class OpenaiTextApi(TextInterface):
             "n": 3,
         }
 
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = http_client.post(url, json=payload, headers=self.headers)
         original_response = get_openapi_response(response)
 
-        missing_information_call = requests.post(
+        missing_information_call = http_client.post(
             url,
             json={
                 "model": "gpt-4",
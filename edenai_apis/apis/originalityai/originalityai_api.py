@@ -3,7 +3,6 @@ from collections import defaultdict
 from http import HTTPStatus
 from typing import Dict, Optional, Any
 
-import requests
 
 from edenai_apis.features import TextInterface
 from edenai_apis.features.provider.provider_interface import ProviderInterface
@@ -19,6 +18,7 @@ from edenai_apis.features.text.plagia_detection.plagia_detection_dataclass impor
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import ResponseType
 
 
@@ -42,7 +42,7 @@ class OriginalityaiApi(ProviderInterface, TextInterface):
         payload = {"content": text, "title": title}
         headers = {"content-type": "application/json", "X-OAI-API-KEY": self.api_key}
 
-        response = requests.post(url, headers=headers, json=payload)
+        response = http_client.post(url, headers=headers, json=payload)
 
         try:
             original_response = response.json()
@@ -101,7 +101,7 @@ class OriginalityaiApi(ProviderInterface, TextInterface):
             "content-type": "application/json",
             "X-OAI-API-KEY": self.api_key,
         }
-        response = requests.post(url=url, headers=headers, json=payload)
+        response = http_client.post(url=url, headers=headers, json=payload)
 
         try:
             original_response = response.json()
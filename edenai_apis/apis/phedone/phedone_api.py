@@ -1,7 +1,6 @@
 import json
 from typing import Dict, Optional, Any
 
-import requests
 
 from edenai_apis.features import TranslationInterface
 from edenai_apis.features.provider.provider_interface import ProviderInterface
@@ -11,6 +10,7 @@ from edenai_apis.features.translation import (
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import ResponseType
 
 
@@ -59,7 +59,7 @@ class PhedoneApi(ProviderInterface, TranslationInterface):
 
         url = f"{self.base_url}translation"
 
-        response = requests.post(url=url, headers=headers, json=file)
+        response = http_client.post(url=url, headers=headers, json=file)
 
         try:
             original_response = response.json()
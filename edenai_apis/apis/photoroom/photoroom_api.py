@@ -9,6 +9,7 @@ from edenai_apis.features.image.background_removal import BackgroundRemovalDataC
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import ResponseType
 
 
@@ -58,7 +59,7 @@ class PhotoroomApi(ImageInterface, ProviderInterface):
             else:
                 photoroom_params = PhotoroomBackgroundRemovalParams(**provider_params)
 
-            response = requests.post(
+            response = http_client.post(
                 f"{self.base_url}segment",
                 headers=self.headers,
                 files=files,
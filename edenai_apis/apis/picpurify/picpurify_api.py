@@ -1,6 +1,5 @@
 from typing import Dict
 
-import requests
 from PIL import Image as Img
 
 from edenai_apis.features import ProviderInterface, ImageInterface
@@ -28,6 +27,7 @@ from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
 from edenai_apis.utils.conversion import standardized_confidence_score_picpurify
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import ResponseType
 
 
@@ -50,7 +50,7 @@ class PicpurifyApi(ProviderInterface, ImageInterface):
         }
         file_ = open(file, "rb")
         files = {"image": file_}
-        response = requests.post(self.url, files=files, data=payload)
+        response = http_client.post(self.url, files=files, data=payload)
         original_response = response.json()
         file_.close()
 
@@ -123,7 +123,7 @@ class PicpurifyApi(ProviderInterface, ImageInterface):
         }
         file_ = open(file, "rb")
         files = {"image": file_}
-        response = requests.post(self.url, files=files, data=payload)
+        response = http_client.post(self.url, files=files, data=payload)
         original_response = response.json()
         file_.close()
 
@@ -5,7 +5,6 @@ import uuid
 from typing import Dict
 from io import BytesIO
 
-import requests
 
 from edenai_apis.features import ProviderInterface, OcrInterface
 from edenai_apis.features.ocr.anonymization_async.anonymization_async_dataclass import (
@@ -15,6 +14,7 @@ from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
 from apis.amazon.helpers import check_webhook_result
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import (
     AsyncBaseResponseType,
     AsyncLaunchJobResponseType,
@@ -60,7 +60,7 @@ class PrivateaiApi(ProviderInterface, OcrInterface):
                 "return_entity": True,
             },
         }
-        response = requests.post(
+        response = http_client.post(
             url=self.url + "v3/process/files/base64",
             data=json.dumps(data),
             headers=self.headers,
@@ -72,7 +72,7 @@ class PrivateaiApi(ProviderInterface, OcrInterface):
         original_response["extension"] = extension
         job_id = "document_anonymization_privateai" + str(uuid.uuid4())
         data_job_id[job_id] = original_response
-        requests.post(
+        http_client.post(
             url=f"https://webhook.site/{self.webhook_token}",
             data=json.dumps(data_job_id),
             headers={"content-type": "application/json"},
@@ -4,13 +4,13 @@ from io import BytesIO
 from typing import Dict
 
 import magic
-import requests
 
 from edenai_apis.features import OcrInterface
 from edenai_apis.features.ocr import AnonymizationAsyncDataClass
 from edenai_apis.features.provider.provider_interface import ProviderInterface
 from edenai_apis.loaders.loaders import load_provider, ProviderDataEnum
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import AsyncBaseResponseType, AsyncLaunchJobResponseType, AsyncResponseType, \
     AsyncPendingResponseType
 from edenai_apis.utils.upload_s3 import USER_PROCESS, upload_file_bytes_to_s3
@@ -44,7 +44,7 @@ class ReadyRedactApi(ProviderInterface, OcrInterface):
         params = {
             "api_key": self.api_key
         }
-        response = requests.post(url=self.url_put_file, params=params, data=payload, files=files, headers=headers)
+        response = http_client.post(url=self.url_put_file, params=params, data=payload, files=files, headers=headers)
         if response.status_code != 200:
             raise ProviderException(response.text, code=response.status_code)
         try:
@@ -68,7 +68,7 @@ class ReadyRedactApi(ProviderInterface, OcrInterface):
             'Content-Type': 'application/json',
             'Accept': 'application/json'
         }
-        response = requests.request("GET", self.url_get_file, headers=headers, data=payload)
+        response = http_client.request("GET", self.url_get_file, headers=headers, data=payload)
         if response.status_code != 200:
             raise ProviderException(response.text, code=response.status_code)
         try:
@@ -0,0 +1,201 @@
+"""
+Waiting for Replicate predictions.
+
+A prediction is created with the `Prefer: wait` header, so that Replicate holds the
+request until the prediction completes (at most `REPLICATE_PREFER_WAIT` seconds,
+Replicate allows 1 to 60). Predictions still running are then polled with an
+exponential backoff (with jitter), until `REPLICATE_WAIT_TIMEOUT` seconds after the
+creation, after which the prediction is cancelled.
+
+Configuration:
+    REPLICATE_PREFER_WAIT: seconds the creation request waits for the prediction
+        (default 60, 0 to disable the long-poll)
+    REPLICATE_WAIT_TIMEOUT: max seconds to wait for a prediction (default 600)
+    REPLICATE_POLL_MIN_INTERVAL: first delay between two polls (default 0.5)
+    REPLICATE_POLL_MAX_INTERVAL: max delay between two polls (default 5)
+"""
+import http.client
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+import requests
+
+from edenai_apis.utils.exception import ProviderException, ProviderTimeoutError
+from edenai_apis.utils.http import http_client
+from edenai_apis.utils.job_completion import JOB_POLL_JITTER, next_poll_delay
+
+REPLICATE_PREFER_WAIT = int(os.environ.get("REPLICATE_PREFER_WAIT", 60))
+REPLICATE_WAIT_TIMEOUT = float(os.environ.get("REPLICATE_WAIT_TIMEOUT", 600))
+REPLICATE_POLL_MIN_INTERVAL = float(os.environ.get("REPLICATE_POLL_MIN_INTERVAL", 0.5))
+REPLICATE_POLL_MAX_INTERVAL = float(os.environ.get("REPLICATE_POLL_MAX_INTERVAL", 5))
+
+# number of predictions whose polls count is kept
+POLLS_HISTORY_SIZE = 1024
+
+SUCCEEDED = "succeeded"
+FAILED_STATUSES = ("failed", "canceled")
+
+
+def _prediction_json(response: requests.Response) -> Dict[str, Any]:
+    if response.status_code >= 500:
+        raise ProviderException(
+            message=http.client.responses.get(response.status_code, response.text),
+            code=response.status_code,
+        )
+    try:
+        response_dict = response.json()
+    except requests.JSONDecodeError:
+        raise ProviderException(response.text, code=response.status_code)
+    if response.status_code not in (200, 201):
+        raise ProviderException(
+            response_dict.get("detail") or response_dict.get("error", response_dict),
+            code=response.status_code,
+        )
+    return response_dict
+
+
+class PredictionWaiter:
+    """Create Replicate predictions and wait for their result
+
+    Args:
+        prefer_wait (int): seconds the creation request waits for the prediction
+        timeout (float): max seconds to wait for a prediction, it is then cancelled
+        min_interval (float): first delay between two polls
+        max_interval (float): max delay between two polls
+        jitter (float): randomization of the delays (+/- ratio)
+        sleep (Callable): waits between polls, `time.sleep` by default
+    """
+
+    def __init__(
+        self,
+        prefer_wait: int = REPLICATE_PREFER_WAIT,
+        timeout: float = REPLICATE_WAIT_TIMEOUT,
+        min_interval: float = REPLICATE_POLL_MIN_INTERVAL,
+        max_interval: float = REPLICATE_POLL_MAX_INTERVAL,
+        jitter: float = JOB_POLL_JITTER,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.prefer_wait = prefer_wait
+        self.timeout = timeout
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.jitter = jitter
+        self.sleep = sleep
+        self._lock = threading.Lock()
+        self._polls: "OrderedDict[str, int]" = OrderedDict()
+        self.predictions = 0
+        self.total_polls = 0
+
+    def create(
+        self, url: str, payload: Dict, headers: Dict[str, str], wait: bool = True
+    ) -> Dict[str, Any]:
+        """Create a prediction, waiting for it up to `prefer_wait` seconds if `wait`"""
+        if wait and self.prefer_wait > 0:
+            headers = {**headers, "Prefer": f"wait={self.prefer_wait}"}
+        return _prediction_json(http_client.post(url, headers=headers, json=payload))
+
+    def cancel(self, prediction: Dict[str, Any], headers: Dict[str, str]) -> None:
+        """Cancel a prediction, errors are ignored since it may have just completed"""
+        cancel_url = prediction.get("urls", {}).get("cancel")
+        if not cancel_url:
+            return
+        try:
+            http_client.post(cancel_url, headers=headers)
+        except requests.RequestException as exc:
+            print(f"Replicate: could not cancel prediction {prediction.get('id')}: {exc}")
+
+    def _record_poll(self, prediction_id: str, polls: int) -> None:
+        with self._lock:
+            self.total_polls += 1
+            self._polls[prediction_id] = polls
+            self._polls.move_to_end(prediction_id)
+            while len(self._polls) > POLLS_HISTORY_SIZE:
+                self._polls.popitem(last=False)
+
+    def wait(
+        self,
+        prediction: Dict[str, Any],
+        headers: Dict[str, str],
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Poll a prediction until it succeeded.
+
+        Raises:
+            ProviderException: if the prediction failed or was canceled
+            ProviderTimeoutError: if it did not complete in `timeout` seconds (it is
+                then cancelled)
+        """
+        deadline = time.monotonic() + (self.timeout if timeout is None else timeout)
+        prediction_id = prediction.get("id", "")
+        with self._lock:
+            self.predictions += 1
+        polls = 0
+        while True:
+            status = prediction.get("status")
+            if status == SUCCEEDED:
+                return prediction
+            if status in FAILED_STATUSES:
+                raise ProviderException(prediction.get("error") or f"Prediction {status}")
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self.cancel(prediction, headers)
+                raise ProviderTimeoutError(
+                    f"Prediction {prediction_id} did not complete in time"
+                )
+            polls += 1
+            delay = next_poll_delay(
+                polls, self.min_interval, self.max_interval, self.jitter
+            )
+            self.sleep(min(delay, remaining))
+            prediction = _prediction_json(
+                http_client.get(prediction["urls"]["get"], headers=headers)
+            )
+            self._record_poll(prediction_id, polls)
+
+    def run(self, url: str, payload: Dict, headers: Dict[str, str]) -> Dict[str, Any]:
+        """Create a prediction and wait for its result"""
+        started = time.monotonic()
+        prediction = self.create(url, payload, headers)
+        return self.wait(
+            prediction, headers, timeout=self.timeout - (time.monotonic() - started)
+        )
+
+    def polls(self, prediction_id: str) -> int:
+        """Number of polls of a recent prediction (0 if it completed on creation)"""
+        with self._lock:
+            return self._polls.get(prediction_id, 0)
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                "predictions": self.predictions,
+                "polls": self.total_polls,
+                "polls_per_prediction": (
+                    self.total_polls / self.predictions if self.predictions else 0.0
+                ),
+            }
+
+
+_PREDICTION_WAITER: Optional[PredictionWaiter] = None
+_PREDICTION_WAITER_LOCK = threading.Lock()
+
+
+def get_prediction_waiter() -> PredictionWaiter:
+    """Return the prediction waiter shared by the Replicate calls"""
+    global _PREDICTION_WAITER
+    if _PREDICTION_WAITER is None:
+        with _PREDICTION_WAITER_LOCK:
+            if _PREDICTION_WAITER is None:
+                _PREDICTION_WAITER = PredictionWaiter()
+    return _PREDICTION_WAITER
+
+
+def set_prediction_waiter(waiter: Optional[PredictionWaiter]) -> None:
+    """Replace the shared prediction waiter (None resets it to the default one)"""
+    global _PREDICTION_WAITER
+    with _PREDICTION_WAITER_LOCK:
+        _PREDICTION_WAITER = waiter
@@ -1,9 +1,6 @@
 import base64
-import http.client
 from typing import Dict, Generator, List, Literal, Optional, Union, overload
 
-import requests
-
 from edenai_apis.features import TextInterface, ImageInterface
 from edenai_apis.features.image.generation.generation_dataclass import (
     GenerationDataClass,
@@ -16,15 +13,20 @@ from edenai_apis.features.text import (
 )
 from edenai_apis.features.text.chat.chat_dataclass import StreamChat, ChatStreamResponse
 from edenai_apis.loaders.loaders import load_provider, ProviderDataEnum
-from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http import http_client
+from edenai_apis.utils.llm_cache import cached_llm_response
+from edenai_apis.utils.llm_engine import llm_request
+from edenai_apis.utils.streaming import iter_sse_events
 from edenai_apis.utils.types import ResponseType
 from .config import get_model_id, get_model_id_image
+from .helpers import get_prediction_waiter
 
 
 class ReplicateApi(ProviderInterface, ImageInterface, TextInterface):
     provider_name = "replicate"
 
     def __init__(self, api_keys: Dict = {}):
+        self.api_keys = api_keys
         api_settings = load_provider(
             ProviderDataEnum.KEY, provider_name=self.provider_name, api_keys=api_keys
         )
@@ -37,28 +39,23 @@ class ReplicateApi(ProviderInterface, ImageInterface, TextInterface):
 
     def __get_stream_response(self, url: str) -> Generator:
         headers = {**self.headers, "Accept": "text/event-stream"}
-        response = requests.get(url, headers=headers, stream=True)
-        last_chunk = ""
-        for chunk in response.iter_lines():
-            if b"event: done" in chunk:
-                response.close()
-                break
-            elif last_chunk == b"event: error" and chunk.startswith(b"data: "):
-                yield ChatStreamResponse(
-                    text="[ERROR]", blocked=True, provider=self.provider_name
-                )
-            elif chunk.startswith(b"data: "):
-                if last_chunk == b"data: " and chunk == b"data: ":
+        response = http_client.get(url, headers=headers, stream=True)
+        events = iter_sse_events(response)
+        try:
+            for event in events:
+                if event.event == "done":
+                    break
+                if event.event == "error":
                     yield ChatStreamResponse(
-                        text="\n", blocked=False, provider=self.provider_name
+                        text="[ERROR]", blocked=True, provider=self.provider_name
                     )
-                else:
+                elif event.event in ("output", "message"):
+                    # multi-lines outputs are sent as several `data` lines
                     yield ChatStreamResponse(
-                        text=chunk.decode("utf-8").replace("data: ", ""),
-                        blocked=False,
-                        provider=self.provider_name,
+                        text=event.data, blocked=False, provider=self.provider_name
                     )
-            last_chunk = chunk
+        finally:
+            events.close()
 
     @overload
     def __get_response(
@@ -73,58 +70,13 @@ class ReplicateApi(ProviderInterface, ImageInterface, TextInterface):
     def __get_response(
         self, url: str, payload: dict, stream: bool = False
     ) -> Union[Generator, dict]:
-        # Launch job
+        waiter = get_prediction_waiter()
         if stream:
             payload["stream"] = True
-        launch_job_response = requests.post(url, headers=self.headers, json=payload)
-        try:
-            launch_job_response_dict = launch_job_response.json()
-        except requests.JSONDecodeError:
-            raise ProviderException(
-                launch_job_response.text, code=launch_job_response.status_code
-            )
-        if launch_job_response.status_code != 201:
-            raise ProviderException(
-                launch_job_response_dict.get("detail"),
-                code=launch_job_response.status_code,
-            )
-
-        if stream:
-            return self.__get_stream_response(
-                launch_job_response_dict["urls"]["stream"]
-            )
-        url_get_response = launch_job_response_dict["urls"]["get"]
-
-        # Get job response
-        response = requests.get(url_get_response, headers=self.headers)
-
-        if response.status_code >= 500:
-            raise ProviderException(
-                message=http.client.responses[response.status_code],
-                code=response.status_code,
-            )
-        response_dict = response.json()
-        if response.status_code != 200:
-            raise ProviderException(
-                response_dict.get("detail"), code=response.status_code
-            )
-
-        status = response_dict["status"]
-        while status != "succeeded":
-            response = requests.get(url_get_response, headers=self.headers)
-            try:
-                response_dict = response.json()
-            except requests.JSONDecodeError:
-                raise ProviderException(response.text, code=response.status_code)
-
-            if response.status_code != 200:
-                raise ProviderException(
-                    response_dict.get("error", response_dict), code=response.status_code
-                )
-
-            status = response_dict["status"]
+            prediction = waiter.create(url, payload, self.headers, wait=False)
+            return self.__get_stream_response(prediction["urls"]["stream"])
 
-        return response_dict
+        return waiter.run(url, payload, self.headers)
 
     def image__generation(
         self,
@@ -154,14 +106,14 @@ class ReplicateApi(ProviderInterface, ImageInterface, TextInterface):
             for image in image_url:
                 generated_images.append(
                     GeneratedImageDataClass(
-                        image=base64.b64encode(requests.get(image).content),
+                        image=base64.b64encode(http_client.get(image).content),
                         image_resource_url=image,
                     )
                 )
         else:
             generated_images.append(
                 GeneratedImageDataClass(
-                    image=base64.b64encode(requests.get(image_url).content),
+                    image=base64.b64encode(http_client.get(image_url).content),
                     image_resource_url=image_url,
                 )
             )
@@ -171,6 +123,8 @@ class ReplicateApi(ProviderInterface, ImageInterface, TextInterface):
             standardized_response=GenerationDataClass(items=generated_images),
         )
 
+    @cached_llm_response
+    @llm_request
     def text__chat(
         self,
         text: str,
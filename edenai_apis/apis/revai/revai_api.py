@@ -4,7 +4,6 @@ from pathlib import Path
 from time import time
 from typing import Dict, List, Optional
 
-import requests
 from apis.amazon.config import storage_clients
 from botocore.errorfactory import ClientError
 
@@ -21,6 +20,7 @@ from edenai_apis.utils.exception import (
     AsyncJobExceptionReason,
     ProviderException,
 )
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import (
     AsyncBaseResponseType,
     AsyncLaunchJobResponseType,
@@ -44,7 +44,7 @@ class RevAIApi(ProviderInterface, AudioInterface):
 
     def _create_vocabulary(self, list_vocabs: list):
         vocab_name = str(uuid.uuid4())
-        response = requests.post(
+        response = http_client.post(
             url="https://api.rev.ai/speechtotext/v1/vocabularies",
             headers={
                 "Authorization": f"Bearer {self.key}",
@@ -95,7 +95,7 @@ class RevAIApi(ProviderInterface, AudioInterface):
                 return
 
         data_config = {**config, "source_config": source_config, **provider_params}
-        response = requests.post(
+        response = http_client.post(
             url="https://ec1.api.rev.ai/speechtotext/v1/jobs",
             headers={
                 "Authorization": f"Bearer {self.key}",
@@ -186,7 +186,7 @@ class RevAIApi(ProviderInterface, AudioInterface):
             if job_id := not config.get(
                 "provider_job_id"
             ):  # check if transcribe have been launched
-                response = requests.get(
+                response = http_client.get(
                     url=f"https://ec1.api.rev.ai/speechtotext/v1/vocabularies/{provider_job_id}",
                     headers=headers,
                 )
@@ -220,7 +220,7 @@ class RevAIApi(ProviderInterface, AudioInterface):
         except ClientError as exc:
             pass
 
-        response = requests.get(
+        response = http_client.get(
             url=f"https://ec1.api.rev.ai/speechtotext/v1/jobs/{provider_job_id}",
             headers=headers,
         )
@@ -238,7 +238,7 @@ class RevAIApi(ProviderInterface, AudioInterface):
             )
         status = original_response["status"]
         if status == "transcribed":
-            response = requests.get(
+            response = http_client.get(
                 url=f"https://ec1.api.rev.ai/speechtotext/v1/jobs/{provider_job_id}/transcript",
                 headers=headers,
             )
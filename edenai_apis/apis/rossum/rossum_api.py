@@ -3,7 +3,6 @@ from io import BufferedReader
 from time import sleep
 from typing import Dict
 
-import requests
 
 from edenai_apis.features.ocr.invoice_parser.invoice_parser_dataclass import (
     BankInvoice,
@@ -20,11 +19,14 @@ from edenai_apis.features.provider.provider_interface import ProviderInterface
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import ResponseType
 
 
 class RossumApi(ProviderInterface, OcrInterface):
     provider_name = "rossum"
+    # calls update the login token on the instance
+    poolable = False
 
     def __init__(self, api_keys: Dict = {}):
         self.api_settings = load_provider(
@@ -44,7 +46,7 @@ class RossumApi(ProviderInterface, OcrInterface):
         Raises:
             ProviderException: If the status code is not 200
         """
-        response = requests.post(
+        response = http_client.post(
             url=self.url + "auth/login",
             json={"username": self.username, "password": self.password},
             headers={"Content-Type": "application/json"},
@@ -99,7 +101,7 @@ class RossumApi(ProviderInterface, OcrInterface):
         Raises:
             ProviderException: If an error occurs while uploading the file (Status code != 201)
         """
-        response = requests.post(
+        response = http_client.post(
             url=self._get_endpoint(self.EndpointType.UPLOAD),
             files={"content": file},
             headers={
@@ -133,7 +135,7 @@ class RossumApi(ProviderInterface, OcrInterface):
         Raises:
             ProviderException: If an error occurs while checking the status (Status code != 200)
         """
-        response = requests.get(
+        response = http_client.get(
             url=annotation_endpoint, headers={"Authorization": f"Token {self.token}"}
         )
 
@@ -160,7 +162,7 @@ class RossumApi(ProviderInterface, OcrInterface):
         Raises:
             ProviderException: If an error occurs while downloading the reviewing data (Status code != 200)
         """
-        response = requests.get(
+        response = http_client.get(
             url=self._get_endpoint(self.EndpointType.DOWNLOAD)
             + f"?status=to_review&format=json&id={id}",
             headers={"Authorization": f"Token {self.token}"},
@@ -1,6 +1,5 @@
 from typing import Dict, List
 
-import requests
 
 from edenai_apis.features import ProviderInterface
 from edenai_apis.features.image import FaceItem, FaceDetectionDataClass
@@ -20,6 +19,7 @@ from edenai_apis.features.image.face_detection.face_detection_dataclass import (
 )
 from edenai_apis.loaders.loaders import load_provider, ProviderDataEnum
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import ResponseType
 
 
@@ -44,7 +44,7 @@ class SkybiometryApi(ProviderInterface, ImageInterface):
         query_params = (
             f"api_key={self.api_key}&api_secret={self.api_secret}&attributes=all"
         )
-        response = requests.post(f"{endpoint}?{query_params}", files=files)
+        response = http_client.post(f"{endpoint}?{query_params}", files=files)
 
         original_response = response.json()
         file_.close()
@@ -2,7 +2,6 @@ from io import BufferedReader
 from time import sleep
 from typing import Any, Dict, Sequence
 
-import requests
 
 from edenai_apis.features import ProviderInterface, OcrInterface
 from edenai_apis.features.ocr import (
@@ -31,6 +30,7 @@ from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
 from edenai_apis.utils.conversion import convert_string_to_number
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import ResponseType
 
 
@@ -48,7 +48,7 @@ class TabscannerApi(ProviderInterface, OcrInterface):
         payload = {"documentType": document_type}
         files = {"file": file}
         headers = {"apikey": self.api_key}
-        response = requests.post(
+        response = http_client.post(
             self.url + "2/process", files=files, data=payload, headers=headers
         )
         response_json = response.json()
@@ -58,7 +58,7 @@ class TabscannerApi(ProviderInterface, OcrInterface):
 
     def _get_response(self, token: str, retry=0) -> Any:
         headers = {"apikey": self.api_key}
-        response = requests.get(self.url + "result/" + token, headers=headers)
+        response = http_client.get(self.url + "result/" + token, headers=headers)
         response_json = response.json()
         if response_json["status"] == "pending" and retry <= 5:
             sleep(1)
@@ -19,6 +19,7 @@ from edenai_apis.features.text.topic_extraction.topic_extraction_dataclass impor
     TopicExtractionDataClass,
 )
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import ResponseType
 
 
@@ -33,7 +34,7 @@ class TenstorrentTextApi(TextInterface):
         }
 
         try:
-            original_response = requests.post(url, json=payload, headers=self.headers)
+            original_response = http_client.post(url, json=payload, headers=self.headers)
         except requests.exceptions.RequestException as exc:
             raise ProviderException(message=str(exc), code=500)
         if original_response.status_code != 200:
@@ -62,7 +63,7 @@ class TenstorrentTextApi(TextInterface):
             "text": text,
         }
         try:
-            original_response = requests.post(url, json=payload, headers=self.headers)
+            original_response = http_client.post(url, json=payload, headers=self.headers)
         except requests.exceptions.RequestException as exc:
             raise ProviderException(message=str(exc), code=500)
         if original_response.status_code != 200:
@@ -103,7 +104,7 @@ class TenstorrentTextApi(TextInterface):
             "question": question,
         }
         try:
-            original_response = requests.post(url, json=payload, headers=self.headers)
+            original_response = http_client.post(url, json=payload, headers=self.headers)
         except requests.exceptions.RequestException as exc:
             raise ProviderException(message=str(exc), code=500)
         if original_response.status_code != 200:
@@ -132,7 +133,7 @@ class TenstorrentTextApi(TextInterface):
             "text": text,
         }
         try:
-            original_response = requests.post(url, json=payload, headers=self.headers)
+            original_response = http_client.post(url, json=payload, headers=self.headers)
         except requests.exceptions.RequestException as exc:
             raise ProviderException(message=str(exc), code=500)
         if original_response.status_code != 200:
@@ -161,7 +162,7 @@ class TenstorrentTextApi(TextInterface):
             "text": text,
         }
         try:
-            original_response = requests.post(url, json=payload, headers=self.headers)
+            original_response = http_client.post(url, json=payload, headers=self.headers)
         except requests.exceptions.RequestException as exc:
             raise ProviderException(message=str(exc), code=500)
         if original_response.status_code != 200:
@@ -2,7 +2,6 @@ import json
 import re
 from typing import Dict, List, Optional
 
-import requests
 
 from edenai_apis.features import AudioInterface
 from edenai_apis.features.audio.speech_to_text_async.speech_to_text_async_dataclass import (
@@ -18,6 +17,7 @@ from edenai_apis.utils.exception import (
     AsyncJobExceptionReason,
     ProviderException,
 )
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import (
     AsyncBaseResponseType,
     AsyncPendingResponseType,
@@ -28,6 +28,8 @@ from edenai_apis.utils.types import (
 
 class VoxistApi(ProviderInterface, AudioInterface):
     provider_name: str = "voxist"
+    # calls update the connection on the instance
+    poolable = False
 
     def __init__(self, api_keys: Dict = {}) -> None:
         self.api_settings: Dict = load_provider(
@@ -46,7 +48,7 @@ class VoxistApi(ProviderInterface, AudioInterface):
             "password": self.password,
         }
 
-        response = requests.post(f"{self.base_url}oauth/token", json=data)
+        response = http_client.post(f"{self.base_url}oauth/token", json=data)
         self.api_key = response.json().get("access_token")
 
     def audio__speech_to_text_async__launch_job(
@@ -78,7 +80,7 @@ class VoxistApi(ProviderInterface, AudioInterface):
         files = [("file_channel1", file_)]
 
         # Call Api
-        response = requests.post(
+        response = http_client.post(
             url=f"{self.base_url}transcription", headers=headers, files=files, data=data
         )
 
@@ -103,7 +105,7 @@ class VoxistApi(ProviderInterface, AudioInterface):
     ) -> AsyncBaseResponseType[SpeechToTextAsyncDataClass]:
         headers = {"Authorization": f"Bearer {self.api_key}"}
 
-        response = requests.get(
+        response = http_client.get(
             url=f"{self.base_url}jobs/{provider_job_id}", headers=headers
         )
 
@@ -1,7 +1,6 @@
 import json
 from typing import Dict, Sequence, Any, Optional
 
-import requests
 
 from edenai_apis.apis.winstonai.config import WINSTON_AI_API_URL
 from edenai_apis.features import ProviderInterface, TextInterface
@@ -17,6 +16,7 @@ from edenai_apis.features.text.plagia_detection.plagia_detection_dataclass impor
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import ResponseType
 
 
@@ -49,7 +49,7 @@ class WinstonaiApi(ProviderInterface, TextInterface):
             }
         )
 
-        response = requests.request(
+        response = http_client.request(
             "POST", f"{self.api_url}/predict", headers=self.headers, data=payload
         )
 
@@ -97,7 +97,7 @@ class WinstonaiApi(ProviderInterface, TextInterface):
             }
         )
 
-        response = requests.request(
+        response = http_client.request(
             "POST", f"{self.api_url}/plagiarism", headers=self.headers, data=payload
         )
 
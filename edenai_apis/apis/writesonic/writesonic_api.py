@@ -1,7 +1,6 @@
 import json
 from typing import Dict
 
-import requests
 
 from edenai_apis.features import ProviderInterface, TextInterface
 from edenai_apis.features.text import (
@@ -10,6 +9,7 @@ from edenai_apis.features.text import (
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import ResponseType
 
 
@@ -36,7 +36,7 @@ class WritesonicApi(ProviderInterface, TextInterface):
         }
 
         try:
-            response = requests.post(
+            response = http_client.post(
                 url, json=payload, headers=self.headers
             )
             original_response = response.json()
@@ -92,7 +92,7 @@ class WritesonicApi(ProviderInterface, TextInterface):
     #             )
 
     #     try:
-    #         original_response = requests.post(url, json=payload, headers= self.headers).json()
+    #         original_response = http_client.post(url, json=payload, headers= self.headers).json()
     #     except json.JSONDecodeError as exc:
     #         raise ProviderException("Internal Server Error") from exc
 
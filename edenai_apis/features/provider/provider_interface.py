@@ -3,6 +3,9 @@ from abc import ABC
 
 class ProviderInterface(ABC):
     provider_name: str
+    # instances can be shared between threads by the providers pool, providers
+    # keeping per-call state on the instance must set it to False
+    poolable: bool = True
 
     @classmethod
     def __init_subclass__(cls) -> None:
@@ -1,18 +1,48 @@
 # pylint: disable=locally-disabled, too-many-branches
+import asyncio
+import contextvars
+import copy
+import functools
 import os
 import random
+import threading
 import time
-from typing import Any, Dict, List, Literal, Optional, Set, Tuple, Type, Union, overload
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+    overload,
+)
 from uuid import uuid4
 
 from edenai_apis import interface_v2
-from edenai_apis.features.provider.provider_interface import ProviderInterface
+from edenai_apis.features.text.chat.chat_dataclass import ChatStreamResponse, StreamChat
+from edenai_apis.loaders.capability_index import get_capability_index
 from edenai_apis.loaders.data_loader import FeatureDataEnum, ProviderDataEnum
 from edenai_apis.loaders.loaders import load_feature, load_provider
 from edenai_apis.utils.constraints import validate_all_provider_constraints
-from edenai_apis.utils.exception import ProviderException, get_appropriate_error
+from edenai_apis.utils.exception import (
+    ProviderException,
+    ProviderTimeoutError,
+    get_appropriate_error,
+)
+from edenai_apis.utils.job_completion import (
+    JOB_ADAPTIVE_POLLING,
+    get_job_store,
+    register_job,
+)
+from edenai_apis.utils.job_scheduler import get_job_scheduler
 from edenai_apis.utils.monitoring import insert_api_call, monitor_call
-from edenai_apis.utils.types import AsyncLaunchJobResponseType
+from edenai_apis.utils.provider_pool import api_keys_fingerprint
+from edenai_apis.utils.streaming import STREAM_BUFFER_SIZE, OutputStream
+from edenai_apis.utils.types import AsyncLaunchJobResponseType, AsyncPendingResponseType
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -97,33 +127,9 @@ def list_features(
         (list | dict): Return all possible provider/feature/subfeature or provider/feature/subfeature/phase as a list or dict
     """
 
-    method_set: Set[FeatureSubfeatureProviderTuple] = set()
-    ApiClasses: List[Type[ProviderInterface]] = load_provider(ProviderDataEnum.CLASS)
-    for cls in ApiClasses:
-        if (
-            not provider_name or cls.provider_name == provider_name
-        ):  # filter for provider_name if provided
-            # detect feature,subfeature,phase by looking at methods names
-            for method_name in filter(
-                lambda method_name: not method_name.startswith("_")
-                and "__" in method_name
-                and getattr(getattr(cls, method_name), "__isabstractmethod__", False)
-                is False,  # do not include method that are not implemented yet (interfaces abstract methods)
-                dir(cls),
-            ):
-                feature_i, subfeature_i, *others = method_name.split("__")
-                if not (feature or feature == feature_i) and not (
-                    subfeature or subfeature == subfeature_i
-                ):  # filter by subfeature if provided
-                    if len(others) > 0 and "async" not in subfeature_i:
-                        phase = others[0]
-                        method_set.add(
-                            (cls.provider_name, feature_i, subfeature_i, phase)
-                        )
-                    else:
-                        method_set.add((cls.provider_name, feature_i, subfeature_i))
-    method_list: ProviderList = list(method_set)
-    method_list.sort()
+    method_list: ProviderList = get_capability_index().filter(
+        provider_name, feature, subfeature
+    )
     if not as_dict:
         return method_list  # return a list
 
@@ -161,15 +167,11 @@ def list_providers(
         List[str]: list of provider names
     """
     # TO DO: keep the set as output, don't convert to list
-    providers_set = set()
-    for provider, feature_i, subfeature_i, *_phase in list_features():
-        if not feature or feature_i == feature:
-            if not subfeature or subfeature_i == subfeature:
-                providers_set.add(provider)
-    return list(providers_set)
+    return list(get_capability_index().providers_for(feature, subfeature))
 
 
 STATUS_SUCCESS = "success"
+STATUS_FAIL = "fail"
 
 
 @monitor_call(condition=IS_MONITORING)
@@ -255,7 +257,23 @@ def compute_output(
             ).model_dump()
         except ProviderException as exc:
             raise get_appropriate_error(provider_name, exc)
+        if is_async:
+            # the completion notifications of the job can then be recorded
+            register_job(provider_name, subfeature_result.get("provider_job_id"))
+
+    return _final_result(
+        provider_name, feature, subfeature, subfeature_result, fake, user_email
+    )
+
 
+def _final_result(
+    provider_name: str,
+    feature: str,
+    subfeature: str,
+    subfeature_result: Dict[str, Any],
+    fake: bool,
+    user_email: Optional[str],
+) -> Dict[str, Any]:
     final_result: Dict[str, Any] = {
         "status": STATUS_SUCCESS,
         "provider": provider_name,
@@ -275,6 +293,102 @@ def compute_output(
     return final_result
 
 
+def _single_chunk(generated_text: str, provider_name: str):
+    return iter(
+        [ChatStreamResponse(text=generated_text, blocked=False, provider=provider_name)]
+    )
+
+
+def _stream_chunks(standardized_response: Any, provider_name: str):
+    if isinstance(standardized_response, StreamChat):
+        return standardized_response.stream
+    generated_text = getattr(standardized_response, "generated_text", None)
+    if generated_text is None:
+        raise ValueError("Only chat responses can be streamed")
+    # the provider answered at once, its answer is sent as a single chunk
+    return _single_chunk(generated_text, provider_name)
+
+
+def compute_output_stream(
+    provider_name: str,
+    feature: str,
+    subfeature: str,
+    args: Dict[str, Any],
+    phase: str = "",
+    fake: bool = False,
+    api_keys: Dict = {},
+    user_email: Optional[str] = None,
+    buffer_size: int = STREAM_BUFFER_SIZE,
+    cancel_event: Optional[threading.Event] = None,
+) -> OutputStream[ChatStreamResponse]:
+    """
+    Streaming version of `compute_output` for chat subfeatures: the provider is called
+    with `stream=True` and its chunks are returned as they are received, without
+    building the result dict.
+
+    Args:
+        provider_name, feature, subfeature, args, phase, fake, api_keys, user_email:
+            same as `compute_output`
+        buffer_size (int): chunks read ahead of the consumer (0: each chunk is read
+            from the provider when the consumer asks for it)
+        cancel_event (threading.Event, optional): cancels the stream when set, the
+            stream can also be cancelled with `OutputStream.cancel`
+
+    Returns:
+        OutputStream: iterator (`for` or `async for`) of `ChatStreamResponse`.
+        The call is monitored when the stream is over.
+    """
+    args = validate_all_provider_constraints(
+        provider_name, feature, subfeature, phase, args
+    )
+
+    def on_complete(_stream: Optional[OutputStream], error: Optional[BaseException]):
+        if IS_MONITORING:
+            insert_api_call(
+                provider=provider_name,
+                feature=feature,
+                subfeature=subfeature,
+                user_email=user_email,
+                error=str(error) if error else ("Fake" if fake else None),
+            )
+
+    def map_error(exc: BaseException) -> BaseException:
+        if isinstance(exc, ProviderException):
+            return get_appropriate_error(provider_name, exc)
+        return exc
+
+    if fake:
+        sample_output = load_provider(
+            ProviderDataEnum.OUTPUT,
+            provider_name=provider_name,
+            feature=feature,
+            subfeature=subfeature,
+            phase=phase,
+        )
+        chunks = _single_chunk(
+            sample_output["standardized_response"]["generated_text"], provider_name
+        )
+    else:
+        feature_class = getattr(interface_v2, feature.title())
+        subfeature_method_name = f'{subfeature}{f"__{phase}" if phase else ""}'
+        subfeature_class = getattr(feature_class, subfeature_method_name)
+        try:
+            result = subfeature_class(provider_name, api_keys)(**{**args, "stream": True})
+            chunks = _stream_chunks(result.standardized_response, provider_name)
+        except Exception as exc:
+            error = map_error(exc)
+            on_complete(None, error)
+            raise error
+
+    return OutputStream(
+        chunks,
+        buffer_size=buffer_size,
+        on_complete=on_complete,
+        map_error=map_error,
+        cancel_event=cancel_event,
+    )
+
+
 # HACK: Why this function is the package provider instead of the backend ?
 # It only use in the backend, never in the package provider
 def check_provider_constraints(
@@ -299,31 +413,22 @@ def check_provider_constraints(
         Tuple[bool, str]: Provider is ok, debug string
     """
 
-    # Refacto : use list_providers ?
-    subfeatures_providers = list_features(as_dict=True)
-    provider_info = subfeatures_providers.get(provider_name, None)
-    if not provider_info:
+    capability_index = get_capability_index()
+    if not capability_index.features_of(provider_name):
         return False, f"Provider : '{provider_name}' unknown."
-    if feature not in provider_info:
+    if not capability_index.supports(provider_name, feature, subfeature):
         return (
             False,
             f"Provider : '{provider_name}' does not provide an API for '{feature} {subfeature}'",
         )
-    if subfeature not in provider_info[feature]:
+    if phase and not capability_index.supports(
+        provider_name, feature, subfeature, phase
+    ):
         return (
             False,
-            f"Provider : '{provider_name}' does not provide an API for '{feature} {subfeature}'",
+            f"Provider : '{provider_name}' does not provide an API for "
+            + "'{feature} {subfeature} {phase}'",
         )
-    if phase:
-        if not isinstance(provider_info[feature][subfeature], dict) or (
-            isinstance(provider_info[feature][subfeature], dict)
-            and phase not in provider_info[feature][subfeature].keys()
-        ):
-            return (
-                False,
-                f"Provider : '{provider_name}' does not provide an API for "
-                + "'{feature} {subfeature} {phase}'",
-            )
 
     if constraints:
         for key, values in constraints:
@@ -368,6 +473,11 @@ def get_async_job_result(
 
     Returns:
         Dict: Result dict
+
+    With `JOB_ADAPTIVE_POLLING`, jobs polled with the same api keys are answered
+    from the job-state store (see `utils.job_completion`): completed jobs are not
+    polled again, and pending jobs are only polled once due, when the provider
+    notified us or according to an adaptive polling schedule.
     """
 
     if fake is True:
@@ -386,6 +496,12 @@ def get_async_job_result(
 
         return fake_result
 
+    stored_result = _stored_job_result(
+        provider_name, feature, subfeature, async_job_id, phase, api_keys
+    )
+    if stored_result is not None:
+        return stored_result
+
     feature_class = getattr(interface_v2, feature.title())
     subfeature_method_name = (
         f'{subfeature}{f"__{phase}" if phase else ""}__get_job_result'
@@ -399,4 +515,572 @@ def get_async_job_result(
     except ProviderException as exc:
         raise get_appropriate_error(provider_name, exc)
 
+    _record_job_result(
+        provider_name, feature, subfeature, async_job_id, phase, api_keys,
+        subfeature_result,
+    )
     return subfeature_result
+
+
+def _stored_job_result(
+    provider_name: str,
+    feature: str,
+    subfeature: str,
+    async_job_id: str,
+    phase: str,
+    api_keys: Dict,
+) -> Optional[Dict]:
+    """Result of a job answered from the job-state store, None if the provider
+    must be polled"""
+    if not JOB_ADAPTIVE_POLLING:
+        return None
+    job_state = get_job_store().get(provider_name, async_job_id)
+    if job_state is None or not job_state.is_owned_by(api_keys_fingerprint(api_keys)):
+        return None
+    if job_state.result is not None:
+        if job_state.result_kind == f"{feature}/{subfeature}/{phase}":
+            return copy.deepcopy(job_state.result)
+        return None
+    if not job_state.is_due():
+        return AsyncPendingResponseType(provider_job_id=async_job_id).model_dump()
+    return None
+
+
+def _record_job_result(
+    provider_name: str,
+    feature: str,
+    subfeature: str,
+    async_job_id: str,
+    phase: str,
+    api_keys: Dict,
+    subfeature_result: Dict,
+) -> None:
+    if JOB_ADAPTIVE_POLLING:
+        get_job_store().record_poll(
+            provider_name,
+            async_job_id,
+            subfeature_result,
+            f"{feature}/{subfeature}/{phase}",
+            api_keys_fingerprint(api_keys),
+        )
+
+
+# Providers implemented with blocking clients (requests and providers SDKs, eg:
+# boto3, google-cloud) are run on a shared bounded thread pool by the async and
+# fan-out calls. Providers implementing a subfeature as a coroutine (see
+# `interface_v2.get_provider_coroutine`) are awaited by the async calls instead, on
+# the aiohttp client of `utils.http`, so they do not hold a thread.
+PROVIDERS_MAX_WORKERS = int(os.environ.get("PROVIDERS_MAX_WORKERS", 64))
+_PROVIDERS_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_PROVIDERS_EXECUTOR_LOCK = threading.Lock()
+
+
+def _get_providers_executor() -> ThreadPoolExecutor:
+    global _PROVIDERS_EXECUTOR
+    if _PROVIDERS_EXECUTOR is None:
+        with _PROVIDERS_EXECUTOR_LOCK:
+            if _PROVIDERS_EXECUTOR is None:
+                _PROVIDERS_EXECUTOR = ThreadPoolExecutor(
+                    max_workers=PROVIDERS_MAX_WORKERS,
+                    thread_name_prefix="edenai_apis_providers",
+                )
+    return _PROVIDERS_EXECUTOR
+
+
+async def _run_in_executor(func, *args, **kwargs):
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(
+        _get_providers_executor(),
+        functools.partial(context.run, func, *args, **kwargs),
+    )
+
+
+async def _provider_coroutine(
+    provider_name: str, method_name: str, api_keys: Dict
+) -> Optional[Callable]:
+    try:
+        if not interface_v2.has_provider_coroutine(provider_name, method_name):
+            return None
+        # provider constructors may block (eg: boto3, aiplatform), the instance is
+        # built on the providers thread pool
+        return await _run_in_executor(
+            interface_v2.get_provider_coroutine, provider_name, method_name, api_keys
+        )
+    except Exception:  # pylint: disable=broad-except
+        # unknown provider, missing keys...: the blocking path raises the
+        # appropriate error
+        return None
+
+
+@monitor_call(condition=IS_MONITORING)
+async def _async_provider_output(
+    provider_name: str,
+    feature: str,
+    subfeature: str,
+    args: Dict[str, Any],
+    coroutine: Callable,
+    phase: str = "",
+    user_email: Optional[str] = None,
+) -> Dict:
+    args = validate_all_provider_constraints(
+        provider_name, feature, subfeature, phase, args
+    )
+    try:
+        subfeature_result = (await coroutine(**args)).model_dump()
+    except ProviderException as exc:
+        raise get_appropriate_error(provider_name, exc)
+    return _final_result(
+        provider_name, feature, subfeature, subfeature_result, False, user_email
+    )
+
+
+@monitor_call(condition=IS_MONITORING)
+async def _async_provider_job_result(
+    provider_name: str,
+    feature: str,
+    subfeature: str,
+    async_job_id: str,
+    coroutine: Callable,
+    phase: str = "",
+    user_email=None,
+    api_keys=dict(),
+) -> Dict:
+    stored_result = _stored_job_result(
+        provider_name, feature, subfeature, async_job_id, phase, api_keys
+    )
+    if stored_result is not None:
+        return stored_result
+    try:
+        subfeature_result = (await coroutine(async_job_id)).model_dump()
+    except ProviderException as exc:
+        raise get_appropriate_error(provider_name, exc)
+    _record_job_result(
+        provider_name, feature, subfeature, async_job_id, phase, api_keys,
+        subfeature_result,
+    )
+    return subfeature_result
+
+
+async def async_compute_output(
+    provider_name: str,
+    feature: str,
+    subfeature: str,
+    args: Dict[str, Any],
+    phase: str = "",
+    fake: bool = False,
+    api_keys: Dict = {},
+    user_email: Optional[str] = None,
+) -> Dict:
+    """
+    Asynchronous version of `compute_output`, can be awaited from an event loop
+    to run many providers calls concurrently. Takes the same arguments.
+
+    The coroutine of the provider subfeature is awaited when it has one, the
+    blocking method is otherwise run on the providers thread pool.
+
+    Returns:
+        dict: Result dict
+    """
+    is_async = ("_async" in phase) if phase else ("_async" in subfeature)
+    suffix = "__launch_job" if is_async else ""
+    coroutine = None if fake else await _provider_coroutine(
+        provider_name,
+        f'{feature}__{subfeature}{f"__{phase}" if phase else ""}{suffix}',
+        api_keys,
+    )
+    if coroutine is not None:
+        result = await _async_provider_output(
+            provider_name,
+            feature,
+            subfeature,
+            args,
+            coroutine,
+            phase=phase,
+            user_email=user_email,
+        )
+        if is_async:
+            register_job(provider_name, result.get("provider_job_id"))
+        return result
+
+    return await _run_in_executor(
+        compute_output,
+        provider_name,
+        feature,
+        subfeature,
+        args,
+        phase=phase,
+        fake=fake,
+        api_keys=api_keys,
+        user_email=user_email,
+    )
+
+
+async def async_compute_output_stream(
+    provider_name: str,
+    feature: str,
+    subfeature: str,
+    args: Dict[str, Any],
+    phase: str = "",
+    fake: bool = False,
+    api_keys: Dict = {},
+    user_email: Optional[str] = None,
+    buffer_size: int = STREAM_BUFFER_SIZE,
+    cancel_event: Optional[threading.Event] = None,
+) -> OutputStream[ChatStreamResponse]:
+    """
+    Asynchronous version of `compute_output_stream`, the returned stream can be
+    consumed with `async for`. Takes the same arguments.
+    """
+    return await _run_in_executor(
+        compute_output_stream,
+        provider_name,
+        feature,
+        subfeature,
+        args,
+        phase=phase,
+        fake=fake,
+        api_keys=api_keys,
+        user_email=user_email,
+        buffer_size=buffer_size,
+        cancel_event=cancel_event,
+    )
+
+
+async def async_get_async_job_result(
+    provider_name: str,
+    feature: str,
+    subfeature: str,
+    async_job_id: AsyncLaunchJobResponseType,
+    phase: str = "",
+    fake: bool = False,
+    user_email=None,
+    api_keys=dict(),
+) -> Dict:
+    """
+    Asynchronous version of `get_async_job_result`. Takes the same arguments.
+
+    The coroutine of the provider subfeature is awaited when it has one, the
+    blocking method is otherwise run on the providers thread pool.
+
+    Returns:
+        Dict: Result dict
+    """
+    coroutine = None if fake else await _provider_coroutine(
+        provider_name,
+        f'{feature}__{subfeature}{f"__{phase}" if phase else ""}__get_job_result',
+        api_keys,
+    )
+    if coroutine is not None:
+        return await _async_provider_job_result(
+            provider_name,
+            feature,
+            subfeature,
+            async_job_id,
+            coroutine,
+            phase=phase,
+            user_email=user_email,
+            api_keys=api_keys,
+        )
+
+    return await _run_in_executor(
+        get_async_job_result,
+        provider_name,
+        feature,
+        subfeature,
+        async_job_id,
+        phase=phase,
+        fake=fake,
+        user_email=user_email,
+        api_keys=api_keys,
+    )
+
+
+def _submit_async_job(
+    provider_name: str,
+    feature: str,
+    subfeature: str,
+    async_job_id: str,
+    phase: str,
+    fake: bool,
+    user_email,
+    api_keys: Dict,
+    timeout: Optional[float],
+) -> Future:
+    poll = functools.partial(
+        get_async_job_result,
+        provider_name,
+        feature,
+        subfeature,
+        async_job_id,
+        phase=phase,
+        fake=fake,
+        user_email=user_email,
+        api_keys=api_keys,
+    )
+    # callers only share the polls of a job for the same api keys and result kind
+    scope = (api_keys_fingerprint(api_keys), feature, subfeature, phase, fake)
+    return get_job_scheduler().submit(
+        provider_name, async_job_id, poll, timeout=timeout, scope=scope
+    )
+
+
+def wait_for_async_job_result(
+    provider_name: str,
+    feature: str,
+    subfeature: str,
+    async_job_id: str,
+    phase: str = "",
+    fake: bool = False,
+    user_email=None,
+    api_keys=dict(),
+    timeout: Optional[float] = None,
+) -> Dict:
+    """Wait for the final result of an async job.
+
+    The job is polled by the shared job scheduler (see `utils.job_scheduler`), the
+    calling thread only waits for its completion. Takes the same arguments as
+    `get_async_job_result`, plus:
+
+    Args:
+        timeout (float): max seconds to wait, `ProviderTimeoutError` is raised after
+
+    Returns:
+        Dict: Result dict, with a `succeeded` or `failed` status
+    """
+    future = _submit_async_job(
+        provider_name,
+        feature,
+        subfeature,
+        async_job_id,
+        phase,
+        fake,
+        user_email,
+        api_keys,
+        timeout,
+    )
+    return future.result()
+
+
+async def async_wait_for_async_job_result(
+    provider_name: str,
+    feature: str,
+    subfeature: str,
+    async_job_id: str,
+    phase: str = "",
+    fake: bool = False,
+    user_email=None,
+    api_keys=dict(),
+    timeout: Optional[float] = None,
+) -> Dict:
+    """
+    Asynchronous version of `wait_for_async_job_result`. Takes the same arguments.
+    No thread is used while the job is pending.
+    """
+    future = _submit_async_job(
+        provider_name,
+        feature,
+        subfeature,
+        async_job_id,
+        phase,
+        fake,
+        user_email,
+        api_keys,
+        timeout,
+    )
+    return await asyncio.wrap_future(future)
+
+
+FanOutMode = Literal["all", "race", "fallback"]
+
+
+def _failed_result(provider_name: str, exc: Exception) -> Dict[str, Any]:
+    return {
+        "status": STATUS_FAIL,
+        "provider": provider_name,
+        "error": {"type": type(exc).__name__, "message": str(exc)},
+    }
+
+
+# `concurrent.futures.wait` is not woken up when a queued call starts, so the race
+# mode checks the timeouts of the calls started in the meantime at this interval
+QUEUED_CALL_POLL_INTERVAL = 0.05
+
+
+class _ProviderCall:
+    """Call submitted to the providers thread pool, its timeout runs from the
+    moment it starts: the time spent queued behind other calls is not counted"""
+
+    __slots__ = ("provider_name", "future", "started_at", "_started")
+
+    def __init__(
+        self, executor: ThreadPoolExecutor, provider_name: str, func: Callable
+    ) -> None:
+        self.provider_name = provider_name
+        self.started_at: Optional[float] = None
+        self._started = threading.Event()
+        context = contextvars.copy_context()
+        self.future: Future = executor.submit(self._run, context, func)
+        # calls cancelled before they start are not waited for
+        self.future.add_done_callback(lambda _: self._started.set())
+
+    def _run(self, context: contextvars.Context, func: Callable) -> Any:
+        self.started_at = time.monotonic()
+        self._started.set()
+        return context.run(func)
+
+    def remaining(self, timeout: Optional[float]) -> Optional[float]:
+        """Time left before the call times out, None if it has no timeout yet"""
+        if timeout is None or self.started_at is None:
+            return None
+        return max(0.0, self.started_at + timeout - time.monotonic())
+
+    def result(self, timeout: Optional[float]) -> Any:
+        if timeout is not None:
+            self._started.wait()
+        return self.future.result(timeout=self.remaining(timeout))
+
+
+def compute_output_multi(
+    providers: List[str],
+    feature: str,
+    subfeature: str,
+    args: Dict[str, Any],
+    mode: FanOutMode = "all",
+    phase: str = "",
+    fake: bool = False,
+    api_keys: Dict[str, Dict] = {},
+    user_email: Optional[str] = None,
+    timeout: Optional[float] = None,
+) -> Union[Dict[str, Any], Dict[str, Dict[str, Any]]]:
+    """
+    Compute the same subfeature with several providers
+
+    Each provider call goes through `compute_output` (so its inputs are validated
+    once against the provider constraints) and runs on the shared providers thread pool.
+
+    The timeout of each call runs from the moment it starts on the thread pool.
+    Calls that time out are not cancelled (a running thread cannot be stopped):
+    they keep running in the background and are still billed by the provider,
+    their result is ignored. Eg: in `fallback` mode, the next provider is called
+    while the timed out one is still running.
+
+    Modes:
+        - `all`: call all providers concurrently and return all results, keyed by provider.
+            Failed (or timed out) providers have a `fail` status and an `error`.
+        - `race`: call all providers concurrently and return the first successful result.
+            Calls that didn't start yet are cancelled, running ones are ignored.
+        - `fallback`: call providers one after the other, in the given order,
+            and return the first successful result.
+
+    Args:
+        providers (List[str]): EdenAI providers names
+        feature (str): EdenAI feature name
+        subfeature (str): EdenAI subfeature name
+        args (Dict): inputs arguments for the feature call
+        mode (str): `all`, `race` or `fallback`. Defaults to `all`.
+        phase (str): Eden AI phase name if given. Defaults to `""`.
+        fake (bool, optional): take result from sample. Defaults to `False`.
+        api_keys (dict, optional): optional user's api_keys, keyed by provider
+        user_email (str, optional): optinal user email for monitoring
+        timeout (float, optional): max time to wait for each provider call, from
+            the moment it starts, in seconds
+
+    Returns:
+        dict: the first successful result for `race` and `fallback` modes,
+            results of each provider for `all` mode
+
+    Raises:
+        ProviderException: in `race` and `fallback` modes, the last provider error
+            if no provider succeeded
+    """
+    if not providers:
+        raise ValueError("At least one provider is required")
+    if mode not in ("all", "race", "fallback"):
+        raise ValueError(f"Unknown mode '{mode}', use one of: all, race, fallback")
+
+    executor = _get_providers_executor()
+
+    def submit(provider_name: str) -> _ProviderCall:
+        return _ProviderCall(
+            executor,
+            provider_name,
+            functools.partial(
+                compute_output,
+                provider_name,
+                feature,
+                subfeature,
+                args.copy(),
+                phase=phase,
+                fake=fake,
+                api_keys=api_keys.get(provider_name, {}),
+                user_email=user_email,
+            ),
+        )
+
+    def timeout_error(provider_name: str) -> ProviderTimeoutError:
+        return ProviderTimeoutError(
+            f"Provider '{provider_name}' did not respond within {timeout} seconds"
+        )
+
+    if mode == "fallback":
+        last_error: Optional[Exception] = None
+        for provider_name in providers:
+            call = submit(provider_name)
+            try:
+                return call.result(timeout)
+            except FutureTimeoutError:
+                last_error = timeout_error(provider_name)
+            except Exception as exc:
+                last_error = exc
+        raise last_error
+
+    calls = {call.future: call for call in map(submit, providers)}
+
+    if mode == "all":
+        results: Dict[str, Dict[str, Any]] = {}
+        for call in calls.values():
+            provider_name = call.provider_name
+            try:
+                results[provider_name] = call.result(timeout)
+            except FutureTimeoutError:
+                results[provider_name] = _failed_result(
+                    provider_name, timeout_error(provider_name)
+                )
+            except Exception as exc:
+                results[provider_name] = _failed_result(provider_name, exc)
+        return results
+
+    # race
+    pending = set(calls)
+    last_error = None
+    try:
+        while pending:
+            wait_timeout = None
+            if timeout is not None:
+                remainings = [calls[future].remaining(timeout) for future in pending]
+                started = [
+                    remaining for remaining in remainings if remaining is not None
+                ]
+                if len(started) < len(remainings):
+                    started.append(QUEUED_CALL_POLL_INTERVAL)
+                wait_timeout = min(started)
+            done, pending = wait(
+                pending, timeout=wait_timeout, return_when=FIRST_COMPLETED
+            )
+            for future in done:
+                if future.exception() is None:
+                    return future.result()
+                last_error = future.exception()
+            timed_out = {
+                future for future in pending if calls[future].remaining(timeout) == 0
+            }
+            if timed_out:
+                pending -= timed_out
+                last_error = timeout_error(
+                    ", ".join(calls[future].provider_name for future in timed_out)
+                )
+    finally:
+        for future in pending:
+            future.cancel()
+    raise last_error
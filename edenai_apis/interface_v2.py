@@ -10,13 +10,14 @@ Example:
     >>> 3d_from_img = 3DModels.create_3d_model_from_image('<provider_here>')
     >>> response = 3d_from_img(image=...)
 """
-from typing import Callable, Dict, Type
+from typing import Callable, Dict, Optional, Type
 
 from edenai_apis.features import AudioInterface, ImageInterface, OcrInterface
 from edenai_apis.features import ProviderInterface
 from edenai_apis.features import TextInterface, TranslationInterface, VideoInterface
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
+from edenai_apis.utils.provider_pool import get_provider_instance
 
 
 def return_provider_method(func: Callable) -> Callable:
@@ -38,13 +39,10 @@ def return_provider_method(func: Callable) -> Callable:
         Returns:
             Callable: provider's function
         """
-        # Get the provider's class.
-        # Example : GoogleAPI
-        ProviderClass = load_provider(ProviderDataEnum.CLASS, provider_name=provider)
-
-        # Instantiate the provider's class.
+        # Get an instance of the provider's class, reused from the pool
+        # if it was already built with the same api_keys.
         # Example : google_api = GoogleAPI()
-        provider_instance = ProviderClass(api_keys)
+        provider_instance = get_provider_instance(provider, api_keys)
 
         # Get the right function.
         # Example : google_api.image__object_detection
@@ -55,6 +53,30 @@ def return_provider_method(func: Callable) -> Callable:
     return wrapped
 
 
+# Providers calling plain http apis can also implement a subfeature as a coroutine
+# using `utils.http.async_http_client`, named after the method with this prefix
+# (eg: `async def _async_text__moderation(self, text, language)`), so that
+# `interface.async_compute_output` awaits it instead of running the method on a
+# thread. The prefix keeps the coroutines out of the capability index.
+ASYNC_METHOD_PREFIX = "_async_"
+
+
+def has_provider_coroutine(provider: str, method_name: str) -> bool:
+    """Check if the provider class implements the `method_name` method as a
+    coroutine, without building the provider"""
+    ProviderClass = load_provider(ProviderDataEnum.CLASS, provider_name=provider)
+    return hasattr(ProviderClass, f"{ASYNC_METHOD_PREFIX}{method_name}")
+
+
+def get_provider_coroutine(
+    provider: str, method_name: str, api_keys: Dict = {}
+) -> Optional[Callable]:
+    """Return the coroutine implementing the `method_name` method (eg:
+    `text__moderation`) of the provider, None if it only has the blocking method"""
+    provider_instance = get_provider_instance(provider, api_keys)
+    return getattr(provider_instance, f"{ASYNC_METHOD_PREFIX}{method_name}", None)
+
+
 def abstract(InterfaceClass: Type[ProviderInterface], method_prefix: str):
     """create an Abstracted Class and set all the methods of given InterfaceClass
     to it with modified names, methods have the same names as the subfeature
@@ -0,0 +1,225 @@
+"""
+Precomputed index of what each provider implements.
+
+Detecting providers capabilities requires a reflection scan of every provider class
+(looking at implemented `feature__subfeature[__phase]` methods). The scan is done
+once, the first time the index is needed, and the result is kept in memory:
+
+    provider -> feature -> subfeature -> phases
+    (feature, subfeature) -> providers
+
+The index can also be saved to a json snapshot with `save_capability_index`.
+A snapshot of all providers is shipped with the package (`apis/capabilities.json`,
+regenerate it with `scripts/capability_index.py` when adding or removing a
+subfeature), so listing features doesn't need to import any provider package.
+The `EDENAI_CAPABILITY_INDEX` environment variable can point to another snapshot.
+"""
+import json
+import os
+import threading
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple, Type
+
+from edenai_apis.features.provider.provider_interface import ProviderInterface
+from edenai_apis.settings import capabilities_path
+
+CAPABILITY_INDEX_ENV = "EDENAI_CAPABILITY_INDEX"
+SNAPSHOT_VERSION = 1
+
+CapabilityTuple = Tuple[str, ...]
+
+
+def scan_provider_class(cls: Type[ProviderInterface]) -> Set[CapabilityTuple]:
+    """Detect (provider, feature, subfeature) or (provider, feature, subfeature, phase)
+    implemented by a provider class by looking at its methods names"""
+    capabilities: Set[CapabilityTuple] = set()
+    for method_name in filter(
+        lambda method_name: not method_name.startswith("_")
+        and "__" in method_name
+        and getattr(getattr(cls, method_name), "__isabstractmethod__", False)
+        is False,  # do not include method that are not implemented yet (interfaces abstract methods)
+        dir(cls),
+    ):
+        feature, subfeature, *others = method_name.split("__")
+        if len(others) > 0 and "async" not in subfeature:
+            capabilities.add((cls.provider_name, feature, subfeature, others[0]))
+        else:
+            capabilities.add((cls.provider_name, feature, subfeature))
+    return capabilities
+
+
+class CapabilityIndex:
+    """Immutable lookup structure built from a list of capability tuples
+
+    Args:
+        capabilities (Iterable[Tuple]): (provider, feature, subfeature[, phase]) tuples
+    """
+
+    def __init__(self, capabilities: Iterable[CapabilityTuple]) -> None:
+        self.capabilities: Tuple[CapabilityTuple, ...] = tuple(
+            sorted(set(map(tuple, capabilities)))
+        )
+        tree: Dict[str, Dict[str, Dict[str, Set[str]]]] = {}
+        reverse: Dict[Tuple[str, str], Set[str]] = {}
+        for provider, feature, subfeature, *phase in self.capabilities:
+            phases = tree.setdefault(provider, {}).setdefault(feature, {}).setdefault(
+                subfeature, set()
+            )
+            if phase:
+                phases.add(phase[0])
+            reverse.setdefault((feature, subfeature), set()).add(provider)
+
+        self._tree: Dict[str, Dict[str, Dict[str, FrozenSet[str]]]] = {
+            provider: {
+                feature: {
+                    subfeature: frozenset(phases)
+                    for subfeature, phases in subfeatures.items()
+                }
+                for feature, subfeatures in features.items()
+            }
+            for provider, features in tree.items()
+        }
+        self._providers_by_subfeature: Dict[Tuple[str, str], FrozenSet[str]] = {
+            key: frozenset(providers) for key, providers in reverse.items()
+        }
+        self._providers_by_feature: Dict[str, FrozenSet[str]] = {}
+        for (feature, _subfeature), providers in self._providers_by_subfeature.items():
+            self._providers_by_feature[feature] = (
+                self._providers_by_feature.get(feature, frozenset()) | providers
+            )
+
+    @property
+    def providers(self) -> List[str]:
+        """All providers names, sorted"""
+        return sorted(self._tree)
+
+    def filter(
+        self,
+        provider_name: Optional[str] = None,
+        feature: Optional[str] = None,
+        subfeature: Optional[str] = None,
+    ) -> List[CapabilityTuple]:
+        """Return sorted capabilities tuples matching the given filters"""
+        if not (provider_name or feature or subfeature):
+            return list(self.capabilities)
+        return [
+            capability
+            for capability in self.capabilities
+            if (not provider_name or capability[0] == provider_name)
+            and (not feature or capability[1] == feature)
+            and (not subfeature or capability[2] == subfeature)
+        ]
+
+    def providers_for(
+        self, feature: Optional[str] = None, subfeature: Optional[str] = None
+    ) -> FrozenSet[str]:
+        """Return providers implementing the given feature and/or subfeature"""
+        if feature and subfeature:
+            return self._providers_by_subfeature.get((feature, subfeature), frozenset())
+        if feature:
+            return self._providers_by_feature.get(feature, frozenset())
+        if subfeature:
+            return frozenset().union(
+                *(
+                    providers
+                    for (_feature, subfeature_i), providers in self._providers_by_subfeature.items()
+                    if subfeature_i == subfeature
+                )
+            )
+        return frozenset(self._tree)
+
+    def features_of(self, provider_name: str) -> Dict[str, Dict[str, FrozenSet[str]]]:
+        """Return feature -> subfeature -> phases for a provider"""
+        return self._tree.get(provider_name, {})
+
+    def phases(
+        self, provider_name: str, feature: str, subfeature: str
+    ) -> Optional[FrozenSet[str]]:
+        """Return phases of a subfeature for a provider (empty if it has none),
+        or `None` if the provider doesn't implement the subfeature"""
+        return self._tree.get(provider_name, {}).get(feature, {}).get(subfeature)
+
+    def supports(
+        self,
+        provider_name: str,
+        feature: str,
+        subfeature: str,
+        phase: Optional[str] = None,
+    ) -> bool:
+        """Check if a provider implements a feature/subfeature (and phase if given)"""
+        phases = self.phases(provider_name, feature, subfeature)
+        if phases is None:
+            return False
+        return not phase or phase in phases
+
+    def to_dict(self) -> Dict:
+        return {
+            "version": SNAPSHOT_VERSION,
+            "capabilities": [list(capability) for capability in self.capabilities],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "CapabilityIndex":
+        if data.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(
+                f"Unsupported capability index snapshot version: {data.get('version')}"
+            )
+        return cls(tuple(capability) for capability in data["capabilities"])
+
+
+def build_capability_index() -> CapabilityIndex:
+    """Scan all providers classes and build a new index"""
+    # imported here to avoid circular imports with data_loader
+    from edenai_apis.loaders.data_loader import load_class
+
+    capabilities: Set[CapabilityTuple] = set()
+    for cls in load_class():
+        capabilities |= scan_provider_class(cls)
+    return CapabilityIndex(capabilities)
+
+
+def save_capability_index(
+    path: str = capabilities_path, index: Optional[CapabilityIndex] = None
+) -> str:
+    """Write a json snapshot of the index (the current one if not given) to `path`"""
+    index = index or get_capability_index()
+    data = index.to_dict()
+    # one capability per line to keep the snapshot readable in diffs
+    capabilities = ",\n    ".join(json.dumps(item) for item in data["capabilities"])
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(
+            f'{{\n  "version": {data["version"]},\n'
+            f'  "capabilities": [\n    {capabilities}\n  ]\n}}\n'
+        )
+    return path
+
+
+def load_capability_index(path: str) -> CapabilityIndex:
+    """Load an index from a json snapshot"""
+    with open(path, "r", encoding="utf-8") as f:
+        return CapabilityIndex.from_dict(json.load(f))
+
+
+_CAPABILITY_INDEX: Optional[CapabilityIndex] = None
+_CAPABILITY_INDEX_LOCK = threading.Lock()
+
+
+def get_capability_index() -> CapabilityIndex:
+    """Return the process-wide index, building (or loading) it on first use"""
+    global _CAPABILITY_INDEX
+    if _CAPABILITY_INDEX is not None:
+        return _CAPABILITY_INDEX
+    with _CAPABILITY_INDEX_LOCK:
+        if _CAPABILITY_INDEX is None:
+            snapshot_path = os.environ.get(CAPABILITY_INDEX_ENV, capabilities_path)
+            if snapshot_path and os.path.isfile(snapshot_path):
+                _CAPABILITY_INDEX = load_capability_index(snapshot_path)
+            else:
+                _CAPABILITY_INDEX = build_capability_index()
+    return _CAPABILITY_INDEX
+
+
+def reset_capability_index() -> None:
+    """Forget the process-wide index, it will be rebuilt on next use"""
+    global _CAPABILITY_INDEX
+    with _CAPABILITY_INDEX_LOCK:
+        _CAPABILITY_INDEX = None
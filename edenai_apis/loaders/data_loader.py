@@ -8,7 +8,6 @@ from pydantic import BaseModel
 from edenai_apis.features.provider.provider_interface import ProviderInterface
 from edenai_apis.loaders.utils import load_json, check_messsing_keys
 from edenai_apis.settings import info_path, keys_path, outputs_path
-from edenai_apis.utils.compare import is_valid
 
 
 class FeatureDataEnum(Enum):
@@ -76,22 +75,19 @@ def load_class(
     """
     from edenai_apis import apis
 
-    api_class_list: List[Type[ProviderInterface]] = [
-        getattr(apis, api) for api in dir(apis) if is_valid(".*Api", api)
-    ]
-    api_class_list.sort(key=lambda api: api.provider_name)
     if provider_name:
-        # get first occurence of class with given provider_name, or None
-        api_class: Optional[Type[ProviderInterface]] = next(
-            filter(lambda cls: cls.provider_name == provider_name, api_class_list), None
-        )
-
-        if api_class is None:
+        # only import the requested provider package
+        class_name = apis.PROVIDERS.get(provider_name)
+        if class_name is None:
             raise ValueError(
                 f"No ProviderInterface class implemented for provider: {provider_name}."
             )
+        return getattr(apis, class_name)
 
-        return api_class
+    api_class_list: List[Type[ProviderInterface]] = [
+        getattr(apis, class_name) for class_name in apis.PROVIDERS.values()
+    ]
+    api_class_list.sort(key=lambda api: api.provider_name)
     return api_class_list
 
 
@@ -143,9 +139,9 @@ def load_info_file(provider_name: str = "") -> Dict:
         return load_json(info_path(provider_name))
 
     all_infos = {}
-    for provider_name_i in map(
-        lambda provider_class: provider_class.provider_name, load_class()
-    ):
+    from edenai_apis import apis
+
+    for provider_name_i in apis.PROVIDERS:
         provider_info = load_info_file(provider_name_i)
         for feature in provider_info:
             for subfeature in provider_info[feature]:
@@ -4,13 +4,29 @@ Module that contains loaders function that returns various types data
 from features & provider
 data function are defined in `edenai_apis.loaders.data_loaders`
 """
+import functools
 import inspect
-from importlib import import_module
-from typing import Optional
+from typing import Callable, Dict, FrozenSet, Optional
 
+from edenai_apis.loaders import data_loader
 from edenai_apis.loaders.data_loader import FeatureDataEnum, ProviderDataEnum
 
 
+@functools.lru_cache(maxsize=None)
+def _loader_parameters(load_data_function: Callable) -> FrozenSet[str]:
+    """Names of the arguments of a data_loader function, computed once per function"""
+    return frozenset(inspect.signature(load_data_function).parameters)
+
+
+def _call_data_loader(function_name: str, args: Dict):
+    # the function is looked up on each call so it can be patched in tests
+    load_data_function = getattr(data_loader, function_name)
+    parameters = _loader_parameters(load_data_function)
+    return load_data_function(
+        **{key: val for key, val in args.items() if key in parameters}
+    )
+
+
 def load_feature(
     data_feature: FeatureDataEnum,
     provider_name: str = "",
@@ -44,20 +60,15 @@ def load_feature(
     Returns:
         - Any: The returned value of data_loader function
     """
-    args = locals()
-    if args.get("kwargs") is not None and len(args["kwargs"]) != 0:
-        more_args_dict: dict = args["kwargs"]
-        for key, val in more_args_dict.items():
-            args[key] = val
-    del args["kwargs"]
-
-    load_data_module = import_module("edenai_apis.loaders.data_loader")
-    load_data_function = getattr(load_data_module, data_feature.value)
-
-    args_data_function = list(inspect.signature(load_data_function).parameters.keys())
-    args_to_use = {key: val for key, val in args.items() if key in args_data_function}
-
-    return load_data_function(**args_to_use)
+    args = {
+        "provider_name": provider_name,
+        "feature": feature,
+        "subfeature": subfeature,
+        "phase": phase,
+        "suffix": suffix,
+        **kwargs,
+    }
+    return _call_data_loader(data_feature.value, args)
 
 
 def load_provider(
@@ -92,17 +103,12 @@ def load_provider(
     Returns:
         - Any: The returned value of data_loader function
     """
-    args = locals()
-    if args.get("kwargs") is not None and len(args["kwargs"]) != 0:
-        more_args_dict: dict = args["kwargs"]
-        for key, val in more_args_dict.items():
-            args[key] = val
-    del args["kwargs"]
-
-    load_data_module = import_module("edenai_apis.loaders.data_loader")
-    load_data_function = getattr(load_data_module, data_provider.value)
-
-    args_data_function = list(inspect.signature(load_data_function).parameters.keys())
-    args_to_use = {key: val for key, val in args.items() if key in args_data_function}
-
-    return load_data_function(**args_to_use)
+    args = {
+        "provider_name": provider_name,
+        "feature": feature,
+        "subfeature": subfeature,
+        "phase": phase,
+        "suffix": suffix,
+        **kwargs,
+    }
+    return _call_data_loader(data_provider.value, args)
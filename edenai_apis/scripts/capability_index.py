@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+"""
+Generate the capability index snapshot shipped with the package (apis/capabilities.json)
+by scanning all providers classes.
+Run it each time a subfeature is added or removed from a provider.
+"""
+from edenai_apis.loaders.capability_index import (
+    build_capability_index,
+    save_capability_index,
+)
+from edenai_apis.settings import capabilities_path
+
+
+def main():
+    print(f"=== Generating {capabilities_path} ===")
+    index = build_capability_index()
+    save_capability_index(capabilities_path, index)
+    print(f"{len(index.capabilities)} subfeatures for {len(index.providers)} providers")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,5 +9,6 @@ keys_path = os.environ.get("API_KEYS_PATH", os.path.join(base_path, "api_keys"))
 apis_path = os.path.join(base_path, "apis")
 features_path = os.path.join(base_path, "features")
 outputs_path = lambda provider: os.path.join(apis_path, provider, "outputs")
+capabilities_path = os.path.join(apis_path, "capabilities.json")
 info_path = lambda provider: os.path.join(apis_path, provider, "info.json")
 loader_path = os.path.join(base_path, "loaders_new", "data_loader")
@@ -0,0 +1,120 @@
+import os
+import time
+
+import pytest
+
+from edenai_apis.interface import check_provider_constraints, list_features
+from edenai_apis.loaders.capability_index import (
+    CAPABILITY_INDEX_ENV,
+    CapabilityIndex,
+    build_capability_index,
+    get_capability_index,
+    load_capability_index,
+    reset_capability_index,
+    save_capability_index,
+)
+from edenai_apis.loaders.data_loader import load_class
+
+CAPABILITIES = [
+    ("amazon", "audio", "text_to_speech"),
+    ("google", "audio", "text_to_speech"),
+    ("google", "image", "search", "upload_image"),
+    ("google", "image", "search", "launch_similarity"),
+    ("openai", "text", "chat"),
+]
+
+
+def _legacy_list_features():
+    """Reflection scan done by list_features before the index"""
+    method_set = set()
+    for cls in load_class():
+        for method_name in filter(
+            lambda method_name: not method_name.startswith("_")
+            and "__" in method_name
+            and getattr(getattr(cls, method_name), "__isabstractmethod__", False)
+            is False,
+            dir(cls),
+        ):
+            feature_i, subfeature_i, *others = method_name.split("__")
+            if len(others) > 0 and "async" not in subfeature_i:
+                method_set.add((cls.provider_name, feature_i, subfeature_i, others[0]))
+            else:
+                method_set.add((cls.provider_name, feature_i, subfeature_i))
+    return sorted(method_set)
+
+
+class TestCapabilityIndex:
+    def test_filter(self):
+        index = CapabilityIndex(CAPABILITIES)
+        assert index.filter() == sorted(CAPABILITIES)
+        assert index.filter(provider_name="amazon") == [CAPABILITIES[0]]
+        assert len(index.filter(feature="audio")) == 2
+        assert len(index.filter(provider_name="google", subfeature="search")) == 2
+
+    def test_providers_for(self):
+        index = CapabilityIndex(CAPABILITIES)
+        assert index.providers_for("audio", "text_to_speech") == {"amazon", "google"}
+        assert index.providers_for("text") == {"openai"}
+        assert index.providers_for(subfeature="search") == {"google"}
+        assert index.providers_for() == {"amazon", "google", "openai"}
+        assert index.providers_for("video", "label_detection_async") == set()
+
+    def test_supports(self):
+        index = CapabilityIndex(CAPABILITIES)
+        assert index.supports("google", "image", "search")
+        assert index.supports("google", "image", "search", "upload_image")
+        assert not index.supports("google", "image", "search", "delete_image")
+        assert index.phases("amazon", "audio", "text_to_speech") == frozenset()
+        assert index.phases("amazon", "image", "search") is None
+
+    def test_snapshot(self, tmp_path):
+        index = CapabilityIndex(CAPABILITIES)
+        path = save_capability_index(str(tmp_path / "index.json"), index)
+        assert load_capability_index(path).capabilities == index.capabilities
+
+    def test_snapshot_loaded_from_env(self, tmp_path, monkeypatch):
+        path = save_capability_index(
+            str(tmp_path / "index.json"), CapabilityIndex(CAPABILITIES)
+        )
+        monkeypatch.setenv(CAPABILITY_INDEX_ENV, path)
+        reset_capability_index()
+        try:
+            assert get_capability_index().providers == ["amazon", "google", "openai"]
+        finally:
+            monkeypatch.delenv(CAPABILITY_INDEX_ENV)
+            reset_capability_index()
+
+
+def test_index_matches_reflection_scan():
+    assert list_features() == _legacy_list_features()
+    assert build_capability_index().capabilities == tuple(_legacy_list_features())
+
+
+def test_check_provider_constraints_with_phase():
+    assert check_provider_constraints(
+        "amazon", "image", "face_recognition", "add_face"
+    )[0]
+    assert not check_provider_constraints("amazon", "audio", "text_to_speech", "x")[0]
+    assert not check_provider_constraints("unknown", "audio", "text_to_speech")[0]
+
+
+@pytest.mark.skipif(
+    os.environ.get("TEST_SCOPE") == "CICD-OPENSOURCE",
+    reason="Don't run benchmarks on opensource cicd workflow",
+)
+def test_benchmark_index_lookup_vs_reflection_scan():
+    get_capability_index()  # build the index before timing lookups
+    iterations = 20
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        providers = {p for p, f, s, *_ in _legacy_list_features() if s == "chat"}
+    legacy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        indexed_providers = get_capability_index().providers_for("text", "chat")
+    index_time = time.perf_counter() - start
+
+    assert indexed_providers == providers
+    assert index_time * 100 < legacy_time
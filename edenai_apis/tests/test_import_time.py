@@ -0,0 +1,73 @@
+"""
+Guard against cold-start regressions:
+providers packages (and their heavy dependencies) must only be imported when needed.
+"""
+import os
+import subprocess
+import sys
+from typing import Dict
+
+import edenai_apis
+from edenai_apis.apis import PROVIDERS
+
+# make edenai_apis importable in the subprocess even if the package isn't installed
+PACKAGE_ROOT = os.path.dirname(os.path.dirname(edenai_apis.__file__))
+
+
+def _import_times(code: str) -> Dict[str, int]:
+    """Run `code` in a fresh interpreter with `-X importtime`
+    and return imported modules with their cumulative import time (us)"""
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={
+            **os.environ,
+            "PYTHONPATH": os.pathsep.join(
+                filter(None, [PACKAGE_ROOT, os.environ.get("PYTHONPATH")])
+            ),
+        },
+    )
+    modules = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _self_time, cumulative, name = line[len("import time:") :].split("|")
+        modules[name.strip()] = int(cumulative)
+    return modules
+
+
+def _imported_providers(modules: Dict[str, int]):
+    return {
+        module.split(".")[2]
+        for module in modules
+        if module.startswith("edenai_apis.apis.")
+        and module.split(".")[2] in PROVIDERS
+    }
+
+
+def test_import_does_not_load_providers():
+    modules = _import_times(
+        "import edenai_apis; edenai_apis.interface.list_features()"
+    )
+    assert "edenai_apis" in modules
+    assert _imported_providers(modules) == set()
+
+
+def test_load_class_only_loads_requested_provider():
+    modules = _import_times(
+        "from edenai_apis.loaders.data_loader import load_class; load_class('cohere')"
+    )
+    assert _imported_providers(modules) == {"cohere"}
+    assert "google.cloud.aiplatform" not in modules
+
+
+def test_all_providers_packages_are_registered():
+    apis_path = os.path.join(os.path.dirname(edenai_apis.__file__), "apis")
+    packages = {
+        name
+        for name in os.listdir(apis_path)
+        if os.path.isfile(os.path.join(apis_path, name, "__init__.py"))
+    }
+    assert packages == set(PROVIDERS)
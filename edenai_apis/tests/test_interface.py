@@ -4,17 +4,34 @@
     - list_features
     - list_providers
     - check_provider_constraints
+    - async_compute_output
+    - async_get_async_job_result
+    - async_wait_for_async_job_result
+    - compute_output_multi
+    - compute_output_stream
 """
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 from pytest_mock import MockerFixture
 
 from edenai_apis.interface import (
+    async_compute_output,
+    async_compute_output_stream,
+    async_get_async_job_result,
+    async_wait_for_async_job_result,
     check_provider_constraints,
     compute_output,
+    compute_output_multi,
+    compute_output_stream,
     list_features,
     list_providers,
 )
+from edenai_apis.features.text.chat.chat_dataclass import ChatStreamResponse, StreamChat
 from edenai_apis.tests.conftest import global_features, only_async
+from edenai_apis.utils.exception import ProviderException, ProviderTimeoutError
 
 VALID_PROVIDER = "amazon"
 VALID_FEATURE = "audio"
@@ -119,3 +136,258 @@ def test_check_provider_constraints():
     assert check_provider_constraints(VALID_PROVIDER, VALID_FEATURE, VALID_SUBFEATURE)[
         0
     ]
+
+
+class TestAsyncInterface:
+    def test_async_compute_output_runs_concurrently(self, mocker: MockerFixture):
+        mocker.patch(
+            "edenai_apis.interface.validate_all_provider_constraints", return_value={}
+        )
+
+        async def run_all():
+            return await asyncio.gather(
+                *(
+                    async_compute_output(
+                        VALID_PROVIDER, VALID_FEATURE, VALID_SUBFEATURE, {}, fake=True
+                    )
+                    for _ in range(6)
+                )
+            )
+
+        start = time.perf_counter()
+        results = asyncio.run(run_all())
+        # each fake call sleeps at least 0.5s, so 6 serial calls take at least 3s
+        assert time.perf_counter() - start < 3
+        for result in results:
+            assert result["provider"] == VALID_PROVIDER
+            assert result["status"] == "success"
+
+    def test_async_get_async_job_result(self):
+        result = asyncio.run(
+            async_get_async_job_result(
+                "amazon", "video", "label_detection_async", "job_id", fake=True
+            )
+        )
+        assert result["provider_job_id"] == "job_id"
+
+    def test_async_wait_for_async_job_result(self):
+        result = asyncio.run(
+            async_wait_for_async_job_result(
+                "amazon", "video", "label_detection_async", "job_id", fake=True
+            )
+        )
+        assert result["status"] == "succeeded"
+        assert result["provider_job_id"] == "job_id"
+
+    def test_provider_coroutine_is_awaited(self, mocker: MockerFixture):
+        mocker.patch(
+            "edenai_apis.interface.validate_all_provider_constraints",
+            return_value={"text": "hello"},
+        )
+        compute = mocker.patch("edenai_apis.interface.compute_output")
+        response = mocker.MagicMock()
+        response.model_dump.return_value = {"original_response": {"text": "hello"}}
+        coroutine = mocker.AsyncMock(return_value=response)
+        get_coroutine = mocker.patch(
+            "edenai_apis.interface_v2.get_provider_coroutine", return_value=coroutine
+        )
+
+        result = asyncio.run(
+            async_compute_output("openai", "text", "moderation", {"text": "hello"})
+        )
+        get_coroutine.assert_called_once_with("openai", "text__moderation", {})
+        coroutine.assert_awaited_once_with(text="hello")
+        compute.assert_not_called()
+        assert result == {
+            "status": "success",
+            "provider": "openai",
+            "original_response": {"text": "hello"},
+        }
+
+    def test_blocking_provider_runs_in_executor(self, mocker: MockerFixture):
+        # amazon has no coroutine, it is not built only to look for one
+        get_coroutine = mocker.patch("edenai_apis.interface_v2.get_provider_coroutine")
+        compute = mocker.patch(
+            "edenai_apis.interface.compute_output",
+            return_value={"status": "success", "provider": "amazon"},
+        )
+        result = asyncio.run(async_compute_output("amazon", "text", "moderation", {}))
+        assert compute.call_count == 1
+        get_coroutine.assert_not_called()
+        assert result == {"status": "success", "provider": "amazon"}
+
+    def test_provider_job_coroutine_is_awaited(self, mocker: MockerFixture):
+        get_job_result = mocker.patch("edenai_apis.interface.get_async_job_result")
+        response = mocker.MagicMock()
+        response.model_dump.return_value = {"status": "pending"}
+        coroutine = mocker.AsyncMock(return_value=response)
+        get_coroutine = mocker.patch(
+            "edenai_apis.interface_v2.get_provider_coroutine", return_value=coroutine
+        )
+
+        result = asyncio.run(
+            async_get_async_job_result(
+                "gladia", "audio", "speech_to_text_async", "job_id"
+            )
+        )
+        get_coroutine.assert_called_once_with(
+            "gladia", "audio__speech_to_text_async__get_job_result", {}
+        )
+        coroutine.assert_awaited_once_with("job_id")
+        get_job_result.assert_not_called()
+        assert result == {"status": "pending"}
+
+
+def _fake_compute_output(delays, failing=()):
+    """Build a compute_output replacement answering after `delays[provider]` seconds"""
+
+    def fake_compute_output(provider_name, feature, subfeature, args, **kwargs):
+        time.sleep(delays.get(provider_name, 0))
+        if provider_name in failing:
+            raise ProviderException(f"{provider_name} error", 500)
+        return {"status": "success", "provider": provider_name}
+
+    return fake_compute_output
+
+
+class TestComputeOutputMulti:
+    def test_all_mode(self, mocker: MockerFixture):
+        mocker.patch(
+            "edenai_apis.interface.compute_output",
+            side_effect=_fake_compute_output({"a": 0.1, "c": 1}, failing=["b"]),
+        )
+        results = compute_output_multi(
+            ["a", "b", "c"], VALID_FEATURE, VALID_SUBFEATURE, {}, timeout=0.5
+        )
+        assert results["a"]["status"] == "success"
+        assert results["b"]["status"] == "fail"
+        assert results["b"]["error"]["type"] == "ProviderException"
+        assert results["c"]["status"] == "fail"
+        assert results["c"]["error"]["type"] == "ProviderTimeoutError"
+
+    def test_timeout_does_not_count_queued_time(self, mocker: MockerFixture):
+        mocker.patch(
+            "edenai_apis.interface.compute_output",
+            side_effect=_fake_compute_output({"a": 0.3, "b": 0.3}),
+        )
+        mocker.patch(
+            "edenai_apis.interface._get_providers_executor",
+            return_value=ThreadPoolExecutor(max_workers=1),
+        )
+        results = compute_output_multi(
+            ["a", "b"], VALID_FEATURE, VALID_SUBFEATURE, {}, timeout=0.5
+        )
+        assert results["a"]["status"] == "success"
+        assert results["b"]["status"] == "success"
+
+    def test_race_mode(self, mocker: MockerFixture):
+        mocker.patch(
+            "edenai_apis.interface.compute_output",
+            side_effect=_fake_compute_output({"slow": 1}, failing=["failing"]),
+        )
+        result = compute_output_multi(
+            ["slow", "failing", "fast"],
+            VALID_FEATURE,
+            VALID_SUBFEATURE,
+            {},
+            mode="race",
+        )
+        assert result["provider"] == "fast"
+
+    def test_race_mode_all_failed(self, mocker: MockerFixture):
+        mocker.patch(
+            "edenai_apis.interface.compute_output",
+            side_effect=_fake_compute_output({}, failing=["a", "b"]),
+        )
+        with pytest.raises(ProviderException):
+            compute_output_multi(
+                ["a", "b"], VALID_FEATURE, VALID_SUBFEATURE, {}, mode="race"
+            )
+
+    def test_race_mode_timeout(self, mocker: MockerFixture):
+        mocker.patch(
+            "edenai_apis.interface.compute_output",
+            side_effect=_fake_compute_output({"a": 1, "b": 1}),
+        )
+        start = time.perf_counter()
+        with pytest.raises(ProviderTimeoutError):
+            compute_output_multi(
+                ["a", "b"],
+                VALID_FEATURE,
+                VALID_SUBFEATURE,
+                {},
+                mode="race",
+                timeout=0.2,
+            )
+        assert time.perf_counter() - start < 0.8
+
+    def test_fallback_mode(self, mocker: MockerFixture):
+        mocked_compute_output = mocker.patch(
+            "edenai_apis.interface.compute_output",
+            side_effect=_fake_compute_output({}, failing=["a"]),
+        )
+        result = compute_output_multi(
+            ["a", "b", "c"], VALID_FEATURE, VALID_SUBFEATURE, {}, mode="fallback"
+        )
+        assert result["provider"] == "b"
+        assert [call.args[0] for call in mocked_compute_output.call_args_list] == [
+            "a",
+            "b",
+        ]
+
+    def test_invalid_mode(self):
+        with pytest.raises(ValueError):
+            compute_output_multi(["a"], VALID_FEATURE, VALID_SUBFEATURE, {}, mode="x")
+
+
+class TestComputeOutputStream:
+    @staticmethod
+    def _mock_chat(mocker: MockerFixture, chunks):
+        def chat(**kwargs):
+            assert kwargs["stream"] is True
+            stream = (
+                ChatStreamResponse(text=text, blocked=False, provider="openai")
+                for text in chunks
+            )
+            return mocker.Mock(standardized_response=StreamChat(stream=stream))
+
+        mocker.patch(
+            "edenai_apis.interface.validate_all_provider_constraints",
+            side_effect=lambda *args: args[-1],
+        )
+        mocker.patch(
+            "edenai_apis.interface.interface_v2.Text.chat",
+            return_value=chat,
+        )
+
+    def test_chunks_and_monitoring(self, mocker: MockerFixture):
+        self._mock_chat(mocker, ["Hello", " world"])
+        mocker.patch("edenai_apis.interface.IS_MONITORING", True)
+        mocked_insert = mocker.patch("edenai_apis.interface.insert_api_call")
+
+        stream = compute_output_stream("openai", "text", "chat", {"text": "Hi"})
+        assert next(stream).text == "Hello"
+        mocked_insert.assert_not_called()
+        assert [chunk.text for chunk in stream] == [" world"]
+        mocked_insert.assert_called_once()
+        assert mocked_insert.call_args.kwargs["error"] is None
+
+    def test_async_stream(self, mocker: MockerFixture):
+        self._mock_chat(mocker, ["a", "b", "c"])
+
+        async def consume():
+            stream = await async_compute_output_stream(
+                "openai", "text", "chat", {"text": "Hi"}
+            )
+            return [chunk.text async for chunk in stream]
+
+        assert asyncio.run(consume()) == ["a", "b", "c"]
+
+    def test_fake(self):
+        chunks = list(
+            compute_output_stream(
+                "openai", "text", "chat", {"text": "Hi"}, fake=True
+            )
+        )
+        assert len(chunks) == 1
+        assert chunks[0].text
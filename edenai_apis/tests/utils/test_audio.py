@@ -1,3 +1,4 @@
+import base64
 import mimetypes
 import os
 from io import BytesIO
@@ -10,6 +11,8 @@ from pytest_mock import MockerFixture
 from settings import base_path
 
 from edenai_apis.utils.audio import (
+    Base64StreamEncoder,
+    upload_text_to_speech_audio,
     audio_converter,
     get_audio_attributes,
     audio_format,
@@ -273,3 +276,62 @@ class TestFileWithGoodExtension:
             file_wrapper = FileWrapper(data_path, "", file_info)
             get_file_extension(file_wrapper, accepted_extensions, channels)
         assert str(exc.value) == "File audio must be Mono"
+
+
+class TestBase64StreamEncoder:
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 4, 7, 100])
+    def test_same_as_base64(self, chunk_size):
+        content = os.urandom(50)
+        encoder = Base64StreamEncoder()
+        for index in range(0, len(content), chunk_size):
+            encoder.update(content[index : index + chunk_size])
+        assert encoder.result() == base64.b64encode(content).decode("utf-8")
+
+
+class TestUploadTextToSpeechAudio:
+    def test_audio_is_streamed_and_encoded(self, mocker: MockerFixture):
+        uploaded = []
+
+        def fake_upload(chunks, file_name, process_type, background=False):
+            uploaded.extend(chunks)
+            return "https://resource.url"
+
+        mocker.patch(
+            "edenai_apis.utils.upload_s3.upload_stream_to_s3", side_effect=fake_upload
+        )
+        audio, resource_url = upload_text_to_speech_audio(
+            iter([b"ab", b"", b"cde"]), ".mp3", inline_audio=True
+        )
+        assert uploaded == [b"ab", b"cde"]
+        assert audio == base64.b64encode(b"abcde").decode("utf-8")
+        assert resource_url == "https://resource.url"
+
+    def test_without_inline_audio(self, mocker: MockerFixture):
+        mocked_upload = mocker.patch(
+            "edenai_apis.utils.upload_s3.upload_stream_to_s3",
+            return_value="https://resource.url",
+        )
+        audio, resource_url = upload_text_to_speech_audio(
+            [b"abc"], ".mp3", inline_audio=False
+        )
+        assert audio == ""
+        assert resource_url == "https://resource.url"
+        mocked_upload.assert_called_once()
+        # uploads are synchronous unless the caller opts in
+        assert mocked_upload.call_args.kwargs["background"] is False
+
+    def test_background_upload(self, mocker: MockerFixture):
+        mocked_upload = mocker.patch(
+            "edenai_apis.utils.upload_s3.upload_stream_to_s3",
+            return_value="https://resource.url",
+        )
+        on_upload_error = mocker.MagicMock()
+        upload_text_to_speech_audio(
+            [b"abc"],
+            ".mp3",
+            inline_audio=False,
+            background_upload=True,
+            on_upload_error=on_upload_error,
+        )
+        assert mocked_upload.call_args.kwargs["background"] is True
+        assert mocked_upload.call_args.kwargs["on_error"] is on_upload_error
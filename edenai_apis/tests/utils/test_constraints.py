@@ -8,6 +8,8 @@ from settings import base_path
 
 from edenai_apis.utils import constraints
 from edenai_apis.utils.constraints import (
+    CompiledConstraints,
+    get_compiled_constraints,
     validate_all_input_languages,
     validate_input_file_type,
     validate_single_language,
@@ -308,3 +310,57 @@ class TestValidateAllInputLanguages:
             subfeature=SUBFEATURE,
         )
         assert output == expected_output
+
+
+class TestCompiledConstraints:
+    def test_pre_parsed_values(self):
+        compiled = CompiledConstraints(
+            {
+                "languages": ["en", "fr"],
+                "allow_null_language": True,
+                "file_types": ["image/png", "video/*"],
+                "models": ["small", "large"],
+                "default_model": "small",
+            }
+        )
+        assert compiled.languages == ("en", "fr", "auto-detect")
+        assert compiled.allow_null_language is True
+        assert compiled.file_types == frozenset({"image/png", "video/*"})
+        assert compiled.file_type_globs == ("video",)
+        assert compiled.models == ("small", "large")
+        assert compiled["default_model"] == "small"
+        assert compiled.get("resolutions") is None
+
+    def test_immutable(self):
+        compiled = CompiledConstraints({"languages": ["en"]})
+        with pytest.raises(AttributeError):
+            compiled.languages = ("fr",)
+        with pytest.raises(TypeError):
+            compiled["languages"] = ["fr"]
+        with pytest.raises(AttributeError):
+            compiled["languages"].append("fr")
+
+    def test_built_once(self, mocker: MockerFixture):
+        get_compiled_constraints.cache_clear()
+        mocked_load = mocker.patch(
+            "edenai_apis.utils.constraints.load_provider",
+            return_value={"constraints": {"languages": ["en"]}},
+        )
+        first = get_compiled_constraints(PROVIDER, FEATURE, SUBFEATURE)
+        assert get_compiled_constraints(PROVIDER, FEATURE, SUBFEATURE) is first
+        assert mocked_load.call_count == 1
+        get_compiled_constraints.cache_clear()
+
+    def test_languages_are_not_reloaded(self, mocker: MockerFixture):
+        mocked_load = mocker.patch(
+            "edenai_apis.utils.languages.load_language_constraints"
+        )
+        output = validate_all_input_languages(
+            constraints=CompiledConstraints({"languages": ["en", "fr"]}),
+            args={"source_language": "en", "target_language": "fr"},
+            provider_name=PROVIDER,
+            feature=FEATURE,
+            subfeature=SUBFEATURE,
+        )
+        assert output == {"source_language": "en", "target_language": "fr"}
+        mocked_load.assert_not_called()
@@ -0,0 +1,107 @@
+import threading
+
+import numpy as np
+import pytest
+from pytest_mock import MockerFixture
+
+from edenai_apis.features.text.embeddings.embeddings_dataclass import (
+    EmbeddingDataClass,
+    EmbeddingsDataClass,
+)
+from edenai_apis.utils.embeddings import (
+    batched_embeddings,
+    embeddings_to_array,
+    split_in_batches,
+)
+from edenai_apis.utils.types import ResponseType
+
+
+class FakeEmbeddingsApi:
+    provider_name = "fake"
+
+    def __init__(self):
+        self.calls = []
+        self.lock = threading.Lock()
+
+    @batched_embeddings
+    def text__embeddings(self, texts, model=None):
+        with self.lock:
+            self.calls.append(list(texts))
+        return ResponseType[EmbeddingsDataClass](
+            original_response={"usage": {"total_tokens": len(texts)}},
+            standardized_response=EmbeddingsDataClass(
+                items=[EmbeddingDataClass(embedding=[float(text), 0.0]) for text in texts]
+            ),
+        )
+
+
+@pytest.fixture
+def constraints(mocker: MockerFixture):
+    constraints = {}
+    mocker.patch(
+        "edenai_apis.utils.embeddings.load_provider",
+        return_value={"constraints": constraints},
+    )
+    return constraints
+
+
+class TestSplitInBatches:
+    def test_no_limit(self):
+        assert split_in_batches(["a", "b", "c"]) == [["a", "b", "c"]]
+
+    def test_max_batch_size(self):
+        assert split_in_batches(["a", "b", "c"], max_batch_size=2) == [
+            ["a", "b"],
+            ["c"],
+        ]
+
+    def test_max_batch_tokens(self):
+        texts = ["a" * 8, "b" * 8, "c" * 40, "d"]
+        assert split_in_batches(texts, max_batch_tokens=4) == [
+            ["a" * 8, "b" * 8],
+            ["c" * 40],
+            ["d"],
+        ]
+
+
+class TestBatchedEmbeddings:
+    def test_single_batch(self, constraints):
+        api = FakeEmbeddingsApi()
+        response = api.text__embeddings(["1", "2"])
+        assert api.calls == [["1", "2"]]
+        assert response.original_response == {"usage": {"total_tokens": 2}}
+
+    def test_chunks_keep_input_order(self, constraints):
+        constraints["max_batch_size"] = 3
+        api = FakeEmbeddingsApi()
+        texts = [str(i) for i in range(10)]
+
+        response = api.text__embeddings(texts)
+
+        assert sorted(map(len, api.calls)) == [1, 3, 3, 3]
+        assert [item.embedding[0] for item in response.standardized_response.items] == [
+            float(i) for i in range(10)
+        ]
+        assert response.original_response["usage"] == {"total_tokens": 10}
+        assert len(response.original_response["batches"]) == 4
+        assert len(response.model_dump()["standardized_response"]["items"]) == 10
+
+
+class TestEmbeddingsToArray:
+    def test_from_dataclass_and_dict(self):
+        embeddings = EmbeddingsDataClass(
+            items=[EmbeddingDataClass(embedding=[1, 2]), EmbeddingDataClass(embedding=[3, 4])]
+        )
+        expected = np.array([[1, 2], [3, 4]], dtype=np.float32)
+        for value in (
+            embeddings,
+            embeddings.model_dump(),
+            {"standardized_response": embeddings.model_dump()},
+        ):
+            array = embeddings_to_array(value)
+            assert array.dtype == np.float32
+            assert array.flags["C_CONTIGUOUS"]
+            np.testing.assert_array_equal(array, expected)
+
+    def test_empty(self):
+        assert embeddings_to_array([]).shape == (0, 0)
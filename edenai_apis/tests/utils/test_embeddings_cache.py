@@ -0,0 +1,126 @@
+import pytest
+
+from edenai_apis.features.text.embeddings.embeddings_dataclass import (
+    EmbeddingDataClass,
+    EmbeddingsDataClass,
+)
+from edenai_apis.utils.embeddings_cache import (
+    MemoryEmbeddingsCache,
+    SQLiteEmbeddingsCache,
+    cached_embeddings,
+    cached_image_embeddings,
+    embeddings_cache_stats,
+    set_embeddings_cache,
+)
+from edenai_apis.utils.types import ResponseType
+
+
+class FakeEmbeddingsApi:
+    provider_name = "fake"
+
+    def __init__(self):
+        self.calls = []
+
+    @cached_embeddings
+    def text__embeddings(self, texts, model=None):
+        self.calls.append(list(texts))
+        return ResponseType[EmbeddingsDataClass](
+            original_response={"usage": {"total_tokens": len(texts)}},
+            standardized_response=EmbeddingsDataClass(
+                items=[EmbeddingDataClass(embedding=[float(text), 0.5]) for text in texts]
+            ),
+        )
+
+    @cached_image_embeddings
+    def image__embeddings(self, file, model, representation, file_url=""):
+        self.calls.append((file, representation))
+        return ResponseType[EmbeddingsDataClass](
+            original_response={},
+            standardized_response=EmbeddingsDataClass(
+                items=[EmbeddingDataClass(embedding=[1.0, 2.0])]
+            ),
+        )
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def cache(request, tmp_path):
+    if request.param == "memory":
+        cache = MemoryEmbeddingsCache(max_entries=3)
+    else:
+        cache = SQLiteEmbeddingsCache(str(tmp_path / "embeddings.db"), max_entries=3)
+    set_embeddings_cache(cache)
+    yield cache
+    set_embeddings_cache(None)
+
+
+class TestEmbeddingsCacheBackends:
+    def test_lru_eviction(self, cache):
+        cache.set_many({"a": [1.0], "b": [2.0], "c": [3.0]})
+        assert cache.get_many(["a"]) == {"a": [1.0]}
+        cache.set_many({"d": [4.0]})
+
+        assert cache.get_many(["a", "b", "c", "d"]) == {
+            "a": [1.0],
+            "c": [3.0],
+            "d": [4.0],
+        }
+        stats = cache.stats()
+        assert stats["size"] == 3
+        assert stats["evictions"] == 1
+        assert stats["hits"] == 4
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.8
+
+    def test_sqlite_persists(self, tmp_path):
+        path = str(tmp_path / "embeddings.db")
+        SQLiteEmbeddingsCache(path).set_many({"a": [0.1, 0.2]})
+        assert SQLiteEmbeddingsCache(path).get_many(["a"]) == {"a": [0.1, 0.2]}
+
+
+class TestCachedEmbeddings:
+    def test_disabled(self):
+        set_embeddings_cache(None)
+        api = FakeEmbeddingsApi()
+        api.text__embeddings(["1"])
+        api.text__embeddings(["1"])
+        assert api.calls == [["1"], ["1"]]
+        assert embeddings_cache_stats() == {}
+
+    def test_only_misses_are_sent(self, cache):
+        api = FakeEmbeddingsApi()
+        first = api.text__embeddings(["1", "2"])
+        assert first.original_response == {"usage": {"total_tokens": 2}}
+
+        response = api.text__embeddings(["2", "3", "1", "3"])
+
+        assert api.calls == [["1", "2"], ["3"]]
+        assert [
+            item.embedding[0] for item in response.standardized_response.items
+        ] == [2.0, 3.0, 1.0, 3.0]
+        assert response.original_response == {
+            "cached_items": 2,
+            "response": {"usage": {"total_tokens": 1}},
+            "usage": {"total_tokens": 1},
+        }
+        assert embeddings_cache_stats()["hits"] == 2
+
+    def test_model_is_part_of_the_key(self, cache):
+        api = FakeEmbeddingsApi()
+        api.text__embeddings(["1"], model="small")
+        api.text__embeddings(["1"], model="large")
+        assert api.calls == [["1"], ["1"]]
+
+    def test_image_embeddings(self, cache, tmp_path):
+        image = tmp_path / "image.png"
+        image.write_bytes(b"image content")
+        api = FakeEmbeddingsApi()
+
+        api.image__embeddings(str(image), "model", "symmetric", file_url="url_1")
+        response = api.image__embeddings(
+            file=str(image), model="model", representation="symmetric"
+        )
+        api.image__embeddings(str(image), "model", "query")
+
+        assert api.calls == [(str(image), "symmetric"), (str(image), "query")]
+        assert response.standardized_response.items[0].embedding == [1.0, 2.0]
+        assert response.original_response["cached_items"] == 1
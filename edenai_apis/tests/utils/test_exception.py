@@ -1,4 +1,24 @@
-from edenai_apis.utils.exception import ProviderException, LanguageException
+import importlib
+import os
+import re
+import time
+from pathlib import Path
+
+import pytest
+
+from edenai_apis.utils.exception import (
+    ErrorClassifier,
+    LanguageException,
+    ProviderException,
+    ProviderInternalServerError,
+    ProviderInvalidInputError,
+    ProviderLimitationError,
+    ProviderTimeoutError,
+    get_appropriate_error,
+    get_error_classifier,
+)
+
+APIS_FOLDER = Path(__file__).parents[2] / "apis"
 
 
 def test_provider_exception():
@@ -15,3 +35,89 @@ def test_language_exception():
     except LanguageException as exc:
         assert exc.code == 400
         assert str(exc) == "Error"
+
+
+def _legacy_classify(errors, message):
+    for exception_type, error_list in errors.items():
+        if any(re.search(error_pattern, message) for error_pattern in error_list):
+            return exception_type
+    return None
+
+
+def _sample_messages():
+    """Messages built from all the providers errors patterns and unknown messages"""
+    messages = []
+    for errors_file in sorted(APIS_FOLDER.glob("*/errors.py")):
+        provider = errors_file.parent.name
+        errors = importlib.import_module(f"edenai_apis.apis.{provider}.errors").ERRORS
+        for error_list in errors.values():
+            for pattern in error_list:
+                literal = re.sub(r"\\(.)", r"\1", pattern)
+                messages.append((provider, f"Error 400: {literal}"))
+                messages.append((provider, literal))
+        messages.append((provider, "Something unexpected happened"))
+    return messages
+
+
+class TestErrorClassifier:
+    def test_first_matching_type_wins(self):
+        classifier = ErrorClassifier(
+            {
+                ProviderLimitationError: [r"quota (\w+)"],
+                ProviderInvalidInputError: [r"invalid", r"quota"],
+            }
+        )
+        assert classifier.classify("quota exceeded") is ProviderLimitationError
+        assert classifier.classify("an invalid\ninput") is ProviderInvalidInputError
+        assert classifier.classify("ok") is None
+        assert ErrorClassifier({}).classify("error") is None
+
+    def test_anchors(self):
+        classifier = ErrorClassifier({ProviderTimeoutError: [r"^timeout$"]})
+        assert classifier.classify("timeout") is ProviderTimeoutError
+        assert classifier.classify("a timeout") is None
+
+    def test_same_result_as_patterns_search(self):
+        for provider, message in _sample_messages():
+            errors = importlib.import_module(f"edenai_apis.apis.{provider}.errors").ERRORS
+            assert get_error_classifier(provider).classify(message) is _legacy_classify(
+                errors, message
+            ), (provider, message)
+
+    def test_get_appropriate_error(self):
+        error = get_appropriate_error(
+            "openai", ProviderException("Internal Server Error", 500)
+        )
+        assert isinstance(error, ProviderInternalServerError)
+        assert error.code == 500
+
+        exception = ProviderException("unknown error")
+        assert get_appropriate_error("openai", exception) is exception
+        assert get_appropriate_error("not_a_provider", exception) is exception
+
+
+@pytest.mark.skipif(
+    os.environ.get("TEST_SCOPE") == "CICD-OPENSOURCE",
+    reason="Don't run benchmarks on opensource cicd workflow",
+)
+def test_benchmark_classify_10k_messages():
+    messages = _sample_messages()
+    messages = (messages * (10_000 // len(messages) + 1))[:10_000]
+    errors = {
+        provider: importlib.import_module(f"edenai_apis.apis.{provider}.errors").ERRORS
+        for provider, _ in messages
+    }
+
+    start = time.perf_counter()
+    for provider, message in messages:
+        importlib.import_module(f"edenai_apis.apis.{provider}.errors")
+        _legacy_classify(errors[provider], message)
+    legacy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for provider, message in messages:
+        get_appropriate_error(provider, ProviderException(message))
+    classifier_time = time.perf_counter() - start
+
+    print(f"10k messages: {legacy_time:.3f}s -> {classifier_time:.3f}s")
+    assert classifier_time < legacy_time
@@ -0,0 +1,145 @@
+import asyncio
+
+import pytest
+import requests
+from aiohttp import web
+from pytest_mock import MockerFixture
+
+from edenai_apis.utils.http import (
+    AsyncHTTPClient,
+    AsyncHTTPResponse,
+    HTTPClient,
+    HTTPMethod,
+)
+
+
+class TestHTTPClient:
+    def test_one_session_per_host(self):
+        client = HTTPClient()
+        session = client.session("https://api.openai.com/v1/chat/completions")
+        assert client.session("https://api.openai.com/v1/embeddings") is session
+        assert client.session("https://api.cohere.ai/v1/chat") is not session
+        assert client.session("http://api.openai.com/v1/embeddings") is not session
+
+    def test_pool_configuration(self):
+        client = HTTPClient(pool_maxsize=64, max_retries=3)
+        adapter = client.session("https://api.openai.com").get_adapter(
+            "https://api.openai.com"
+        )
+        assert adapter._pool_maxsize == 64
+        assert adapter.max_retries.connect == 3
+
+    def test_request_uses_default_timeout(self, mocker: MockerFixture):
+        client = HTTPClient(timeout=(5, 30))
+        session = client.session("https://example.com")
+        mocked_request = mocker.patch.object(session, "request")
+
+        client.post("https://example.com/path", json={"key": "value"})
+        mocked_request.assert_called_once_with(
+            HTTPMethod.POST.value,
+            "https://example.com/path",
+            data=None,
+            json={"key": "value"},
+            timeout=(5, 30),
+        )
+
+        client.get("https://example.com/path", timeout=1)
+        assert mocked_request.call_args.kwargs["timeout"] == 1
+
+    def test_sessions_do_not_keep_cookies(self):
+        client = HTTPClient()
+        session = client.session("https://example.com")
+        assert session.cookies._policy.allowed_domains() == ()
+
+    def test_close(self):
+        client = HTTPClient()
+        session = client.session("https://example.com")
+        client.close()
+        assert client.session("https://example.com") is not session
+
+
+async def _serve(client: AsyncHTTPClient, handler, requests_to_run):
+    """Run `requests_to_run(base_url)` against a local server answering with `handler`"""
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    try:
+        return await requests_to_run(f"http://127.0.0.1:{port}")
+    finally:
+        await client.close()
+        await runner.cleanup()
+
+
+class TestAsyncHTTPClient:
+    def test_request(self):
+        client = AsyncHTTPClient()
+
+        async def echo(request: web.Request):
+            return web.json_response(
+                {"method": request.method, "body": await request.json()}, status=201
+            )
+
+        response = asyncio.run(
+            _serve(
+                client,
+                echo,
+                lambda url: client.post(f"{url}/path", json={"key": "value"}),
+            )
+        )
+        assert response.status_code == 201
+        assert response.ok
+        assert response.headers["content-type"].startswith("application/json")
+        assert response.json() == {"method": "POST", "body": {"key": "value"}}
+
+    def test_one_session_per_event_loop(self):
+        client = AsyncHTTPClient()
+
+        async def sessions():
+            session = client.session()
+            assert client.session() is session
+            await client.close()
+            return session
+
+        assert asyncio.run(sessions()) is not asyncio.run(sessions())
+
+    def test_connection_errors_are_retried(self, mocker: MockerFixture):
+        client = AsyncHTTPClient(max_retries=2)
+        mocker.patch("edenai_apis.utils.http.RETRY_BACKOFF_FACTOR", 0)
+
+        async def unreachable():
+            try:
+                # nothing listens on the discard port
+                await client.get("http://127.0.0.1:9/")
+            finally:
+                await client.close()
+
+        with pytest.raises(requests.ConnectionError):
+            asyncio.run(unreachable())
+
+    def test_timeout(self):
+        client = AsyncHTTPClient(timeout=0.1)
+
+        async def slow(request: web.Request):
+            await asyncio.sleep(1)
+            return web.Response()
+
+        with pytest.raises(requests.Timeout):
+            asyncio.run(_serve(client, slow, lambda url: client.get(url)))
+
+
+class TestAsyncHTTPResponse:
+    def test_requests_attributes(self):
+        response = AsyncHTTPResponse(
+            404, {"Content-Type": "text/plain"}, b"not found", "https://example.com"
+        )
+        assert response.text == "not found"
+        assert response.headers["content-type"] == "text/plain"
+        assert not response.ok
+        with pytest.raises(requests.HTTPError):
+            response.raise_for_status()
+        with pytest.raises(requests.JSONDecodeError):
+            response.json()
@@ -0,0 +1,308 @@
+import base64
+import datetime
+import json
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import padding, rsa
+from cryptography.x509.oid import NameOID
+from pytest_mock import MockerFixture
+
+from edenai_apis.apis.amazon.amazon_ocr_api import AmazonOcrApi
+from edenai_apis.interface import compute_output, get_async_job_result
+from edenai_apis.utils.async_to_sync import fibonacci_waiting_call
+from edenai_apis.utils.http import http_client
+from edenai_apis.utils.job_completion import (
+    FAILED,
+    PENDING,
+    SUCCEEDED,
+    JobNotificationReceiver,
+    MemoryJobStateStore,
+    handle_job_notification,
+    next_poll_delay,
+    parse_job_notification,
+    set_job_store,
+    verify_sns_message,
+)
+
+SNS_KEY = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+SNS_NAME = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "sns.amazonaws.com")])
+SNS_CERTIFICATE = (
+    x509.CertificateBuilder()
+    .subject_name(SNS_NAME)
+    .issuer_name(SNS_NAME)
+    .public_key(SNS_KEY.public_key())
+    .serial_number(1)
+    .not_valid_before(datetime.datetime(2020, 1, 1))
+    .not_valid_after(datetime.datetime(2100, 1, 1))
+    .sign(SNS_KEY, hashes.SHA256())
+)
+SNS_CERTIFICATE_URL = "https://sns.eu-west-1.amazonaws.com/SimpleNotificationService.pem"
+
+
+@pytest.fixture(autouse=True)
+def sns_certificate(mocker: MockerFixture):
+    return mocker.patch(
+        "edenai_apis.utils.job_completion._sns_certificate",
+        return_value=SNS_CERTIFICATE,
+    )
+
+
+def sign_sns_message(message, key=SNS_KEY):
+    message = {
+        "MessageId": "message",
+        "Timestamp": "2024-01-01T00:00:00.000Z",
+        "TopicArn": "arn:aws:sns:eu-west-1:123456789012:textract",
+        "SignatureVersion": "2",
+        "SigningCertURL": SNS_CERTIFICATE_URL,
+        **message,
+    }
+    signed_keys = ["Message", "MessageId", "Subject", "Timestamp", "TopicArn", "Type"]
+    if message["Type"] != "Notification":
+        signed_keys = [
+            "Message",
+            "MessageId",
+            "SubscribeURL",
+            "Timestamp",
+            "Token",
+            "TopicArn",
+            "Type",
+        ]
+    string_to_sign = "".join(
+        f"{name}\n{message[name]}\n" for name in signed_keys if name in message
+    )
+    signature = key.sign(string_to_sign.encode(), padding.PKCS1v15(), hashes.SHA256())
+    message["Signature"] = base64.b64encode(signature).decode()
+    return message
+
+
+@pytest.fixture
+def store():
+    store = MemoryJobStateStore()
+    set_job_store(store)
+    yield store
+    set_job_store(None)
+
+
+def sns_notification(job_id, status):
+    return sign_sns_message(
+        {
+            "Type": "Notification",
+            "Message": json.dumps({"JobId": job_id, "Status": status, "API": "X"}),
+        }
+    )
+
+
+class TestParseJobNotification:
+    def test_sns(self):
+        [(job_id, status, payload)] = parse_job_notification(
+            json.dumps(sns_notification("job", "SUCCEEDED"))
+        )
+        assert (job_id, status, payload["API"]) == ("job", SUCCEEDED, "X")
+
+    def test_sns_subscription_is_confirmed(self, mocker: MockerFixture):
+        get = mocker.patch.object(http_client, "get")
+        confirmation = {
+            "Type": "SubscriptionConfirmation",
+            "Message": "confirm",
+            "Token": "token",
+            "SubscribeURL": "https://sns.eu-west-1.amazonaws.com/?Action=Confirm",
+        }
+        assert parse_job_notification(sign_sns_message(confirmation)) == []
+        confirmation["SubscribeURL"] = "https://attacker.com/"
+        assert parse_job_notification(sign_sns_message(confirmation)) == []
+        get.assert_called_once()
+
+    def test_sns_signature_is_verified(self):
+        notification = sns_notification("job", "SUCCEEDED")
+        assert verify_sns_message(notification)
+
+        tampered = {**notification, "Message": json.dumps({"JobId": "other"})}
+        assert not verify_sns_message(tampered)
+        assert parse_job_notification(tampered) == []
+
+        forged_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        forged = sign_sns_message(
+            {"Type": "Notification", "Message": notification["Message"]}, forged_key
+        )
+        assert parse_job_notification(forged) == []
+
+        unsigned = {"Type": "Notification", "Message": notification["Message"]}
+        assert parse_job_notification(unsigned) == []
+
+    def test_sns_certificate_must_come_from_sns(self, sns_certificate):
+        notification = sns_notification("job", "SUCCEEDED")
+        notification["SigningCertURL"] = "https://attacker.com/cert.pem"
+        assert not verify_sns_message(notification)
+        sns_certificate.assert_not_called()
+
+    @pytest.mark.parametrize(
+        ("body", "expected"),
+        [
+            ({"job_id": "a", "status": "error"}, [("a", FAILED)]),
+            ({"id": "a", "status": "processing"}, [("a", PENDING)]),
+            ({"a": {"text": "hello"}}, []),
+            (b"not json", []),
+        ],
+    )
+    def test_webhooks(self, body, expected):
+        jobs = parse_job_notification(body)
+        assert [(job_id, status) for job_id, status, _ in jobs] == expected
+
+
+class TestJobStateStore:
+    def test_notification_wakes_up_waiters(self, store):
+        store.register("amazon", "job")
+        timer = threading.Timer(
+            0.1, handle_job_notification, ("amazon", sns_notification("job", "SUCCEEDED"))
+        )
+        timer.start()
+        start = time.perf_counter()
+        assert store.wait("amazon", "job", timeout=5)
+        assert time.perf_counter() - start < 1
+        assert store.get("amazon", "job").status == SUCCEEDED
+
+    def test_only_registered_jobs_are_recorded(self, store):
+        assert handle_job_notification("amazon", sns_notification("job", "FAILED")) == 0
+        assert store.get("amazon", "job") is None
+
+        store.register("amazon", "job")
+        assert handle_job_notification("amazon", sns_notification("job", "FAILED")) == 1
+        assert store.get("amazon", "job").status == FAILED
+
+    def test_wait_timeout(self, store):
+        assert not store.wait("amazon", "job", timeout=0.05)
+
+    def test_ttl_and_max_entries(self):
+        store = MemoryJobStateStore(ttl=60, max_entries=2)
+        for job_id in "abc":
+            store.notify("amazon", job_id, "SUCCEEDED")
+        assert store.get("amazon", "a") is None
+        assert store.get("amazon", "c").status == SUCCEEDED
+
+        store.ttl = 0
+        time.sleep(0.01)
+        assert store.get("amazon", "c") is None
+
+    def test_next_poll_delay(self):
+        delays = [next_poll_delay(polls, 1, 8, jitter=0) for polls in range(1, 7)]
+        assert delays == [1, 2, 4, 8, 8, 8]
+        assert 0.8 <= next_poll_delay(1, 1, 8, jitter=0.2) <= 1.2
+
+
+class TestJobNotificationReceiver:
+    def test_receives_notifications(self, store):
+        store.register("openai", "job")
+        with JobNotificationReceiver() as receiver:
+            response = http_client.post(
+                receiver.url_for("openai"),
+                data=json.dumps({"job_id": "job", "status": "done", "text": "hi"}),
+            )
+        assert response.status_code == 204
+        state = store.get("openai", "job")
+        assert state.status == SUCCEEDED
+        # notifications never provide the job result
+        assert state.payload is None
+
+
+class TestGetAsyncJobResult:
+    @pytest.fixture
+    def provider_call(self, mocker: MockerFixture):
+        interface_v2 = mocker.patch("edenai_apis.interface.interface_v2")
+        subfeature_class = interface_v2.Video.label_detection_async__get_job_result
+        return subfeature_class.return_value.return_value.model_dump
+
+    @pytest.fixture
+    def adaptive_polling(self, mocker: MockerFixture):
+        mocker.patch("edenai_apis.interface.JOB_ADAPTIVE_POLLING", True)
+
+    def get_result(self, api_keys=None):
+        return get_async_job_result(
+            "amazon", "video", "label_detection_async", "job", api_keys=api_keys or {}
+        )
+
+    def test_launched_jobs_are_registered(self, store, mocker: MockerFixture):
+        interface_v2 = mocker.patch("edenai_apis.interface.interface_v2")
+        mocker.patch(
+            "edenai_apis.interface.validate_all_provider_constraints", return_value={}
+        )
+        launch_job = interface_v2.Video.label_detection_async__launch_job
+        launch_job.return_value.return_value.model_dump.return_value = {
+            "provider_job_id": "job"
+        }
+        compute_output("amazon", "video", "label_detection_async", {})
+        assert store.get("amazon", "job") is not None
+
+    def test_provider_is_polled_on_every_call_by_default(self, store, provider_call):
+        provider_call.return_value = {"status": "succeeded", "provider_job_id": "job"}
+        self.get_result()
+        self.get_result()
+        assert provider_call.call_count == 2
+        assert store.get("amazon", "job") is None
+
+    def test_results_are_not_shared_between_api_keys(
+        self, store, provider_call, adaptive_polling
+    ):
+        provider_call.return_value = {"status": "succeeded", "provider_job_id": "job"}
+        self.get_result(api_keys={"api_key": "tenant-a"})
+        self.get_result(api_keys={"api_key": "tenant-b"})
+        assert provider_call.call_count == 2
+        self.get_result(api_keys={"api_key": "tenant-b"})
+        assert provider_call.call_count == 2
+        self.get_result(api_keys={"api_key": "tenant-a"})
+        assert provider_call.call_count == 3
+
+    def test_completed_jobs_are_cached(self, store, provider_call, adaptive_polling):
+        provider_call.return_value = {"status": "succeeded", "provider_job_id": "job"}
+        assert self.get_result()["status"] == "succeeded"
+        assert self.get_result()["status"] == "succeeded"
+        assert provider_call.call_count == 1
+
+    def test_pending_jobs_are_polled_when_due(
+        self, store, provider_call, adaptive_polling, mocker
+    ):
+        mocker.patch(
+            "edenai_apis.utils.job_completion.next_poll_delay", return_value=60
+        )
+        provider_call.return_value = {"status": "pending", "provider_job_id": "job"}
+        self.get_result()
+        assert self.get_result() == {"status": "pending", "provider_job_id": "job"}
+        assert provider_call.call_count == 1
+
+        handle_job_notification("amazon", sns_notification("job", "SUCCEEDED"))
+        provider_call.return_value = {"status": "succeeded", "provider_job_id": "job"}
+        assert self.get_result()["status"] == "succeeded"
+        assert provider_call.call_count == 2
+
+
+
+def test_amazon_notification_channel(mocker: MockerFixture):
+    api = SimpleNamespace(api_settings={"topic": "topic_arn", "role": "role_arn"})
+    assert AmazonOcrApi._notification_channel(api) == {}
+
+    mocker.patch("edenai_apis.apis.amazon.amazon_ocr_api.JOB_NOTIFICATIONS", True)
+    assert AmazonOcrApi._notification_channel(api) == {
+        "NotificationChannel": {"SNSTopicArn": "topic_arn", "RoleArn": "role_arn"}
+    }
+    assert AmazonOcrApi._notification_channel(SimpleNamespace(api_settings={})) == {}
+
+def test_fibonacci_waiting_call_wakes_up_on_notification(store):
+    responses = iter([{"JobStatus": "IN_PROGRESS"}, {"JobStatus": "SUCCEEDED"}])
+    threading.Timer(
+        0.1, handle_job_notification, ("amazon", sns_notification("job", "SUCCEEDED"))
+    ).start()
+
+    start = time.perf_counter()
+    response = fibonacci_waiting_call(
+        max_time=60,
+        status="SUCCEEDED",
+        func=lambda JobId: next(responses),
+        job_key=("amazon", "job"),
+        JobId="job",
+    )
+    assert response["JobStatus"] == "SUCCEEDED"
+    assert time.perf_counter() - start < 1
@@ -0,0 +1,129 @@
+import threading
+import time
+
+import pytest
+from pytest_mock import MockerFixture
+
+from edenai_apis.utils.exception import ProviderException, ProviderTimeoutError
+from edenai_apis.utils.job_completion import (
+    MemoryJobStateStore,
+    handle_job_notification,
+    set_job_store,
+)
+from edenai_apis.utils.job_scheduler import AsyncJobScheduler, set_job_scheduler
+
+
+class FakeJob:
+    """Job pending for its `pending_polls` first polls"""
+
+    def __init__(self, pending_polls: int = 0):
+        self.pending_polls = pending_polls
+        self.polls = 0
+        self.lock = threading.Lock()
+
+    def __call__(self):
+        with self.lock:
+            self.polls += 1
+            if self.polls > self.pending_polls:
+                return {"status": "succeeded", "polls": self.polls}
+        return {"status": "pending"}
+
+
+@pytest.fixture(autouse=True)
+def fast_polls(mocker: MockerFixture):
+    set_job_store(MemoryJobStateStore())
+    mocker.patch("edenai_apis.utils.job_scheduler.next_poll_delay", return_value=0.01)
+    yield
+    set_job_store(None)
+
+
+@pytest.fixture
+def scheduler():
+    scheduler = AsyncJobScheduler(max_workers=2, batch_size=50)
+    yield scheduler
+    scheduler.close()
+
+
+class TestAsyncJobScheduler:
+    def test_many_jobs_few_threads(self, scheduler):
+        threads_before = threading.active_count()
+        jobs = [FakeJob(pending_polls=2) for _ in range(1000)]
+        futures = [
+            scheduler.submit("provider", str(index), job)
+            for index, job in enumerate(jobs)
+        ]
+
+        results = [future.result(timeout=10) for future in futures]
+
+        assert all(result == {"status": "succeeded", "polls": 3} for result in results)
+        # the scheduler thread and the two pollers
+        assert threading.active_count() - threads_before <= 3
+        assert scheduler.stats() == {"pending": 0, "polls": 3000}
+
+    def test_same_job_is_polled_once(self, scheduler):
+        job = FakeJob(pending_polls=1)
+        first = scheduler.submit("provider", "job", job)
+        second = scheduler.submit("provider", "job", job)
+        assert first.result(timeout=5) == second.result(timeout=5)
+        assert job.polls == 2
+
+    def test_jobs_are_shared_within_a_scope(self, scheduler):
+        first_job, second_job = FakeJob(pending_polls=1), FakeJob(pending_polls=1)
+        first = scheduler.submit("provider", "job", first_job, scope="tenant-a")
+        second = scheduler.submit("provider", "job", second_job, scope="tenant-b")
+        first.result(timeout=5)
+        second.result(timeout=5)
+        assert (first_job.polls, second_job.polls) == (2, 2)
+
+    def test_each_waiter_has_its_own_timeout(self, scheduler):
+        job = FakeJob(pending_polls=30)
+        short = scheduler.submit("provider", "job", job, timeout=0.05)
+        long = scheduler.submit("provider", "job", job, timeout=10)
+        with pytest.raises(ProviderTimeoutError):
+            short.result(timeout=5)
+        assert long.result(timeout=5)["status"] == "succeeded"
+        assert scheduler.stats()["pending"] == 0
+
+    def test_errors_are_propagated(self, scheduler):
+        def poll():
+            raise ProviderException("job failed")
+
+        with pytest.raises(ProviderException, match="job failed"):
+            scheduler.submit("provider", "job", poll).result(timeout=5)
+
+    def test_timeout(self, scheduler):
+        future = scheduler.submit("provider", "job", FakeJob(10**6), timeout=0.1)
+        with pytest.raises(ProviderTimeoutError):
+            future.result(timeout=5)
+
+    def test_rate_limit(self):
+        scheduler = AsyncJobScheduler(rate_limits={"limited": 20})
+        start = time.perf_counter()
+        futures = [scheduler.submit("limited", str(i), FakeJob()) for i in range(30)]
+        for future in futures:
+            future.result(timeout=5)
+        # a burst of 20 polls, then 20 polls per second
+        assert time.perf_counter() - start >= 0.4
+        scheduler.close()
+
+    def test_notification_wakes_up_the_job(self, mocker: MockerFixture):
+        mocker.patch("edenai_apis.utils.job_scheduler.next_poll_delay", return_value=60)
+        scheduler = AsyncJobScheduler()
+        set_job_scheduler(scheduler)
+        job = FakeJob(pending_polls=1)
+        future = scheduler.submit("amazon", "job", job)
+        while job.polls == 0:
+            time.sleep(0.01)
+
+        handle_job_notification("amazon", {"job_id": "job", "status": "succeeded"})
+
+        assert future.result(timeout=5)["status"] == "succeeded"
+        set_job_scheduler(None)
+
+    def test_close_cancels_pending_jobs(self):
+        scheduler = AsyncJobScheduler()
+        future = scheduler.submit("provider", "job", FakeJob(10**6))
+        scheduler.close()
+        assert future.cancelled()
+        with pytest.raises(RuntimeError):
+            scheduler.submit("provider", "other", FakeJob())
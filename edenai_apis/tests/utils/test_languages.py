@@ -6,6 +6,8 @@
 import pytest
 from pytest_mock import MockerFixture
 
+from edenai_apis.utils import languages as languages_module
+
 from edenai_apis.utils.languages import (
     AUTO_DETECT,
     AUTO_DETECT_NAME,
@@ -19,7 +21,17 @@ from edenai_apis.utils.languages import (
     load_language_constraints,
     load_standardized_language,
     provide_appropriate_language,
+    LanguageIndex,
+    get_language_index,
 )
+from edenai_apis.utils.exception import LanguageException
+
+
+@pytest.fixture(autouse=True)
+def clear_language_indexes():
+    get_language_index.cache_clear()
+    yield
+    get_language_index.cache_clear()
 
 
 class TestCheckLanguageFormat:
@@ -230,6 +242,16 @@ class TestLoadStandardizedLanguage:
             expected_output
         ), f"Expected `{expected_output}` but got `{output}`"
 
+    def test_languages_are_loaded_once(self, mocker: MockerFixture):
+        mocked_load = mocker.patch(
+            "edenai_apis.utils.languages.load_language_constraints",
+            return_value=["en", "fra"],
+        )
+        for _ in range(3):
+            output = load_standardized_language("feature", "subfeature", ["provider"])
+        assert output == ["en", "fr"]
+        assert mocked_load.call_count == 1
+
 
 class TestFormatLanguageName:
     def test_unknown_language(self):
@@ -491,3 +513,48 @@ class TestProvideAppropriateLanguage:
             provide_appropriate_language(
                 iso_code, self.PROVIDER, self.FEATURE, self.SUBFEATURE
             )
+
+
+class TestLanguageIndex:
+    def test_resolved_codes_are_cached(self, mocker: MockerFixture):
+        index = LanguageIndex(["en-US", "fr", "es"])
+        spy = mocker.spy(languages_module, "closest_supported_match")
+        assert index.resolve("en") == "en-US"
+        assert index.resolve("en") == "en-US"
+        assert index.resolve("fr") == "fr"
+        assert spy.call_count == 1
+
+    def test_unsupported_codes_are_cached(self, mocker: MockerFixture):
+        index = LanguageIndex(["en-US", "fr"])
+        spy = mocker.spy(languages_module, "closest_supported_match")
+        assert index.resolve("en-EN") is None
+        assert index.resolve("en-EN") is None
+        assert spy.call_count == 1
+
+    def test_lru_size(self):
+        index = LanguageIndex(["en", "fr", "es"], cache_size=2)
+        for iso_code in ("en", "fr", "es"):
+            index.resolve(iso_code)
+        assert list(index._resolved) == ["fr", "es"]
+
+    def test_fail_fast(self, mocker: MockerFixture):
+        mocked_match = mocker.patch(
+            "edenai_apis.utils.languages.closest_supported_match",
+            side_effect=RuntimeError,
+        )
+        with pytest.raises(LanguageException):
+            LanguageIndex(["en-US"]).resolve("en")
+        assert mocked_match.call_count == languages_module.LANGUAGE_MATCH_RETRIES
+
+    def test_invalid_format(self):
+        with pytest.raises(SyntaxError):
+            LanguageIndex(["en"]).resolve("12345")
+
+    def test_provider_index_is_built_once(self, mocker: MockerFixture):
+        mocked_load = mocker.patch(
+            "edenai_apis.utils.languages.load_language_constraints",
+            return_value=["en", "fr"],
+        )
+        for iso_code in ("en", "fr", "en"):
+            provide_appropriate_language(iso_code, "provider", "feature", "subfeature")
+        assert mocked_load.call_count == 1
@@ -0,0 +1,213 @@
+import asyncio
+import json
+import pickle
+import time
+
+import pytest
+
+from edenai_apis.features.text.chat.chat_dataclass import StreamChat
+from edenai_apis.features.text.generation import GenerationDataClass
+from edenai_apis.utils.llm_cache import (
+    MemoryLLMCache,
+    SQLiteLLMCache,
+    cached_llm_response,
+    llm_cache_key,
+    set_llm_cache,
+)
+from edenai_apis.utils.types import ResponseType
+
+
+class FakeLLMApi:
+    provider_name = "fake"
+
+    def __init__(self, api_keys=None):
+        self.api_keys = api_keys or {}
+        self.calls = 0
+
+    @cached_llm_response
+    def text__generation(self, text, temperature, max_tokens, model=None):
+        self.calls += 1
+        return ResponseType[GenerationDataClass](
+            original_response={"text": text, "call": self.calls},
+            standardized_response=GenerationDataClass(generated_text=text.upper()),
+        )
+
+    @cached_llm_response
+    async def _async_text__generation(self, text, temperature, max_tokens, model=None):
+        self.calls += 1
+        return ResponseType[GenerationDataClass](
+            original_response={"text": text, "call": self.calls},
+            standardized_response=GenerationDataClass(generated_text=text.upper()),
+        )
+
+    @cached_llm_response(deterministic=True)
+    def text__spell_check(self, text, language):
+        self.calls += 1
+        return ResponseType[GenerationDataClass](
+            original_response={"call": self.calls},
+            standardized_response=GenerationDataClass(generated_text=text),
+        )
+
+    @cached_llm_response
+    def text__translation(self, text, temperature):
+        self.calls += 1
+        return ResponseType[GenerationDataClass](
+            original_response=object(),
+            standardized_response=GenerationDataClass(generated_text=text),
+        )
+
+    @cached_llm_response
+    def text__chat(self, text, temperature, stream=False):
+        self.calls += 1
+        return ResponseType[StreamChat](
+            original_response=None, standardized_response=StreamChat(stream=iter([]))
+        )
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def cache(request, tmp_path):
+    if request.param == "memory":
+        cache = MemoryLLMCache(max_entries=2, ttl=0)
+    else:
+        cache = SQLiteLLMCache(str(tmp_path / "llm.db"), max_entries=2, ttl=0)
+    set_llm_cache(cache)
+    yield cache
+    set_llm_cache(None)
+
+
+def test_key_is_normalized():
+    assert llm_cache_key("openai", "text__chat", {"a": 1, "b": [1, 2]}) == llm_cache_key(
+        "openai", "text__chat", {"b": [1, 2], "a": 1}
+    )
+    assert llm_cache_key("openai", "text__chat", {"a": 1}) != llm_cache_key(
+        "cohere", "text__chat", {"a": 1}
+    )
+    assert llm_cache_key("openai", "text__chat", {"a": 1}) != llm_cache_key(
+        "openai", "text__chat", {"a": 1}, api_keys={"api_key": "user"}
+    )
+
+
+class TestCachedLLMResponse:
+    def test_temperature_zero_is_cached(self, cache):
+        api = FakeLLMApi()
+        first = api.text__generation("hello", 0, 10, model="m")
+        second = api.text__generation(text="hello", temperature=0.0, max_tokens=10, model="m")
+        assert api.calls == 1
+        assert second.model_dump() == first.model_dump()
+        assert cache.stats()["hits"] == 1
+
+        api.text__generation("hello", 0, 10, model="other")
+        assert api.calls == 2
+
+    def test_sampled_calls_are_not_cached(self, cache):
+        api = FakeLLMApi()
+        api.text__generation("hello", 0.7, 10)
+        api.text__generation("hello", 0.7, 10)
+        assert api.calls == 2
+        assert len(cache) == 0
+
+    def test_deterministic_subfeature(self, cache):
+        api = FakeLLMApi()
+        api.text__spell_check("helo", "en")
+        assert api.text__spell_check("helo", "en").original_response == {"call": 1}
+        assert api.calls == 1
+
+    def test_stream_is_not_cached(self, cache):
+        api = FakeLLMApi()
+        api.text__chat("hi", 0, stream=True)
+        api.text__chat("hi", 0)
+        api.text__chat("hi", 0)
+        assert api.calls == 3
+        assert len(cache) == 0
+
+    def test_disabled(self):
+        set_llm_cache(None)
+        api = FakeLLMApi()
+        api.text__spell_check("helo", "en")
+        api.text__spell_check("helo", "en")
+        assert api.calls == 2
+
+    def test_coroutine_shares_the_cache(self, cache):
+        api = FakeLLMApi()
+        first = asyncio.run(api._async_text__generation("hello", 0, 10))
+        assert asyncio.run(api._async_text__generation("hello", 0, 10)) == first
+        assert api.text__generation("hello", 0, 10).model_dump() == first.model_dump()
+        assert api.calls == 1
+
+    def test_responses_are_not_shared_between_api_keys(self, cache):
+        user_api = FakeLLMApi(api_keys={"api_key": "user"})
+        other_api = FakeLLMApi(api_keys={"api_key": "other"})
+        user_api.text__generation("hello", 0, 10)
+        other_api.text__generation("hello", 0, 10)
+        assert other_api.calls == 1
+        FakeLLMApi(api_keys={"api_key": "user"}).text__generation("hello", 0, 10)
+        assert cache.stats()["hits"] == 1
+
+    def test_response_which_is_not_json_is_not_cached(self, cache):
+        api = FakeLLMApi()
+        api.text__translation("hello", 0)
+        api.text__translation("hello", 0)
+        assert api.calls == 2
+        assert len(cache) == 0
+
+    def test_least_recently_used_is_evicted(self, cache):
+        api = FakeLLMApi()
+        for text in ("a", "b", "a", "c"):
+            api.text__generation(text, 0, 10)
+        assert api.calls == 3
+        assert cache.stats()["evictions"] == 1
+        api.text__generation("a", 0, 10)
+        assert api.calls == 3
+        api.text__generation("b", 0, 10)
+        assert api.calls == 4
+
+
+@pytest.mark.parametrize("cache_class", [MemoryLLMCache, SQLiteLLMCache])
+def test_ttl(cache_class):
+    cache = cache_class(ttl=0.1) if cache_class is MemoryLLMCache else cache_class(
+        ":memory:", ttl=0.1
+    )
+    response = ResponseType[GenerationDataClass](
+        original_response={}, standardized_response=GenerationDataClass(generated_text="")
+    )
+    cache.set("key", response)
+    assert cache.get("key") is not None
+    time.sleep(0.15)
+    assert cache.get("key") is None
+    assert cache.stats()["misses"] == 1
+
+
+def test_sqlite_stores_json(tmp_path):
+    cache = SQLiteLLMCache(str(tmp_path / "llm.db"))
+    cache.set(
+        "key",
+        ResponseType[GenerationDataClass](
+            original_response={"text": "hi"},
+            standardized_response=GenerationDataClass(generated_text="HI"),
+        ),
+    )
+    (value,) = cache._connection.execute("SELECT response FROM responses").fetchone()
+    assert json.loads(value)["original_response"] == {"text": "hi"}
+    response = cache.get("key")
+    assert response.standardized_response == GenerationDataClass(generated_text="HI")
+
+
+def test_entries_which_cannot_be_loaded_are_misses(tmp_path):
+    cache = SQLiteLLMCache(str(tmp_path / "llm.db"))
+    # pickled by a previous version, or written to the shared database by anyone
+    cache._set("pickled", pickle.dumps({"text": "hi"}), float("inf"))
+    cache._set(
+        "unknown_class",
+        json.dumps(
+            {
+                "module": "os",
+                "class": "system",
+                "original_response": None,
+                "standardized_response": "ls",
+            }
+        ),
+        float("inf"),
+    )
+    assert cache.get("pickled") is None
+    assert cache.get("unknown_class") is None
+    assert cache.stats()["misses"] == 2
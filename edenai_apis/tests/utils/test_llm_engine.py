@@ -0,0 +1,197 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+
+from edenai_apis.utils.exception import ProviderException, ProviderLimitationError
+from edenai_apis.utils.llm_engine import (
+    LLMBudget,
+    LLMRequestEngine,
+    estimate_request_tokens,
+    llm_request,
+    set_llm_engine,
+    usage_tokens,
+)
+
+
+class FakeLLMApi:
+    provider_name = "fake"
+
+    def __init__(self):
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    @llm_request
+    def text__generation(self, text, temperature, max_tokens, model=None):
+        with self.lock:
+            self.calls += 1
+        return MagicMock(original_response={"usage": {"total_tokens": 10}})
+
+    @llm_request
+    async def _async_text__generation(self, text, temperature, max_tokens, model=None):
+        await asyncio.sleep(0)
+        with self.lock:
+            self.calls += 1
+        return MagicMock(original_response={"usage": {"total_tokens": 10}})
+
+
+@pytest.fixture
+def engine():
+    engine = LLMRequestEngine(rpm_limits={}, tpm_limits={})
+    set_llm_engine(engine)
+    yield engine
+    set_llm_engine(None)
+
+
+def test_estimate_request_tokens():
+    assert estimate_request_tokens("a" * 8) == 2
+    assert estimate_request_tokens(
+        {"text": "a" * 8, "history": [{"role": "user", "message": "a" * 4}], "n": 3}
+    ) == 4
+
+
+def test_usage_tokens():
+    assert usage_tokens({"usage": {"total_tokens": 12}}) == 12
+    assert usage_tokens({"usage": {"input_tokens": 5, "output_tokens": 7}}) == 12
+    assert usage_tokens({"text": "no usage"}) is None
+    assert usage_tokens(None) is None
+
+
+class TestLLMBudget:
+    def test_requests_per_minute(self):
+        budget = LLMBudget(rpm=120)  # 2 requests per second, burst of 120
+        for _ in range(120):
+            assert budget.acquire(0, timeout=0)
+        start = time.perf_counter()
+        assert budget.acquire(0)
+        assert time.perf_counter() - start >= 0.4
+
+    def test_tokens_per_minute(self):
+        budget = LLMBudget(tpm=600)  # 10 tokens per second
+        assert budget.acquire(600, timeout=0)
+        assert not budget.acquire(10, timeout=0.5)
+        # the call used less than reserved
+        budget.settle(600, 100)
+        assert budget.acquire(400, timeout=0)
+
+    def test_exhausted(self):
+        budget = LLMBudget(rpm=60)
+        budget.exhausted()
+        assert not budget.acquire(0, timeout=0.1)
+
+    def test_sync_and_async_calls_are_served_in_arrival_order(self):
+        budget = LLMBudget(rpm=600)  # 10 requests per second
+        budget.requests.drain()
+        served = []
+
+        def sync_call(name):
+            assert budget.acquire(0, timeout=5)
+            served.append(name)
+
+        async def async_call(name):
+            assert await budget.async_acquire(0, timeout=5)
+            served.append(name)
+
+        async def run_all():
+            loop = asyncio.get_running_loop()
+            first = loop.run_in_executor(None, sync_call, "sync 1")
+            await asyncio.sleep(0.02)
+            second = asyncio.ensure_future(async_call("async"))
+            await asyncio.sleep(0.02)
+            third = loop.run_in_executor(None, sync_call, "sync 2")
+            await asyncio.gather(first, second, third)
+
+        asyncio.run(run_all())
+        assert served == ["sync 1", "async", "sync 2"]
+
+    def test_call_giving_up_leaves_the_line(self):
+        budget = LLMBudget(rpm=600)
+        budget.requests.drain()
+        waiting = threading.Thread(target=lambda: budget.acquire(0))
+        waiting.start()
+        time.sleep(0.02)
+        assert not budget.acquire(0, timeout=0.05)
+        waiting.join(5)
+        assert budget.acquire(0, timeout=0.5)
+
+
+class TestLLMRequestEngine:
+    def test_unlimited_provider_is_not_queued(self, engine):
+        api = FakeLLMApi()
+        api.text__generation("hello", 0, 10)
+        assert api.calls == 1
+        assert engine.stats() == {}
+
+    def test_budget_by_model(self):
+        engine = LLMRequestEngine(
+            rpm_limits={"openai": 100, "openai/gpt-4": 10}, tpm_limits={}
+        )
+        assert engine.budget("openai", "gpt-4") is not engine.budget("openai", "gpt-3")
+        assert engine.budget("openai", "gpt-3") is engine.budget("openai", "gpt-4o")
+        assert engine.budget("openai", "gpt-4").requests.capacity == 10
+
+    def test_calls_wait_for_the_budget(self):
+        engine = LLMRequestEngine(rpm_limits={"fake": 600}, tpm_limits={})
+        set_llm_engine(engine)
+        engine.budget("fake").requests.drain()  # 10 requests per second from now
+        api = FakeLLMApi()
+        try:
+            start = time.perf_counter()
+            with ThreadPoolExecutor(5) as executor:
+                list(executor.map(lambda _: api.text__generation("hi", 0, 5), range(5)))
+        finally:
+            set_llm_engine(None)
+        assert time.perf_counter() - start >= 0.4
+        assert api.calls == 5
+        assert engine.stats()["fake"]["calls"] == 5
+
+    def test_coroutines_wait_for_the_budget(self):
+        engine = LLMRequestEngine(rpm_limits={"fake": 600}, tpm_limits={})
+        set_llm_engine(engine)
+        engine.budget("fake").requests.drain()
+        api = FakeLLMApi()
+
+        async def run_all():
+            await asyncio.gather(
+                *(api._async_text__generation("hi", 0, 5) for _ in range(5))
+            )
+
+        try:
+            start = time.perf_counter()
+            asyncio.run(run_all())
+        finally:
+            set_llm_engine(None)
+        assert time.perf_counter() - start >= 0.4
+        assert api.calls == 5
+        assert engine.stats()["fake"]["calls"] == 5
+
+    def test_tokens_are_estimated_and_settled(self):
+        engine = LLMRequestEngine(rpm_limits={}, tpm_limits={"fake": 6000})
+        set_llm_engine(engine)
+        try:
+            FakeLLMApi().text__generation("a" * 400, 0, 1000, model="m")
+        finally:
+            set_llm_engine(None)
+        # 1100 tokens reserved, 10 used
+        assert engine.budget("fake").tokens._tokens == pytest.approx(5990, abs=5)
+
+    def test_budget_timeout(self):
+        engine = LLMRequestEngine(rpm_limits={"fake": 1}, tpm_limits={}, max_wait=0.1)
+        engine.run("fake", None, lambda: None)
+        with pytest.raises(ProviderLimitationError):
+            engine.run("fake", None, lambda: None)
+
+    def test_rate_limit_error_empties_the_budget(self):
+        engine = LLMRequestEngine(rpm_limits={"fake": 60}, tpm_limits={}, max_wait=0)
+
+        def call():
+            raise ProviderException("Too many requests", 429)
+
+        with pytest.raises(ProviderException):
+            engine.run("fake", None, call)
+        assert engine.stats()["fake"]["rate_limited"] == 1
+        with pytest.raises(ProviderLimitationError):
+            engine.run("fake", None, lambda: None)
@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from edenai_apis.utils.metrics import (
+    BATCH_METRICS,
+    METRICS,
+    rank_documents,
+    top_k_indices,
+)
+
+
+@pytest.fixture
+def embeddings():
+    rng = np.random.default_rng(0)
+    return rng.normal(size=(50, 16)).tolist(), rng.normal(size=16).tolist()
+
+
+class TestBatchMetrics:
+    @pytest.mark.parametrize("metric", sorted(METRICS))
+    def test_same_scores_as_pairwise_metrics(self, metric, embeddings):
+        texts_embed, query_embed = embeddings
+        expected = [METRICS[metric](query_embed, text) for text in texts_embed]
+        scores = BATCH_METRICS[metric](query_embed, texts_embed)
+        assert scores.shape == (len(texts_embed),)
+        np.testing.assert_allclose(scores, expected, rtol=1e-4, atol=1e-3)
+
+
+class TestTopKIndices:
+    def test_all_sorted_descending(self):
+        scores = np.array([0.1, 0.9, 0.5, 0.9])
+        assert top_k_indices(scores).tolist() == [1, 3, 2, 0]
+
+    def test_top_k(self):
+        scores = np.array([0.1, 0.9, 0.5, 0.7, 0.9, 0.2])
+        assert top_k_indices(scores, 3).tolist() == [1, 4, 3]
+        assert top_k_indices(scores, 0).tolist() == []
+        assert top_k_indices(scores, 10).tolist() == [1, 4, 3, 2, 5, 0]
+
+
+class TestRankDocuments:
+    def test_same_items_as_sorting_all_scores(self, embeddings):
+        texts_embed, query_embed = embeddings
+        scores = [METRICS["cosine"](query_embed, text) for text in texts_embed]
+        expected = sorted(range(len(scores)), key=lambda i: scores[i], reverse=True)
+
+        items = rank_documents(query_embed, texts_embed, "cosine")
+        assert [item.document for item in items] == expected
+
+        items = rank_documents(query_embed, texts_embed, "cosine", top_k=5)
+        assert [item.document for item in items] == expected[:5]
+        assert items[0].model_dump() == {
+            "object": "search_result",
+            "document": expected[0],
+            "score": pytest.approx(scores[expected[0]], rel=1e-4),
+        }
+
+    def test_no_documents(self):
+        assert rank_documents([1.0, 0.0], [], "cosine") == []
@@ -0,0 +1,178 @@
+import threading
+from typing import Any, Dict, List
+
+import pytest
+
+from edenai_apis.utils import monitoring
+from edenai_apis.utils.monitoring import (
+    MonitoringQueue,
+    MonitoringSink,
+    SQLiteSink,
+    flush_monitoring,
+    insert_api_call,
+    monitor_call,
+    set_monitoring_sink,
+)
+
+
+def row(index: int) -> Dict[str, Any]:
+    return {column: str(index) for column in monitoring.HISTORY_COLUMNS}
+
+
+class BlockingSink(MonitoringSink):
+    """Sink waiting for `release` before writing, to fill the queue"""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.batches: List[List[Dict]] = []
+
+    def write_batch(self, rows):
+        self.release.wait(5)
+        self.batches.append(rows)
+
+
+class FailingSink(MonitoringSink):
+    def write_batch(self, rows):
+        raise ConnectionError("db is down")
+
+
+class RejectingSink(BlockingSink):
+    """Sink rejecting the batches containing an invalid row"""
+
+    def write_batch(self, rows):
+        if any(row["error"] == "invalid" for row in rows):
+            raise ValueError("value too long")
+        self.batches.append(rows)
+
+
+class DownSink(MonitoringSink):
+    def __init__(self):
+        self.attempts = 0
+
+    def write_batch(self, rows):
+        self.attempts += 1
+        raise ConnectionError("db is down")
+
+    def is_row_error(self, exc):
+        return False
+
+
+@pytest.fixture
+def sink():
+    sink = SQLiteSink()
+    yield sink
+    monitoring.close_monitoring()
+
+
+class TestMonitoringQueue:
+    def test_writes_by_batches(self):
+        sink = BlockingSink()
+        sink.release.set()
+        monitoring_queue = MonitoringQueue(sink, batch_size=3, flush_interval=60)
+        for index in range(7):
+            monitoring_queue.put(row(index))
+
+        assert monitoring_queue.flush(timeout=5)
+        assert [len(batch) for batch in sink.batches] == [3, 3, 1]
+        assert monitoring_queue.stats()["written"] == 7
+        monitoring_queue.close()
+
+    def test_flush_interval(self):
+        sink = BlockingSink()
+        sink.release.set()
+        monitoring_queue = MonitoringQueue(sink, batch_size=100, flush_interval=0.01)
+        monitoring_queue.put(row(0))
+        monitoring_queue.close()
+        assert sink.batches == [[row(0)]]
+
+    @pytest.mark.parametrize(
+        ("drop_policy", "expected"),
+        [("drop_newest", ["0", "1", "2"]), ("drop_oldest", ["0", "3", "4"])],
+    )
+    def test_drop_policy(self, drop_policy, expected):
+        sink = BlockingSink()
+        monitoring_queue = MonitoringQueue(
+            sink, max_size=2, batch_size=1, flush_interval=0, drop_policy=drop_policy
+        )
+        monitoring_queue.put(row(0))
+        # wait for the worker to take the first call, it is then blocked in the sink
+        while monitoring_queue.stats()["queued"]:
+            pass
+        for index in range(1, 5):
+            monitoring_queue.put(row(index))
+
+        sink.release.set()
+        monitoring_queue.close()
+        assert [batch[0]["provider"] for batch in sink.batches] == expected
+        assert monitoring_queue.stats()["dropped"] == 2
+
+    def test_sink_errors_do_not_stop_the_worker(self):
+        monitoring_queue = MonitoringQueue(FailingSink(), flush_interval=0)
+        monitoring_queue.put(row(0))
+        assert monitoring_queue.flush(timeout=5)
+        monitoring_queue.put(row(1))
+        assert monitoring_queue.flush(timeout=5)
+        assert monitoring_queue.stats()["failed"] == 2
+        monitoring_queue.close()
+
+    def test_only_invalid_rows_are_lost(self):
+        sink = RejectingSink()
+        monitoring_queue = MonitoringQueue(sink, batch_size=8, flush_interval=60)
+        for index in range(8):
+            error = "invalid" if index == 5 else None
+            monitoring_queue.put({**row(index), "error": error})
+        assert monitoring_queue.flush(timeout=5)
+        assert sorted(row["provider"] for batch in sink.batches for row in batch) == [
+            str(index) for index in range(8) if index != 5
+        ]
+        assert monitoring_queue.stats()["written"] == 7
+        assert monitoring_queue.stats()["failed"] == 1
+        monitoring_queue.close()
+
+    def test_sink_errors_are_not_retried_by_row(self):
+        sink = DownSink()
+        monitoring_queue = MonitoringQueue(sink, batch_size=8, flush_interval=60)
+        for index in range(8):
+            monitoring_queue.put(row(index))
+        assert monitoring_queue.flush(timeout=5)
+        assert sink.attempts == 1
+        assert monitoring_queue.stats()["failed"] == 8
+        monitoring_queue.close()
+
+    def test_calls_after_close_are_dropped(self):
+        monitoring_queue = MonitoringQueue(BlockingSink())
+        monitoring_queue.close()
+        assert monitoring_queue.put(row(0)) is False
+
+
+class TestInsertApiCall:
+    def test_insert_is_queued(self, sink):
+        set_monitoring_sink(sink, flush_interval=60)
+        insert_api_call("openai", "text", "chat", "user@edenai.co", None)
+        assert sink.rows() == []
+
+        assert flush_monitoring(timeout=5)
+        [inserted] = sink.rows()
+        assert inserted["provider"] == "openai"
+        assert inserted["edenai_user"] == "user@edenai.co"
+
+    def test_monitor_call(self, sink):
+        set_monitoring_sink(sink)
+
+        @monitor_call(condition=True)
+        def compute(provider_name, feature, subfeature, **kwargs):
+            raise ValueError("error")
+
+        with pytest.raises(ValueError):
+            compute("openai", "text", "chat", user_email="user@edenai.co")
+        assert flush_monitoring(timeout=5)
+        [inserted] = sink.rows()
+        assert inserted["subfeature"] == "chat"
+        assert inserted["error"] == "error"
+
+    def test_long_values_are_truncated(self, sink):
+        set_monitoring_sink(sink)
+        insert_api_call("openai", "text", "chat", "user@edenai.co", "e" * 1000)
+        assert flush_monitoring(timeout=5)
+        [inserted] = sink.rows()
+        assert inserted["error"] == "e" * 255
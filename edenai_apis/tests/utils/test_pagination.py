@@ -0,0 +1,82 @@
+import threading
+import time
+
+import pytest
+
+from edenai_apis.apis.amazon.helpers import amazon_job_pages
+from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.pagination import iter_items, iter_pages
+
+
+class FakePaginatedApi:
+    """Return `pages` pages of items, after `delay` seconds"""
+
+    def __init__(self, pages: int, delay: float = 0, failing_page: int = -1):
+        self.pages = pages
+        self.delay = delay
+        self.failing_page = failing_page
+        self.requested = []
+        self.lock = threading.Lock()
+
+    def __call__(self, JobId, NextToken=None):
+        index = int(NextToken or 0)
+        with self.lock:
+            self.requested.append(index)
+        time.sleep(self.delay)
+        page = {"JobStatus": "SUCCEEDED", "Items": [index * 10, index * 10 + 1]}
+        if index == self.failing_page:
+            page = {"JobStatus": "FAILED", "StatusMessage": "page error"}
+        if index + 1 < self.pages:
+            page["NextToken"] = str(index + 1)
+        return page
+
+
+def fetch(api):
+    return lambda token: api("job", token)
+
+
+class TestIterPages:
+    def test_all_pages_in_order(self):
+        api = FakePaginatedApi(pages=5)
+        pages = list(iter_pages(fetch(api)))
+        assert [page["Items"][0] for page in pages] == [0, 10, 20, 30, 40]
+        assert api.requested == [0, 1, 2, 3, 4]
+
+    def test_next_page_is_fetched_while_parsing(self):
+        api = FakePaginatedApi(pages=5, delay=0.1)
+
+        def slow_parser(page):
+            time.sleep(0.1)
+            return page["Items"]
+
+        start = time.perf_counter()
+        items = list(iter_items(iter_pages(fetch(api)), slow_parser))
+        # 5 fetches and 5 parsings of 0.1s would take 1s serially
+        assert time.perf_counter() - start < 0.8
+        assert items == [value for index in range(5) for value in (index * 10, index * 10 + 1)]
+
+    def test_first_page_is_not_fetched_again(self):
+        api = FakePaginatedApi(pages=2)
+        first_page = api("job")
+        list(iter_pages(fetch(api), first_page=first_page))
+        assert api.requested == [0, 1]
+
+    def test_stop_early(self):
+        api = FakePaginatedApi(pages=100)
+        pages = iter_pages(fetch(api))
+        next(pages)
+        pages.close()
+        assert len(api.requested) <= 2
+
+
+class TestAmazonJobPages:
+    def test_pages(self):
+        api = FakePaginatedApi(pages=3)
+        assert [page["Items"][0] for page in amazon_job_pages(api, "job")] == [0, 10, 20]
+
+    def test_failed_page(self):
+        api = FakePaginatedApi(pages=3, failing_page=1)
+        pages = amazon_job_pages(api, "job")
+        assert next(pages)["Items"] == [0, 1]
+        with pytest.raises(ProviderException, match="page error"):
+            next(pages)
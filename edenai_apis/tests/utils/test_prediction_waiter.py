@@ -0,0 +1,66 @@
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from edenai_apis.apis.replicate.helpers import PredictionWaiter
+from edenai_apis.utils.exception import ProviderException, ProviderTimeoutError
+
+URLS = {"get": "https://get", "cancel": "https://cancel"}
+
+
+def prediction_response(status, status_code=200, **kwargs):
+    response = MagicMock(status_code=status_code)
+    response.json.return_value = {"id": "p1", "status": status, "urls": URLS, **kwargs}
+    return response
+
+
+@pytest.fixture
+def mocked_http(mocker: MockerFixture):
+    return mocker.patch("edenai_apis.apis.replicate.helpers.http_client")
+
+
+class TestPredictionWaiter:
+    def test_long_poll_on_creation(self, mocked_http):
+        mocked_http.post.return_value = prediction_response("succeeded", 201, output="ok")
+        waiter = PredictionWaiter(prefer_wait=30)
+        assert waiter.run("https://create", {}, {"Authorization": "Token"})["output"] == "ok"
+        assert mocked_http.post.call_args.kwargs["headers"]["Prefer"] == "wait=30"
+        mocked_http.get.assert_not_called()
+        assert waiter.polls("p1") == 0
+
+    def test_backoff(self, mocked_http):
+        mocked_http.post.return_value = prediction_response("starting", 201)
+        mocked_http.get.side_effect = [
+            prediction_response("processing"),
+            prediction_response("processing"),
+            prediction_response("succeeded"),
+        ]
+        sleeps = []
+        waiter = PredictionWaiter(
+            min_interval=1, max_interval=3, jitter=0, sleep=sleeps.append
+        )
+        assert waiter.run("https://create", {}, {})["status"] == "succeeded"
+        assert sleeps == [1, 2, 3]
+        assert waiter.polls("p1") == 3
+        assert waiter.stats()["polls"] == 3
+
+    def test_failed(self, mocked_http):
+        mocked_http.post.return_value = prediction_response("failed", 201, error="oom")
+        with pytest.raises(ProviderException, match="oom"):
+            PredictionWaiter().run("https://create", {}, {})
+
+    def test_timeout_cancels_the_prediction(self, mocked_http):
+        mocked_http.post.return_value = prediction_response("starting", 201)
+        mocked_http.get.return_value = prediction_response("processing")
+        waiter = PredictionWaiter(timeout=0.05, min_interval=0.01, max_interval=0.01)
+        with pytest.raises(ProviderTimeoutError):
+            waiter.run("https://create", {}, {})
+        assert mocked_http.post.call_args.args == ("https://cancel",)
+
+    def test_creation_error(self, mocked_http):
+        mocked_http.post.return_value = prediction_response(
+            None, 422, detail="invalid version"
+        )
+        with pytest.raises(ProviderException, match="invalid version"):
+            PredictionWaiter().run("https://create", {}, {})
@@ -0,0 +1,103 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from pytest_mock import MockerFixture
+
+from edenai_apis.utils.provider_pool import ProviderInstancePool, api_keys_fingerprint
+
+
+class FakeApi:
+    provider_name = "fake"
+
+    def __init__(self, api_keys={}):
+        self.api_keys = api_keys
+
+
+class StatefulApi(FakeApi):
+    provider_name = "stateful"
+    poolable = False
+
+    def call(self, value):
+        self.current = value
+        time.sleep(0.01)
+        return self.current
+
+
+@pytest.fixture
+def pool(mocker: MockerFixture):
+    mocker.patch(
+        "edenai_apis.utils.provider_pool.load_provider", return_value=FakeApi
+    )
+    return ProviderInstancePool(max_size=2, ttl=0)
+
+
+def test_api_keys_fingerprint():
+    assert api_keys_fingerprint({}) == ""
+    assert api_keys_fingerprint({"a": 1, "b": 2}) == api_keys_fingerprint(
+        {"b": 2, "a": 1}
+    )
+    assert api_keys_fingerprint({"a": 1}) != api_keys_fingerprint({"a": 2})
+
+
+def test_pool_reuses_instances(pool: ProviderInstancePool):
+    first = pool.get("fake", {"key": "1"})
+    assert pool.get("fake", {"key": "1"}) is first
+    assert pool.get("fake", {"key": "2"}) is not first
+    stats = pool.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+
+
+def test_pool_lru_eviction(pool: ProviderInstancePool):
+    first = pool.get("fake", {"key": "1"})
+    pool.get("fake", {"key": "2"})
+    pool.get("fake", {"key": "3"})
+    assert pool.stats()["size"] == 2
+    assert pool.get("fake", {"key": "1"}) is not first
+
+
+def test_pool_ttl_eviction(mocker: MockerFixture):
+    mocker.patch(
+        "edenai_apis.utils.provider_pool.load_provider", return_value=FakeApi
+    )
+    pool = ProviderInstancePool(max_size=2, ttl=0.01)
+    first = pool.get("fake")
+    time.sleep(0.02)
+    assert pool.get("fake") is not first
+
+
+def test_pool_invalidate(pool: ProviderInstancePool):
+    first = pool.get("fake", {"key": "1"})
+    second = pool.get("fake", {"key": "2"})
+    assert pool.invalidate("fake", {"key": "1"}) == 1
+    assert pool.get("fake", {"key": "1"}) is not first
+    assert pool.get("fake", {"key": "2"}) is second
+    assert pool.invalidate("fake") == 2
+
+
+def test_disabled_pool(mocker: MockerFixture):
+    mocker.patch(
+        "edenai_apis.utils.provider_pool.load_provider", return_value=FakeApi
+    )
+    pool = ProviderInstancePool(max_size=0)
+    assert pool.get("fake") is not pool.get("fake")
+
+
+def test_concurrent_calls_share_one_instance(pool: ProviderInstancePool):
+    with ThreadPoolExecutor(8) as executor:
+        instances = set(executor.map(lambda _: id(pool.get("fake")), range(16)))
+    assert len(instances) == 1
+
+
+def test_stateful_provider_is_not_pooled(mocker: MockerFixture):
+    mocker.patch(
+        "edenai_apis.utils.provider_pool.load_provider", return_value=StatefulApi
+    )
+    pool = ProviderInstancePool(max_size=2, ttl=0)
+    with ThreadPoolExecutor(8) as executor:
+        results = list(
+            executor.map(lambda value: pool.get("stateful").call(value), range(16))
+        )
+    assert results == list(range(16))
+    assert pool.stats()["size"] == 0
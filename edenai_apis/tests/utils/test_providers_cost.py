@@ -0,0 +1,53 @@
+import threading
+import time
+
+from edenai_apis.utils.providers_cost import ProvidersCostCache
+
+
+class FakeLoader:
+    def __init__(self):
+        self.calls = 0
+        self.refreshed = threading.Event()
+
+    def __call__(self):
+        self.calls += 1
+        if self.calls > 1:
+            self.refreshed.set()
+        return {"version": self.calls}
+
+
+class TestProvidersCostCache:
+    def test_loaded_once(self):
+        loader = FakeLoader()
+        cache = ProvidersCostCache(ttl=3600, loader=loader)
+        assert cache.get() == {"version": 1}
+        assert cache.get() == {"version": 1}
+        assert loader.calls == 1
+        cache.stop()
+
+    def test_background_refresh(self):
+        loader = FakeLoader()
+        cache = ProvidersCostCache(ttl=0.01, loader=loader)
+        cache.get()
+        assert loader.refreshed.wait(5)
+        # the event is set by the loader, before the table is swapped
+        deadline = time.monotonic() + 5
+        while cache.get()["version"] == 1 and time.monotonic() < deadline:
+            time.sleep(0.001)
+        assert cache.get()["version"] > 1
+        cache.stop()
+
+    def test_failed_refresh_keeps_previous_table(self):
+        failed = threading.Event()
+
+        def loader():
+            if cache._table is None:
+                return {"version": 1}
+            failed.set()
+            raise ConnectionError("s3 is down")
+
+        cache = ProvidersCostCache(ttl=0.01, loader=loader)
+        cache.get()
+        assert failed.wait(5)
+        assert cache.get() == {"version": 1}
+        cache.stop()
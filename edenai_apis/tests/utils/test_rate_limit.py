@@ -0,0 +1,32 @@
+import time
+
+from edenai_apis.utils.rate_limit import TokenBucket, parse_rate_limits
+
+
+class TestTokenBucket:
+    def test_burst_then_rate(self):
+        bucket = TokenBucket(rate=10, capacity=2)
+        assert bucket.try_acquire() == 0
+        assert bucket.try_acquire() == 0
+        assert 0 < bucket.try_acquire() <= 0.1
+
+        start = time.perf_counter()
+        assert bucket.acquire()
+        assert time.perf_counter() - start >= 0.05
+
+    def test_unlimited(self):
+        bucket = TokenBucket(rate=0)
+        assert all(bucket.try_acquire() == 0 for _ in range(1000))
+
+    def test_acquire_timeout(self):
+        bucket = TokenBucket(rate=1)
+        bucket.try_acquire()
+        assert not bucket.acquire(timeout=0.01)
+
+
+def test_parse_rate_limits():
+    assert parse_rate_limits("amazon:5, openai:2.5,,bad") == {
+        "amazon": 5.0,
+        "openai": 2.5,
+    }
+    assert parse_rate_limits(None) == {}
@@ -0,0 +1,271 @@
+import asyncio
+import gc
+import json
+import threading
+import time
+
+import pytest
+
+from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.streaming import (
+    OutputStream,
+    iter_json_array,
+    iter_ndjson,
+    iter_sse_events,
+    iter_sse_json,
+    parse_json_array_chunks,
+    parse_sse_lines,
+    split_lines,
+)
+
+
+class FakeStreamedResponse:
+    """Streamed response sending `chunks`, records what was read"""
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.sent = 0
+        self.closed = False
+
+    def iter_content(self, chunk_size=None):
+        for chunk in self.chunks:
+            self.sent += 1
+            yield chunk
+
+    def close(self):
+        self.closed = True
+
+
+def split_every(data: bytes, size: int):
+    return [data[index : index + size] for index in range(0, len(data), size)]
+
+
+class TestSplitLines:
+    def test_lines_split_across_chunks(self):
+        chunks = [b"data: a", b"b\r", b"\n\r\nda", b"ta: c\n", b"last"]
+        assert list(split_lines(chunks)) == [b"data: ab", b"", b"data: c", b"last"]
+
+
+class TestParseSSE:
+    def test_events(self):
+        lines = [
+            ": keep-alive",
+            "",
+            "event: output",
+            "data: first line",
+            "data:second line",
+            "id: 1",
+            "",
+            "data: {}",
+        ]
+        events = list(parse_sse_lines(lines))
+        assert [(event.event, event.data) for event in events] == [
+            ("output", "first line\nsecond line"),
+            ("message", "{}"),
+        ]
+        assert events[0].id == "1"
+
+    def test_any_chunking(self):
+        data = b'data: {"text": "a"}\r\n\r\n: ping\n\ndata: {"text": "b"}\n\ndata: [DONE]\n\n'
+        for size in (1, 3, 7, len(data)):
+            response = FakeStreamedResponse(split_every(data, size))
+            assert list(iter_sse_json(response)) == [{"text": "a"}, {"text": "b"}]
+            assert response.closed
+
+    def test_events_are_yielded_as_they_arrive(self):
+        response = FakeStreamedResponse(
+            [b'data: {"text": "a"}\n\n', b'data: {"text": "b"}\n\n']
+        )
+        stream = iter_sse_json(response)
+        assert next(stream) == {"text": "a"}
+        assert response.sent == 1
+
+    def test_abandoned_stream_is_closed(self):
+        response = FakeStreamedResponse([b"data: 1\n\n", b"data: 2\n\n"])
+        stream = iter_sse_events(response)
+        next(stream)
+        stream.close()
+        assert response.closed
+
+    def test_invalid_json(self):
+        response = FakeStreamedResponse([b"data: {not json\n\n"])
+        with pytest.raises(ProviderException):
+            list(iter_sse_json(response))
+        assert response.closed
+
+
+class TestNDJson:
+    def test_objects(self):
+        data = b'{"event_type": "stream-start"}\n\n{"event_type": "text-generation", "text": "hi"}\n'
+        response = FakeStreamedResponse(split_every(data, 5))
+        assert [obj["event_type"] for obj in iter_ndjson(response)] == [
+            "stream-start",
+            "text-generation",
+        ]
+        assert response.closed
+
+
+class TestJsonArray:
+    def test_any_chunking(self):
+        elements = [{"outputs": [{"text": "a, ]"}]}, {"outputs": []}, [1, 2]]
+        data = json.dumps(elements, indent=2).encode()
+        for size in (1, 4, len(data)):
+            response = FakeStreamedResponse(split_every(data, size))
+            assert list(iter_json_array(response)) == elements
+            assert response.closed
+
+    def test_elements_are_yielded_as_they_arrive(self):
+        chunks = iter(['[{"a": 1}', ',{"b": 2}', "]"])
+        elements = parse_json_array_chunks(chunks)
+        assert next(elements) == {"a": 1}
+        assert next(chunks) == ',{"b": 2}'
+
+    def test_truncated(self):
+        with pytest.raises(ProviderException):
+            list(parse_json_array_chunks(['[{"a": 1}, {"b"']))
+
+
+class Source:
+    """Provider chunks, records how many were read and if the stream was closed"""
+
+    def __init__(self, count=5, failing_at=-1):
+        self.count = count
+        self.failing_at = failing_at
+        self.read = 0
+        self.closed = False
+
+    def __iter__(self):
+        try:
+            for index in range(self.count):
+                if index == self.failing_at:
+                    raise ProviderException("stream error")
+                self.read += 1
+                yield index
+        finally:
+            self.closed = True
+
+
+class TestOutputStream:
+    def test_chunks_are_read_on_demand(self):
+        source = Source()
+        completions = []
+        stream = OutputStream(
+            iter(source), on_complete=lambda stream, error: completions.append(error)
+        )
+        assert next(stream) == 0
+        assert source.read == 1
+        assert list(stream) == [1, 2, 3, 4]
+        assert completions == [None]
+        assert stream.done and stream.chunks_count == 5
+
+    def test_buffer_stops_reading_when_full(self):
+        source = Source(count=100)
+        stream = OutputStream(iter(source), buffer_size=3)
+        assert next(stream) == 0
+        time.sleep(0.3)
+        # 3 chunks in the buffer, one waiting for room
+        assert source.read == 5
+        assert list(stream) == list(range(1, 100))
+
+    @pytest.mark.parametrize("buffer_size", [0, 2])
+    def test_cancel(self, buffer_size):
+        source = Source(count=100)
+        completions = []
+        stream = OutputStream(
+            iter(source),
+            buffer_size=buffer_size,
+            on_complete=lambda stream, error: completions.append(error),
+        )
+        next(stream)
+        stream.cancel()
+        assert list(stream) == []
+        time.sleep(0.3)
+        assert source.closed
+        assert stream.cancelled
+        assert completions == [None]
+
+    def test_cancel_while_reading_closes_the_chunks(self):
+        reading, release = threading.Event(), threading.Event()
+        closed = []
+
+        def chunks():
+            try:
+                yield 0
+                reading.set()
+                release.wait(5)
+                yield 1
+                yield 2
+            finally:
+                closed.append(True)
+
+        stream = OutputStream(chunks())
+        next(stream)
+        reader = threading.Thread(target=lambda: next(stream))
+        reader.start()
+        reading.wait(5)
+        stream.cancel()
+        assert not closed
+        release.set()
+        reader.join(5)
+        assert closed
+        assert list(stream) == []
+
+    @pytest.mark.parametrize("buffer_size", [0, 2])
+    def test_abandoned_stream_is_cancelled(self, buffer_size):
+        source = Source(count=100)
+        completions = []
+        stream = OutputStream(
+            iter(source),
+            buffer_size=buffer_size,
+            on_complete=lambda stream, error: completions.append(error),
+        )
+        next(stream)
+        del stream
+        gc.collect()
+        time.sleep(0.3)
+        assert source.closed
+        assert completions == [None]
+
+    def test_cancel_event(self):
+        cancel_event = threading.Event()
+        stream = OutputStream(iter(Source(count=100)), cancel_event=cancel_event)
+        next(stream)
+        cancel_event.set()
+        assert list(stream) == []
+
+    @pytest.mark.parametrize("buffer_size", [0, 2])
+    def test_error(self, buffer_size):
+        completions = []
+        stream = OutputStream(
+            iter(Source(failing_at=2)),
+            buffer_size=buffer_size,
+            on_complete=lambda stream, error: completions.append(error),
+            map_error=lambda exc: ValueError(str(exc)),
+        )
+        assert [next(stream), next(stream)] == [0, 1]
+        with pytest.raises(ValueError, match="stream error"):
+            next(stream)
+        assert str(completions[0]) == "stream error"
+        assert list(stream) == []
+
+    def test_async_for(self):
+        async def consume():
+            return [chunk async for chunk in OutputStream(iter(Source()))]
+
+        assert asyncio.run(consume()) == [0, 1, 2, 3, 4]
+
+    def test_async_for_does_not_use_the_default_executor(self):
+        reader_threads = set()
+
+        def chunks():
+            for index in range(3):
+                reader_threads.add(threading.current_thread().name)
+                yield index
+
+        async def consume():
+            return [chunk async for chunk in OutputStream(chunks())]
+
+        assert asyncio.run(consume()) == [0, 1, 2]
+        assert all(
+            name.startswith("edenai_apis_stream_reader") for name in reader_threads
+        )
@@ -1,12 +1,17 @@
 import os
+import threading
 
 import pytest
+from pytest_mock import MockerFixture
 from settings import base_path
 
 from edenai_apis.utils.upload_s3 import (
     get_providers_json_from_s3,
+    S3_MIN_PART_SIZE,
+    reset_s3_client,
     s3_client_load,
     upload_file_to_s3,
+    upload_stream_to_s3,
 )
 
 
@@ -36,3 +41,91 @@ def test_upload_to_s3():
 def test_get_providers_json_from_s3():
     providers_info = get_providers_json_from_s3()
     assert isinstance(providers_info, dict)
+
+
+def test_s3_client_is_cached(mocker: MockerFixture):
+    mocker.patch(
+        "edenai_apis.utils.upload_s3.load_provider",
+        return_value={
+            "aws_access_key_id": "key_id",
+            "aws_secret_access_key": "secret",
+            "providers_resource_bucket": "providers",
+            "users_resource_bucket": "users",
+            "cloudfront_key_id": "cloudfront",
+            "ressource_region": "eu-west-3",
+        },
+    )
+    mocked_client = mocker.patch("edenai_apis.utils.upload_s3.boto3.client")
+    reset_s3_client()
+
+    assert s3_client_load() is s3_client_load()
+    mocked_client.assert_called_once()
+    reset_s3_client()
+
+
+class TestUploadStreamToS3:
+    @pytest.fixture
+    def s3_client(self, mocker: MockerFixture):
+        client = mocker.MagicMock()
+        client.create_multipart_upload.return_value = {"UploadId": "upload_id"}
+        client.upload_part.side_effect = lambda **kwargs: {
+            "ETag": f"etag{kwargs['PartNumber']}"
+        }
+        mocker.patch(
+            "edenai_apis.utils.upload_s3.s3_client_load", return_value=client
+        )
+        mocker.patch(
+            "edenai_apis.utils.upload_s3.get_s3_file_url", return_value="https://url"
+        )
+        return client
+
+    def test_small_content_single_put(self, s3_client):
+        url = upload_stream_to_s3([b"ab", b"cd"], ".mp3")
+        assert url == "https://url"
+        assert s3_client.put_object.call_args.kwargs["Body"] == b"abcd"
+        s3_client.create_multipart_upload.assert_not_called()
+
+    def test_multipart_upload(self, s3_client):
+        chunk = b"a" * (S3_MIN_PART_SIZE // 2)
+        upload_stream_to_s3(iter([chunk] * 5), ".mp3", part_size=S3_MIN_PART_SIZE)
+
+        parts = [call.kwargs["Body"] for call in s3_client.upload_part.call_args_list]
+        assert [len(part) for part in parts] == [
+            S3_MIN_PART_SIZE,
+            S3_MIN_PART_SIZE,
+            S3_MIN_PART_SIZE // 2,
+        ]
+        assert s3_client.complete_multipart_upload.call_args.kwargs[
+            "MultipartUpload"
+        ] == {
+            "Parts": [
+                {"ETag": "etag1", "PartNumber": 1},
+                {"ETag": "etag2", "PartNumber": 2},
+                {"ETag": "etag3", "PartNumber": 3},
+            ]
+        }
+        s3_client.put_object.assert_not_called()
+
+    def test_abort_on_error(self, s3_client):
+        def chunks():
+            yield b"a" * S3_MIN_PART_SIZE
+            raise ConnectionError("provider stream closed")
+
+        with pytest.raises(ConnectionError):
+            upload_stream_to_s3(chunks(), ".mp3", part_size=S3_MIN_PART_SIZE)
+        s3_client.abort_multipart_upload.assert_called_once()
+        s3_client.complete_multipart_upload.assert_not_called()
+
+    def test_background_upload_error_is_reported(self, s3_client):
+        errors = []
+        done = threading.Event()
+
+        def on_error(exc):
+            errors.append(exc)
+            done.set()
+
+        s3_client.put_object.side_effect = ConnectionError("s3 is down")
+        url = upload_stream_to_s3([b"ab"], ".mp3", background=True, on_error=on_error)
+        assert url == "https://url"
+        assert done.wait(5)
+        assert isinstance(errors[0], ConnectionError)
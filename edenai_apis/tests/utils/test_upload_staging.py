@@ -0,0 +1,112 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from botocore.exceptions import ClientError
+
+from edenai_apis.utils.upload_s3 import upload_file_to_s3
+from edenai_apis.utils.upload_staging import (
+    LocalStagingBackend,
+    S3StagingBackend,
+    UploadStaging,
+    file_sha256,
+    set_upload_staging,
+)
+
+
+class CountingBackend(LocalStagingBackend):
+    def __init__(self, directory):
+        super().__init__(directory)
+        self.uploads = []
+        self.lock = threading.Lock()
+
+    def upload(self, file_path, key):
+        with self.lock:
+            self.uploads.append(key)
+        time.sleep(0.01)
+        return super().upload(file_path, key)
+
+
+@pytest.fixture
+def backend(tmp_path):
+    return CountingBackend(str(tmp_path / "staging"))
+
+
+@pytest.fixture
+def audio(tmp_path):
+    path = tmp_path / "audio.mp3"
+    path.write_bytes(b"audio content")
+    return str(path)
+
+
+class TestUploadStaging:
+    def test_same_content_is_uploaded_once(self, backend, audio, tmp_path):
+        staging = UploadStaging(backend)
+        copy = tmp_path / "copy.mp3"
+        copy.write_bytes(b"audio content")
+
+        url = staging.stage(audio, "audio.mp3")
+        assert staging.stage(str(copy), "1234_audio.mp3") == url
+        assert url.startswith("file://")
+        assert Path(url[len("file://") :]).read_bytes() == b"audio content"
+        assert backend.uploads == [f"{file_sha256(audio)}_audio.mp3"]
+        assert staging.stats()["hits"] == 1
+
+    def test_extension_is_part_of_the_key(self, backend, audio):
+        staging = UploadStaging(backend)
+        staging.stage(audio, "audio.mp3")
+        staging.stage(audio, "audio.wav")
+        assert len(backend.uploads) == 2
+
+    def test_expiration(self, backend, audio):
+        staging = UploadStaging(backend)
+        backend.ttl = 0
+        staging.stage(audio, "audio.mp3")
+        staging.stage(audio, "audio.mp3")
+        assert len(backend.uploads) == 2
+
+    def test_eviction_deletes_local_files(self, backend, tmp_path):
+        staging = UploadStaging(backend, max_entries=1)
+        files = []
+        for index in range(2):
+            path = tmp_path / f"{index}.mp3"
+            path.write_bytes(str(index).encode())
+            files.append(staging.stage(str(path), path.name))
+        assert not Path(files[0][len("file://") :]).exists()
+        assert Path(files[1][len("file://") :]).exists()
+        assert staging.stats()["size"] == 1
+
+    def test_concurrent_stages_upload_once(self, backend, audio):
+        staging = UploadStaging(backend)
+        with ThreadPoolExecutor(8) as executor:
+            urls = set(executor.map(lambda _: staging.stage(audio, "a.mp3"), range(16)))
+        assert len(urls) == 1
+        assert len(backend.uploads) == 1
+
+    def test_upload_file_to_s3_is_staged(self, backend, audio):
+        set_upload_staging(UploadStaging(backend))
+        try:
+            url = upload_file_to_s3(audio, "audio.mp3")
+            assert upload_file_to_s3(audio, "other_name.mp3") == url
+        finally:
+            set_upload_staging(None)
+        assert len(backend.uploads) == 1
+
+
+class TestS3StagingBackend:
+    def test_skip_existing(self, audio):
+        s3_client = MagicMock()
+        backend = S3StagingBackend(
+            "bucket", s3_client, presign=False, skip_existing=True
+        )
+        assert backend.upload(audio, "key") == "key"
+        s3_client.upload_file.assert_not_called()
+
+        s3_client.head_object.side_effect = ClientError(
+            {"Error": {"Code": "404"}}, "HeadObject"
+        )
+        backend.upload(audio, "key")
+        s3_client.upload_file.assert_called_once_with(audio, "bucket", "key")
@@ -1,5 +1,12 @@
+import random
 from time import sleep
-from typing import Callable
+from typing import Callable, Optional, Tuple
+
+from edenai_apis.utils.job_completion import (
+    JOB_POLL_JITTER,
+    get_job_store,
+    register_job,
+)
 
 
 def fibonacci_waiting_call(
@@ -8,6 +15,7 @@ def fibonacci_waiting_call(
     func: Callable,
     status_positif: bool = True,
     provider_handel_call: Callable = None,
+    job_key: Optional[Tuple[str, str]] = None,
     **func_args,
 ):
     """Check response call if succeeded synchronously form an async endpoint
@@ -19,6 +27,9 @@ def fibonacci_waiting_call(
         status_positif (int): Wether to test status with a sucess or a waiting one
         provider_handel_call (Callable): The function wrapper for the provider call
         to handle errors
+        job_key (tuple): (provider_name, job_id) of the job. When given, waiting
+        stops as soon as a completion notification is received for the job
+        (see `utils.job_completion`) instead of sleeping until the next poll
     """
     first_occurence, second_occurence = (
         1,
@@ -26,6 +37,8 @@ def fibonacci_waiting_call(
     )  # waiting exponentially using fibonacci
     wait_time = first_occurence + second_occurence
     total_wait_time = wait_time
+    if job_key:
+        register_job(*job_key)
     get_response = (
         func(**func_args)
         if not provider_handel_call
@@ -36,7 +49,12 @@ def fibonacci_waiting_call(
             not status_positif and get_response["JobStatus"] != status
         ):
             break
-        sleep(wait_time)
+        # jitter so that jobs launched together are not polled together
+        delay = wait_time * random.uniform(1 - JOB_POLL_JITTER, 1 + JOB_POLL_JITTER)
+        if job_key:
+            get_job_store().wait(*job_key, timeout=delay)
+        else:
+            sleep(delay)
         first_occurence = second_occurence
         second_occurence = wait_time
         wait_time = first_occurence + second_occurence
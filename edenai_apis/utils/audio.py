@@ -1,5 +1,7 @@
+import base64
+import os
 from io import BufferedReader
-from typing import Union, List, Dict
+from typing import Callable, Iterable, Iterator, Optional, Tuple, Union, List, Dict
 
 from pydub import AudioSegment
 from pydub.utils import mediainfo
@@ -16,6 +18,11 @@ SSML_TAG_EXCEPTION_MESSAGE = (
     "add them manually using tags."
 )
 
+# Set `TTS_INLINE_AUDIO=false` to only return the audio resource url in text to speech
+# responses (the `audio` field is then empty) instead of the base64 encoded audio
+TTS_INLINE_AUDIO = os.environ.get("TTS_INLINE_AUDIO", "true").lower() != "false"
+TTS_CHUNK_SIZE = 64 * 1024
+
 AUDIO_FILE_FORMAT = [
     "wav",
     "flac",
@@ -270,3 +277,80 @@ def validate_audio_attribute_against_ssml_tags_use(text, rate, pitch, volume):
         if any((rate, pitch, volume)):
             raise ProviderException(SSML_TAG_EXCEPTION_MESSAGE)
         return True
+
+
+# ******Text_to_Speech audio upload******#
+
+
+class Base64StreamEncoder:
+    """Base64 encode a stream of bytes chunks, chunk by chunk"""
+
+    def __init__(self) -> None:
+        self._parts: List[str] = []
+        self._remainder = b""
+
+    def update(self, chunk: bytes) -> None:
+        data = self._remainder + chunk
+        # base64 encodes 3 bytes blocks, keep the incomplete block for the next chunk
+        cut = len(data) - len(data) % 3
+        self._parts.append(base64.b64encode(data[:cut]).decode("utf-8"))
+        self._remainder = data[cut:]
+
+    def result(self) -> str:
+        return "".join(self._parts) + base64.b64encode(self._remainder).decode("utf-8")
+
+
+def _encode_while_streaming(
+    chunks: Iterable[bytes], encoder: Base64StreamEncoder
+) -> Iterator[bytes]:
+    for chunk in chunks:
+        if chunk:
+            encoder.update(chunk)
+            yield chunk
+
+
+def upload_text_to_speech_audio(
+    chunks: Iterable[bytes],
+    extension: str,
+    inline_audio: Optional[bool] = None,
+    background_upload: bool = False,
+    on_upload_error: Optional[Callable[[Exception], None]] = None,
+) -> Tuple[str, str]:
+    """Stream a text to speech audio to s3 and base64 encode it on the fly.
+    The whole audio is never held in memory in its raw form.
+
+    Args:
+        chunks (Iterable[bytes]): audio content, eg: `response.iter_content(TTS_CHUNK_SIZE)`
+        extension (str): audio file extension, eg: `.mp3`
+        inline_audio (bool, optional): return the base64 audio, default to `TTS_INLINE_AUDIO`.
+            If False, an empty string is returned instead.
+        background_upload (bool): when the audio is not inlined, upload it in the
+            background and return its url right away. The url does not resolve
+            until the upload is done, nor ever if the upload fails.
+        on_upload_error (Callable, optional): called with the exception when a
+            background upload fails
+
+    Returns:
+        Tuple[str, str]: the base64 audio and the audio resource url
+    """
+    # imported here so boto3 is only loaded by providers uploading audio
+    from edenai_apis.utils.upload_s3 import USER_PROCESS, upload_stream_to_s3
+
+    if inline_audio is None:
+        inline_audio = TTS_INLINE_AUDIO
+
+    if not inline_audio:
+        resource_url = upload_stream_to_s3(
+            chunks,
+            extension,
+            USER_PROCESS,
+            background=background_upload,
+            on_error=on_upload_error,
+        )
+        return "", resource_url
+
+    encoder = Base64StreamEncoder()
+    resource_url = upload_stream_to_s3(
+        _encode_while_streaming(chunks, encoder), extension, USER_PROCESS
+    )
+    return encoder.result(), resource_url
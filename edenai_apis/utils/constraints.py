@@ -1,4 +1,7 @@
-from typing import Dict, List, Optional
+import functools
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Optional, Sequence
 
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
@@ -6,6 +9,7 @@ from edenai_apis.utils.audio import get_file_extension, retreive_voice_id
 from edenai_apis.utils.exception import ProviderException
 from edenai_apis.utils.files import FileWrapper
 from edenai_apis.utils.languages import (
+    AUTO_DETECT,
     LanguageErrorMessage,
     provide_appropriate_language,
     load_standardized_language,
@@ -13,6 +17,101 @@ from edenai_apis.utils.languages import (
 from edenai_apis.utils.resolutions import provider_appropriate_resolution
 
 
+def _freeze(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: _freeze(val) for key, val in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(val) for val in value)
+    return value
+
+
+class CompiledConstraints(Mapping):
+    """Immutable constraints of a (provider, feature, subfeature, phase), parsed once.
+
+    Behaves like the read-only `constraints` dict of the provider info.json and
+    exposes the pre-parsed values used by validations:
+        - `languages`: supported languages (with `auto-detect` if null language is allowed)
+        - `allow_null_language`
+        - `file_types` and `file_type_globs` (eg: `image` for `image/*`)
+        - `models` and `model_set`: supported models (or voice ids genders)
+    """
+
+    __slots__ = (
+        "_constraints",
+        "languages",
+        "allow_null_language",
+        "file_types",
+        "file_type_globs",
+        "models",
+        "model_set",
+    )
+
+    def __init__(self, constraints: Optional[Mapping] = None) -> None:
+        frozen = _freeze(constraints or {})
+        allow_null_language = bool(frozen.get("allow_null_language"))
+        languages = tuple(frozen.get("languages") or ())
+        if allow_null_language:
+            languages += (AUTO_DETECT,)
+        file_types = tuple(frozen.get("file_types") or ())
+        setattr_ = super().__setattr__
+        setattr_("_constraints", frozen)
+        setattr_("allow_null_language", allow_null_language)
+        setattr_("languages", languages)
+        setattr_("file_types", frozenset(file_types))
+        setattr_(
+            "file_type_globs",
+            tuple(
+                file_type.split("/")[0]
+                for file_type in file_types
+                if file_type.endswith("*")
+            ),
+        )
+        models = tuple(frozen.get("models") or frozen.get("voice_ids") or ())
+        setattr_("models", models)
+        setattr_("model_set", frozenset(models))
+
+    @classmethod
+    def of(cls, constraints: Optional[Mapping]) -> "CompiledConstraints":
+        """Compile `constraints` unless it is already compiled"""
+        if isinstance(constraints, cls):
+            return constraints
+        return cls(constraints)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("CompiledConstraints is immutable")
+
+    def __getitem__(self, key: str) -> Any:
+        return self._constraints[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._constraints)
+
+    def __len__(self) -> int:
+        return len(self._constraints)
+
+    def __repr__(self) -> str:
+        return f"CompiledConstraints({dict(self._constraints)!r})"
+
+
+@functools.lru_cache(maxsize=None)
+def get_compiled_constraints(
+    provider: str, feature: str, subfeature: str, phase: Optional[str] = ""
+) -> Optional[CompiledConstraints]:
+    """Return the compiled constraints of a (provider, feature, subfeature, phase),
+    built once. `None` if the provider info has no constraints."""
+    provider_info = load_provider(
+        ProviderDataEnum.PROVIDER_INFO,
+        provider_name=provider,
+        feature=feature,
+        subfeature=subfeature,
+        phase=phase,
+    )
+    constraints = provider_info.get("constraints")
+    if constraints is None:
+        return None
+    return CompiledConstraints(constraints)
+
+
 def validate_input_file_extension(constraints: dict, args: dict) -> dict:
     """Check that a provider offers support for the input file extension for speech to text
 
@@ -79,11 +178,11 @@ def validate_input_file_type(constraints: dict, provider: str, args: dict) -> di
     Raises:
         - `ProviderException`: if file is not supported
     """
-    provider_file_type_constraints: List[str] = constraints.get("file_types", [])
+    constraints = CompiledConstraints.of(constraints)
 
     input_file: FileWrapper = args.get("file")
 
-    if input_file and len(provider_file_type_constraints) > 0:
+    if input_file and constraints.file_types:
         input_file_type = input_file.file_info.file_media_type
 
         if input_file_type is None:
@@ -93,16 +192,10 @@ def validate_input_file_type(constraints: dict, provider: str, args: dict) -> di
 
         # constraint can be written as "image/*" for example
         # it means it accepts all types of images
-        type_glob = [
-            constraint.split("/")[0]
-            for constraint in provider_file_type_constraints
-            if constraint.endswith("*")
-        ]
-
-        if input_file_type not in provider_file_type_constraints and not any(
-            [global_type in input_file_type for global_type in type_glob]
+        if input_file_type not in constraints.file_types and not any(
+            global_type in input_file_type for global_type in constraints.file_type_globs
         ):
-            supported_types = ",\n".join(provider_file_type_constraints)
+            supported_types = ",\n".join(constraints["file_types"])
             raise ProviderException(
                 f"Provider {provider} doesn't support file type: {input_file_type} "
                 f"for this feature.\n"
@@ -117,6 +210,7 @@ def validate_single_language(
     subfeature,
     language: dict,
     null_language_accepted: bool,
+    supported_languages: Optional[Sequence[str]] = None,
 ) -> Optional[str]:
     """
     Validate and format given language
@@ -127,6 +221,7 @@ def validate_single_language(
         - subfeature (str): subfeature name
         - language (dict): Dictionnary with `key` and `value` of input language. `value` canbe None. (ex: { 'key': 'source_langue', 'value': 'en'})
         - null_language_accepted (bool): if Provider can auto-detect langauages (accepts providing None as language)
+        - supported_languages (list, optional): provider languages, loaded from the provider info if not given
 
     Returns:
         - language (str | None) validated language, can be None if provider accepts it
@@ -153,6 +248,7 @@ def validate_single_language(
             provider_name=provider_name,
             feature=feature,
             subfeature=subfeature,
+            list_languages=supported_languages,
         )
     except SyntaxError as exc:
         raise ProviderException(
@@ -208,7 +304,7 @@ def validate_all_input_languages(
     ):
         return args
 
-    accepts_null_language = constraints.get("allow_null_language", False)
+    constraints = CompiledConstraints.of(constraints)
 
     for argument_name, argument_value in args.items():
         if "language" not in argument_name:
@@ -219,7 +315,8 @@ def validate_all_input_languages(
             feature=feature,
             subfeature=subfeature,
             language={"key": argument_name, "value": argument_value},
-            null_language_accepted=accepts_null_language,
+            null_language_accepted=constraints.allow_null_language,
+            supported_languages=constraints.languages,
         )
     return args
 
@@ -242,7 +339,8 @@ def validate_audio_format(constraints: dict, args: dict) -> dict:
 def validate_models(
     provider: str, subfeature: str, constraints: dict, args: dict
 ) -> Dict:
-    models = constraints.get("models") or constraints.get("voice_ids")
+    constraints = CompiledConstraints.of(constraints)
+    models = constraints.models
     if not models:
         if "settings" in args:
             del args["settings"]
@@ -252,14 +350,14 @@ def validate_models(
     settings = args.get("settings", {})
 
     # if it's a voice id for text_to_speech
-    if any(option in models for option in ["MALE", "FEMALE"]):
+    if any(option in constraints.model_set for option in ["MALE", "FEMALE"]):
         voice_id = retreive_voice_id(
             provider, subfeature, args["language"], args["option"], settings
         )
         args["voice_id"] = voice_id
     else:  # otherwise
         if settings and provider in settings:
-            if constraints and settings[provider] in models:
+            if constraints and settings[provider] in constraints.model_set:
                 selected_model = settings[provider]
             else:
                 all_availaible_models = ", ".join(models)
@@ -364,15 +462,8 @@ def validate_all_provider_constraints(
         - args: updated/validated args
     """
 
-    # load provider constraints
-    provider_info = load_provider(
-        ProviderDataEnum.PROVIDER_INFO,
-        provider_name=provider,
-        feature=feature,
-        subfeature=subfeature,
-        phase=phase,
-    )
-    provider_constraints = provider_info.get("constraints")
+    # load provider constraints, compiled once
+    provider_constraints = get_compiled_constraints(provider, feature, subfeature, phase)
 
     if provider_constraints is not None:
         validated_args = args.copy()
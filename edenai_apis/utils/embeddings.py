@@ -0,0 +1,154 @@
+"""
+Batching of embeddings requests.
+
+Providers limit the number of texts (and sometimes tokens) sent in one embeddings
+request. These limits are declared in the provider info.json constraints:
+
+    "embeddings": {
+        "constraints": {
+            "max_batch_size": 96,       # max number of texts per request
+            "max_batch_tokens": 16384   # max estimated tokens per request (optional)
+        }
+    }
+
+Decorating a provider `text__embeddings` method with `batched_embeddings` splits
+large inputs to these limits, sends the chunks concurrently and reassembles the
+embeddings in the input order.
+"""
+import functools
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+from edenai_apis.features.text.embeddings.embeddings_dataclass import (
+    EmbeddingDataClass,
+    EmbeddingsDataClass,
+)
+from edenai_apis.loaders.data_loader import ProviderDataEnum
+from edenai_apis.loaders.loaders import load_provider
+from edenai_apis.utils.tokens import estimate_tokens
+from edenai_apis.utils.types import ResponseType
+
+EMBEDDINGS_MAX_WORKERS = int(os.environ.get("EMBEDDINGS_MAX_WORKERS", 8))
+_EMBEDDINGS_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_EMBEDDINGS_EXECUTOR_LOCK = threading.Lock()
+
+
+def _get_embeddings_executor() -> ThreadPoolExecutor:
+    global _EMBEDDINGS_EXECUTOR
+    if _EMBEDDINGS_EXECUTOR is None:
+        with _EMBEDDINGS_EXECUTOR_LOCK:
+            if _EMBEDDINGS_EXECUTOR is None:
+                _EMBEDDINGS_EXECUTOR = ThreadPoolExecutor(
+                    max_workers=EMBEDDINGS_MAX_WORKERS,
+                    thread_name_prefix="edenai_apis_embeddings",
+                )
+    return _EMBEDDINGS_EXECUTOR
+
+
+def split_in_batches(
+    texts: Sequence[str],
+    max_batch_size: Optional[int] = None,
+    max_batch_tokens: Optional[int] = None,
+) -> List[List[str]]:
+    """Split texts in consecutive batches respecting the given limits.
+    A text exceeding `max_batch_tokens` on its own is sent alone."""
+    batches: List[List[str]] = []
+    batch: List[str] = []
+    batch_tokens = 0
+    for text in texts:
+        text_tokens = estimate_tokens(text) if max_batch_tokens else 0
+        if batch and (
+            (max_batch_size and len(batch) >= max_batch_size)
+            or (max_batch_tokens and batch_tokens + text_tokens > max_batch_tokens)
+        ):
+            batches.append(batch)
+            batch, batch_tokens = [], 0
+        batch.append(text)
+        batch_tokens += text_tokens
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def _merge_original_responses(responses: List[Any]) -> Dict[str, Any]:
+    merged: Dict[str, Any] = {"batches": responses}
+    total_tokens = [
+        response["usage"].get("total_tokens")
+        for response in responses
+        if isinstance(response, dict) and isinstance(response.get("usage"), dict)
+    ]
+    if total_tokens and all(tokens is not None for tokens in total_tokens):
+        merged["usage"] = {"total_tokens": sum(total_tokens)}
+    return merged
+
+
+def batched_embeddings(func: Callable) -> Callable:
+    """Decorator for providers `text__embeddings(self, texts, model)` methods,
+    see module docstring"""
+
+    @functools.wraps(func)
+    def wrapper(self, texts: List[str], model: Optional[str] = None, **kwargs):
+        constraints = (
+            load_provider(
+                ProviderDataEnum.PROVIDER_INFO,
+                provider_name=self.provider_name,
+                feature="text",
+                subfeature="embeddings",
+            ).get("constraints")
+            or {}
+        )
+        batches = split_in_batches(
+            texts,
+            constraints.get("max_batch_size"),
+            constraints.get("max_batch_tokens"),
+        )
+        if len(batches) <= 1:
+            return func(self, texts, model, **kwargs)
+
+        # results are gathered in submission order, so embeddings keep the input order
+        futures = [
+            _get_embeddings_executor().submit(func, self, batch, model, **kwargs)
+            for batch in batches
+        ]
+        responses: List[ResponseType[EmbeddingsDataClass]] = [
+            future.result() for future in futures
+        ]
+        items: List[EmbeddingDataClass] = []
+        for response in responses:
+            items.extend(response.standardized_response.items)
+        return ResponseType[EmbeddingsDataClass](
+            original_response=_merge_original_responses(
+                [response.original_response for response in responses]
+            ),
+            standardized_response=EmbeddingsDataClass.model_construct(items=items),
+        )
+
+    return wrapper
+
+
+def embeddings_to_array(
+    embeddings: Union[EmbeddingsDataClass, Dict[str, Any], Sequence[Any]]
+) -> np.ndarray:
+    """Convert embeddings to a contiguous float32 (n_texts, dimension) array
+
+    Args:
+        embeddings: an `EmbeddingsDataClass`, its dumped dict, a `compute_output`
+            result or a list of items/vectors
+    """
+    if isinstance(embeddings, dict):
+        embeddings = embeddings.get("standardized_response", embeddings)["items"]
+    elif isinstance(embeddings, EmbeddingsDataClass):
+        embeddings = embeddings.items
+    vectors = [
+        item["embedding"]
+        if isinstance(item, dict)
+        else getattr(item, "embedding", item)
+        for item in embeddings
+    ]
+    if not vectors:
+        return np.empty((0, 0), dtype=np.float32)
+    return np.ascontiguousarray(vectors, dtype=np.float32)
@@ -0,0 +1,404 @@
+"""
+Content-addressed cache of embeddings.
+
+Embedding the same content twice with the same provider and model returns the same
+vector, so embeddings are cached on a hash of (provider, feature, model, options,
+content). Decorating a provider `text__embeddings` method with `cached_embeddings`
+(or `image__embeddings` with `cached_image_embeddings`) only sends the cache misses
+to the provider.
+
+The cache is disabled by default and can be configured with environment variables:
+    - `EMBEDDINGS_CACHE`: `memory` (in-process LRU) or `sqlite` (on-disk)
+    - `EMBEDDINGS_CACHE_SIZE`: max number of embeddings kept (least recently used
+      embeddings are evicted first)
+    - `EMBEDDINGS_CACHE_PATH`: path of the sqlite database
+
+or with `set_embeddings_cache`:
+
+    >>> from edenai_apis.utils.embeddings_cache import MemoryEmbeddingsCache, set_embeddings_cache
+    >>> set_embeddings_cache(MemoryEmbeddingsCache(max_entries=50_000))
+
+When some embeddings of a request come from the cache, the original_response is
+`{"cached_items": int, "response": <provider response for the misses>, "usage": ...}`.
+"""
+import functools
+import hashlib
+import inspect
+import json
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from edenai_apis.features.text.embeddings.embeddings_dataclass import (
+    EmbeddingDataClass,
+    EmbeddingsDataClass,
+)
+from edenai_apis.utils.types import ResponseType
+
+DEFAULT_CACHE_SIZE = int(os.environ.get("EMBEDDINGS_CACHE_SIZE", 10_000))
+DEFAULT_CACHE_PATH = os.environ.get(
+    "EMBEDDINGS_CACHE_PATH",
+    os.path.join(os.path.expanduser("~"), ".cache", "edenai_apis", "embeddings.db"),
+)
+
+
+def embedding_key(
+    provider_name: str,
+    feature: str,
+    model: Optional[str],
+    content: bytes,
+    options: Optional[Dict[str, Any]] = None,
+) -> str:
+    """Return the cache key of the embedding of `content`"""
+    content_hash = hashlib.sha256(content).hexdigest()
+    serialized = json.dumps(
+        [provider_name, feature, model, options or {}, content_hash],
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+class EmbeddingsCache(ABC):
+    """Base class of embeddings caches, keeps hits/misses stats
+
+    Args:
+        max_entries (int): max number of embeddings kept
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_CACHE_SIZE) -> None:
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._stats_lock = threading.Lock()
+
+    @abstractmethod
+    def _get_many(self, keys: Sequence[str]) -> Dict[str, np.ndarray]:
+        """Return the cached embeddings of the given keys"""
+
+    @abstractmethod
+    def _set_many(self, embeddings: Dict[str, np.ndarray]) -> int:
+        """Store embeddings and return the number of evicted embeddings"""
+
+    @abstractmethod
+    def _clear(self) -> None:
+        """Drop all embeddings"""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        ...
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, List[float]]:
+        """Return the cached embeddings of the given keys, missing keys are omitted"""
+        found = self._get_many(list(dict.fromkeys(keys))) if keys else {}
+        hits = sum(1 for key in keys if key in found)
+        with self._stats_lock:
+            self.hits += hits
+            self.misses += len(keys) - hits
+        return {key: vector.tolist() for key, vector in found.items()}
+
+    def set_many(self, embeddings: Dict[str, Iterable[float]]) -> None:
+        if not embeddings or self.max_entries <= 0:
+            return
+        evicted = self._set_many(
+            {key: np.asarray(vector, dtype=np.float64) for key, vector in embeddings.items()}
+        )
+        with self._stats_lock:
+            self.evictions += evicted
+
+    def clear(self) -> None:
+        """Drop all embeddings and reset stats"""
+        self._clear()
+        with self._stats_lock:
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self) -> Dict[str, float]:
+        """Return cache hits/misses stats"""
+        with self._stats_lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self),
+                "max_size": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
+
+
+class MemoryEmbeddingsCache(EmbeddingsCache):
+    """In-process LRU embeddings cache"""
+
+    def __init__(self, max_entries: int = DEFAULT_CACHE_SIZE) -> None:
+        super().__init__(max_entries)
+        self._embeddings: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get_many(self, keys: Sequence[str]) -> Dict[str, np.ndarray]:
+        found = {}
+        with self._lock:
+            for key in keys:
+                vector = self._embeddings.get(key)
+                if vector is not None:
+                    self._embeddings.move_to_end(key)
+                    found[key] = vector
+        return found
+
+    def _set_many(self, embeddings: Dict[str, np.ndarray]) -> int:
+        evicted = 0
+        with self._lock:
+            for key, vector in embeddings.items():
+                self._embeddings[key] = vector
+                self._embeddings.move_to_end(key)
+            while len(self._embeddings) > self.max_entries:
+                self._embeddings.popitem(last=False)
+                evicted += 1
+        return evicted
+
+    def _clear(self) -> None:
+        with self._lock:
+            self._embeddings.clear()
+
+    def __len__(self) -> int:
+        return len(self._embeddings)
+
+
+class SQLiteEmbeddingsCache(EmbeddingsCache):
+    """On-disk embeddings cache, shared by all processes using the same database.
+    Least recently used embeddings are evicted first.
+
+    Args:
+        path (str): path of the sqlite database, created if needed
+        max_entries (int): max number of embeddings kept
+    """
+
+    # max number of sqlite host parameters in a query
+    _CHUNK_SIZE = 500
+
+    def __init__(
+        self, path: str = DEFAULT_CACHE_PATH, max_entries: int = DEFAULT_CACHE_SIZE
+    ) -> None:
+        super().__init__(max_entries)
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                "key TEXT PRIMARY KEY, embedding BLOB NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS embeddings_accessed_at "
+                "ON embeddings (accessed_at)"
+            )
+
+    def _get_many(self, keys: Sequence[str]) -> Dict[str, np.ndarray]:
+        found = {}
+        now = time.time()
+        with self._lock, self._connection:
+            for start in range(0, len(keys), self._CHUNK_SIZE):
+                chunk = keys[start : start + self._CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._connection.execute(
+                    f"SELECT key, embedding FROM embeddings WHERE key IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+                for key, blob in rows:
+                    found[key] = np.frombuffer(blob, dtype=np.float64)
+                self._connection.execute(
+                    f"UPDATE embeddings SET accessed_at = ? WHERE key IN ({placeholders})",
+                    [now, *chunk],
+                )
+        return found
+
+    def _set_many(self, embeddings: Dict[str, np.ndarray]) -> int:
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, embedding, accessed_at) "
+                "VALUES (?, ?, ?)",
+                [(key, vector.tobytes(), now) for key, vector in embeddings.items()],
+            )
+            (size,) = self._connection.execute(
+                "SELECT COUNT(*) FROM embeddings"
+            ).fetchone()
+            evicted = max(size - self.max_entries, 0)
+            if evicted:
+                self._connection.execute(
+                    "DELETE FROM embeddings WHERE key IN ("
+                    "SELECT key FROM embeddings ORDER BY accessed_at LIMIT ?)",
+                    (evicted,),
+                )
+        return evicted
+
+    def _clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM embeddings")
+
+    def __len__(self) -> int:
+        with self._lock:
+            (size,) = self._connection.execute(
+                "SELECT COUNT(*) FROM embeddings"
+            ).fetchone()
+        return size
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+def _cache_from_env() -> Optional[EmbeddingsCache]:
+    backend = os.environ.get("EMBEDDINGS_CACHE", "").lower()
+    if backend == "memory":
+        return MemoryEmbeddingsCache()
+    if backend == "sqlite":
+        return SQLiteEmbeddingsCache()
+    return None
+
+
+_EMBEDDINGS_CACHE: Optional[EmbeddingsCache] = None
+_EMBEDDINGS_CACHE_LOADED = False
+_EMBEDDINGS_CACHE_LOCK = threading.Lock()
+
+
+def get_embeddings_cache() -> Optional[EmbeddingsCache]:
+    """Return the global embeddings cache, `None` when caching is disabled"""
+    global _EMBEDDINGS_CACHE, _EMBEDDINGS_CACHE_LOADED
+    if not _EMBEDDINGS_CACHE_LOADED:
+        with _EMBEDDINGS_CACHE_LOCK:
+            if not _EMBEDDINGS_CACHE_LOADED:
+                _EMBEDDINGS_CACHE = _cache_from_env()
+                _EMBEDDINGS_CACHE_LOADED = True
+    return _EMBEDDINGS_CACHE
+
+
+def set_embeddings_cache(cache: Optional[EmbeddingsCache]) -> None:
+    """Set the global embeddings cache, `None` disables caching"""
+    global _EMBEDDINGS_CACHE, _EMBEDDINGS_CACHE_LOADED
+    with _EMBEDDINGS_CACHE_LOCK:
+        _EMBEDDINGS_CACHE = cache
+        _EMBEDDINGS_CACHE_LOADED = True
+
+
+def embeddings_cache_stats() -> Dict[str, float]:
+    """Return the global embeddings cache stats (empty when caching is disabled)"""
+    cache = get_embeddings_cache()
+    return cache.stats() if cache is not None else {}
+
+
+def _response_tokens(original_response: Any) -> int:
+    if isinstance(original_response, dict) and isinstance(
+        original_response.get("usage"), dict
+    ):
+        return original_response["usage"].get("total_tokens") or 0
+    return 0
+
+
+def _cached_response(
+    vectors: List[List[float]], cached_items: int, original_response: Any
+) -> ResponseType[EmbeddingsDataClass]:
+    return ResponseType[EmbeddingsDataClass](
+        original_response={
+            "cached_items": cached_items,
+            "response": original_response,
+            "usage": {"total_tokens": _response_tokens(original_response)},
+        },
+        standardized_response=EmbeddingsDataClass.model_construct(
+            items=[
+                EmbeddingDataClass.model_construct(embedding=vector)
+                for vector in vectors
+            ]
+        ),
+    )
+
+
+def cached_embeddings(func: Callable) -> Callable:
+    """Decorator for providers `text__embeddings(self, texts, model)` methods,
+    see module docstring"""
+
+    @functools.wraps(func)
+    def wrapper(self, texts: List[str], model: Optional[str] = None, **kwargs):
+        cache = get_embeddings_cache()
+        if cache is None or not texts:
+            return func(self, texts, model, **kwargs)
+
+        keys = [
+            embedding_key(
+                self.provider_name, "text", model, text.encode("utf-8"), kwargs
+            )
+            for text in texts
+        ]
+        cached = cache.get_many(keys)
+        if not cached:
+            response = func(self, texts, model, **kwargs)
+            cache.set_many(
+                {
+                    key: item.embedding
+                    for key, item in zip(keys, response.standardized_response.items)
+                }
+            )
+            return response
+
+        cached_items = sum(1 for key in keys if key in cached)
+        # only send each missing text once
+        missing = {key: text for key, text in zip(keys, texts) if key not in cached}
+        original_response = None
+        if missing:
+            response = func(self, list(missing.values()), model, **kwargs)
+            computed = {
+                key: list(item.embedding)
+                for key, item in zip(missing, response.standardized_response.items)
+            }
+            cache.set_many(computed)
+            cached.update(computed)
+            original_response = response.original_response
+        return _cached_response(
+            [cached[key] for key in keys], cached_items, original_response
+        )
+
+    return wrapper
+
+
+def cached_image_embeddings(func: Callable) -> Callable:
+    """Decorator for providers `image__embeddings(self, file, model, ...)` methods,
+    the file content is used as cache key, see module docstring"""
+
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(self, file: str, *args, **kwargs):
+        cache = get_embeddings_cache()
+        if cache is None or not file or not os.path.isfile(file):
+            return func(self, file, *args, **kwargs)
+
+        options = signature.bind(self, file, *args, **kwargs).arguments
+        for name in ("self", "file", "file_url"):
+            options.pop(name, None)
+        with open(file, "rb") as file_:
+            content = file_.read()
+        key = embedding_key(
+            self.provider_name, "image", options.pop("model", None), content, options
+        )
+        cached = cache.get_many([key])
+        if cached:
+            return _cached_response([cached[key]], 1, None)
+
+        response = func(self, file, *args, **kwargs)
+        cache.set_many(
+            {key: item.embedding for item in response.standardized_response.items[:1]}
+        )
+        return response
+
+    return wrapper
@@ -1,7 +1,8 @@
 import importlib
 import re
 from enum import Enum
-from typing import Dict, List, Optional, Type
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Type
 
 
 class AsyncJobExceptionReason(Enum):
@@ -134,6 +135,43 @@ class ProviderInvalidPromptError(ProviderInvalidInputError):
     """When an invalid Prompt is passed to generative features"""
 
 
+class ErrorClassifier:
+    """Compiled `ERRORS` table of a provider.
+
+    The patterns of each exception type are joined in one regex, the types are then
+    searched in the order of the table so that the first matching type still wins.
+    """
+
+    __slots__ = ("_regexes",)
+
+    def __init__(self, errors: ProviderErrorLists) -> None:
+        self._regexes: List[Tuple[re.Pattern, Type[ProviderException]]] = [
+            (re.compile("|".join(f"(?:{pattern})" for pattern in patterns)), error_type)
+            for error_type, patterns in errors.items()
+            if patterns
+        ]
+
+    def classify(self, message: str) -> Optional[Type[ProviderException]]:
+        """Return the exception type of the first matching patterns list, if any"""
+        for regex, exception_type in self._regexes:
+            if regex.search(message):
+                return exception_type
+        return None
+
+
+@lru_cache(maxsize=None)
+def get_error_classifier(provider: str) -> Optional[ErrorClassifier]:
+    """Compile the errors of a provider once, None if it doesn't define errors"""
+    for module_name in (f"edenai_apis.apis.{provider}.errors", f"apis.{provider}.errors"):
+        try:
+            provider_mod = importlib.import_module(module_name)
+        except ModuleNotFoundError:
+            continue
+        return ErrorClassifier(getattr(provider_mod, "ERRORS"))
+    # we didn't implement errors yet for this provider
+    return None
+
+
 def get_appropriate_error(
     provider: str, exception: ProviderException
 ) -> ProviderException:
@@ -141,17 +179,11 @@ def get_appropriate_error(
     Given a ProviderException, check in the provider's errors list for corresponding error message
     return appropriate error if present else return original exception
     """
-    try:
-        provider_mod = importlib.import_module(f"apis.{provider}.errors")
-    except ModuleNotFoundError:
-        # we didn't implement errors yet for this provider
+    classifier = get_error_classifier(provider)
+    if classifier is None:
         return exception
-    error_dict = getattr(provider_mod, "ERRORS")
     error_msg = str(exception)
-    error_code = exception.status_code
-
-    for exception_type, error_list in error_dict.items():
-        if any([re.search(error_pattern, error_msg) for error_pattern in error_list]):
-            return exception_type(error_msg, error_code)
-
-    return exception
+    exception_type = classifier.classify(error_msg)
+    if exception_type is None:
+        return exception
+    return exception_type(error_msg, exception.status_code)
@@ -1,4 +1,44 @@
+"""
+Shared HTTP client for providers calling their APIs with `requests`.
+
+Calling `requests.post`/`requests.get` directly opens a new connection
+(TCP + TLS handshake) for every call. `http_client` keeps one pooled
+`requests.Session` per host, so connections are kept alive and reused across calls.
+
+    >>> from edenai_apis.utils.http import http_client
+    >>> response = http_client.post(url, json=payload, headers=headers)
+
+Pools, timeouts and retries can be configured with environment variables:
+    - `HTTP_POOL_CONNECTIONS`: number of hosts pools kept by each session adapter
+    - `HTTP_POOL_MAXSIZE`: max number of connections kept alive per host
+    - `HTTP_CONNECT_TIMEOUT`: connection timeout in seconds
+    - `HTTP_READ_TIMEOUT`: read timeout in seconds (unset means no read timeout)
+    - `HTTP_MAX_RETRIES`: retries on connection errors only (the request was not
+      sent), for any method
+
+`async_http_client` is its asyncio counterpart (aiohttp), used by the providers
+coroutines (see `interface.async_compute_output`): a call awaiting a provider does
+not hold a thread, so thousands of calls can be in flight at once. It keeps one
+session per event loop, to be closed with `await async_http_client.close()` before
+the loop is. Its responses have the `requests.Response` attributes used by the
+providers (`status_code`, `text`, `content`, `headers`, `json()`, `ok`).
+    - `ASYNC_HTTP_MAX_CONNECTIONS`: max number of connections (default 1000)
+    - `ASYNC_HTTP_MAX_CONNECTIONS_PER_HOST`: max number of connections per host
+      (default 0, no limit other than `ASYNC_HTTP_MAX_CONNECTIONS`)
+"""
+import asyncio
+import json
+import os
+import threading
+import weakref
 from enum import Enum
+from http.cookiejar import DefaultCookiePolicy
+from typing import Any, Dict, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter, Retry
+from requests.structures import CaseInsensitiveDict
 
 
 class HTTPMethod(Enum):
@@ -7,3 +47,279 @@ class HTTPMethod(Enum):
     PUT = "PUT"
     PATCH = "PATCH"
     DELETE = "DELETE"
+
+
+def _float_from_env(name: str, default: Optional[float]) -> Optional[float]:
+    value = os.environ.get(name)
+    return float(value) if value else default
+
+
+Timeout = Union[None, float, Tuple[Optional[float], Optional[float]]]
+
+DEFAULT_POOL_CONNECTIONS = int(os.environ.get("HTTP_POOL_CONNECTIONS", 10))
+DEFAULT_POOL_MAXSIZE = int(os.environ.get("HTTP_POOL_MAXSIZE", 32))
+DEFAULT_MAX_RETRIES = int(os.environ.get("HTTP_MAX_RETRIES", 2))
+DEFAULT_TIMEOUT: Timeout = (
+    _float_from_env("HTTP_CONNECT_TIMEOUT", 10),
+    _float_from_env("HTTP_READ_TIMEOUT", None),
+)
+ASYNC_HTTP_MAX_CONNECTIONS = int(os.environ.get("ASYNC_HTTP_MAX_CONNECTIONS", 1000))
+ASYNC_HTTP_MAX_CONNECTIONS_PER_HOST = int(
+    os.environ.get("ASYNC_HTTP_MAX_CONNECTIONS_PER_HOST", 0)
+)
+# backoff of the retries on connection errors, as urllib3 `Retry(backoff_factor)`
+RETRY_BACKOFF_FACTOR = 0.2
+
+
+class HTTPClient:
+    """Keeps a pooled `requests.Session` per host and exposes the `requests` api
+    (`request`, `get`, `post`, `put`, `patch`, `delete`)
+
+    Sessions are shared between all users of a provider, so they never store cookies.
+
+    Args:
+        pool_connections (int): number of hosts pools kept by the session adapter
+        pool_maxsize (int): max number of connections kept alive per host
+        max_retries (int): retries on connection errors only (the request was not
+            sent), for any method
+        timeout: default timeout used when none is given to a request
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        timeout: Timeout = DEFAULT_TIMEOUT,
+    ) -> None:
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self._sessions: Dict[str, requests.Session] = {}
+        self._lock = threading.Lock()
+
+    def _build_session(self) -> requests.Session:
+        session = requests.Session()
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        retries = Retry(
+            total=self.max_retries,
+            connect=self.max_retries,
+            read=0,
+            status=0,
+            backoff_factor=RETRY_BACKOFF_FACTOR,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=retries,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def session(self, url: str) -> requests.Session:
+        """Get the session used for the host of the given url"""
+        parsed_url = urlsplit(url)
+        host = f"{parsed_url.scheme}://{parsed_url.netloc}"
+        session = self._sessions.get(host)
+        if session is None:
+            with self._lock:
+                session = self._sessions.get(host)
+                if session is None:
+                    session = self._build_session()
+                    self._sessions[host] = session
+        return session
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        kwargs.setdefault("timeout", self.timeout)
+        return self.session(url).request(method, url, **kwargs)
+
+    def get(self, url: str, params=None, **kwargs) -> requests.Response:
+        return self.request(HTTPMethod.GET.value, url, params=params, **kwargs)
+
+    def post(self, url: str, data=None, json=None, **kwargs) -> requests.Response:
+        return self.request(HTTPMethod.POST.value, url, data=data, json=json, **kwargs)
+
+    def put(self, url: str, data=None, **kwargs) -> requests.Response:
+        return self.request(HTTPMethod.PUT.value, url, data=data, **kwargs)
+
+    def patch(self, url: str, data=None, **kwargs) -> requests.Response:
+        return self.request(HTTPMethod.PATCH.value, url, data=data, **kwargs)
+
+    def delete(self, url: str, **kwargs) -> requests.Response:
+        return self.request(HTTPMethod.DELETE.value, url, **kwargs)
+
+    def close(self) -> None:
+        """Close all sessions and their pooled connections"""
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+
+http_client = HTTPClient()
+
+
+class AsyncHTTPResponse:
+    """Response of `AsyncHTTPClient`, read at once, with the `requests.Response`
+    attributes used by the providers"""
+
+    __slots__ = ("status_code", "headers", "content", "url", "encoding")
+
+    def __init__(
+        self,
+        status_code: int,
+        headers: Dict[str, str],
+        content: bytes,
+        url: str = "",
+        encoding: Optional[str] = None,
+    ) -> None:
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers)
+        self.content = content
+        self.url = url
+        self.encoding = encoding or "utf-8"
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding, errors="replace")
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    def json(self, **kwargs) -> Any:
+        try:
+            return json.loads(self.text, **kwargs)
+        except json.JSONDecodeError as exc:
+            # what `requests.Response.json` raises, providers catch either
+            raise requests.JSONDecodeError(exc.msg, exc.doc, exc.pos) from exc
+
+    def raise_for_status(self) -> None:
+        if not self.ok:
+            raise requests.HTTPError(f"{self.status_code} Error for url: {self.url}")
+
+    def __repr__(self) -> str:
+        return f"<AsyncHTTPResponse [{self.status_code}]>"
+
+
+def _client_timeout(timeout: Timeout):
+    import aiohttp
+
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+    else:
+        connect = read = timeout
+    return aiohttp.ClientTimeout(total=None, sock_connect=connect, sock_read=read)
+
+
+class AsyncHTTPClient:
+    """asyncio counterpart of `HTTPClient` (aiohttp), exposes coroutines `request`,
+    `get`, `post`, `put`, `patch` and `delete` taking the `requests` arguments
+    (`json`, `data`, `params`, `headers`, `timeout`)
+
+    Args:
+        max_connections (int): max number of connections of a session
+        max_connections_per_host (int): max number of connections per host, 0 for
+            no limit
+        max_retries (int): retries on connection errors only (the request was not
+            sent), for any method
+        timeout: default timeout used when none is given to a request
+    """
+
+    def __init__(
+        self,
+        max_connections: int = ASYNC_HTTP_MAX_CONNECTIONS,
+        max_connections_per_host: int = ASYNC_HTTP_MAX_CONNECTIONS_PER_HOST,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        timeout: Timeout = DEFAULT_TIMEOUT,
+    ) -> None:
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.max_retries = max_retries
+        self.timeout = timeout
+        # aiohttp sessions are bound to the event loop they were created in
+        self._sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+
+    def session(self):
+        """Get the `aiohttp.ClientSession` of the running event loop"""
+        import aiohttp
+
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            session = self._sessions.get(loop)
+            if session is None or session.closed:
+                session = aiohttp.ClientSession(
+                    connector=aiohttp.TCPConnector(
+                        limit=self.max_connections,
+                        limit_per_host=self.max_connections_per_host,
+                    ),
+                    # sessions are shared between all users of a provider
+                    cookie_jar=aiohttp.DummyCookieJar(),
+                )
+                self._sessions[loop] = session
+        return session
+
+    async def request(self, method: str, url: str, **kwargs) -> AsyncHTTPResponse:
+        import aiohttp
+
+        timeout = _client_timeout(kwargs.pop("timeout", self.timeout))
+        session = self.session()
+        attempt = 0
+        while True:
+            try:
+                async with session.request(
+                    method, url, timeout=timeout, **kwargs
+                ) as response:
+                    content = await response.read()
+                    return AsyncHTTPResponse(
+                        response.status,
+                        dict(response.headers),
+                        content,
+                        str(response.url),
+                        response.charset,
+                    )
+            except aiohttp.ClientConnectorError as exc:
+                if attempt >= self.max_retries:
+                    raise requests.ConnectionError(str(exc)) from exc
+                await asyncio.sleep(RETRY_BACKOFF_FACTOR * 2**attempt)
+                attempt += 1
+            except (aiohttp.ServerTimeoutError, asyncio.TimeoutError) as exc:
+                raise requests.Timeout(str(exc)) from exc
+            except aiohttp.ClientError as exc:
+                raise requests.RequestException(str(exc)) from exc
+
+    async def get(self, url: str, params=None, **kwargs) -> AsyncHTTPResponse:
+        return await self.request(HTTPMethod.GET.value, url, params=params, **kwargs)
+
+    async def post(
+        self, url: str, data=None, json=None, **kwargs
+    ) -> AsyncHTTPResponse:
+        return await self.request(
+            HTTPMethod.POST.value, url, data=data, json=json, **kwargs
+        )
+
+    async def put(self, url: str, data=None, **kwargs) -> AsyncHTTPResponse:
+        return await self.request(HTTPMethod.PUT.value, url, data=data, **kwargs)
+
+    async def patch(self, url: str, data=None, **kwargs) -> AsyncHTTPResponse:
+        return await self.request(HTTPMethod.PATCH.value, url, data=data, **kwargs)
+
+    async def delete(self, url: str, **kwargs) -> AsyncHTTPResponse:
+        return await self.request(HTTPMethod.DELETE.value, url, **kwargs)
+
+    async def close(self) -> None:
+        """Close the session of the running event loop"""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            session = self._sessions.pop(loop, None)
+        if session is not None:
+            await session.close()
+
+
+async_http_client = AsyncHTTPClient()
@@ -0,0 +1,576 @@
+"""
+Completion tracking of providers async jobs.
+
+Providers can tell us when a job is finished instead of being polled: Amazon
+Textract/Rekognition publish the job status on the SNS topic given in
+`NotificationChannel`, other providers call a webhook. Those notifications are
+recorded in a job-state store, shared by:
+
+- `interface.get_async_job_result`, when `JOB_ADAPTIVE_POLLING` is enabled: it
+  returns the result from the store once a job has completed, and otherwise only
+  calls the provider when the job is due: right after a notification or following
+  an adaptive polling schedule (exponential backoff with jitter) when no
+  notification comes. Results and schedules are only used for the api keys which
+  polled the job, other callers always poll the provider.
+- waiters in `utils.async_to_sync`, woken up as soon as a notification arrives.
+
+Notifications are given to `handle_job_notification`, either from the web
+framework of the application, or from the small `JobNotificationReceiver` http
+server (one path per provider, e.g. `POST /amazon`) used to subscribe an SNS topic
+or a webhook locally and in tests.
+
+Anybody can post on the notification endpoint, so:
+- SNS messages are only accepted with a valid signature (`verify_sns_message`)
+- notifications are only recorded for the jobs registered by this process
+  (`register_job`: jobs launched through `interface.compute_output`, waited for
+  with `async_to_sync.fibonacci_waiting_call` or polled)
+- notifications only tell the status of a job, which is then polled: their content
+  is never used as the job result. Only `record_job_result`, for jobs computed in
+  this process, stores a result payload.
+
+Configuration:
+    JOB_NOTIFICATIONS: `true` when the notifications of the providers are received
+        (e.g. the SNS topic of the amazon settings is subscribed to the
+        application): providers then ask for them when launching jobs (default
+        `false`, jobs are launched without notification channel)
+    JOB_ADAPTIVE_POLLING: `true` to answer `get_async_job_result` from the store
+        (default `false`, the provider is polled on every call). Enable it only when
+        notifications are received, pending jobs are otherwise answered up to
+        `JOB_POLL_MAX_INTERVAL` seconds late
+    JOB_STATE_TTL: seconds a job state is kept (default 3600)
+    JOB_STATE_MAX_ENTRIES: max number of job states kept (default 10000)
+    JOB_POLL_MIN_INTERVAL: first delay between two polls of a pending job (default 1)
+    JOB_POLL_MAX_INTERVAL: max delay between two polls of a pending job (default 15)
+    JOB_POLL_JITTER: random ratio applied on the delays (default 0.2)
+"""
+import base64
+import copy
+import functools
+import json
+import os
+import random
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Union
+from urllib.parse import urlparse
+
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import padding
+
+from edenai_apis.utils.http import http_client
+
+JOB_NOTIFICATIONS = os.environ.get("JOB_NOTIFICATIONS", "false").lower() == "true"
+JOB_ADAPTIVE_POLLING = (
+    os.environ.get("JOB_ADAPTIVE_POLLING", "false").lower() == "true"
+)
+JOB_STATE_TTL = float(os.environ.get("JOB_STATE_TTL", 3600))
+JOB_STATE_MAX_ENTRIES = int(os.environ.get("JOB_STATE_MAX_ENTRIES", 10000))
+JOB_POLL_MIN_INTERVAL = float(os.environ.get("JOB_POLL_MIN_INTERVAL", 1))
+JOB_POLL_MAX_INTERVAL = float(os.environ.get("JOB_POLL_MAX_INTERVAL", 15))
+JOB_POLL_JITTER = float(os.environ.get("JOB_POLL_JITTER", 0.2))
+
+PENDING = "pending"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+_STATUSES = {
+    "succeeded": SUCCEEDED,
+    "success": SUCCEEDED,
+    "completed": SUCCEEDED,
+    "done": SUCCEEDED,
+    "finished": SUCCEEDED,
+    "failed": FAILED,
+    "failure": FAILED,
+    "error": FAILED,
+}
+
+JobKey = Tuple[str, str]
+Notification = Tuple[str, str, Any]
+
+
+def normalize_job_status(status: Optional[str]) -> str:
+    """Map a provider job status (`SUCCEEDED`, `completed`, `ERROR`...) to
+    `succeeded`, `failed` or `pending`"""
+    return _STATUSES.get(str(status or "").lower(), PENDING)
+
+
+def next_poll_delay(
+    polls: int,
+    min_interval: float = JOB_POLL_MIN_INTERVAL,
+    max_interval: float = JOB_POLL_MAX_INTERVAL,
+    jitter: float = JOB_POLL_JITTER,
+) -> float:
+    """Delay before the next poll of a job already polled `polls` times.
+
+    The delay doubles at each poll up to `max_interval`, and is randomized by
+    +/- `jitter` so that jobs launched together are not polled together.
+    """
+    delay = min(max_interval, min_interval * 2 ** max(polls - 1, 0))
+    return max(0.0, delay * random.uniform(1 - jitter, 1 + jitter))
+
+
+class JobState:
+    """State of a provider job
+
+    Attributes:
+        status (str): `pending`, `succeeded` or `failed`
+        payload (Any): result of a job computed in this process (`record_job_result`)
+        result (dict): result of `get_async_job_result` once the job completed
+        result_kind (str): `feature/subfeature/phase` of the cached result
+        owner (str): fingerprint of the api keys which last polled the job
+        polls (int): number of times the provider was polled for the job
+        next_poll_at (float): time.monotonic() before which the job is not polled
+    """
+
+    __slots__ = (
+        "status",
+        "payload",
+        "result",
+        "result_kind",
+        "owner",
+        "polls",
+        "next_poll_at",
+        "updated_at",
+    )
+
+    def __init__(self) -> None:
+        self.status = PENDING
+        self.payload: Any = None
+        self.result: Optional[Dict] = None
+        self.result_kind: Optional[str] = None
+        self.owner: Optional[str] = None
+        self.polls = 0
+        self.next_poll_at = 0.0
+        self.updated_at = time.monotonic()
+
+    def is_owned_by(self, owner: str) -> bool:
+        """Whether the result and schedule of the job were recorded for `owner`"""
+        return self.owner is not None and self.owner == owner
+
+    def is_due(self, now: Optional[float] = None) -> bool:
+        """Whether the provider should be polled for this job"""
+        return (time.monotonic() if now is None else now) >= self.next_poll_at
+
+
+class JobStateStore(ABC):
+    """Store of the providers jobs states
+
+    Implementations must be thread safe. `wait` lets a thread block until a
+    notification is recorded for a job.
+    """
+
+    @abstractmethod
+    def get(self, provider_name: str, job_id: str) -> Optional[JobState]:
+        """Return the state of a job, or None if the job is unknown"""
+
+    @abstractmethod
+    def notify(
+        self, provider_name: str, job_id: str, status: str, payload: Any = None
+    ) -> JobState:
+        """Record a notification for a job and wake up its waiters"""
+
+    @abstractmethod
+    def register(self, provider_name: str, job_id: str) -> JobState:
+        """Start tracking a job, notifications are only recorded for tracked jobs"""
+
+    @abstractmethod
+    def record_poll(
+        self,
+        provider_name: str,
+        job_id: str,
+        result: Dict,
+        result_kind: str = "",
+        owner: str = "",
+    ) -> JobState:
+        """Record the result of a poll of the provider for a job, made with the
+        api keys whose fingerprint is `owner`"""
+
+    @abstractmethod
+    def wait(self, provider_name: str, job_id: str, timeout: float) -> bool:
+        """Wait at most `timeout` seconds for a notification for a job.
+        Return True if a notification was received"""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Forget all jobs"""
+
+
+class MemoryJobStateStore(JobStateStore):
+    """In process job-state store, states expire after `ttl` seconds and at most
+    `max_entries` states are kept (least recently updated are dropped first)"""
+
+    def __init__(
+        self, ttl: float = JOB_STATE_TTL, max_entries: int = JOB_STATE_MAX_ENTRIES
+    ) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._states: "OrderedDict[JobKey, JobState]" = OrderedDict()
+        self._condition = threading.Condition()
+
+    def _get(self, key: JobKey, now: float) -> Optional[JobState]:
+        state = self._states.get(key)
+        if state is not None and now - state.updated_at > self.ttl:
+            del self._states[key]
+            return None
+        return state
+
+    def _touch(self, key: JobKey, now: float) -> JobState:
+        state = self._get(key, now)
+        if state is None:
+            state = self._states[key] = JobState()
+        state.updated_at = now
+        self._states.move_to_end(key)
+        while len(self._states) > self.max_entries:
+            self._states.popitem(last=False)
+        return state
+
+    def get(self, provider_name: str, job_id: str) -> Optional[JobState]:
+        with self._condition:
+            return self._get((provider_name, str(job_id)), time.monotonic())
+
+    def notify(
+        self, provider_name: str, job_id: str, status: str, payload: Any = None
+    ) -> JobState:
+        with self._condition:
+            state = self._touch((provider_name, str(job_id)), time.monotonic())
+            state.status = normalize_job_status(status)
+            if payload is not None:
+                state.payload = payload
+            # the provider has something new for us, the next call must poll it
+            state.next_poll_at = 0.0
+            self._condition.notify_all()
+            return state
+
+    def register(self, provider_name: str, job_id: str) -> JobState:
+        with self._condition:
+            return self._touch((provider_name, str(job_id)), time.monotonic())
+
+    def record_poll(
+        self,
+        provider_name: str,
+        job_id: str,
+        result: Dict,
+        result_kind: str = "",
+        owner: str = "",
+    ) -> JobState:
+        with self._condition:
+            now = time.monotonic()
+            state = self._touch((provider_name, str(job_id)), now)
+            if state.owner != owner:
+                # another tenant polled the job, do not keep the previous one's result
+                state.owner = owner
+                state.result = None
+                state.result_kind = None
+            state.polls += 1
+            status = normalize_job_status(result.get("status"))
+            if status == SUCCEEDED:
+                state.status = SUCCEEDED
+                state.result = copy.deepcopy(result)
+                state.result_kind = result_kind
+            else:
+                state.next_poll_at = now + next_poll_delay(state.polls)
+            return state
+
+    def wait(self, provider_name: str, job_id: str, timeout: float) -> bool:
+        key = (provider_name, str(job_id))
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            state = self._get(key, time.monotonic())
+            seen = state.updated_at if state is not None else None
+            while True:
+                state = self._states.get(key)
+                if state is not None and state.updated_at != seen and (
+                    state.status != PENDING or state.next_poll_at == 0.0
+                ):
+                    return True
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+
+    def clear(self) -> None:
+        with self._condition:
+            self._states.clear()
+
+
+_JOB_STORE: Optional[JobStateStore] = None
+_JOB_STORE_LOCK = threading.Lock()
+
+
+def get_job_store() -> JobStateStore:
+    """Return the job-state store of the process"""
+    global _JOB_STORE
+    if _JOB_STORE is None:
+        with _JOB_STORE_LOCK:
+            if _JOB_STORE is None:
+                _JOB_STORE = MemoryJobStateStore()
+    return _JOB_STORE
+
+
+def set_job_store(store: Optional[JobStateStore]) -> None:
+    """Replace the job-state store (e.g. by one shared between processes)"""
+    global _JOB_STORE
+    with _JOB_STORE_LOCK:
+        _JOB_STORE = store
+
+
+def register_job(provider_name: str, job_id: str) -> None:
+    """Track a job launched by this process, so that its notifications are recorded"""
+    if job_id:
+        get_job_store().register(provider_name, job_id)
+
+
+def _job_from_message(message: Mapping) -> Optional[Notification]:
+    """(job_id, status, payload) of a notification describing one job"""
+    for id_key in ("JobId", "job_id", "provider_job_id", "id"):
+        if message.get(id_key):
+            status = next(
+                (
+                    message[status_key]
+                    for status_key in ("Status", "status", "JobStatus", "state")
+                    if status_key in message
+                ),
+                None,
+            )
+            return str(message[id_key]), normalize_job_status(status), message
+    return None
+
+
+def _confirm_sns_subscription(subscribe_url: str) -> None:
+    # only follow urls from aws, anybody can post on the receiver
+    host = urlparse(subscribe_url).hostname or ""
+    if not host.endswith(".amazonaws.com"):
+        return
+    http_client.get(subscribe_url)
+
+
+SNS_CERTIFICATE_HOST = re.compile(r"^sns\.[a-z0-9-]+\.amazonaws\.com(\.cn)?$")
+_SNS_SIGNED_KEYS = {
+    "Notification": ("Message", "MessageId", "Subject", "Timestamp", "TopicArn", "Type"),
+    "SubscriptionConfirmation": (
+        "Message",
+        "MessageId",
+        "SubscribeURL",
+        "Timestamp",
+        "Token",
+        "TopicArn",
+        "Type",
+    ),
+}
+_SNS_SIGNED_KEYS["UnsubscribeConfirmation"] = _SNS_SIGNED_KEYS[
+    "SubscriptionConfirmation"
+]
+_SNS_SIGNATURE_HASHES = {"1": hashes.SHA1, "2": hashes.SHA256}
+
+
+@functools.lru_cache(maxsize=16)
+def _sns_certificate(url: str) -> x509.Certificate:
+    response = http_client.get(url)
+    response.raise_for_status()
+    return x509.load_pem_x509_certificate(response.content)
+
+
+def verify_sns_message(message: Mapping) -> bool:
+    """Check the signature of an SNS http message, with the certificate of the
+    `SigningCertURL` (which must be an SNS url).
+    See https://docs.aws.amazon.com/sns/latest/dg/sns-verify-signature-of-message.html
+    """
+    signed_keys = _SNS_SIGNED_KEYS.get(message.get("Type"))
+    hash_algorithm = _SNS_SIGNATURE_HASHES.get(str(message.get("SignatureVersion")))
+    certificate_url = urlparse(str(message.get("SigningCertURL") or ""))
+    if (
+        signed_keys is None
+        or hash_algorithm is None
+        or not message.get("Signature")
+        or certificate_url.scheme != "https"
+        or not SNS_CERTIFICATE_HOST.match(certificate_url.hostname or "")
+    ):
+        return False
+    string_to_sign = "".join(
+        f"{key}\n{message[key]}\n" for key in signed_keys if key in message
+    )
+    try:
+        _sns_certificate(certificate_url.geturl()).public_key().verify(
+            base64.b64decode(message["Signature"]),
+            string_to_sign.encode("utf-8"),
+            padding.PKCS1v15(),
+            hash_algorithm(),
+        )
+    except Exception:  # pylint: disable=broad-except
+        return False
+    return True
+
+
+def parse_job_notification(
+    body: Union[bytes, str, Mapping], headers: Optional[Mapping[str, str]] = None
+) -> List[Notification]:
+    """Extract the jobs (job_id, status, payload) of a notification body.
+
+    Supported formats:
+        - SNS http notifications, whose `Message` is the Textract/Rekognition
+          completion message (`{"JobId": ..., "Status": "SUCCEEDED", ...}`).
+          Subscription confirmations are confirmed. Messages without a valid
+          signature are ignored.
+        - webhooks describing one job (`{"job_id": ..., "status": ...}`)
+    """
+    if isinstance(body, (bytes, str)):
+        try:
+            body = json.loads(body or "{}")
+        except json.JSONDecodeError:
+            return []
+    if not isinstance(body, Mapping):
+        return []
+
+    message_type = (headers or {}).get("x-amz-sns-message-type") or body.get("Type")
+    if message_type in _SNS_SIGNED_KEYS and not verify_sns_message(body):
+        return []
+    if message_type == "SubscriptionConfirmation":
+        if body.get("SubscribeURL"):
+            _confirm_sns_subscription(body["SubscribeURL"])
+        return []
+    if message_type == "Notification":
+        try:
+            message = json.loads(body.get("Message") or "{}")
+        except json.JSONDecodeError:
+            return []
+        job = _job_from_message(message) if isinstance(message, Mapping) else None
+        return [job] if job else []
+
+    job = _job_from_message(body)
+    return [job] if job else []
+
+
+def handle_job_notification(
+    provider_name: str,
+    body: Union[bytes, str, Mapping],
+    headers: Optional[Mapping[str, str]] = None,
+    store: Optional[JobStateStore] = None,
+) -> int:
+    """Record the jobs of a provider notification in the job-state store. Only the
+    status of the jobs registered by this process is recorded.
+
+    Returns:
+        int: number of jobs updated
+    """
+    store = store or get_job_store()
+    updated = 0
+    for job_id, status, _ in parse_job_notification(body, headers):
+        if store.get(provider_name, job_id) is None:
+            continue
+        store.notify(provider_name, job_id, status)
+        _call_job_listeners(provider_name, job_id)
+        updated += 1
+    return updated
+
+
+def record_job_result(provider_name: str, job_id: str, payload: Any) -> None:
+    """Record the result of a job computed in this process (providers faking
+    async jobs), so that it is read without waiting for the webhook"""
+    get_job_store().notify(provider_name, job_id, SUCCEEDED, payload)
+    _call_job_listeners(provider_name, job_id)
+
+
+JobListener = Callable[[str, str], None]
+_JOB_LISTENERS: List[JobListener] = []
+
+
+def add_job_listener(listener: JobListener) -> None:
+    """Call `listener(provider_name, job_id)` for each job notification"""
+    if listener not in _JOB_LISTENERS:
+        _JOB_LISTENERS.append(listener)
+
+
+def remove_job_listener(listener: JobListener) -> None:
+    if listener in _JOB_LISTENERS:
+        _JOB_LISTENERS.remove(listener)
+
+
+def _call_job_listeners(provider_name: str, job_id: str) -> None:
+    for listener in list(_JOB_LISTENERS):
+        try:
+            listener(provider_name, str(job_id))
+        except Exception as exc:  # pylint: disable=broad-except
+            print(f"Job listener error for {provider_name} job {job_id}: {exc}")
+
+
+class _NotificationHandler(BaseHTTPRequestHandler):
+    server: "_NotificationServer"
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        provider_name = self.path.strip("/").split("/")[0].split("?")[0]
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length)
+        if not provider_name:
+            self.send_response(404)
+        else:
+            headers = {key.lower(): value for key, value in self.headers.items()}
+            handle_job_notification(provider_name, body, headers, self.server.store)
+            self.send_response(204)
+        self.end_headers()
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass
+
+
+class _NotificationServer(ThreadingHTTPServer):
+    daemon_threads = True
+    store: Optional[JobStateStore] = None
+
+
+class JobNotificationReceiver:
+    """Http server recording the jobs notifications posted on `/<provider_name>`
+
+    Args:
+        host (str): interface to listen on
+        port (int): port to listen on, 0 for a random free port
+        store (JobStateStore): store to record in, default to `get_job_store()`
+
+        >>> with JobNotificationReceiver() as receiver:
+        ...     webhook_url = receiver.url_for("openai")
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        store: Optional[JobStateStore] = None,
+    ) -> None:
+        self._server = _NotificationServer((host, port), _NotificationHandler)
+        self._server.store = store
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def url_for(self, provider_name: str) -> str:
+        return f"{self.url}/{provider_name}"
+
+    def start(self) -> "JobNotificationReceiver":
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._server.serve_forever,
+                name="edenai_apis_job_notifications",
+                daemon=True,
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self) -> "JobNotificationReceiver":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
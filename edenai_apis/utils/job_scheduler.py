@@ -0,0 +1,397 @@
+"""
+Scheduler waiting for the completion of many providers async jobs.
+
+Waiting for an async job used to pin a thread sleeping between two polls. The
+scheduler instead keeps all the pending jobs in a heap ordered by their next poll
+time. A single thread pops the jobs which are due and polls them by batches on a
+small shared worker pool. Each job is resolved through a `concurrent.futures.Future`.
+Ten thousand waiting jobs need a handful of threads, and asyncio callers do not
+need any (see `interface.async_wait_for_async_job_result`).
+
+Jobs are polled following the adaptive schedule of the job-state store (or
+`next_poll_delay` for jobs it does not know), and right away when a completion
+notification is received for them (see `utils.job_completion`). Polls can be rate
+limited per provider.
+
+Configuration:
+    JOB_SCHEDULER_WORKERS: number of threads polling the providers (default 4)
+    JOB_SCHEDULER_BATCH_SIZE: max number of jobs polled by one task (default 16)
+    JOB_POLL_RATE_LIMITS: max polls per second by provider, e.g. `amazon:5,openai:2`
+    JOB_POLL_DEFAULT_RATE: max polls per second of the other providers (default 0,
+        unlimited)
+"""
+import copy
+import heapq
+import itertools
+import os
+import threading
+import time
+from concurrent.futures import Future, InvalidStateError, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from edenai_apis.utils.exception import ProviderTimeoutError
+from edenai_apis.utils.job_completion import (
+    PENDING,
+    add_job_listener,
+    get_job_store,
+    next_poll_delay,
+    normalize_job_status,
+    register_job,
+)
+from edenai_apis.utils.rate_limit import TokenBucket, parse_rate_limits
+
+JOB_SCHEDULER_WORKERS = int(os.environ.get("JOB_SCHEDULER_WORKERS", 4))
+JOB_SCHEDULER_BATCH_SIZE = int(os.environ.get("JOB_SCHEDULER_BATCH_SIZE", 16))
+JOB_POLL_RATE_LIMITS = parse_rate_limits(os.environ.get("JOB_POLL_RATE_LIMITS"))
+JOB_POLL_DEFAULT_RATE = float(os.environ.get("JOB_POLL_DEFAULT_RATE", 0))
+
+JobKey = Tuple[str, str]
+
+
+def is_job_finished(result: Dict) -> bool:
+    """Default completion check, on the `status` of `get_async_job_result` results"""
+    return normalize_job_status(result.get("status")) != PENDING
+
+
+def _resolve(
+    future: Future, result: Any = None, exception: Optional[BaseException] = None
+) -> None:
+    # the future may have been cancelled by its caller in the meantime
+    try:
+        if exception is not None:
+            future.set_exception(exception)
+        else:
+            future.set_result(result)
+    except InvalidStateError:
+        pass
+
+
+class _PendingJob:
+    __slots__ = (
+        "provider_name",
+        "job_id",
+        "scope",
+        "poll",
+        "is_done",
+        "waiters",
+        "polls",
+        "poll_at",
+        "version",
+        "in_flight",
+        "notified",
+    )
+
+    def __init__(self, provider_name, job_id, scope, poll, is_done) -> None:
+        self.provider_name: str = provider_name
+        self.job_id: str = job_id
+        self.scope: Hashable = scope
+        self.poll: Callable[[], Dict] = poll
+        self.is_done: Callable[[Dict], bool] = is_done
+        # future and deadline of each caller waiting for the job
+        self.waiters: List[Tuple[Future, Optional[float]]] = []
+        self.polls = 0
+        self.poll_at = 0.0
+        # heap entries of an older version are stale and ignored
+        self.version = 0
+        self.in_flight = False
+        self.notified = False
+
+    def add_waiter(self, deadline: Optional[float]) -> Future:
+        future: Future = Future()
+        self.waiters.append((future, deadline))
+        return future
+
+    def is_abandoned(self) -> bool:
+        """Whether no caller is waiting anymore (timed out or cancelled)"""
+        return all(future.done() for future, _ in self.waiters)
+
+    def deadline(self) -> Optional[float]:
+        """Earliest deadline of the callers still waiting"""
+        deadlines = [
+            deadline
+            for future, deadline in self.waiters
+            if deadline is not None and not future.done()
+        ]
+        return min(deadlines) if deadlines else None
+
+    def expire(self, now: float) -> None:
+        """Fail the waiters whose deadline passed"""
+        for future, deadline in self.waiters:
+            if deadline is not None and now >= deadline and not future.done():
+                _resolve(
+                    future,
+                    exception=ProviderTimeoutError(
+                        f"{self.provider_name} job {self.job_id} is still pending"
+                    ),
+                )
+
+
+class AsyncJobScheduler:
+    """Poll pending async jobs by batches on a shared worker pool
+
+    Args:
+        max_workers (int): number of threads polling the providers
+        batch_size (int): max number of jobs polled by one worker task
+        rate_limits (dict): max polls per second by provider name
+        default_rate (float): max polls per second for other providers, 0 for none
+    """
+
+    def __init__(
+        self,
+        max_workers: int = JOB_SCHEDULER_WORKERS,
+        batch_size: int = JOB_SCHEDULER_BATCH_SIZE,
+        rate_limits: Optional[Dict[str, float]] = None,
+        default_rate: float = JOB_POLL_DEFAULT_RATE,
+    ) -> None:
+        self.max_workers = max_workers
+        self.batch_size = max(batch_size, 1)
+        self.rate_limits = (
+            dict(JOB_POLL_RATE_LIMITS) if rate_limits is None else dict(rate_limits)
+        )
+        self.default_rate = default_rate
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._heap: List[Tuple[float, int, int, _PendingJob]] = []
+        self._jobs: Dict[JobKey, Dict[Hashable, _PendingJob]] = {}
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        self.polls = 0
+
+    def _bucket(self, provider_name: str) -> TokenBucket:
+        bucket = self._buckets.get(provider_name)
+        if bucket is None:
+            rate = self.rate_limits.get(provider_name, self.default_rate)
+            bucket = self._buckets[provider_name] = TokenBucket(rate)
+        return bucket
+
+    def _push(self, job: _PendingJob, poll_at: float) -> None:
+        job.poll_at = poll_at
+        job.version += 1
+        heapq.heappush(self._heap, (poll_at, next(self._sequence), job.version, job))
+        self._condition.notify()
+
+    def _start(self) -> None:
+        if self._thread is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="edenai_apis_job_poller",
+            )
+            self._thread = threading.Thread(
+                target=self._run, name="edenai_apis_job_scheduler", daemon=True
+            )
+            self._thread.start()
+
+    def submit(
+        self,
+        provider_name: str,
+        job_id: str,
+        poll: Callable[[], Dict],
+        is_done: Callable[[Dict], bool] = is_job_finished,
+        timeout: Optional[float] = None,
+        scope: Hashable = "",
+    ) -> Future:
+        """Poll a job until `is_done(poll())`.
+
+        Args:
+            provider_name (str): provider of the job, used for the rate limits
+            job_id (str): provider job id
+            poll (Callable): function returning the current result of the job
+            is_done (Callable): whether a result is the final one
+            timeout (float): seconds after which the future fails with a
+                `ProviderTimeoutError`
+            scope (Hashable): what `poll` returns for the job besides its id (api
+                keys, feature...), only jobs submitted with the same scope share
+                their polls
+
+        Returns:
+            Future: resolved with the final result, or the exception raised by
+            `poll`. A job submitted twice with the same scope is polled once, each
+            caller gets its own future and deadline.
+        """
+        key = (provider_name, str(job_id))
+        now = time.monotonic()
+        deadline = None if timeout is None else now + timeout
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("the job scheduler is closed")
+            job = self._jobs.get(key, {}).get(scope)
+            if job is not None:
+                future = job.add_waiter(deadline)
+                if deadline is not None and not job.in_flight and deadline < job.poll_at:
+                    self._push(job, deadline)
+                return future
+            job = _PendingJob(provider_name, str(job_id), scope, poll, is_done)
+            self._jobs.setdefault(key, {})[scope] = job
+            # its notifications wake it up
+            register_job(provider_name, job_id)
+            future = job.add_waiter(deadline)
+            self._start()
+            self._push(job, now)
+            return future
+
+    def wake(self, provider_name: str, job_id: str) -> None:
+        """Poll a job as soon as possible (e.g. a notification was received)"""
+        with self._condition:
+            for job in self._jobs.get((provider_name, str(job_id)), {}).values():
+                if job.in_flight:
+                    job.notified = True
+                else:
+                    self._push(job, time.monotonic())
+
+    def _forget(self, job: _PendingJob) -> None:
+        """Called with the lock held"""
+        key = (job.provider_name, job.job_id)
+        jobs = self._jobs.get(key, {})
+        if jobs.get(job.scope) is job:
+            del jobs[job.scope]
+            if not jobs:
+                del self._jobs[key]
+
+    def _finish(
+        self,
+        job: _PendingJob,
+        result: Any = None,
+        exception: Optional[BaseException] = None,
+    ) -> None:
+        with self._condition:
+            self._forget(job)
+            waiters = list(job.waiters)
+        for index, (future, _) in enumerate(waiters):
+            # each caller gets its own copy of the result
+            _resolve(future, copy.deepcopy(result) if index else result, exception)
+
+    def _next_poll_at(self, job: _PendingJob, now: float) -> float:
+        if job.notified:
+            job.notified = False
+            return now
+        # follow the schedule of get_async_job_result, which would not call the
+        # provider before anyway
+        state = get_job_store().get(job.provider_name, job.job_id)
+        if state is not None and state.next_poll_at > now:
+            return state.next_poll_at
+        return now + next_poll_delay(job.polls)
+
+    def _take_due_jobs(self) -> List[_PendingJob]:
+        """Pop the due jobs, waiting for the first one. Called with the lock held"""
+        while not self._closed:
+            now = time.monotonic()
+            due = []
+            throttled: Dict[str, int] = {}
+            while self._heap and self._heap[0][0] <= now:
+                _, _, version, job = heapq.heappop(self._heap)
+                if version != job.version:
+                    continue
+                job.expire(now)
+                if job.is_abandoned():
+                    self._forget(job)
+                    continue
+                bucket = self._bucket(job.provider_name)
+                wait = bucket.try_acquire()
+                if wait:
+                    # spread the throttled jobs over the next tokens, instead of
+                    # waking them all up for the next one
+                    position = throttled.get(job.provider_name, 0)
+                    throttled[job.provider_name] = position + 1
+                    self._push(job, now + wait + position / bucket.rate)
+                    continue
+                job.in_flight = True
+                due.append(job)
+            if due:
+                return due
+            timeout = self._heap[0][0] - now if self._heap else None
+            self._condition.wait(timeout)
+        return []
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                due = self._take_due_jobs()
+                if self._closed:
+                    return
+            for start in range(0, len(due), self.batch_size):
+                batch = due[start : start + self.batch_size]
+                self._executor.submit(self._poll_batch, batch)
+
+    def _poll_batch(self, jobs: List[_PendingJob]) -> None:
+        for job in jobs:
+            with self._condition:
+                abandoned = job.is_abandoned()
+                if abandoned:
+                    self._forget(job)
+            if abandoned:
+                continue
+            try:
+                result = job.poll()
+                done = job.is_done(result)
+            except Exception as exc:  # pylint: disable=broad-except
+                self._finish(job, exception=exc)
+                continue
+            finally:
+                job.polls += 1
+                with self._condition:
+                    self.polls += 1
+            if done:
+                self._finish(job, result=result)
+                continue
+            with self._condition:
+                job.in_flight = False
+                if not self._closed:
+                    poll_at = self._next_poll_at(job, time.monotonic())
+                    deadline = job.deadline()
+                    if deadline is not None:
+                        poll_at = min(poll_at, deadline)
+                    self._push(job, poll_at)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._condition:
+            pending = sum(len(jobs) for jobs in self._jobs.values())
+            return {"pending": pending, "polls": self.polls}
+
+    def close(self) -> None:
+        """Stop polling, pending futures are cancelled"""
+        with self._condition:
+            self._closed = True
+            futures = [
+                future
+                for jobs in self._jobs.values()
+                for job in jobs.values()
+                for future, _ in job.waiters
+            ]
+            self._condition.notify_all()
+        for future in futures:
+            future.cancel()
+        if self._thread is not None:
+            self._thread.join()
+            self._executor.shutdown(wait=True)
+
+
+_JOB_SCHEDULER: Optional[AsyncJobScheduler] = None
+_JOB_SCHEDULER_LOCK = threading.Lock()
+
+
+def _wake_scheduled_job(provider_name: str, job_id: str) -> None:
+    if _JOB_SCHEDULER is not None:
+        _JOB_SCHEDULER.wake(provider_name, job_id)
+
+
+def get_job_scheduler() -> AsyncJobScheduler:
+    """Return the job scheduler of the process, woken up by job notifications"""
+    global _JOB_SCHEDULER
+    if _JOB_SCHEDULER is None:
+        with _JOB_SCHEDULER_LOCK:
+            if _JOB_SCHEDULER is None:
+                _JOB_SCHEDULER = AsyncJobScheduler()
+                add_job_listener(_wake_scheduled_job)
+    return _JOB_SCHEDULER
+
+
+def set_job_scheduler(scheduler: Optional[AsyncJobScheduler]) -> None:
+    """Replace the job scheduler of the process, the previous one is closed"""
+    global _JOB_SCHEDULER
+    with _JOB_SCHEDULER_LOCK:
+        previous, _JOB_SCHEDULER = _JOB_SCHEDULER, scheduler
+        add_job_listener(_wake_scheduled_job)
+    if previous is not None and previous is not scheduler:
+        previous.close()
@@ -1,17 +1,30 @@
+import functools
+import os
 import re
-from collections import defaultdict
+import threading
+from collections import OrderedDict, defaultdict
 from importlib import import_module
-from typing import List, Optional, Sequence
+from typing import Dict, List, Optional, Sequence, Tuple
 
 import pycountry
 from langcodes import Language, closest_supported_match, tag_parser
 
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
+from edenai_apis.utils.exception import LanguageException
 
 AUTO_DETECT = "auto-detect"
 AUTO_DETECT_NAME = "Auto detection"
 
+# number of input codes resolved by language index (LRU)
+LANGUAGE_CACHE_SIZE = int(os.environ.get("LANGUAGE_CACHE_SIZE", 256))
+# closest_supported_match can raise a RuntimeError, it is retried a few times
+LANGUAGE_MATCH_RETRIES = 3
+
+LANGUAGE_FORMAT = re.compile(
+    r"^[a-z]{2,3}(-[a-z]{2,3})?(-[A-Za-z][a-z]{3})?(-([A-Z]{2,3}|\d{3}))?"
+)
+
 
 class LanguageErrorMessage:
     LANGUAGE_REQUIRED = lambda input_lang: (
@@ -34,12 +47,7 @@ def check_language_format(iso_code: str) -> bool:
     """Checks if language code name is formatted correctly (lang-extlang-Script-Reg)"""
     if iso_code is None:
         return None
-    return bool(
-        re.fullmatch(
-            r"^[a-z]{2,3}(-[a-z]{2,3})?(-[A-Za-z][a-z]{3})?(-([A-Z]{2,3}|\d{3}))?",
-            iso_code,
-        )
-    )
+    return bool(LANGUAGE_FORMAT.fullmatch(iso_code))
 
 
 def convert_three_two_letters(iso_code: str) -> Optional[str]:
@@ -68,7 +76,8 @@ def load_language_constraints(
         subfeature=subfeature,
     )
     default = defaultdict(lambda: None)
-    languages = info.get("constraints", default).get("languages", [])
+    # copy the list, the info dict is shared by all calls
+    languages = list(info.get("constraints", default).get("languages", []))
     if info.get("constraints", default).get("allow_null_language"):
         languages.append(AUTO_DETECT)
     return languages
@@ -102,13 +111,12 @@ def load_standardized_language(
         interface = import_module("edenai_apis.interface")
         providers = interface.list_providers(feature, subfeature)
 
-    result = []
+    result: Dict[str, None] = {}
     for provider in providers:
-        list_languages = expand_languages_for_user(
-            load_language_constraints(provider, feature, subfeature)
+        result.update(
+            dict.fromkeys(get_language_index(provider, feature, subfeature).expanded)
         )
-        result = list(set(list_languages + result))
-    return result
+    return list(result)
 
 
 def format_language_name(language_name: str, isocode: str) -> str:
@@ -184,30 +192,106 @@ def compare_language_and_region_code(
     )
 
 
-def provide_appropriate_language(
-    iso_code: str, provider_name: str, feature: str, subfeature: str
-):
-    if not check_language_format(iso_code):
-        raise SyntaxError(f"Language code '{iso_code}' badly formatted")
-
-    list_languages: Sequence[str] = load_language_constraints(
-        provider_name, feature, subfeature
-    )
-
-    # Sometimes closest_supported_match raise a RuntimeError,
-    # so we need a while True for catch this error and retry until function works
-    while True:
+def _closest_supported_language(
+    iso_code: str, languages: Sequence[str]
+) -> Optional[str]:
+    """`closest_supported_match` with at most `LANGUAGE_MATCH_RETRIES` attempts"""
+    for _ in range(LANGUAGE_MATCH_RETRIES):
         try:
-            selected_code_language = closest_supported_match(iso_code, list_languages)
-            break
+            return closest_supported_match(iso_code, languages)
         except RuntimeError:
             pass
+    raise LanguageException(f"Could not match language '{iso_code}'")
+
+
+class LanguageIndex:
+    """Languages supported by a provider for a (feature, subfeature), with the
+    input codes already resolved (LRU of `LANGUAGE_CACHE_SIZE` codes)
+
+    Args:
+        languages (Sequence[str]): supported languages, as in the provider info
+        cache_size (int): max number of resolved input codes kept
+    """
+
+    __slots__ = ("languages", "_supported", "_expanded", "cache_size", "_resolved", "_lock")
+
+    def __init__(
+        self, languages: Sequence[str], cache_size: int = LANGUAGE_CACHE_SIZE
+    ) -> None:
+        self.languages: Tuple[str, ...] = tuple(languages)
+        self._supported = frozenset(self.languages)
+        self._expanded: Optional[Tuple[str, ...]] = None
+        self.cache_size = cache_size
+        self._resolved: "OrderedDict[str, Optional[str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def expanded(self) -> Tuple[str, ...]:
+        """Languages displayed to the users (see `expand_languages_for_user`)"""
+        if self._expanded is None:
+            self._expanded = tuple(
+                dict.fromkeys(expand_languages_for_user(self.languages))
+            )
+        return self._expanded
+
+    def _match(self, iso_code: str) -> Optional[str]:
+        if iso_code in self._supported:
+            return iso_code
+
+        selected_code_language = _closest_supported_language(iso_code, self.languages)
+        if "-" in iso_code and selected_code_language:
+            if has_language_contrains_script(iso_code, selected_code_language):
+                return selected_code_language
+            if compare_language_and_region_code(iso_code, selected_code_language):
+                return selected_code_language
+            return None
+        return selected_code_language
+
+    def resolve(self, iso_code: str) -> Optional[str]:
+        """Returns the supported language closest to `iso_code`, None if there is none
+
+        Raises:
+            SyntaxError: if `iso_code` is badly formatted
+        """
+        with self._lock:
+            if iso_code in self._resolved:
+                self._resolved.move_to_end(iso_code)
+                return self._resolved[iso_code]
+
+        if not check_language_format(iso_code):
+            raise SyntaxError(f"Language code '{iso_code}' badly formatted")
+        resolved = self._match(iso_code)
+
+        with self._lock:
+            self._resolved[iso_code] = resolved
+            while len(self._resolved) > self.cache_size:
+                self._resolved.popitem(last=False)
+        return resolved
+
+
+@functools.lru_cache(maxsize=None)
+def get_language_index(provider_name: str, feature: str, subfeature: str) -> LanguageIndex:
+    """Language index of a (provider, feature, subfeature), built once"""
+    return LanguageIndex(load_language_constraints(provider_name, feature, subfeature))
+
+
+@functools.lru_cache(maxsize=LANGUAGE_CACHE_SIZE)
+def _language_index_of(languages: Tuple[str, ...]) -> LanguageIndex:
+    return LanguageIndex(languages)
 
-    if "-" in iso_code and selected_code_language:
-        if has_language_contrains_script(iso_code, selected_code_language):
-            return selected_code_language
-        if compare_language_and_region_code(iso_code, selected_code_language):
-            return selected_code_language
-        return None
 
-    return selected_code_language
+def provide_appropriate_language(
+    iso_code: str,
+    provider_name: str,
+    feature: str,
+    subfeature: str,
+    list_languages: Optional[Sequence[str]] = None,
+):
+    """Returns the provider supported language closest to `iso_code`.
+    `list_languages` can be given to avoid loading the provider languages constraints
+    """
+    if list_languages is None:
+        index = get_language_index(provider_name, feature, subfeature)
+    else:
+        index = _language_index_of(tuple(list_languages))
+    return index.resolve(iso_code)
@@ -0,0 +1,449 @@
+"""
+Cache of the responses of deterministic LLM calls.
+
+A LLM called at temperature 0 (or a deterministic subfeature, eg: moderation) with
+the same prompt returns the same response, so the responses of these calls are cached
+on a hash of (provider, api keys, method, arguments), the arguments being the whole
+input the request payload is built from (text, model, options...). The api keys are
+part of the key so that a response is only returned to callers using the same keys
+(and the same account settings, eg: fine-tuned models). Decorating a provider LLM
+method with `cached_llm_response` returns the cached response of identical calls
+instead of calling the provider again:
+
+    - calls with a `temperature` argument are only cached when it is 0
+    - methods declared with `cached_llm_response(deterministic=True)` are always
+      cached (they have fixed instructions and a fixed temperature of 0)
+    - streamed responses are never cached
+    - responses are stored as json, a provider response which is not json is not
+      cached
+
+The cache is disabled by default and can be configured with environment variables:
+    - `LLM_CACHE`: `memory` (in-process LRU) or `sqlite` (on-disk)
+    - `LLM_CACHE_SIZE`: max number of responses kept (least recently used responses
+      are evicted first)
+    - `LLM_CACHE_TTL`: seconds a response is kept (default 86400, 0 to keep them
+      until evicted)
+    - `LLM_CACHE_PATH`: path of the sqlite database
+
+or with `set_llm_cache`:
+
+    >>> from edenai_apis.utils.llm_cache import MemoryLLMCache, set_llm_cache
+    >>> set_llm_cache(MemoryLLMCache(max_entries=50_000, ttl=3600))
+"""
+import functools
+import hashlib
+import inspect
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from pydantic import BaseModel
+
+from edenai_apis.features.text.chat.chat_dataclass import StreamChat
+from edenai_apis.utils.provider_pool import api_keys_fingerprint
+from edenai_apis.utils.types import ResponseType
+
+DEFAULT_CACHE_SIZE = int(os.environ.get("LLM_CACHE_SIZE", 10_000))
+DEFAULT_CACHE_TTL = float(os.environ.get("LLM_CACHE_TTL", 86_400))
+DEFAULT_CACHE_PATH = os.environ.get(
+    "LLM_CACHE_PATH",
+    os.path.join(os.path.expanduser("~"), ".cache", "edenai_apis", "llm.db"),
+)
+
+
+def llm_cache_key(
+    provider_name: str,
+    method: str,
+    arguments: Dict[str, Any],
+    api_keys: Optional[Dict] = None,
+) -> str:
+    """Return the cache key of a call, arguments order does not matter"""
+    serialized = json.dumps(
+        [provider_name, api_keys_fingerprint(api_keys), method, arguments],
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+def _dump_response(response: ResponseType) -> Optional[str]:
+    """Return the response as json, None if the provider response is not json"""
+    standardized_response = response.standardized_response
+    try:
+        return json.dumps(
+            {
+                "module": type(standardized_response).__module__,
+                "class": type(standardized_response).__name__,
+                "original_response": response.original_response,
+                "standardized_response": standardized_response.model_dump(
+                    mode="json"
+                ),
+            },
+            ensure_ascii=False,
+        )
+    except (TypeError, ValueError):
+        return None
+
+
+def _load_response(value: str) -> Optional[ResponseType]:
+    """Return the response stored as json, None if it cannot be loaded (eg: stored by
+    another version). The class of the standardized response must be a dataclass of
+    the features which is already imported, nothing is imported from a cached value"""
+    try:
+        entry = json.loads(value)
+        module_name = entry["module"]
+        if not module_name.startswith("edenai_apis.features."):
+            return None
+        module = sys.modules.get(module_name)
+        response_class = getattr(module, entry["class"], None)
+        if not isinstance(response_class, type) or not issubclass(
+            response_class, BaseModel
+        ):
+            return None
+        standardized_response = response_class.model_validate(
+            entry["standardized_response"]
+        )
+        return ResponseType[response_class].model_construct(
+            original_response=entry["original_response"],
+            standardized_response=standardized_response,
+        )
+    except (ValueError, TypeError, KeyError):
+        return None
+
+
+class LLMCache(ABC):
+    """Base class of LLM responses caches, keeps hits/misses stats
+
+    Args:
+        max_entries (int): max number of responses kept
+        ttl (float): seconds a response is kept, 0 to keep them until evicted
+    """
+
+    def __init__(
+        self, max_entries: int = DEFAULT_CACHE_SIZE, ttl: float = DEFAULT_CACHE_TTL
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._stats_lock = threading.Lock()
+
+    def _expires_at(self) -> float:
+        return time.time() + self.ttl if self.ttl > 0 else float("inf")
+
+    @abstractmethod
+    def _get(self, key: str) -> Optional[str]:
+        """Return the cached response of `key`, None if missing or expired"""
+
+    @abstractmethod
+    def _set(self, key: str, value: str, expires_at: float) -> int:
+        """Store a response and return the number of evicted responses"""
+
+    @abstractmethod
+    def _clear(self) -> None:
+        """Drop all responses"""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        ...
+
+    def get(self, key: str) -> Optional[ResponseType]:
+        """Return the cached response of `key`, None if missing"""
+        value = self._get(key)
+        response = _load_response(value) if value is not None else None
+        with self._stats_lock:
+            if response is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return response
+
+    def set(self, key: str, response: ResponseType) -> None:
+        if self.max_entries <= 0:
+            return
+        value = _dump_response(response)
+        if value is None:
+            return
+        evicted = self._set(key, value, self._expires_at())
+        with self._stats_lock:
+            self.evictions += evicted
+
+    def clear(self) -> None:
+        """Drop all responses and reset stats"""
+        self._clear()
+        with self._stats_lock:
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self) -> Dict[str, float]:
+        """Return cache hits/misses stats"""
+        with self._stats_lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self),
+                "max_size": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
+
+
+class MemoryLLMCache(LLMCache):
+    """In-process LRU cache of LLM responses"""
+
+    def __init__(
+        self, max_entries: int = DEFAULT_CACHE_SIZE, ttl: float = DEFAULT_CACHE_TTL
+    ) -> None:
+        super().__init__(max_entries, ttl)
+        self._responses: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._responses.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.time():
+                del self._responses[key]
+                return None
+            self._responses.move_to_end(key)
+            return value
+
+    def _set(self, key: str, value: str, expires_at: float) -> int:
+        evicted = 0
+        with self._lock:
+            self._responses[key] = (expires_at, value)
+            self._responses.move_to_end(key)
+            while len(self._responses) > self.max_entries:
+                self._responses.popitem(last=False)
+                evicted += 1
+        return evicted
+
+    def _clear(self) -> None:
+        with self._lock:
+            self._responses.clear()
+
+    def __len__(self) -> int:
+        return len(self._responses)
+
+
+class SQLiteLLMCache(LLMCache):
+    """On-disk cache of LLM responses, shared by all processes using the same
+    database. Expired responses are dropped first, then the least recently used ones.
+
+    Args:
+        path (str): path of the sqlite database, created if needed
+        max_entries (int): max number of responses kept
+        ttl (float): seconds a response is kept, 0 to keep them until evicted
+    """
+
+    def __init__(
+        self,
+        path: str = DEFAULT_CACHE_PATH,
+        max_entries: int = DEFAULT_CACHE_SIZE,
+        ttl: float = DEFAULT_CACHE_TTL,
+    ) -> None:
+        super().__init__(max_entries, ttl)
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, response TEXT NOT NULL, "
+                "expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed_at "
+                "ON responses (accessed_at)"
+            )
+
+    def _get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                "SELECT response, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, expires_at = row
+            if expires_at <= now:
+                self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+            self._connection.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+        return value
+
+    def _set(self, key: str, value: str, expires_at: float) -> int:
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, response, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, value, expires_at, now),
+            )
+            (size,) = self._connection.execute(
+                "SELECT COUNT(*) FROM responses"
+            ).fetchone()
+            if size <= self.max_entries:
+                return 0
+            evicted = self._connection.execute(
+                "DELETE FROM responses WHERE expires_at <= ?", (now,)
+            ).rowcount
+            overflow = size - evicted - self.max_entries
+            if overflow > 0:
+                self._connection.execute(
+                    "DELETE FROM responses WHERE key IN ("
+                    "SELECT key FROM responses ORDER BY accessed_at LIMIT ?)",
+                    (overflow,),
+                )
+                evicted += overflow
+        return evicted
+
+    def _clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses")
+
+    def __len__(self) -> int:
+        with self._lock:
+            (size,) = self._connection.execute(
+                "SELECT COUNT(*) FROM responses"
+            ).fetchone()
+        return size
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+def _cache_from_env() -> Optional[LLMCache]:
+    backend = os.environ.get("LLM_CACHE", "").lower()
+    if backend == "memory":
+        return MemoryLLMCache()
+    if backend == "sqlite":
+        return SQLiteLLMCache()
+    return None
+
+
+_LLM_CACHE: Optional[LLMCache] = None
+_LLM_CACHE_LOADED = False
+_LLM_CACHE_LOCK = threading.Lock()
+
+
+def get_llm_cache() -> Optional[LLMCache]:
+    """Return the global LLM responses cache, `None` when caching is disabled"""
+    global _LLM_CACHE, _LLM_CACHE_LOADED
+    if not _LLM_CACHE_LOADED:
+        with _LLM_CACHE_LOCK:
+            if not _LLM_CACHE_LOADED:
+                _LLM_CACHE = _cache_from_env()
+                _LLM_CACHE_LOADED = True
+    return _LLM_CACHE
+
+
+def set_llm_cache(cache: Optional[LLMCache]) -> None:
+    """Set the global LLM responses cache, `None` disables caching"""
+    global _LLM_CACHE, _LLM_CACHE_LOADED
+    with _LLM_CACHE_LOCK:
+        _LLM_CACHE = cache
+        _LLM_CACHE_LOADED = True
+
+
+def llm_cache_stats() -> Dict[str, float]:
+    """Return the global LLM responses cache stats (empty when caching is disabled)"""
+    cache = get_llm_cache()
+    return cache.stats() if cache is not None else {}
+
+
+def _is_cacheable_call(arguments: Dict[str, Any], deterministic: bool) -> bool:
+    if arguments.get("stream"):
+        return False
+    if deterministic:
+        return True
+    temperature = arguments.get("temperature")
+    return temperature is not None and float(temperature) == 0
+
+
+def cached_llm_response(
+    func: Optional[Callable] = None, *, deterministic: bool = False
+) -> Callable:
+    """Decorator for providers LLM methods, returns the cached response of identical
+    deterministic calls, see module docstring
+
+    Args:
+        deterministic (bool): the method always returns the same response for the
+            same arguments, its calls are cached whatever their temperature
+    """
+    if func is None:
+        return functools.partial(cached_llm_response, deterministic=deterministic)
+
+    signature = inspect.signature(func)
+    # the coroutine of a provider method (`_async_text__chat`, see interface_v2)
+    # shares the cache of the method
+    method_name = func.__name__
+    if method_name.startswith("_async_"):
+        method_name = method_name[len("_async_") :]
+
+    def cache_key(self, args, kwargs) -> Optional[str]:
+        """Key of a call, None if it is not cached"""
+        arguments = signature.bind(self, *args, **kwargs)
+        arguments.apply_defaults()
+        arguments = dict(arguments.arguments)
+        arguments.pop("self")
+        if not _is_cacheable_call(arguments, deterministic):
+            return None
+        if arguments.get("temperature") is not None:
+            # `0` and `0.0` are the same request
+            arguments["temperature"] = float(arguments["temperature"])
+        return llm_cache_key(
+            self.provider_name, method_name, arguments, api_keys=self.api_keys
+        )
+
+    def store(cache: LLMCache, key: str, response: ResponseType) -> None:
+        if not isinstance(response.standardized_response, StreamChat):
+            cache.set(key, response)
+
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(self, *args, **kwargs):
+            cache = get_llm_cache()
+            key = cache_key(self, args, kwargs) if cache is not None else None
+            if key is None:
+                return await func(self, *args, **kwargs)
+            response = cache.get(key)
+            if response is None:
+                response = await func(self, *args, **kwargs)
+                store(cache, key, response)
+            return response
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        cache = get_llm_cache()
+        key = cache_key(self, args, kwargs) if cache is not None else None
+        if key is None:
+            return func(self, *args, **kwargs)
+        response = cache.get(key)
+        if response is None:
+            response = func(self, *args, **kwargs)
+            store(cache, key, response)
+        return response
+
+    return wrapper
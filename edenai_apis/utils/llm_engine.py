@@ -0,0 +1,379 @@
+"""
+Requests and tokens budgets of the LLM providers calls.
+
+Providers limit the requests per minute (RPM) and tokens per minute (TPM) of each
+account, often per model. Sending calls as they come makes bursts of `429` errors
+once the limit is reached, while most of the budget of the minute is left unused.
+
+The LLM methods of the providers (`text__generation`, `text__chat`, ...) are decorated
+with `llm_request`: before the call, the tokens of the request are estimated locally
+(prompt and `max_tokens`) and taken from the budget of the (provider, model), waiting
+in line for the budget to refill when needed. Once the provider answered, the budget
+is corrected with the tokens it reports in `usage`. A `429` empties the budget, so
+that the queued calls wait for it to refill instead of failing too.
+
+Configuration (budgets are per minute, `provider/model` keys override `provider`):
+    LLM_RPM_LIMITS: requests per minute, eg: `openai:3500,openai/gpt-4:500`
+    LLM_TPM_LIMITS: tokens per minute, eg: `openai:90000,mistral:2000000`
+    LLM_MAX_WAIT: max seconds a call waits for the budget (default 60), a
+        `ProviderLimitationError` is raised after
+Calls to providers without limits are not queued. Coroutines (providers async
+methods) wait for the budget with `asyncio.sleep`, without holding a thread, and are
+served in arrival order with the blocking calls.
+"""
+import asyncio
+import functools
+import inspect
+import os
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple
+
+from edenai_apis.utils.exception import ProviderException, ProviderLimitationError
+from edenai_apis.utils.rate_limit import TokenBucket, parse_rate_limits
+from edenai_apis.utils.tokens import estimate_tokens
+
+LLM_RPM_LIMITS = parse_rate_limits(os.environ.get("LLM_RPM_LIMITS"))
+LLM_TPM_LIMITS = parse_rate_limits(os.environ.get("LLM_TPM_LIMITS"))
+LLM_MAX_WAIT = float(os.environ.get("LLM_MAX_WAIT", 60))
+
+# seconds between two checks of its turn by a coroutine waiting in line
+BUDGET_RETRY_INTERVAL = 0.05
+
+# arguments of the LLM methods which are not part of the prompt
+NOT_PROMPT_ARGUMENTS = ("self", "model", "language", "max_tokens", "temperature")
+
+
+def estimate_request_tokens(value: Any) -> int:
+    """Estimated tokens of the texts of a request (strings in nested lists/dicts)"""
+    if isinstance(value, str):
+        return estimate_tokens(value)
+    if isinstance(value, dict):
+        return sum(estimate_request_tokens(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(estimate_request_tokens(item) for item in value)
+    return 0
+
+
+def usage_tokens(original_response: Any) -> Optional[int]:
+    """Tokens used by a call, as reported in the `usage` of the provider response"""
+    if not isinstance(original_response, dict):
+        return None
+    usage = original_response.get("usage")
+    if not isinstance(usage, dict):
+        return None
+    if "total_tokens" in usage:
+        return usage["total_tokens"]
+    if "input_tokens" in usage or "output_tokens" in usage:
+        return usage.get("input_tokens", 0) + usage.get("output_tokens", 0)
+    return None
+
+
+def is_rate_limit_error(exc: BaseException) -> bool:
+    return isinstance(exc, ProviderLimitationError) or (
+        isinstance(exc, ProviderException) and exc.status_code == 429
+    )
+
+
+class LLMBudget:
+    """Requests and tokens budgets of a (provider, model), refilled continuously
+
+    Args:
+        rpm (float): requests per minute, 0 for unlimited
+        tpm (float): tokens per minute, 0 for unlimited
+    """
+
+    def __init__(self, rpm: float = 0, tpm: float = 0) -> None:
+        self.requests = TokenBucket(rpm / 60, capacity=rpm)
+        self.tokens = TokenBucket(tpm / 60, capacity=tpm)
+        # calls wait for the budget in line: each call takes a ticket and only the
+        # call being served takes from the budget. The lock is not held while the
+        # calls wait, threads wait on `_turn` and coroutines check their turn.
+        self._lock = threading.Lock()
+        self._turn = threading.Condition(self._lock)
+        self._next_ticket = 0
+        self._serving = 0
+        self._left: Set[int] = set()
+        self.calls = 0
+        self.waited = 0.0
+        self.rate_limited = 0
+
+    def _take(self, tokens: int) -> float:
+        """Take a request and `tokens` tokens, or return the seconds to wait for
+        them. Called with the lock held by the call being served"""
+        wait = self.requests.try_acquire()
+        if not wait:
+            wait = self.tokens.try_acquire(tokens)
+            if not wait:
+                self.calls += 1
+                return 0.0
+            self.requests.release(1)
+        return wait
+
+    def _take_ticket(self) -> int:
+        """Called with the lock held"""
+        ticket = self._next_ticket
+        self._next_ticket += 1
+        return ticket
+
+    def _leave(self, ticket: int) -> None:
+        """Leave the line, served or not. Called with the lock held"""
+        if ticket != self._serving:
+            # the turn of this call is skipped when it comes
+            self._left.add(ticket)
+            return
+        self._serving += 1
+        while self._serving in self._left:
+            self._left.remove(self._serving)
+            self._serving += 1
+        self._turn.notify_all()
+
+    def acquire(self, tokens: int, timeout: Optional[float] = None) -> bool:
+        """Wait for a request and `tokens` tokens, False after `timeout` seconds"""
+        start = time.monotonic()
+        deadline = None if timeout is None else start + timeout
+        with self._turn:
+            ticket = self._take_ticket()
+            try:
+                while True:
+                    if ticket == self._serving:
+                        wait = self._take(tokens)
+                        if not wait:
+                            self.waited += time.monotonic() - start
+                            return True
+                        if deadline is not None and time.monotonic() + wait > deadline:
+                            return False
+                    elif deadline is not None:
+                        wait = deadline - time.monotonic()
+                        if wait <= 0:
+                            return False
+                    else:
+                        wait = None
+                    self._turn.wait(wait)
+            finally:
+                self._leave(ticket)
+
+    async def async_acquire(self, tokens: int, timeout: Optional[float] = None) -> bool:
+        """`acquire` for coroutines, waits with `asyncio.sleep`"""
+        start = time.monotonic()
+        deadline = None if timeout is None else start + timeout
+        with self._lock:
+            ticket = self._take_ticket()
+        try:
+            while True:
+                with self._lock:
+                    if ticket == self._serving:
+                        wait = self._take(tokens)
+                        if not wait:
+                            self.waited += time.monotonic() - start
+                            return True
+                    else:
+                        wait = BUDGET_RETRY_INTERVAL
+                if deadline is not None and time.monotonic() + wait > deadline:
+                    return False
+                await asyncio.sleep(wait)
+        finally:
+            with self._lock:
+                self._leave(ticket)
+
+    def settle(self, reserved: int, used: Optional[int]) -> None:
+        """Correct the tokens budget with the tokens really used by a call"""
+        if used is not None:
+            self.tokens.release(reserved - used)
+
+    def exhausted(self) -> None:
+        """The provider answered that the limit is reached"""
+        self.rate_limited += 1
+        self.requests.drain()
+        self.tokens.drain()
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "calls": self.calls,
+            "waited": self.waited,
+            "rate_limited": self.rate_limited,
+        }
+
+
+def _budget_timeout(provider_name: str, model: Optional[str]) -> ProviderLimitationError:
+    model_name = f" {model}" if model else ""
+    return ProviderLimitationError(
+        f"Too many requests for {provider_name}{model_name}, please retry later"
+    )
+
+
+class LLMRequestEngine:
+    """Runs the LLM calls within the budgets of their (provider, model)
+
+    Args:
+        rpm_limits (dict): requests per minute by `provider` or `provider/model`
+        tpm_limits (dict): tokens per minute by `provider` or `provider/model`
+        max_wait (float): max seconds a call waits for the budget
+    """
+
+    def __init__(
+        self,
+        rpm_limits: Optional[Dict[str, float]] = None,
+        tpm_limits: Optional[Dict[str, float]] = None,
+        max_wait: float = LLM_MAX_WAIT,
+    ) -> None:
+        self.rpm_limits = dict(LLM_RPM_LIMITS if rpm_limits is None else rpm_limits)
+        self.tpm_limits = dict(LLM_TPM_LIMITS if tpm_limits is None else tpm_limits)
+        self.max_wait = max_wait
+        self._limited_providers = frozenset(
+            key.split("/")[0] for key in (*self.rpm_limits, *self.tpm_limits)
+        )
+        self._budgets: Dict[Tuple[str, str], LLMBudget] = {}
+        self._lock = threading.Lock()
+
+    def is_limited(self, provider_name: str) -> bool:
+        return provider_name in self._limited_providers
+
+    def _limit(self, limits: Dict[str, float], provider_name: str, model: str) -> float:
+        return limits.get(f"{provider_name}/{model}", limits.get(provider_name, 0))
+
+    def budget(self, provider_name: str, model: Optional[str] = None) -> LLMBudget:
+        """Budget of a (provider, model), shared by all models of the provider unless
+        the model has its own limits"""
+        model = model or ""
+        has_own_limits = (
+            f"{provider_name}/{model}" in self.rpm_limits
+            or f"{provider_name}/{model}" in self.tpm_limits
+        )
+        key = (provider_name, model if has_own_limits else "")
+        budget = self._budgets.get(key)
+        if budget is None:
+            with self._lock:
+                budget = self._budgets.get(key)
+                if budget is None:
+                    budget = self._budgets[key] = LLMBudget(
+                        rpm=self._limit(self.rpm_limits, provider_name, model),
+                        tpm=self._limit(self.tpm_limits, provider_name, model),
+                    )
+        return budget
+
+    def run(
+        self,
+        provider_name: str,
+        model: Optional[str],
+        call: Callable[[], Any],
+        tokens: int = 0,
+    ) -> Any:
+        """Wait for the budget of `tokens` estimated tokens, then make the call
+
+        Raises:
+            ProviderLimitationError: if the budget was not available in `max_wait`
+        """
+        if not self.is_limited(provider_name):
+            return call()
+        budget = self.budget(provider_name, model)
+        if not budget.acquire(tokens, timeout=self.max_wait):
+            raise _budget_timeout(provider_name, model)
+        try:
+            result = call()
+        except ProviderException as exc:
+            if is_rate_limit_error(exc):
+                budget.exhausted()
+            raise
+        budget.settle(tokens, usage_tokens(getattr(result, "original_response", None)))
+        return result
+
+    async def async_run(
+        self,
+        provider_name: str,
+        model: Optional[str],
+        call: Callable[[], Awaitable[Any]],
+        tokens: int = 0,
+    ) -> Any:
+        """`run` for coroutines"""
+        if not self.is_limited(provider_name):
+            return await call()
+        budget = self.budget(provider_name, model)
+        if not await budget.async_acquire(tokens, timeout=self.max_wait):
+            raise _budget_timeout(provider_name, model)
+        try:
+            result = await call()
+        except ProviderException as exc:
+            if is_rate_limit_error(exc):
+                budget.exhausted()
+            raise
+        budget.settle(tokens, usage_tokens(getattr(result, "original_response", None)))
+        return result
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            budgets = dict(self._budgets)
+        return {
+            "/".join(filter(None, key)): budget.stats() for key, budget in budgets.items()
+        }
+
+
+_LLM_ENGINE: Optional[LLMRequestEngine] = None
+_LLM_ENGINE_LOCK = threading.Lock()
+
+
+def get_llm_engine() -> LLMRequestEngine:
+    """Return the LLM engine of the process, configured from the environment"""
+    global _LLM_ENGINE
+    if _LLM_ENGINE is None:
+        with _LLM_ENGINE_LOCK:
+            if _LLM_ENGINE is None:
+                _LLM_ENGINE = LLMRequestEngine()
+    return _LLM_ENGINE
+
+
+def set_llm_engine(engine: Optional[LLMRequestEngine]) -> None:
+    """Replace the LLM engine of the process (None resets it to the default one)"""
+    global _LLM_ENGINE
+    with _LLM_ENGINE_LOCK:
+        _LLM_ENGINE = engine
+
+
+def llm_request(func: Callable) -> Callable:
+    """Decorator for providers LLM methods, runs them within the budget of their
+    (provider, model), see module docstring"""
+    signature = inspect.signature(func)
+
+    def request_budget(self, args, kwargs) -> Tuple[Optional[str], int]:
+        """(model, estimated tokens) of a call"""
+        arguments = signature.bind(self, *args, **kwargs).arguments
+        tokens = estimate_request_tokens(
+            {
+                name: value
+                for name, value in arguments.items()
+                if name not in NOT_PROMPT_ARGUMENTS
+            }
+        ) + (arguments.get("max_tokens") or 0)
+        return arguments.get("model"), tokens
+
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(self, *args, **kwargs):
+            engine = get_llm_engine()
+            if not engine.is_limited(self.provider_name):
+                return await func(self, *args, **kwargs)
+            model, tokens = request_budget(self, args, kwargs)
+            return await engine.async_run(
+                self.provider_name,
+                model,
+                lambda: func(self, *args, **kwargs),
+                tokens=tokens,
+            )
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        engine = get_llm_engine()
+        if not engine.is_limited(self.provider_name):
+            return func(self, *args, **kwargs)
+        model, tokens = request_budget(self, args, kwargs)
+        return engine.run(
+            self.provider_name,
+            model,
+            lambda: func(self, *args, **kwargs),
+            tokens=tokens,
+        )
+
+    return wrapper
@@ -1,7 +1,9 @@
-from typing import List
+from typing import List, Optional
 
 import numpy as np
 
+from edenai_apis.features.text.search.search_dataclass import InfosSearchDataClass
+
 SCORE_MULTIPLIER = 100.0
 
 def cosine_similarity(embedding1: List[float], embedding2: List[float]):
@@ -38,3 +40,90 @@ METRICS = {
     "manhattan" : manhattan_similarity,
     "euclidean" : squared_euclidean_similarity,
 }
+
+
+def _as_matrix(embeddings) -> np.ndarray:
+    matrix = np.asarray(embeddings, dtype=np.float32)
+    if matrix.ndim == 1:
+        matrix = matrix.reshape(1, -1) if matrix.size else matrix.reshape(0, 0)
+    return matrix
+
+
+def batch_cosine_similarity(query: List[float], embeddings) -> np.ndarray:
+    """
+    Computes the cosine similarity between a query vector and each row of an
+    (N, D) embeddings matrix.
+    """
+    query = np.asarray(query, dtype=np.float32)
+    matrix = _as_matrix(embeddings)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scores = (matrix @ query) / (
+            np.linalg.norm(matrix, axis=1) * np.linalg.norm(query)
+        )
+    return scores * SCORE_MULTIPLIER
+
+
+def batch_manhattan_similarity(query: List[float], embeddings) -> np.ndarray:
+    """
+    Computes the manhattan similarity between a query vector and each row of an
+    (N, D) embeddings matrix.
+    """
+    query = np.asarray(query, dtype=np.float32)
+    return SCORE_MULTIPLIER - np.abs(_as_matrix(embeddings) - query).sum(axis=1)
+
+
+def batch_squared_euclidean_similarity(query: List[float], embeddings) -> np.ndarray:
+    """
+    Computes the euclidean similarity between a query vector and each row of an
+    (N, D) embeddings matrix.
+    """
+    query = np.asarray(query, dtype=np.float32)
+    dist = np.linalg.norm(_as_matrix(embeddings) - query, axis=1)
+    return (1 - dist) * SCORE_MULTIPLIER
+
+
+BATCH_METRICS = {
+    "cosine": batch_cosine_similarity,
+    "manhattan": batch_manhattan_similarity,
+    "euclidean": batch_squared_euclidean_similarity,
+}
+
+
+def top_k_indices(scores: np.ndarray, k: Optional[int] = None) -> np.ndarray:
+    """
+    Returns the indices of the `k` best scores, best first. Only the `k` best
+    scores are sorted, the others are just partitioned out.
+    Equal scores keep their original order, like `sorted`.
+    """
+    scores = np.asarray(scores)
+    n_scores = len(scores)
+    if k is None or k >= n_scores:
+        return np.argsort(-scores, kind="stable")
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    best = np.argpartition(-scores, k - 1)[:k]
+    # sort the k best on (score desc, index asc) to stay stable
+    return best[np.lexsort((best, -scores[best]))]
+
+
+def rank_documents(
+    query_embedding: List[float],
+    embeddings,
+    similarity_metric: str = "cosine",
+    top_k: Optional[int] = None,
+) -> List[InfosSearchDataClass]:
+    """
+    Scores every document embedding against the query embedding and returns
+    the `top_k` best documents (all of them by default) as search items,
+    sorted by score in descending order.
+    """
+    function_score = BATCH_METRICS[similarity_metric]
+    if len(embeddings) == 0:
+        return []
+    scores = function_score(query_embedding, embeddings)
+    return [
+        InfosSearchDataClass.model_construct(
+            object="search_result", document=int(index), score=float(scores[index])
+        )
+        for index in top_k_indices(scores, top_k)
+    ]
@@ -22,29 +22,119 @@ CREATE TABLE IF NOT EXISTS history (
      );
      GRANT INSERT ON TABLE history TO history_write_only;
 ```
+
+Calls are not inserted on the request path: `insert_api_call` puts them in a bounded
+in-process queue which a background thread drains, inserting them by batches.
+The queue can be tuned with the following environment variables:
+    - `MONITORING_QUEUE_SIZE`: max number of calls waiting to be inserted
+    - `MONITORING_BATCH_SIZE`: max number of calls inserted at once
+    - `MONITORING_FLUSH_INTERVAL`: max time (seconds) a call waits before being inserted
+    - `MONITORING_DROP_POLICY`: what to do when the queue is full, `drop_newest`
+      (default, the new call is dropped), `drop_oldest` or `block`
+    - `MONITORING_POOL_SIZE`: max number of postgres connections
+
+Text values longer than their column are truncated. When a batch cannot be
+inserted because of some of its calls, it is split in halves and inserted again, so
+only the faulty calls are lost.
+
+Calls waiting in the queue are inserted when the interpreter exits. Another sink
+(eg: `SQLiteSink` for tests) can be set with `set_monitoring_sink`.
 """
+import atexit
 import getpass
+import inspect
 import os
 import socket
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
 from datetime import datetime
-from typing import Optional
+from typing import Any, Deque, Dict, List, Literal, Optional, Tuple
 
 import psycopg2
-from loaders.data_loader import ProviderDataEnum
-from loaders.loaders import load_provider
-from psycopg2 import errors
-from psycopg2.extensions import AsIs
+from psycopg2.extras import execute_values
+from psycopg2.pool import PoolError, ThreadedConnectionPool
+
+from edenai_apis.loaders.data_loader import ProviderDataEnum
+from edenai_apis.loaders.loaders import load_provider
+from edenai_apis.utils.providers_cost import get_providers_cost
+
+HISTORY_COLUMNS = (
+    "provider",
+    "feature",
+    "subfeature",
+    "environment",
+    "host",
+    "start_date",
+    "edenai_user",
+    "error",
+    "host_user",
+)
 
-from .upload_s3 import get_providers_json_from_s3
+# varchar columns of the `history` table
+HISTORY_COLUMNS_MAX_LENGTH = {
+    "provider": 100,
+    "feature": 100,
+    "subfeature": 100,
+    "environment": 100,
+    "host": 100,
+    "edenai_user": 100,
+    "error": 255,
+    "host_user": 100,
+}
 
-global INFOS_FROM_S3
-global POSTGRES_CONNECTION
+DropPolicy = Literal["drop_newest", "drop_oldest", "block"]
+
+DEFAULT_QUEUE_SIZE = int(os.environ.get("MONITORING_QUEUE_SIZE", 10_000))
+DEFAULT_BATCH_SIZE = int(os.environ.get("MONITORING_BATCH_SIZE", 500))
+DEFAULT_FLUSH_INTERVAL = float(os.environ.get("MONITORING_FLUSH_INTERVAL", 1.0))
+DEFAULT_DROP_POLICY: DropPolicy = os.environ.get(  # type: ignore[assignment]
+    "MONITORING_DROP_POLICY", "drop_newest"
+)
+DEFAULT_POOL_SIZE = int(os.environ.get("MONITORING_POOL_SIZE", 4))
 
 
 def monitor_call(condition=False):
     """decorator for compute output functions to add monitoring features"""
 
     def decorator_monitor_call(compute_func):
+        if inspect.iscoroutinefunction(compute_func):
+
+            async def async_wrapper(
+                provider_name,
+                feature,
+                subfeature,
+                *args,
+                **kwargs,
+            ):
+                fake = kwargs.get("fake", False)
+                error = "Fake" if fake else None
+                user_email = kwargs.get("user_email")
+                try:
+                    return await compute_func(
+                        provider_name,
+                        feature,
+                        subfeature,
+                        *args,
+                        **kwargs,
+                    )
+                except Exception as exc:
+                    error = str(exc)
+                    raise
+                finally:
+                    if condition:
+                        insert_api_call(
+                            provider=provider_name,
+                            feature=feature,
+                            subfeature=subfeature,
+                            user_email=user_email,
+                            error=error,
+                        )
+
+            return async_wrapper
+
         def wrapper(
             provider_name,
             feature,
@@ -81,6 +171,338 @@ def monitor_call(condition=False):
     return decorator_monitor_call
 
 
+class MonitoringSink(ABC):
+    """Where monitored calls are inserted"""
+
+    @abstractmethod
+    def write_batch(self, rows: List[Dict[str, Any]]) -> None:
+        """Insert a batch of calls (dicts with `HISTORY_COLUMNS` keys)"""
+
+    def is_row_error(self, exc: Exception) -> bool:
+        """Whether a `write_batch` error can come from some of the rows (eg: an
+        invalid value) rather than from the sink itself (eg: the db is down)"""
+        return True
+
+    def close(self) -> None:
+        """Release the sink resources"""
+
+
+class PostgresSink(MonitoringSink):
+    """Inserts calls in the postgres `history` table, with one multi-rows insert per
+    batch. Connections are taken from a thread-safe pool, created on first write.
+
+    Args:
+        dsn (str, optional): connection string, built from the `rds` keys if not given
+        max_connections (int): max number of connections of the pool
+    """
+
+    def __init__(
+        self, dsn: Optional[str] = None, max_connections: int = DEFAULT_POOL_SIZE
+    ) -> None:
+        self.dsn = dsn
+        self.max_connections = max_connections
+        self._pool = None
+        self._lock = threading.Lock()
+
+    def _get_pool(self):
+        if self._pool is None:
+            with self._lock:
+                if self._pool is None:
+                    dsn = self.dsn
+                    if dsn is None:
+                        rds_settings = load_provider(ProviderDataEnum.KEY, "rds")
+                        dsn = (
+                            f"dbname=history_db user={rds_settings['write_only_user']} "
+                            + f"password={rds_settings['write_only_password']} host={rds_settings['host']}"
+                        )
+                    self._pool = ThreadedConnectionPool(1, self.max_connections, dsn)
+                    print("Connect to postgres history ok")
+        return self._pool
+
+    def write_batch(self, rows: List[Dict[str, Any]]) -> None:
+        pool = self._get_pool()
+        connection = pool.getconn()
+        try:
+            with connection.cursor() as cur:
+                execute_values(
+                    cur,
+                    f"insert into history ({','.join(HISTORY_COLUMNS)}) values %s",
+                    [tuple(row[column] for column in HISTORY_COLUMNS) for row in rows],
+                    page_size=len(rows),
+                )
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            pool.putconn(connection)
+
+    def is_row_error(self, exc: Exception) -> bool:
+        return not isinstance(
+            exc, (psycopg2.OperationalError, psycopg2.InterfaceError, PoolError)
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            if self._pool is not None:
+                self._pool.closeall()
+                self._pool = None
+
+
+class SQLiteSink(MonitoringSink):
+    """Inserts calls in a local sqlite `history` table, eg: for tests
+
+    Args:
+        path (str): path of the sqlite database, in memory by default
+    """
+
+    def __init__(self, path: str = ":memory:") -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self.connection:
+            self.connection.execute(
+                f"CREATE TABLE IF NOT EXISTS history ({','.join(HISTORY_COLUMNS)})"
+            )
+
+    def write_batch(self, rows: List[Dict[str, Any]]) -> None:
+        placeholders = ",".join("?" * len(HISTORY_COLUMNS))
+        with self._lock, self.connection:
+            self.connection.executemany(
+                f"INSERT INTO history ({','.join(HISTORY_COLUMNS)}) VALUES ({placeholders})",
+                [
+                    tuple(
+                        str(row[column]) if isinstance(row[column], datetime) else row[column]
+                        for column in HISTORY_COLUMNS
+                    )
+                    for row in rows
+                ],
+            )
+
+    def rows(self) -> List[Dict[str, Any]]:
+        """Return all inserted calls"""
+        with self._lock:
+            cursor = self.connection.execute(
+                f"SELECT {','.join(HISTORY_COLUMNS)} FROM history"
+            )
+            return [dict(zip(HISTORY_COLUMNS, row)) for row in cursor.fetchall()]
+
+    def close(self) -> None:
+        with self._lock:
+            self.connection.close()
+
+
+class MonitoringQueue:
+    """Bounded queue of calls drained by a background thread writing batches to a sink.
+    A batch is written when it reaches `batch_size` calls or `flush_interval` seconds
+    after its first call.
+
+    Args:
+        sink (MonitoringSink): where calls are written
+        max_size (int): max number of calls waiting in the queue
+        batch_size (int): max number of calls written at once
+        flush_interval (float): max time (seconds) a call waits before being written
+        drop_policy (str): when the queue is full, `drop_newest` drops the new call,
+            `drop_oldest` drops the oldest waiting call and `block` waits for space
+    """
+
+    def __init__(
+        self,
+        sink: MonitoringSink,
+        max_size: int = DEFAULT_QUEUE_SIZE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        drop_policy: DropPolicy = DEFAULT_DROP_POLICY,
+    ) -> None:
+        if drop_policy not in ("drop_newest", "drop_oldest", "block"):
+            raise ValueError(f"Unknown monitoring drop policy `{drop_policy}`")
+        self.sink = sink
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.drop_policy = drop_policy
+        self._calls: Deque[Dict[str, Any]] = deque()
+        self._condition = threading.Condition()
+        self.enqueued = 0
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+        # number of enqueued calls written, failed or dropped from the queue
+        self._handled = 0
+        self._flush_waiters = 0
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name="edenai_apis_monitoring", daemon=True
+        )
+        self._thread.start()
+
+    def put(self, row: Dict[str, Any]) -> bool:
+        """Add a call to the queue, never waits unless the drop policy is `block`.
+        Returns False if the call was dropped"""
+        with self._condition:
+            if len(self._calls) >= self.max_size and not self._closed:
+                if self.drop_policy == "drop_newest":
+                    self.dropped += 1
+                    return False
+                if self.drop_policy == "drop_oldest":
+                    self._calls.popleft()
+                    self.dropped += 1
+                    self._handled += 1
+                else:
+                    while len(self._calls) >= self.max_size and not self._closed:
+                        self._condition.wait()
+            if self._closed:
+                self.dropped += 1
+                return False
+            self._calls.append(row)
+            self.enqueued += 1
+            self._condition.notify_all()
+        return True
+
+    def _write_rows(self, rows: List[Dict[str, Any]]) -> Tuple[int, int]:
+        """Write rows, splitting them in halves when the sink rejects some of them.
+        Returns the numbers of written and failed rows"""
+        try:
+            self.sink.write_batch(rows)
+            return len(rows), 0
+        except Exception as exc:  # the worker must never die
+            if len(rows) == 1 or not self.sink.is_row_error(exc):
+                print(f"Monitoring: could not insert {len(rows)} calls: {exc}")
+                return 0, len(rows)
+        middle = len(rows) // 2
+        written, failed = self._write_rows(rows[:middle])
+        other_written, other_failed = self._write_rows(rows[middle:])
+        return written + other_written, failed + other_failed
+
+    def _write(self, batch: List[Dict[str, Any]]) -> None:
+        written, failed = self._write_rows(batch)
+        with self._condition:
+            self.written += written
+            self.failed += failed
+            self._handled += len(batch)
+            self._condition.notify_all()
+
+    def _next_batch(self) -> Optional[List[Dict[str, Any]]]:
+        """Wait for a full batch, the flush interval, a flush or close.
+        Returns None when the queue is closed and empty"""
+        with self._condition:
+            while not self._calls and not self._closed:
+                self._condition.wait()
+            deadline = time.monotonic() + self.flush_interval
+            while (
+                len(self._calls) < self.batch_size
+                and not self._flush_waiters
+                and not self._closed
+            ):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+            if not self._calls:
+                return None
+            batch = [
+                self._calls.popleft()
+                for _ in range(min(self.batch_size, len(self._calls)))
+            ]
+            # room was made for `block` producers
+            self._condition.notify_all()
+            return batch
+
+    def _run(self) -> None:
+        if isinstance(self.sink, PostgresSink):
+            # warm the providers cost cache, it is then refreshed in the background
+            print("Download providers price from s3")
+            try:
+                get_providers_cost()
+            except Exception as exc:
+                print(f"Monitoring: could not download providers price: {exc}")
+
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            self._write(batch)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the calls queued so far to be written.
+        Returns False if the timeout expired"""
+        with self._condition:
+            target = self.enqueued
+            self._flush_waiters += 1
+            self._condition.notify_all()
+            try:
+                return self._condition.wait_for(
+                    lambda: self._handled >= target or not self._thread.is_alive(),
+                    timeout,
+                ) and self._handled >= target
+            finally:
+                self._flush_waiters -= 1
+
+    def close(self, timeout: Optional[float] = 10) -> None:
+        """Write the waiting calls, stop the worker and close the sink"""
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join(timeout)
+        self.sink.close()
+
+    def stats(self) -> Dict[str, int]:
+        with self._condition:
+            return {
+                "queued": len(self._calls),
+                "enqueued": self.enqueued,
+                "written": self.written,
+                "dropped": self.dropped,
+                "failed": self.failed,
+            }
+
+
+_MONITORING_QUEUE: Optional[MonitoringQueue] = None
+_MONITORING_QUEUE_LOCK = threading.Lock()
+
+
+def get_monitoring_queue() -> MonitoringQueue:
+    """Return the global monitoring queue, writing to postgres by default"""
+    global _MONITORING_QUEUE
+    if _MONITORING_QUEUE is None:
+        with _MONITORING_QUEUE_LOCK:
+            if _MONITORING_QUEUE is None:
+                _MONITORING_QUEUE = MonitoringQueue(PostgresSink())
+    return _MONITORING_QUEUE
+
+
+def set_monitoring_sink(sink: MonitoringSink, **queue_kwargs) -> MonitoringQueue:
+    """Replace the global monitoring queue by a new one writing to `sink`,
+    the previous queue is flushed and closed"""
+    global _MONITORING_QUEUE
+    with _MONITORING_QUEUE_LOCK:
+        previous, _MONITORING_QUEUE = _MONITORING_QUEUE, MonitoringQueue(
+            sink, **queue_kwargs
+        )
+    if previous is not None:
+        previous.close()
+    return _MONITORING_QUEUE
+
+
+def flush_monitoring(timeout: Optional[float] = None) -> bool:
+    """Wait for the monitored calls queued so far to be inserted"""
+    if _MONITORING_QUEUE is None:
+        return True
+    return _MONITORING_QUEUE.flush(timeout)
+
+
+@atexit.register
+def close_monitoring() -> None:
+    """Insert the waiting calls and close the global monitoring queue"""
+    global _MONITORING_QUEUE
+    with _MONITORING_QUEUE_LOCK:
+        previous, _MONITORING_QUEUE = _MONITORING_QUEUE, None
+    if previous is not None:
+        previous.close()
+
+
 def insert_api_call(
     provider: str,
     feature: str,
@@ -88,20 +510,7 @@ def insert_api_call(
     user_email: Optional[str],
     error: Optional[str],
 ):
-    global POSTGRES_CONNECTION
-    if not "POSTGRES_CONNECTION" in globals():
-        rds_settings = load_provider(ProviderDataEnum.KEY, "rds")
-        # Connect to your postgres DB
-        POSTGRES_CONNECTION = psycopg2.connect(
-            f"dbname=history_db user={rds_settings['write_only_user']} "
-            + f"password={rds_settings['write_only_password']} host={rds_settings['host']}"
-        )
-        print("Connect to postgres history ok")
-    global INFOS_FROM_S3
-    if not "INFOS_FROM_S3" in globals():
-        print("Download providers price from s3")
-        INFOS_FROM_S3 = get_providers_json_from_s3()
-
+    """Queue a call to be inserted in the history by the monitoring worker"""
     to_insert = {
         "provider": provider,
         "feature": feature,
@@ -115,19 +524,8 @@ def insert_api_call(
         "error": error,
         "host_user": getpass.getuser(),
     }
-
-    columns = to_insert.keys()
-    values = [to_insert[column] for column in columns]
-
-    insert_statement = "insert into history (%s) values %s"
-
-    # Open a cursor to perform database operations
-    try:
-        cur = POSTGRES_CONNECTION.cursor()
-        cur.execute(insert_statement, (AsIs(",".join(columns)), tuple(values)))
-        POSTGRES_CONNECTION.commit()  # <--- makes sure the change is shown in the database
-    except errors.InFailedSqlTransaction as exc:
-        print(exc)
-        POSTGRES_CONNECTION.rollback()
-
-    cur.close()
+    for column, max_length in HISTORY_COLUMNS_MAX_LENGTH.items():
+        value = to_insert[column]
+        if isinstance(value, str) and len(value) > max_length:
+            to_insert[column] = value[:max_length]
+    get_monitoring_queue().put(to_insert)
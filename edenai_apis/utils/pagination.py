@@ -0,0 +1,80 @@
+"""
+Pipelined pagination of providers results.
+
+Paginated results (eg: Amazon Rekognition/Textract `NextToken`) are fetched one page
+after the other, since the token of a page is needed to request the next one. The
+request of the next page is however started as soon as a page is received, on a
+shared thread pool, so it overlaps with the parsing of the current page by the
+caller.
+
+    >>> for page in iter_pages(lambda token: client.get_label_detection(...)):
+    ...     labels.extend(parse(page))
+
+The pool size is set with the `PAGINATION_MAX_WORKERS` environment variable (8 by
+default), each iteration has at most one page request in flight.
+"""
+import contextvars
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, Optional, TypeVar
+
+PAGINATION_MAX_WORKERS = int(os.environ.get("PAGINATION_MAX_WORKERS", 8))
+_PAGINATION_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_PAGINATION_EXECUTOR_LOCK = threading.Lock()
+
+T = TypeVar("T")
+
+
+def _get_pagination_executor() -> ThreadPoolExecutor:
+    global _PAGINATION_EXECUTOR
+    if _PAGINATION_EXECUTOR is None:
+        with _PAGINATION_EXECUTOR_LOCK:
+            if _PAGINATION_EXECUTOR is None:
+                _PAGINATION_EXECUTOR = ThreadPoolExecutor(
+                    max_workers=PAGINATION_MAX_WORKERS,
+                    thread_name_prefix="edenai_apis_pagination",
+                )
+    return _PAGINATION_EXECUTOR
+
+
+def iter_pages(
+    fetch_page: Callable[[Optional[str]], Dict],
+    first_page: Optional[Dict] = None,
+    token_key: str = "NextToken",
+    prefetch: bool = True,
+) -> Iterator[Dict]:
+    """Yield all the pages of a paginated result.
+
+    Args:
+        fetch_page (Callable): return the page of the given token (None for the
+            first page). Exceptions are raised when the page is reached.
+        first_page (dict): first page, if it was already fetched
+        token_key (str): key of the next page token in the pages
+        prefetch (bool): request the next page while the current one is consumed
+    """
+    page = fetch_page(None) if first_page is None else first_page
+    while True:
+        token = page.get(token_key)
+        next_page: Optional[Future] = None
+        if token and prefetch:
+            context = contextvars.copy_context()
+            next_page = _get_pagination_executor().submit(
+                context.run, fetch_page, token
+            )
+        try:
+            yield page
+        except GeneratorExit:
+            # the caller stopped, the prefetched page is not needed
+            if next_page is not None:
+                next_page.cancel()
+            raise
+        if not token:
+            return
+        page = next_page.result() if next_page is not None else fetch_page(token)
+
+
+def iter_items(pages: Iterable[Dict], parser: Callable[[Dict], Iterable[T]]) -> Iterator[T]:
+    """Yield the standardized items of each page as soon as the page is received"""
+    for page in pages:
+        yield from parser(page)
@@ -0,0 +1,172 @@
+"""
+Pool of instantiated provider classes.
+
+Building a provider class can be expensive (eg: `AmazonApi` creates all its boto3
+clients, `GoogleApi` creates its gRPC clients and initialize aiplatform), so instances
+are kept in a bounded LRU pool keyed on the provider name and a fingerprint of the
+api_keys used to build them.
+
+Pooled instances are shared between threads, providers keeping per-call state on
+their instance (eg: a token renewed or a workspace selected during a call) set
+`poolable = False` and get a new instance on each call.
+
+The pool can be tuned with the following environment variables:
+    - `PROVIDER_POOL_SIZE`: max number of instances kept in memory (0 disables the pool)
+    - `PROVIDER_POOL_TTL`: lifetime of an instance in seconds (0 means no expiration)
+
+When a user rotates its keys, call `invalidate_provider_instances` to drop the
+instances built with the old keys.
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple, Type
+
+from edenai_apis.features.provider.provider_interface import ProviderInterface
+from edenai_apis.loaders.data_loader import ProviderDataEnum
+from edenai_apis.loaders.loaders import load_provider
+
+DEFAULT_POOL_SIZE = int(os.environ.get("PROVIDER_POOL_SIZE", 256))
+DEFAULT_POOL_TTL = float(os.environ.get("PROVIDER_POOL_TTL", 3600))
+
+PoolKey = Tuple[str, str]
+
+
+def api_keys_fingerprint(api_keys: Optional[Dict]) -> str:
+    """Return a stable hash of the given api_keys, the raw keys are never stored"""
+    if not api_keys:
+        return ""
+    serialized = json.dumps(api_keys, sort_keys=True, default=str)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+class ProviderInstancePool:
+    """Thread-safe LRU/TTL pool of provider instances
+
+    Args:
+        max_size (int): max number of instances kept, 0 disables the pool
+        ttl (float): instances lifetime in seconds, 0 means instances never expire
+    """
+
+    def __init__(
+        self, max_size: int = DEFAULT_POOL_SIZE, ttl: float = DEFAULT_POOL_TTL
+    ) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self._instances: "OrderedDict[PoolKey, Tuple[ProviderInterface, float]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _is_expired(self, created_at: float) -> bool:
+        return self.ttl > 0 and time.monotonic() - created_at > self.ttl
+
+    def get(
+        self, provider_name: str, api_keys: Optional[Dict] = None
+    ) -> ProviderInterface:
+        """Return a provider instance for the given api_keys, building it if needed"""
+        ProviderClass: Type[ProviderInterface] = load_provider(
+            ProviderDataEnum.CLASS, provider_name=provider_name
+        )
+        if self.max_size <= 0 or not getattr(ProviderClass, "poolable", True):
+            return ProviderClass(api_keys or {})
+
+        key = (provider_name, api_keys_fingerprint(api_keys))
+        with self._lock:
+            cached = self._instances.get(key)
+            if cached is not None and not self._is_expired(cached[1]):
+                self._instances.move_to_end(key)
+                self.hits += 1
+                return cached[0]
+            if cached is not None:
+                del self._instances[key]
+                self.evictions += 1
+            self.misses += 1
+
+        # build the instance outside the lock, provider constructors may be slow
+        instance = ProviderClass(api_keys or {})
+
+        with self._lock:
+            # another thread may have built the same instance in the meantime
+            cached = self._instances.get(key)
+            if cached is not None and not self._is_expired(cached[1]):
+                self._instances.move_to_end(key)
+                return cached[0]
+            self._instances[key] = (instance, time.monotonic())
+            while len(self._instances) > self.max_size:
+                self._instances.popitem(last=False)
+                self.evictions += 1
+        return instance
+
+    def invalidate(
+        self, provider_name: Optional[str] = None, api_keys: Optional[Dict] = None
+    ) -> int:
+        """Drop pooled instances
+
+        Args:
+            provider_name (str, optional): only drop instances of this provider
+            api_keys (Dict, optional): only drop instances built with these api_keys
+
+        Returns:
+            int: number of dropped instances
+        """
+        fingerprint = api_keys_fingerprint(api_keys) if api_keys is not None else None
+        with self._lock:
+            to_drop = [
+                key
+                for key in self._instances
+                if (provider_name is None or key[0] == provider_name)
+                and (fingerprint is None or key[1] == fingerprint)
+            ]
+            for key in to_drop:
+                del self._instances[key]
+        return len(to_drop)
+
+    def clear(self) -> None:
+        """Drop all instances and reset stats"""
+        with self._lock:
+            self._instances.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self) -> Dict[str, float]:
+        """Return pool hits/misses stats"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._instances),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
+
+
+PROVIDER_POOL = ProviderInstancePool()
+
+
+def get_provider_instance(
+    provider_name: str, api_keys: Optional[Dict] = None
+) -> ProviderInterface:
+    """Get a (possibly shared) instance of the provider class from the global pool"""
+    return PROVIDER_POOL.get(provider_name, api_keys)
+
+
+def invalidate_provider_instances(
+    provider_name: Optional[str] = None, api_keys: Optional[Dict] = None
+) -> int:
+    """Drop instances from the global pool, eg: after a key rotation"""
+    return PROVIDER_POOL.invalidate(provider_name, api_keys)
+
+
+def provider_pool_stats() -> Dict[str, float]:
+    """Return the global pool stats"""
+    return PROVIDER_POOL.stats()
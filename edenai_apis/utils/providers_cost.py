@@ -0,0 +1,105 @@
+"""
+Cache of the providers cost table (`providers_cost_master.json` on s3).
+
+The table is downloaded once and refreshed every `PROVIDERS_COST_TTL` seconds
+(3600 by default) by a background thread, so readers never wait for s3 once the
+table is loaded. If a refresh fails, the previous table is kept until the next one.
+
+    >>> from edenai_apis.utils.providers_cost import get_providers_cost
+    >>> cost_data = get_providers_cost()
+"""
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from edenai_apis.utils.upload_s3 import get_providers_json_from_s3
+
+DEFAULT_COST_TTL = float(os.environ.get("PROVIDERS_COST_TTL", 3600))
+
+
+class ProvidersCostCache:
+    """TTL cache of the providers cost table with a background refresher
+
+    Args:
+        ttl (float): seconds between two refreshes
+        loader (Callable): function downloading the table
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_COST_TTL,
+        loader: Callable[[], Dict[str, Any]] = get_providers_json_from_s3,
+    ) -> None:
+        self.ttl = ttl
+        self.loader = loader
+        self._table: Optional[Dict[str, Any]] = None
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._refresher: Optional[threading.Thread] = None
+
+    def _is_stale(self) -> bool:
+        return time.monotonic() - self._loaded_at > self.ttl
+
+    def refresh(self) -> Dict[str, Any]:
+        """Download the table now"""
+        table = self.loader()
+        with self._lock:
+            self._table = table
+            self._loaded_at = time.monotonic()
+        return table
+
+    def get(self) -> Dict[str, Any]:
+        """Return the cost table, only the first call waits for the download.
+        A stale table is returned while the refresher updates it."""
+        table = self._table
+        if table is None:
+            with self._lock:
+                table = self._table
+            if table is None:
+                table = self.refresh()
+        self.start_refresher()
+        if self._is_stale() and not self._refresher_alive():
+            # no refresher (eg: stopped), refresh synchronously
+            table = self.refresh()
+        return table
+
+    def _refresher_alive(self) -> bool:
+        return self._refresher is not None and self._refresher.is_alive()
+
+    def _run(self) -> None:
+        while not self._stop.wait(
+            max(self.ttl - (time.monotonic() - self._loaded_at), 0)
+        ):
+            try:
+                self.refresh()
+            except Exception as exc:  # keep the previous table
+                print(f"Could not refresh providers cost: {exc}")
+                self._stop.wait(min(self.ttl, 60))
+
+    def start_refresher(self) -> None:
+        """Start the background refresher thread if needed"""
+        if self._refresher_alive() or self._stop.is_set():
+            return
+        with self._lock:
+            if self._refresher_alive():
+                return
+            self._refresher = threading.Thread(
+                target=self._run, name="edenai_apis_providers_cost", daemon=True
+            )
+            self._refresher.start()
+
+    def stop(self) -> None:
+        """Stop the background refresher"""
+        self._stop.set()
+        if self._refresher is not None:
+            self._refresher.join(timeout=1)
+
+
+PROVIDERS_COST = ProvidersCostCache()
+
+
+def get_providers_cost() -> Dict[str, Any]:
+    """Return the (cached) providers cost table"""
+    return PROVIDERS_COST.get()
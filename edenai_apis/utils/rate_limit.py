@@ -0,0 +1,91 @@
+"""
+Token buckets to rate limit calls made to providers.
+
+A bucket holds at most `capacity` tokens and is refilled at `rate` tokens per
+second. `try_acquire` never blocks and tells how long to wait when the tokens
+are not available, so schedulers can plan the call instead of sleeping.
+
+    >>> bucket = TokenBucket(rate=5)  # 5 calls per second
+    >>> bucket.acquire()
+"""
+import threading
+import time
+from typing import Dict, Optional
+
+
+class TokenBucket:
+    """Thread-safe token bucket
+
+    Args:
+        rate (float): tokens added per second, 0 or less means unlimited
+        capacity (float): max tokens, default to `rate` (one second of burst)
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None) -> None:
+        self.rate = rate
+        self.capacity = max(capacity if capacity is not None else rate, 1)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated_at) * self.rate
+        )
+        self._updated_at = now
+
+    def try_acquire(self, tokens: float = 1) -> float:
+        """Take `tokens` if available.
+
+        Returns:
+            float: 0 when the tokens were taken, otherwise the seconds to wait
+            before they are available (nothing is taken)
+        """
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            self._refill(time.monotonic())
+            # a request bigger than the bucket waits for a full bucket
+            tokens = min(tokens, self.capacity)
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+            return (tokens - self._tokens) / self.rate
+
+    def release(self, tokens: float) -> None:
+        """Give back `tokens` taken in excess, or take more (negative `tokens`) when a
+        call cost more than what was acquired. The bucket can then be in debt."""
+        if self.rate <= 0:
+            return
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self.capacity, self._tokens + tokens)
+
+    def drain(self) -> None:
+        """Empty the bucket, eg: when the provider answered that the limit is reached"""
+        with self._lock:
+            self._tokens = 0
+            self._updated_at = time.monotonic()
+
+    def acquire(self, tokens: float = 1, timeout: Optional[float] = None) -> bool:
+        """Block until `tokens` are taken, or `timeout` seconds are elapsed"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = self.try_acquire(tokens)
+            if not wait:
+                return True
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining < wait:
+                    return False
+            time.sleep(wait)
+
+
+def parse_rate_limits(value: Optional[str]) -> Dict[str, float]:
+    """Parse rate limits given as `provider:rate` pairs, e.g. `amazon:5,openai:2.5`"""
+    limits = {}
+    for item in (value or "").split(","):
+        name, _, rate = item.rpartition(":")
+        if name.strip() and rate.strip():
+            limits[name.strip()] = float(rate)
+    return limits
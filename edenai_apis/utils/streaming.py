@@ -0,0 +1,433 @@
+"""
+Incremental parsing of streamed providers responses.
+
+Chat providers stream their answer as server-sent events (`data: {...}` frames
+separated by blank lines), as newline-delimited json, or as a json array sent element
+by element. The parsers below read the http response as it is received (the request
+must be sent with `stream=True`), so that each token is yielded as soon as its frame is
+complete:
+
+    >>> response = http_client.post(url, json=payload, headers=headers, stream=True)
+    >>> for data in iter_sse_json(response):
+    ...     yield ChatStreamResponse(text=data["choices"][0]["delta"]["content"], ...)
+
+Frames split across network chunks are buffered until they are complete, keep-alive
+comments and empty lines are skipped, and the connection is closed when the stream
+ends or when the consumer stops iterating.
+
+`OutputStream` wraps the chunks of a streamed response for the consumers of
+`interface.compute_output_stream`: chunks are read from the provider when the
+consumer asks for them (or at most `STREAM_BUFFER_SIZE` chunks ahead of it), the
+stream can be cancelled from any thread, and a hook is called once it is over.
+The chunks of an `async for` loop are read on a thread pool dedicated to streams
+(`STREAM_MAX_WORKERS` threads): a stream holds its thread while it waits for the next
+token, it must not take the threads of the providers calls.
+"""
+import asyncio
+import json
+import os
+import queue
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Callable, Generic, Iterable, Iterator, Optional, TypeVar, Union
+
+import requests
+
+from edenai_apis.utils.exception import ProviderException
+
+SSE_DONE = "[DONE]"
+
+# number of chunks read ahead of the consumer by an `OutputStream` (0: read on demand)
+STREAM_BUFFER_SIZE = int(os.environ.get("STREAM_BUFFER_SIZE", 0))
+# seconds between two checks of the cancellation while waiting for a buffered chunk
+STREAM_CANCEL_CHECK_INTERVAL = 0.1
+# max number of streams read at the same time by `async for` loops
+STREAM_MAX_WORKERS = int(os.environ.get("STREAM_MAX_WORKERS", 64))
+_STREAM_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_STREAM_EXECUTOR_LOCK = threading.Lock()
+
+Line = Union[bytes, str]
+T = TypeVar("T")
+
+
+class ServerSentEvent:
+    """An event of a `text/event-stream` response"""
+
+    __slots__ = ("event", "data", "id", "retry")
+
+    def __init__(
+        self,
+        event: str = "message",
+        data: str = "",
+        id: Optional[str] = None,
+        retry: Optional[int] = None,
+    ) -> None:
+        self.event = event
+        self.data = data
+        self.id = id
+        self.retry = retry
+
+    def json(self) -> Any:
+        try:
+            return json.loads(self.data)
+        except json.JSONDecodeError as exc:
+            raise ProviderException(f"Invalid stream event: {self.data}") from exc
+
+    def __repr__(self) -> str:
+        return f"ServerSentEvent(event={self.event!r}, data={self.data!r})"
+
+
+def _decode(line: Line) -> str:
+    return line.decode("utf-8") if isinstance(line, bytes) else line
+
+
+def parse_sse_lines(lines: Iterable[Line]) -> Iterator[ServerSentEvent]:
+    """Yield the events of a server-sent events stream, given its lines.
+
+    An event is dispatched on a blank line (or at the end of the stream), the `data`
+    lines of an event are joined with new lines and comments (`: keep-alive`) ignored.
+    """
+    event, data, event_id, retry = "", [], None, None
+    for raw_line in lines:
+        line = _decode(raw_line).rstrip("\r")
+        if not line:
+            if data or event:
+                yield ServerSentEvent(event or "message", "\n".join(data), event_id, retry)
+            event, data, retry = "", [], None
+            continue
+        if line.startswith(":"):
+            continue
+        field, _, value = line.partition(":")
+        if value.startswith(" "):
+            value = value[1:]
+        if field == "data":
+            data.append(value)
+        elif field == "event":
+            event = value
+        elif field == "id":
+            event_id = value
+        elif field == "retry" and value.isdigit():
+            retry = int(value)
+    if data or event:
+        yield ServerSentEvent(event or "message", "\n".join(data), event_id, retry)
+
+
+def parse_ndjson_lines(lines: Iterable[Line]) -> Iterator[Any]:
+    """Yield the json objects of a newline-delimited json stream"""
+    for raw_line in lines:
+        line = _decode(raw_line).strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as exc:
+            raise ProviderException(f"Invalid stream line: {line}") from exc
+
+
+def parse_json_array_chunks(chunks: Iterable[Line]) -> Iterator[Any]:
+    """Yield the elements of a json array (`[{...},{...}]`) as soon as each of them
+    is received, whatever the way the array is split in chunks"""
+    decoder = json.JSONDecoder()
+    buffer = ""
+    started = False
+    for chunk in chunks:
+        buffer += _decode(chunk)
+        while True:
+            buffer = buffer.lstrip()
+            if not started:
+                if not buffer:
+                    break
+                if buffer[0] != "[":
+                    raise ProviderException(f"Invalid stream data: {buffer}")
+                started = True
+                buffer = buffer[1:]
+                continue
+            if buffer[:1] in (",", "]"):
+                buffer = buffer[1:]
+                continue
+            if not buffer:
+                break
+            try:
+                element, end = decoder.raw_decode(buffer)
+            except json.JSONDecodeError:
+                # element not fully received yet
+                break
+            buffer = buffer[end:]
+            yield element
+    if buffer.strip():
+        raise ProviderException(f"Invalid stream data: {buffer}")
+
+
+def split_lines(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Yield the lines (`\n` or `\r\n` terminated) of a stream of chunks, lines split
+    across chunks are buffered until they are complete"""
+    pending = b""
+    for chunk in chunks:
+        if not chunk:
+            continue
+        *lines, pending = (pending + chunk).split(b"\n")
+        for line in lines:
+            yield line[:-1] if line.endswith(b"\r") else line
+    if pending:
+        yield pending
+
+
+def _response_lines(response: requests.Response) -> Iterator[bytes]:
+    # chunk_size=None: read the data as it arrives instead of filling fixed size chunks
+    return split_lines(response.iter_content(chunk_size=None))
+
+
+def iter_sse_events(response: requests.Response) -> Iterator[ServerSentEvent]:
+    """Yield the server-sent events of a streamed response, the response is closed
+    when the iteration ends or is abandoned"""
+    try:
+        yield from parse_sse_lines(_response_lines(response))
+    finally:
+        response.close()
+
+
+def iter_sse_json(
+    response: requests.Response, done: Optional[str] = SSE_DONE
+) -> Iterator[Any]:
+    """Yield the json data of the server-sent events of a streamed response, until
+    the `done` data (eg: openai-like `data: [DONE]`)"""
+    try:
+        for event in parse_sse_lines(_response_lines(response)):
+            if not event.data:
+                continue
+            if done is not None and event.data == done:
+                return
+            yield event.json()
+    finally:
+        response.close()
+
+
+def iter_ndjson(response: requests.Response) -> Iterator[Any]:
+    """Yield the json objects of a streamed newline-delimited json response"""
+    try:
+        yield from parse_ndjson_lines(_response_lines(response))
+    finally:
+        response.close()
+
+
+def iter_json_array(response: requests.Response) -> Iterator[Any]:
+    """Yield the elements of a streamed json array response"""
+    try:
+        yield from parse_json_array_chunks(response.iter_content(chunk_size=None))
+    finally:
+        response.close()
+
+
+_END = object()
+
+
+class _Failure:
+    __slots__ = ("exception",)
+
+    def __init__(self, exception: BaseException) -> None:
+        self.exception = exception
+
+
+def _close_chunks(chunks: Iterator) -> None:
+    close = getattr(chunks, "close", None)
+    if close is not None:
+        close()
+
+
+def _put(buffer: queue.Queue, item: Any, cancel_event: threading.Event) -> bool:
+    """Wait for room in the buffer, False if the stream was cancelled"""
+    while not cancel_event.is_set():
+        try:
+            buffer.put(item, timeout=STREAM_CANCEL_CHECK_INTERVAL)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _fill_buffer(
+    chunks: Iterator, buffer: queue.Queue, cancel_event: threading.Event
+) -> None:
+    # does not reference the stream, so that an abandoned stream is garbage
+    # collected and cancelled, which stops this thread
+    try:
+        for chunk in chunks:
+            if not _put(buffer, chunk, cancel_event):
+                return
+        _put(buffer, _END, cancel_event)
+    except Exception as exc:
+        _put(buffer, _Failure(exc), cancel_event)
+    finally:
+        _close_chunks(chunks)
+
+
+def _get_stream_executor() -> ThreadPoolExecutor:
+    global _STREAM_EXECUTOR
+    if _STREAM_EXECUTOR is None:
+        with _STREAM_EXECUTOR_LOCK:
+            if _STREAM_EXECUTOR is None:
+                _STREAM_EXECUTOR = ThreadPoolExecutor(
+                    max_workers=STREAM_MAX_WORKERS,
+                    thread_name_prefix="edenai_apis_stream_reader",
+                )
+    return _STREAM_EXECUTOR
+
+
+class OutputStream(Generic[T]):
+    """Iterator (sync and async) over the chunks of a streamed provider response
+
+    A stream abandoned by its consumer (eg: client disconnected) is cancelled when it
+    is garbage collected.
+
+    Args:
+        chunks (Iterator): chunks of the provider response, eg: `StreamChat.stream`
+        buffer_size (int): chunks read ahead of the consumer by a background thread,
+            it stops reading the provider when the buffer is full. With 0, a chunk is
+            read from the provider each time the consumer asks for one.
+        on_complete (Callable): called once with the stream and the exception (None
+            if the stream ended or was cancelled) when the stream is over
+        map_error (Callable): transform the exceptions raised by the provider
+        cancel_event (threading.Event): cancels the stream when set
+        executor (Executor): runs the blocking reads of `async for` loops, default to
+            the thread pool of the streams
+    """
+
+    def __init__(
+        self,
+        chunks: Iterator[T],
+        buffer_size: int = STREAM_BUFFER_SIZE,
+        on_complete: Optional[
+            Callable[["OutputStream", Optional[BaseException]], None]
+        ] = None,
+        map_error: Optional[Callable[[BaseException], BaseException]] = None,
+        cancel_event: Optional[threading.Event] = None,
+        executor: Optional[Executor] = None,
+    ) -> None:
+        self._chunks = iter(chunks)
+        self.buffer_size = buffer_size
+        self._on_complete = on_complete
+        self._map_error = map_error
+        self._cancel_event = cancel_event or threading.Event()
+        self._executor = executor
+        self._lock = threading.Lock()
+        # held while the provider chunks are read in the consumer thread
+        self._reading = threading.Lock()
+        self._completed = False
+        self.chunks_count = 0
+        self.error: Optional[BaseException] = None
+        self._buffer: Optional[queue.Queue] = None
+        if buffer_size > 0:
+            self._buffer = queue.Queue(maxsize=buffer_size)
+            threading.Thread(
+                target=_fill_buffer,
+                args=(self._chunks, self._buffer, self._cancel_event),
+                name="edenai_apis_stream",
+                daemon=True,
+            ).start()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    @property
+    def done(self) -> bool:
+        return self._completed
+
+    def _complete(self, error: Optional[BaseException] = None) -> None:
+        with self._lock:
+            if self._completed:
+                return
+            self._completed = True
+            self.error = error
+        if self._on_complete is not None:
+            try:
+                self._on_complete(self, error)
+            except Exception as exc:  # a failing hook must not break the stream
+                print(f"Stream completion hook failed: {exc}")
+
+    def _read(self) -> Any:
+        if self._buffer is None:
+            with self._reading:
+                if self.cancelled:
+                    _close_chunks(self._chunks)
+                    return _END
+                try:
+                    return next(self._chunks)
+                except StopIteration:
+                    return _END
+                except Exception as exc:
+                    return _Failure(exc)
+                finally:
+                    # cancelled while reading: cancel() could not close the chunks
+                    if self.cancelled:
+                        _close_chunks(self._chunks)
+        while not self.cancelled:
+            try:
+                return self._buffer.get(timeout=STREAM_CANCEL_CHECK_INTERVAL)
+            except queue.Empty:
+                continue
+        return _END
+
+    def _next_or_end(self) -> Any:
+        if self._completed:
+            return _END
+        item = self._read()
+        if item is _END:
+            self._complete()
+            return _END
+        if isinstance(item, _Failure):
+            error = item.exception
+            if self._map_error is not None:
+                error = self._map_error(error)
+            self._complete(error)
+            raise error
+        self.chunks_count += 1
+        return item
+
+    def __iter__(self) -> "OutputStream[T]":
+        return self
+
+    def __next__(self) -> T:
+        item = self._next_or_end()
+        if item is _END:
+            raise StopIteration
+        return item
+
+    def __aiter__(self) -> "OutputStream[T]":
+        return self
+
+    async def __anext__(self) -> T:
+        loop = asyncio.get_running_loop()
+        try:
+            item = await loop.run_in_executor(
+                self._executor or _get_stream_executor(), self._next_or_end
+            )
+        except asyncio.CancelledError:
+            self.cancel()
+            raise
+        if item is _END:
+            raise StopAsyncIteration
+        return item
+
+    def cancel(self) -> None:
+        """Stop the stream and close the provider response. A chunk being read is
+        still received, the stream then ends."""
+        self._cancel_event.set()
+        if self._buffer is None and self._reading.acquire(blocking=False):
+            try:
+                _close_chunks(self._chunks)
+            finally:
+                self._reading.release()
+        self._complete()
+
+    close = cancel
+
+    def __del__(self) -> None:
+        if not getattr(self, "_completed", True):
+            self.cancel()
+
+    def __enter__(self) -> "OutputStream[T]":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.cancel()
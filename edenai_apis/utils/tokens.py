@@ -0,0 +1,15 @@
+"""
+Local token count estimation, used to respect providers tokens limits
+without calling their tokenizers.
+"""
+import math
+
+# English text averages ~4 characters per token with BPE tokenizers (tiktoken, sentencepiece)
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Return an estimation of the number of tokens of a text"""
+    if not text:
+        return 0
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
@@ -1,8 +1,11 @@
 import datetime
+import functools
 import json
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
-from typing import Callable, Tuple
+from typing import Callable, Iterable, Optional, Tuple
 from uuid import uuid4
 
 import boto3
@@ -27,6 +30,13 @@ USER_PROCESS = "users_process"
 URL_SHORT_PERIOD = 3600
 URL_LONG_PERIOD = 3600 * 24 * 7
 
+# s3 multipart uploads parts must be at least 5MB (except the last one)
+S3_MIN_PART_SIZE = 5 * 1024 * 1024
+S3_PART_SIZE = max(
+    int(os.environ.get("S3_PART_SIZE", 8 * 1024 * 1024)), S3_MIN_PART_SIZE
+)
+S3_UPLOAD_MAX_WORKERS = int(os.environ.get("S3_UPLOAD_MAX_WORKERS", 8))
+
 
 def set_time_and_presigned_url_process(process_type: str) -> Tuple[Callable, int, str]:
     """Returns A tuple with the adequat function to call, the url expiration time and the bucket to which
@@ -45,15 +55,43 @@ def set_time_and_presigned_url_process(process_type: str) -> Tuple[Callable, int
         return get_cloud_front_file_url, URL_LONG_PERIOD, BUCKET_RESSOURCE
 
 
-def rsa_signer(message):
+@functools.lru_cache(maxsize=1)
+def _load_cloudfront_private_key():
     with open(os.path.join(keys_path, "cloudfront_private_key.pem"), "rb") as key:
-        private_key = serialization.load_pem_private_key(
+        return serialization.load_pem_private_key(
             key.read(), password=None, backend=default_backend()
         )
+
+
+def rsa_signer(message):
+    private_key = _load_cloudfront_private_key()
     return private_key.sign(message, padding.PKCS1v15(), hashes.SHA1())
 
 
+_S3_CLIENT = None
+_S3_CLIENT_LOCK = threading.Lock()
+
+
 def s3_client_load():
+    """Return the process-wide s3 client, built once from the amazon keys.
+    boto3 clients are thread-safe so the same client is used by all uploads and presigns
+    """
+    global _S3_CLIENT
+    if _S3_CLIENT is None:
+        with _S3_CLIENT_LOCK:
+            if _S3_CLIENT is None:
+                _S3_CLIENT = _build_s3_client()
+    return _S3_CLIENT
+
+
+def reset_s3_client() -> None:
+    """Drop the cached s3 client, eg: after a key rotation"""
+    global _S3_CLIENT
+    with _S3_CLIENT_LOCK:
+        _S3_CLIENT = None
+
+
+def _build_s3_client():
     api_settings = load_provider(ProviderDataEnum.KEY, "amazon")
     aws_access_key_id = api_settings["aws_access_key_id"]
     aws_secret_access_key = api_settings["aws_secret_access_key"]
@@ -72,8 +110,18 @@ def s3_client_load():
 
 
 def upload_file_to_s3(file_path: str, file_name: str, process_type=PROVIDER_PROCESS):
-    """Upload file to s3"""
+    """Upload file to s3.
+    Files for providers are staged: a file already uploaded is not uploaded again
+    while its url is valid (see utils.upload_staging)"""
+    if process_type == PROVIDER_PROCESS:
+        # imported here, upload_staging imports this module
+        from edenai_apis.utils.upload_staging import stage_file
+
+        url = stage_file(file_path, file_name)
+        if url is not None:
+            return url
     filename = str(uuid4()) + "_" + str(file_name)
+    # load the client first, it sets the buckets names
     s3_client = s3_client_load()
     func_call, process_time, bucket = set_time_and_presigned_url_process(process_type)
     s3_client.upload_file(file_path, bucket, filename)
@@ -85,12 +133,135 @@ def upload_file_bytes_to_s3(
 ) -> str:
     """Upload file byte to s3"""
     filename = str(uuid4()) + "_" + str(file_name)
+    # load the client first, it sets the buckets names
     s3_client = s3_client_load()
     func_call, process_time, bucket = set_time_and_presigned_url_process(process_type)
     s3_client.upload_fileobj(file, bucket, filename)
     return func_call(filename, process_time)
 
 
+def _upload_chunks(
+    s3_client, chunks: Iterable[bytes], bucket: str, key: str, part_size: int
+) -> None:
+    """Upload chunks to s3, keeping at most one part in memory.
+    Small contents are sent with a single put_object."""
+    buffer = bytearray()
+    upload_id = None
+    parts = []
+    try:
+        for chunk in chunks:
+            buffer += chunk
+            if len(buffer) < part_size:
+                continue
+            if upload_id is None:
+                upload_id = s3_client.create_multipart_upload(Bucket=bucket, Key=key)[
+                    "UploadId"
+                ]
+            part_number = len(parts) + 1
+            response = s3_client.upload_part(
+                Bucket=bucket,
+                Key=key,
+                UploadId=upload_id,
+                PartNumber=part_number,
+                Body=bytes(buffer),
+            )
+            parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+            buffer = bytearray()
+
+        if upload_id is None:
+            s3_client.put_object(Bucket=bucket, Key=key, Body=bytes(buffer))
+            return
+        if buffer:
+            part_number = len(parts) + 1
+            response = s3_client.upload_part(
+                Bucket=bucket,
+                Key=key,
+                UploadId=upload_id,
+                PartNumber=part_number,
+                Body=bytes(buffer),
+            )
+            parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+        s3_client.complete_multipart_upload(
+            Bucket=bucket, Key=key, UploadId=upload_id, MultipartUpload={"Parts": parts}
+        )
+    except Exception:
+        if upload_id is not None:
+            s3_client.abort_multipart_upload(Bucket=bucket, Key=key, UploadId=upload_id)
+        raise
+
+
+def _upload_chunks_in_background(
+    s3_client, chunks, bucket, key, part_size, on_error
+) -> None:
+    try:
+        _upload_chunks(s3_client, chunks, bucket, key, part_size)
+    except Exception as exc:  # nobody waits for the result
+        print(f"Upload of {key} to s3 failed: {exc}")
+        if on_error is not None:
+            on_error(exc)
+
+
+_UPLOAD_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_UPLOAD_EXECUTOR_LOCK = threading.Lock()
+
+
+def _get_upload_executor() -> ThreadPoolExecutor:
+    global _UPLOAD_EXECUTOR
+    if _UPLOAD_EXECUTOR is None:
+        with _UPLOAD_EXECUTOR_LOCK:
+            if _UPLOAD_EXECUTOR is None:
+                _UPLOAD_EXECUTOR = ThreadPoolExecutor(
+                    max_workers=S3_UPLOAD_MAX_WORKERS,
+                    thread_name_prefix="edenai_apis_s3_upload",
+                )
+    return _UPLOAD_EXECUTOR
+
+
+def upload_stream_to_s3(
+    chunks: Iterable[bytes],
+    file_name: str,
+    process_type: str = PROVIDER_PROCESS,
+    part_size: int = S3_PART_SIZE,
+    background: bool = False,
+    on_error: Optional[Callable[[Exception], None]] = None,
+) -> str:
+    """Upload a stream of bytes chunks (eg: a provider response `iter_content()`)
+    to s3 with a multipart upload, without holding the whole content in memory.
+
+    Args:
+        chunks (Iterable[bytes]): content to upload
+        file_name (str): suffix of the s3 file name, eg: `.mp3`
+        process_type (str): `PROVIDER_PROCESS` or `USER_PROCESS`
+        part_size (int): size of the uploaded parts, at least 5MB
+        background (bool): upload in a background thread and return the url
+            right away. The url is valid as soon as the upload is done, and never
+            if the upload fails.
+        on_error (Callable, optional): called with the exception when a background
+            upload fails
+
+    Returns:
+        str: presigned url of the file
+    """
+    filename = str(uuid4()) + "_" + str(file_name)
+    # load the client first, it sets the buckets names
+    s3_client = s3_client_load()
+    func_call, process_time, bucket = set_time_and_presigned_url_process(process_type)
+    part_size = max(part_size, S3_MIN_PART_SIZE)
+    if background:
+        _get_upload_executor().submit(
+            _upload_chunks_in_background,
+            s3_client,
+            chunks,
+            bucket,
+            filename,
+            part_size,
+            on_error,
+        )
+    else:
+        _upload_chunks(s3_client, chunks, bucket, filename, part_size)
+    return func_call(filename, process_time)
+
+
 def get_cloud_front_file_url(filename: str, process_time: int) -> str:
     cloudfront_signer = CloudFrontSigner(CLOUDFRONT_KEY_ID, rsa_signer)
 
@@ -0,0 +1,339 @@
+"""
+Staging of the users files uploaded for a provider.
+
+Some providers only take an url of the file (deepgram, assembly, revai...) or a
+file in their own storage (amazon video, google storage), so the file is uploaded
+before each call. The staging layer hashes the file (streaming sha256) and keeps an
+index of the uploaded objects by hash: calling another provider or subfeature with
+the same file reuses the object instead of uploading it again.
+
+Entries expire with the presigned urls: an s3 url is valid `URL_SHORT_PERIOD`
+seconds, and is reused until `STAGING_URL_MARGIN` seconds before it expires, so
+that the provider still has the time to download the file.
+
+Backends:
+    - `S3StagingBackend`: edenai bucket, presigned url (or a custom bucket/client,
+      returning the object key)
+    - `GCSStagingBackend`: a google storage bucket, returning the gs:// uri
+    - `LocalStagingBackend`: a local directory, returning file:// uris (tests and
+      local development)
+
+Configuration:
+    UPLOAD_STAGING: `true` (default) to enable the staging index, `false` to upload
+        each file under a new name
+    UPLOAD_STAGING_BACKEND: `s3` (default) or `local`
+    UPLOAD_STAGING_DIR: directory of the local backend
+    UPLOAD_STAGING_MAX_ENTRIES: max number of files indexed (default 1024)
+    STAGING_URL_MARGIN: seconds before the url expiration after which a staged file
+        is uploaded again (default 300)
+"""
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from edenai_apis.utils import upload_s3
+
+UPLOAD_STAGING = os.environ.get("UPLOAD_STAGING", "true").lower() == "true"
+UPLOAD_STAGING_BACKEND = os.environ.get("UPLOAD_STAGING_BACKEND", "s3")
+UPLOAD_STAGING_DIR = os.environ.get(
+    "UPLOAD_STAGING_DIR", os.path.join(tempfile.gettempdir(), "edenai_apis_staging")
+)
+UPLOAD_STAGING_MAX_ENTRIES = int(os.environ.get("UPLOAD_STAGING_MAX_ENTRIES", 1024))
+STAGING_URL_MARGIN = float(os.environ.get("STAGING_URL_MARGIN", 300))
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+StagingKey = Tuple[str, str, str]
+
+
+def file_sha256(file_path: str, chunk_size: int = HASH_CHUNK_SIZE) -> str:
+    """Hex sha256 of a file, read by chunks"""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as file_:
+        for chunk in iter(lambda: file_.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class StagingBackend(ABC):
+    """Storage the staged files are uploaded to
+
+    Attributes:
+        name (str): identifies the storage in the index (eg: `s3:<bucket>`)
+        ttl (float): seconds a staged file can be reused
+    """
+
+    name: str = ""
+    ttl: float = upload_s3.URL_SHORT_PERIOD
+
+    @abstractmethod
+    def upload(self, file_path: str, key: str) -> str:
+        """Upload a file under `key`, return what is given to the provider
+        (url, uri or object key)"""
+
+    def delete(self, key: str) -> None:
+        """Called when a staged file expires, remote objects are left to the
+        bucket lifecycle rules"""
+
+
+class S3StagingBackend(StagingBackend):
+    """Upload to s3, in the edenai provider bucket by default
+
+    Args:
+        bucket (str): bucket name, default to the edenai provider bucket
+        s3_client: boto3 s3 client, default to the shared one
+        presign (bool): return a presigned url (default) or the object key
+        skip_existing (bool): do not upload objects already in the bucket
+        transfer_config: boto3 TransferConfig (multipart size, concurrency)
+    """
+
+    def __init__(
+        self,
+        bucket: Optional[str] = None,
+        s3_client=None,
+        presign: bool = True,
+        skip_existing: bool = False,
+        transfer_config=None,
+    ) -> None:
+        self._bucket = bucket
+        self._s3_client = s3_client
+        self.presign = presign
+        self.skip_existing = skip_existing
+        self.transfer_config = transfer_config
+        # reuse presigned urls while the provider still has the time to download
+        self.ttl = (
+            upload_s3.URL_SHORT_PERIOD - STAGING_URL_MARGIN
+            if presign
+            else upload_s3.URL_SHORT_PERIOD
+        )
+
+    @property
+    def s3_client(self):
+        # loading the shared client sets the buckets names
+        return self._s3_client or upload_s3.s3_client_load()
+
+    @property
+    def bucket(self) -> str:
+        if self._bucket is None:
+            upload_s3.s3_client_load()  # sets upload_s3.BUCKET
+            return upload_s3.BUCKET
+        return self._bucket
+
+    @property
+    def name(self) -> str:
+        return f"s3:{self.bucket}:{'url' if self.presign else 'key'}"
+
+    def _exists(self, key: str) -> bool:
+        try:
+            self.s3_client.head_object(Bucket=self.bucket, Key=key)
+        except Exception as exc:  # botocore ClientError
+            error = getattr(exc, "response", {}).get("Error", {})
+            if error.get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return False
+            raise
+        return True
+
+    def upload(self, file_path: str, key: str) -> str:
+        s3_client = self.s3_client
+        if not (self.skip_existing and self._exists(key)):
+            extra = {"Config": self.transfer_config} if self.transfer_config else {}
+            s3_client.upload_file(file_path, self.bucket, key, **extra)
+        if self.presign:
+            return upload_s3.get_s3_file_url(key, upload_s3.URL_SHORT_PERIOD)
+        return key
+
+
+class GCSStagingBackend(StagingBackend):
+    """Upload to a google storage bucket, returns the gs:// uri
+
+    Args:
+        storage_client: google.cloud.storage.Client
+        bucket_name (str): bucket name
+    """
+
+    def __init__(self, storage_client, bucket_name: str) -> None:
+        self.storage_client = storage_client
+        self.bucket_name = bucket_name
+        self.name = f"gcs:{bucket_name}"
+
+    def upload(self, file_path: str, key: str) -> str:
+        bucket = self.storage_client.bucket(self.bucket_name)
+        bucket.blob(key).upload_from_filename(file_path)
+        return f"gs://{self.bucket_name}/{key}"
+
+
+class LocalStagingBackend(StagingBackend):
+    """Copy the files in a local directory, stand-in for s3 in tests and local runs"""
+
+    def __init__(self, directory: str = UPLOAD_STAGING_DIR) -> None:
+        self.directory = Path(directory)
+        self.name = f"local:{self.directory}"
+
+    def upload(self, file_path: str, key: str) -> str:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(file_path, self.directory / key)
+        return (self.directory / key).resolve().as_uri()
+
+    def delete(self, key: str) -> None:
+        (self.directory / key).unlink(missing_ok=True)
+
+
+class _StagedFile:
+    __slots__ = ("location", "key", "backend", "expires_at")
+
+    def __init__(self, location: str, key: str, backend: StagingBackend) -> None:
+        self.location = location
+        self.key = key
+        self.backend = backend
+        self.expires_at = time.monotonic() + backend.ttl
+
+
+class UploadStaging:
+    """Index of the staged files by content hash
+
+    Args:
+        backend (StagingBackend): default storage
+        max_entries (int): max number of staged files indexed (LRU eviction)
+    """
+
+    def __init__(
+        self,
+        backend: Optional[StagingBackend] = None,
+        max_entries: int = UPLOAD_STAGING_MAX_ENTRIES,
+    ) -> None:
+        self.backend = backend or S3StagingBackend()
+        self.max_entries = max_entries
+        self._index: "OrderedDict[StagingKey, _StagedFile]" = OrderedDict()
+        self._lock = threading.Lock()
+        # one lock by file being uploaded, so that concurrent calls upload it once
+        self._uploading: Dict[StagingKey, threading.Lock] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _drop(self, key: StagingKey) -> None:
+        staged = self._index.pop(key)
+        staged.backend.delete(staged.key)
+
+    def _lookup(self, key: StagingKey) -> Optional[_StagedFile]:
+        with self._lock:
+            staged = self._index.get(key)
+            if staged is None:
+                return None
+            if time.monotonic() >= staged.expires_at:
+                self._drop(key)
+                return None
+            self._index.move_to_end(key)
+            return staged
+
+    def _upload(
+        self, key: StagingKey, file_path: str, object_key: str, backend: StagingBackend
+    ) -> _StagedFile:
+        staged = _StagedFile(backend.upload(file_path, object_key), object_key, backend)
+        with self._lock:
+            self.misses += 1
+            self._index[key] = staged
+            while len(self._index) > self.max_entries:
+                self._drop(next(iter(self._index)))
+        return staged
+
+    def stage(
+        self,
+        file_path: str,
+        file_name: str,
+        backend: Optional[StagingBackend] = None,
+    ) -> str:
+        """Upload a file, unless the same content was already staged with the same
+        extension in the same storage.
+
+        Args:
+            file_path (str): local file
+            file_name (str): name of the file, the object is named `<sha256>_<name>`
+            backend (StagingBackend): storage, default to the staging one
+
+        Returns:
+            str: url, uri or key returned by the backend
+        """
+        backend = backend or self.backend
+        name = Path(str(file_name)).name
+        digest = file_sha256(file_path)
+        key = (backend.name, digest, Path(name).suffix)
+
+        staged = self._lookup(key)
+        if staged is None:
+            with self._lock:
+                upload_lock = self._uploading.setdefault(key, threading.Lock())
+            with upload_lock:
+                # uploaded by another thread while we were waiting
+                staged = self._lookup(key)
+                if staged is None:
+                    try:
+                        staged = self._upload(key, file_path, f"{digest}_{name}", backend)
+                    finally:
+                        with self._lock:
+                            self._uploading.pop(key, None)
+                    return staged.location
+        with self._lock:
+            self.hits += 1
+        return staged.location
+
+    def clear(self) -> None:
+        with self._lock:
+            for key in list(self._index):
+                self._drop(key)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._index),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
+
+
+_UPLOAD_STAGING: Optional[UploadStaging] = None
+_UPLOAD_STAGING_LOCK = threading.Lock()
+
+
+def get_upload_staging() -> Optional[UploadStaging]:
+    """Return the staging of the process, None when `UPLOAD_STAGING` is disabled"""
+    global _UPLOAD_STAGING
+    if _UPLOAD_STAGING is None and UPLOAD_STAGING:
+        with _UPLOAD_STAGING_LOCK:
+            if _UPLOAD_STAGING is None:
+                backend = (
+                    LocalStagingBackend()
+                    if UPLOAD_STAGING_BACKEND == "local"
+                    else S3StagingBackend()
+                )
+                _UPLOAD_STAGING = UploadStaging(backend)
+    return _UPLOAD_STAGING
+
+
+def set_upload_staging(staging: Optional[UploadStaging]) -> None:
+    """Replace the staging of the process (None resets it to the default one)"""
+    global _UPLOAD_STAGING
+    with _UPLOAD_STAGING_LOCK:
+        _UPLOAD_STAGING = staging
+
+
+def stage_file(
+    file_path: str, file_name: str, backend: Optional[StagingBackend] = None
+) -> Optional[str]:
+    """Stage a file with the staging of the process.
+
+    Returns:
+        str: location of the file, None if the staging is disabled
+    """
+    staging = get_upload_staging()
+    if staging is None:
+        return None
+    return staging.stage(file_path, file_name, backend)